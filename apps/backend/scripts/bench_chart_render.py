@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark: matplotlib vs raster chart renderer.
+
+Renders every indicator preset of ChartGeneratorService (plus the
+ChartVisionService chart) on synthetic OHLCV data with both renderers and
+prints the mean / p95 render time and the PNG size. The "batch" row renders
+all selected presets through ``render_charts`` (shared indicator series and
+layout templates).
+
+Run from apps/backend:
+    python scripts/bench_chart_render.py --bars 200 --repeat 20
+    python scripts/bench_chart_render.py --width 1600 --height 1000 --presets complete smc
+
+SMC overlays are left empty: the matplotlib path only draws the legacy
+attribute names, so an empty analysis keeps the comparison like for like.
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import warnings
+from pathlib import Path
+from types import SimpleNamespace
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_ROOT))
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from src.core.config import settings  # noqa: E402
+from src.engines.ai.chart_vision import ChartVisionService  # noqa: E402
+from src.services.chart_generator_service import (  # noqa: E402
+    INDICATOR_PRESETS,
+    ChartConfig,
+    ChartGeneratorService,
+)
+from src.services.technical_analysis_service import SMCAnalysis  # noqa: E402
+
+RENDERERS = ("matplotlib", "raster")
+
+
+def synthetic_frame(bars: int, seed: int = 42) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 1.1 + np.cumsum(rng.normal(0, 0.0008, bars))
+    open_ = np.r_[close[0], close[:-1]]
+    spread = np.abs(rng.normal(0, 0.0004, bars))
+    return pd.DataFrame(
+        {
+            "open": open_,
+            "high": np.maximum(open_, close) + spread,
+            "low": np.minimum(open_, close) - spread,
+            "close": close,
+            "volume": rng.integers(100, 5000, bars).astype(float),
+        },
+        index=pd.date_range("2026-01-05", periods=bars, freq="15min"),
+    )
+
+
+def measure(render, repeat: int) -> tuple[list[float], int]:
+    size = len(render())  # warm-up (font cache, imports)
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        render()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings, size
+
+
+def p95(values: list[float]) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--bars", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--width", type=int, default=1200)
+    parser.add_argument("--height", type=int, default=800)
+    parser.add_argument("--presets", nargs="*", default=list(INDICATOR_PRESETS))
+    args = parser.parse_args()
+    # The legacy renderer warns about empty legends on panels without labelled lines.
+    warnings.filterwarnings("ignore", category=UserWarning)
+
+    df = synthetic_frame(args.bars)
+    vision_df = df.rename(columns=str.capitalize)
+    analysis = SimpleNamespace(smc=SMCAnalysis())
+
+    rows: list[tuple[str, str, float, float, int]] = []
+    for renderer in RENDERERS:
+        settings.CHART_RENDERER = renderer
+        generator = ChartGeneratorService()
+        for preset in args.presets:
+            config = ChartConfig(
+                "EURUSD", width=args.width, height=args.height, indicators=INDICATOR_PRESETS[preset],
+            )
+            timings, size = measure(lambda config=config, generator=generator: generator.render_chart(config, df, analysis), args.repeat)
+            rows.append((preset, renderer, statistics.mean(timings), p95(timings), size))
+        # Every preset from one frame, as generate_charts does
+        configs = [
+            ChartConfig("EURUSD", width=args.width, height=args.height, indicators=INDICATOR_PRESETS[preset])
+            for preset in args.presets
+        ]
+        timings, _ = measure(
+            lambda configs=configs, generator=generator: "".join(generator.render_charts(configs, df, analysis)),
+            args.repeat,
+        )
+        rows.append(("batch", renderer, statistics.mean(timings), p95(timings), 0))
+        vision = ChartVisionService()
+        timings, size = measure(
+            lambda vision=vision: asyncio.run(
+                vision.generate_chart_image("EURUSD", "15m", vision_df, width=args.width, height=args.height)
+            ),
+            args.repeat,
+        )
+        rows.append(("vision", renderer, statistics.mean(timings), p95(timings), size))
+
+    print(f"{args.bars} bars, {args.width}x{args.height}, {args.repeat} runs")
+    print(f"{'chart':<12}{'renderer':<12}{'mean ms':>10}{'p95 ms':>10}{'png KB':>10}{'speedup':>10}")
+    baseline = {(chart, renderer): mean for chart, renderer, mean, _, _ in rows}
+    for chart, renderer, mean, tail, size in rows:
+        speedup = baseline[(chart, "matplotlib")] / mean if mean else 0.0
+        print(f"{chart:<12}{renderer:<12}{mean:>10.1f}{tail:>10.1f}{size / 1024:>10.1f}{speedup:>9.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
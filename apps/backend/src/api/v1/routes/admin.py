@@ -18,6 +18,7 @@ from src.core.models import (
     BrokerAccount,
     License,
     LicenseStatus,
+    Trade,
     User,
     WhopOrder,
     WhopOrderStatus,
@@ -679,7 +680,8 @@ async def delete_user(
     if user.license:
         user.license.current_uses = max(0, user.license.current_uses - 1)
 
-    # Remove broker accounts tied to this user to avoid FK violations.
+    # Remove trades and broker accounts tied to this user to avoid FK violations.
+    await db.execute(delete(Trade).where(Trade.user_id == user.id))
     await db.execute(
         delete(BrokerAccount).where(BrokerAccount.user_id == user.id)
     )
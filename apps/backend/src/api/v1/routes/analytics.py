@@ -2,20 +2,21 @@
 Analytics routes - Performance metrics and reporting.
 """
 
-from datetime import UTC, date, datetime
+from datetime import date
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.v1.routes.auth import get_current_user
-from src.api.v1.routes.bot import collect_user_trades
+from src.api.v1.routes.bot import sync_user_trades
 from src.core.database import get_db
 from src.core.models import User
 from src.engines.data.indicators import TechnicalIndicators
 from src.engines.data.market_data import get_market_data_service
 from src.engines.trading.broker_factory import NoBrokerConfiguredError
 from src.engines.trading.metatrader_broker import RateLimitError
+from src.services.performance_analytics_service import get_performance_analytics_service
 from src.services.trading_service import get_trading_service
 
 router = APIRouter()
@@ -108,22 +109,6 @@ class AnalysisResponse(BaseModel):
     indicators: dict
 
 
-def _parse_trade_timestamp(raw: str | None) -> datetime | None:
-    """Parse timestamps from persisted trade payloads."""
-    if not raw:
-        return None
-
-    normalized = raw.replace("Z", "+00:00")
-    try:
-        parsed = datetime.fromisoformat(normalized)
-    except ValueError:
-        return None
-
-    if parsed.tzinfo is None:
-        parsed = parsed.replace(tzinfo=UTC)
-    return parsed
-
-
 @router.get("/account", response_model=AccountSummary)
 async def get_account_summary():
     """Get current account summary."""
@@ -193,31 +178,22 @@ async def get_account_summary():
 async def get_performance_metrics(
     start_date: date | None = None,
     end_date: date | None = None,
+    initial_balance: float = Query(0.0, ge=0),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """Get overall performance metrics scoped to the authenticated user."""
-    all_trades = await collect_user_trades(db, current_user)
-
-    closed_trades: list[dict] = []
-    for trade in all_trades:
-        pnl = trade.get("profit_loss")
-        if pnl is None:
-            continue
-
-        ts = _parse_trade_timestamp(trade.get("exit_timestamp") or trade.get("timestamp"))
-        if ts is None:
-            continue
-
-        trade_day = ts.date()
-        if start_date and trade_day < start_date:
-            continue
-        if end_date and trade_day > end_date:
-            continue
-
-        closed_trades.append(trade)
+    """
+    Get overall performance metrics scoped to the authenticated user.
+
+    ``initial_balance`` is the equity the curve starts from; drawdown % and the
+    Sharpe / Sortino ratios are relative to it (0: relative to cumulative P&L).
+    """
+    await sync_user_trades(db, current_user)
+    summary = await get_performance_analytics_service().summary(
+        db, current_user.id, start=start_date, end=end_date, initial_balance=initial_balance
+    )
 
-    if not closed_trades:
+    if summary.total_trades == 0:
         return PerformanceMetrics(
             total_trades=0,
             winning_trades=0,
@@ -237,71 +213,26 @@ async def get_performance_metrics(
             average_hold_time="0h",
         )
 
-    wins = [
-        t
-        for t in closed_trades
-        if isinstance(t.get("profit_loss"), (int, float)) and float(t["profit_loss"]) > 0
-    ]
-    losses = [
-        t
-        for t in closed_trades
-        if isinstance(t.get("profit_loss"), (int, float)) and float(t["profit_loss"]) < 0
-    ]
-    total = len(closed_trades)
-    win_count = len(wins)
-    loss_count = len(losses)
-    win_rate = (win_count / total * 100) if total > 0 else 0
-
-    total_pnl = sum(float(t.get("profit_loss", 0)) for t in closed_trades)
-    total_wins = sum(float(t.get("profit_loss", 0)) for t in wins)
-    total_losses = abs(sum(float(t.get("profit_loss", 0)) for t in losses))
-    avg_win = (total_wins / win_count) if win_count > 0 else 0
-    avg_loss = (total_losses / loss_count) if loss_count > 0 else 0
-    profit_factor = (total_wins / total_losses) if total_losses > 0 else float("inf") if total_wins > 0 else 0
-    largest_win = max((float(t.get("profit_loss", 0)) for t in wins), default=0)
-    largest_loss = min((float(t.get("profit_loss", 0)) for t in losses), default=0)
-    expectancy = (total_pnl / total) if total > 0 else 0
-
-    sorted_for_drawdown = sorted(
-        closed_trades,
-        key=lambda t: (t.get("exit_timestamp") or t.get("timestamp") or ""),
-    )
-    cumulative = 0.0
-    peak = 0.0
-    max_dd = 0.0
-    for t in sorted_for_drawdown:
-        cumulative += float(t.get("profit_loss", 0) or 0)
-        if cumulative > peak:
-            peak = cumulative
-        drawdown = peak - cumulative
-        if drawdown > max_dd:
-            max_dd = drawdown
-
-    hold_times: list[float] = []
-    for t in closed_trades:
-        entry_ts = _parse_trade_timestamp(t.get("timestamp"))
-        exit_ts = _parse_trade_timestamp(t.get("exit_timestamp"))
-        if entry_ts and exit_ts and exit_ts >= entry_ts:
-            hold_times.append((exit_ts - entry_ts).total_seconds() / 3600)
-    avg_hold = f"{sum(hold_times) / len(hold_times):.1f}h" if hold_times else "N/A"
-
+    profit_factor = summary.profit_factor
     return PerformanceMetrics(
-        total_trades=total,
-        winning_trades=win_count,
-        losing_trades=loss_count,
-        win_rate=f"{win_rate:.2f}",
+        total_trades=summary.total_trades,
+        winning_trades=summary.winning_trades,
+        losing_trades=summary.losing_trades,
+        win_rate=f"{summary.win_rate:.2f}",
         profit_factor=f"{profit_factor:.2f}" if profit_factor != float("inf") else "Infinity",
-        total_pnl=f"{total_pnl:.2f}",
-        average_win=f"{avg_win:.2f}",
-        average_loss=f"{avg_loss:.2f}",
-        largest_win=f"{largest_win:.2f}",
-        largest_loss=f"{largest_loss:.2f}",
-        max_drawdown=f"{max_dd:.2f}",
-        max_drawdown_percent="0.00",
-        sharpe_ratio=None,
-        sortino_ratio=None,
-        expectancy=f"{expectancy:.2f}",
-        average_hold_time=avg_hold,
+        total_pnl=f"{summary.total_pnl:.2f}",
+        average_win=f"{summary.average_win:.2f}",
+        average_loss=f"{summary.average_loss:.2f}",
+        largest_win=f"{summary.largest_win:.2f}",
+        largest_loss=f"{summary.largest_loss:.2f}",
+        max_drawdown=f"{summary.max_drawdown:.2f}",
+        max_drawdown_percent=f"{summary.max_drawdown_percent:.2f}",
+        sharpe_ratio=f"{summary.sharpe_ratio:.2f}" if summary.sharpe_ratio is not None else None,
+        sortino_ratio=f"{summary.sortino_ratio:.2f}" if summary.sortino_ratio is not None else None,
+        expectancy=f"{summary.expectancy:.2f}",
+        average_hold_time=(
+            f"{summary.average_hold_hours:.1f}h" if summary.average_hold_hours is not None else "N/A"
+        ),
     )
 
 
@@ -309,10 +240,22 @@ async def get_performance_metrics(
 async def get_daily_performance(
     start_date: date | None = None,
     end_date: date | None = None,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
 ):
-    """Get daily P&L breakdown."""
-    # TODO: Calculate from database
-    return []
+    """Get daily P&L breakdown (closing day, UTC)."""
+    await sync_user_trades(db, current_user)
+    days = await get_performance_analytics_service().daily(db, current_user.id, start=start_date, end=end_date)
+    return [
+        DailyPerformance(
+            date=day["date"],
+            pnl=f"{day['pnl']:.2f}",
+            trades=day["trades"],
+            win_rate=f"{day['win_rate']:.2f}",
+            cumulative_pnl=f"{day['cumulative_pnl']:.2f}",
+        )
+        for day in days
+    ]
 
 
 @router.get("/equity-curve", response_model=list[EquityPoint])
@@ -320,10 +263,25 @@ async def get_equity_curve(
     start_date: date | None = None,
     end_date: date | None = None,
     resolution: str = Query("1h", pattern="^(1m|5m|15m|1h|4h|1d)$"),
+    initial_balance: float = Query(0.0, ge=0),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
 ):
-    """Get equity curve data."""
-    # TODO: Calculate from database
-    return []
+    """Get equity curve data: one point per bucket with closed trades."""
+    await sync_user_trades(db, current_user)
+    points = await get_performance_analytics_service().equity_curve(
+        db, current_user.id, start=start_date, end=end_date,
+        resolution=resolution, initial_balance=initial_balance,
+    )
+    return [
+        EquityPoint(
+            timestamp=point["timestamp"],
+            equity=f"{point['equity']:.2f}",
+            drawdown=f"{point['drawdown']:.2f}",
+            drawdown_percent=f"{point['drawdown_percent']:.2f}",
+        )
+        for point in points
+    ]
 
 
 @router.get("/indicators/{symbol}", response_model=IndicatorData)
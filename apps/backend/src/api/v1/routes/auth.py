@@ -8,7 +8,7 @@ from datetime import UTC, datetime
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from pydantic import BaseModel, EmailStr, Field
-from sqlalchemy import func, select
+from sqlalchemy import delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -26,6 +26,7 @@ from src.core.security import (
     verify_password,
     verify_token,
 )
+from src.services.trade_history_service import LEGACY_CACHE_KEY_PREFIX, get_trade_history_service
 
 router = APIRouter()
 
@@ -335,14 +336,9 @@ async def register(
     db.add(user)
     await db.flush()
 
-    # Initialize a fresh per-user trade history cache so new accounts always start at zero.
-    trade_history_key = f"trade_history_user_{user.id}"
-    result = await db.execute(select(AppSettings).where(AppSettings.key == trade_history_key))
-    existing_history = result.scalar_one_or_none()
-    if existing_history:
-        existing_history.value = "[]"
-    else:
-        db.add(AppSettings(key=trade_history_key, value="[]"))
+    # New accounts always start with an empty trade history (ids can be reused).
+    await get_trade_history_service().clear_user(db, user.id)
+    await db.execute(delete(AppSettings).where(AppSettings.key == f"{LEGACY_CACHE_KEY_PREFIX}{user.id}"))
 
     await db.refresh(user)
 
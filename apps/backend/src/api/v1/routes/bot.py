@@ -12,6 +12,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.v1.routes.auth import get_current_user
+from src.core.cycle_tracer import get_cycle_tracer
 from src.core.database import get_db
 from src.core.models import AppSettings, BrokerAccount, User
 from src.engines.trading.auto_trader import (
@@ -19,9 +20,15 @@ from src.engines.trading.auto_trader import (
     BotStatus,
     get_auto_trader,
 )
+from src.services.candle_resampler import timeframe_seconds
+from src.services.deal_sync_service import get_deal_sync_service
+from src.services.trade_history_service import (
+    get_trade_history_service,
+    normalize_direction,
+    trade_to_dict,
+)
 
 router = APIRouter(prefix="/bot", tags=["Bot Control"])
-TRADE_HISTORY_KEY_PREFIX = "trade_history_user_"
 
 
 # ============ Database Helper Functions ============
@@ -57,11 +64,6 @@ async def save_bot_config_to_db(db: AsyncSession, config_dict: dict) -> None:
     await db.commit()
 
 
-def _trade_history_key_for_user(user_id: int) -> str:
-    """Build deterministic per-user key for persisted trade history."""
-    return f"{TRADE_HISTORY_KEY_PREFIX}{user_id}"
-
-
 def _safe_float(value: object, default: float = 0.0) -> float:
     """Safely coerce unknown numeric payloads to float."""
     try:
@@ -104,178 +106,78 @@ async def _get_visible_brokers(db: AsyncSession, current_user: User) -> list[Bro
     return list(result.scalars().all())
 
 
-def _normalize_direction(raw_direction: str) -> str:
-    """Normalize direction labels from different providers."""
-    upper = raw_direction.upper()
-    if "BUY" in upper:
-        return "LONG"
-    if "SELL" in upper:
-        return "SHORT"
-    return raw_direction
-
-
-async def _save_trade_history_to_db(
-    db: AsyncSession,
-    trades: list,
-    settings_key: str = "trade_history",
-) -> None:
-    """Save trade history to database for persistence across restarts."""
-    result = await db.execute(
-        select(AppSettings).where(AppSettings.key == settings_key)
-    )
-    setting = result.scalar_one_or_none()
-
-    # Keep last 200 trades to avoid bloating the DB
-    trades_to_save = trades[-200:] if len(trades) > 200 else trades
-    trades_json = json.dumps(trades_to_save)
-    if setting:
-        setting.value = trades_json
-    else:
-        setting = AppSettings(key=settings_key, value=trades_json)
-        db.add(setting)
-
-    await db.commit()
-
-
-async def _load_trade_history_from_db(db: AsyncSession, settings_key: str = "trade_history") -> list:
-    """Load trade history from database."""
-    result = await db.execute(
-        select(AppSettings).where(AppSettings.key == settings_key)
-    )
-    setting = result.scalar_one_or_none()
-    if setting and setting.value:
-        try:
-            return json.loads(setting.value)
-        except Exception:
-            pass
-    return []
+def _memory_trade_to_dict(trade, broker: BrokerAccount) -> dict:
+    """API shape of an in-memory ``TradeRecord``."""
+    return {
+        "id": str(trade.id),
+        "broker_id": broker.id,
+        "broker_name": broker.name,
+        "symbol": trade.symbol,
+        "direction": normalize_direction(trade.direction),
+        "entry_price": _safe_float(trade.entry_price),
+        "exit_price": _safe_float(trade.exit_price) if trade.exit_price is not None else None,
+        "stop_loss": _safe_float(trade.stop_loss),
+        "take_profit": _safe_float(trade.take_profit),
+        "units": _safe_float(trade.units),
+        "timestamp": _safe_iso_timestamp(trade.timestamp),
+        "exit_timestamp": _safe_iso_timestamp(trade.exit_timestamp) if trade.exit_timestamp else None,
+        "confidence": _safe_float(trade.confidence),
+        "status": trade.status,
+        "profit_loss": _safe_float(trade.profit_loss) if trade.profit_loss is not None else None,
+    }
 
 
-async def collect_user_trades(db: AsyncSession, current_user: User) -> list[dict]:
+async def sync_user_trades(db: AsyncSession, current_user: User) -> list[BrokerAccount]:
     """
-    Collect trade history scoped to the authenticated user.
+    Upsert the user's trades into the ``trades`` table; returns the visible brokers.
 
     Data sources:
-    1. In-memory trades from each visible broker instance.
-    2. Persisted per-user trade cache.
-    3. Broker deal history for visible brokers (last 30 days).
+    1. In-memory trades from each visible broker instance (unchanged rows are skipped).
+    2. Legacy per-user JSON cache (imported once).
+    3. Broker deal history, synced by a background worker per visible broker;
+       the request only makes sure the worker runs and never waits on the broker.
     """
     from src.engines.trading.multi_broker_manager import get_multi_broker_manager
 
     manager = get_multi_broker_manager()
+    service = get_trade_history_service()
+    deal_sync = get_deal_sync_service()
     brokers = await _get_visible_brokers(db, current_user)
 
-    trades: list[dict] = []
-    seen_ids: set[str] = set()
-
-    # In-memory trades from broker-specific traders
     for broker in brokers:
+        deal_sync.ensure(current_user.id, broker.id)
         instance = manager.get_instance(broker.id)
-        if not instance:
-            continue
-
-        for trade in instance.trader.state.trade_history:
-            normalized_id = f"mem:{broker.id}:{trade.id}"
-            if normalized_id in seen_ids:
-                continue
-
-            timestamp_iso = _safe_iso_timestamp(trade.timestamp)
-            exit_timestamp_iso = _safe_iso_timestamp(trade.exit_timestamp) if trade.exit_timestamp else None
-            trades.append(
-                {
-                    "id": str(trade.id),
-                    "broker_id": broker.id,
-                    "broker_name": broker.name,
-                    "symbol": trade.symbol,
-                    "direction": _normalize_direction(trade.direction),
-                    "entry_price": _safe_float(trade.entry_price),
-                    "exit_price": _safe_float(trade.exit_price) if trade.exit_price is not None else None,
-                    "stop_loss": _safe_float(trade.stop_loss),
-                    "take_profit": _safe_float(trade.take_profit),
-                    "units": _safe_float(trade.units),
-                    "timestamp": timestamp_iso,
-                    "exit_timestamp": exit_timestamp_iso,
-                    "confidence": _safe_float(trade.confidence),
-                    "status": trade.status,
-                    "profit_loss": _safe_float(trade.profit_loss) if trade.profit_loss is not None else None,
-                }
+        if instance:
+            await service.upsert_trades(
+                db,
+                current_user.id,
+                (_memory_trade_to_dict(trade, broker) for trade in instance.trader.state.trade_history),
+                source="bot",
             )
-            seen_ids.add(normalized_id)
-
-    # Persisted per-user cache
-    settings_key = _trade_history_key_for_user(current_user.id)
-    db_trades = await _load_trade_history_from_db(db, settings_key=settings_key)
-    for trade in db_trades:
-        broker_id = trade.get("broker_id")
-        base_id = trade.get("id", "")
-        normalized_id = f"db:{broker_id}:{base_id}"
-        if normalized_id in seen_ids:
-            continue
-
-        trade["timestamp"] = _safe_iso_timestamp(trade.get("timestamp"))
-        if trade.get("exit_timestamp"):
-            trade["exit_timestamp"] = _safe_iso_timestamp(trade.get("exit_timestamp"))
-        trades.append(trade)
-        seen_ids.add(normalized_id)
-
-    # Broker deal history as fallback/source of truth for closed trades
-    start_time = (datetime.now(UTC) - timedelta(days=30)).isoformat()
-    for broker in brokers:
-        try:
-            broker_connection = await manager._ensure_broker_connection(broker.id, broker_account=broker)
-        except Exception:
-            broker_connection = None
 
-        if not broker_connection or not hasattr(broker_connection, "get_deals_history"):
-            continue
+    await service.import_legacy_cache(db, current_user.id)
+    await db.commit()
+    return brokers
 
-        try:
-            deals = await broker_connection.get_deals_history(start_time)
-        except Exception:
-            deals = []
-
-        for deal in deals:
-            deal_id = str(deal.get("id") or deal.get("dealId") or "")
-            if not deal_id:
-                continue
-
-            normalized_id = f"deal:{broker.id}:{deal_id}"
-            if normalized_id in seen_ids:
-                continue
-
-            deal_type = str(deal.get("type", ""))
-            profit = _safe_float(deal.get("profit"))
-            swap = _safe_float(deal.get("swap"))
-            commission = _safe_float(deal.get("commission"))
-            total_pnl = profit + swap + commission
-
-            if total_pnl == 0 and "BUY" not in deal_type.upper() and "SELL" not in deal_type.upper():
-                continue
-
-            deal_time = _safe_iso_timestamp(deal.get("time") or deal.get("brokerTime"))
-            trades.append(
-                {
-                    "id": deal_id,
-                    "broker_id": broker.id,
-                    "broker_name": broker.name,
-                    "symbol": deal.get("symbol", "UNKNOWN"),
-                    "direction": _normalize_direction(deal_type),
-                    "entry_price": _safe_float(deal.get("price")),
-                    "exit_price": _safe_float(deal.get("price")),
-                    "stop_loss": 0.0,
-                    "take_profit": 0.0,
-                    "units": _safe_float(deal.get("volume")),
-                    "timestamp": deal_time,
-                    "exit_timestamp": deal_time,
-                    "confidence": 0.0,
-                    "status": "filled",
-                    "profit_loss": total_pnl,
-                }
-            )
-            seen_ids.add(normalized_id)
 
-    trades.sort(key=lambda item: item.get("timestamp", ""), reverse=True)
-    return trades
+async def collect_user_trades(
+    db: AsyncSession,
+    current_user: User,
+    limit: int | None = None,
+    offset: int = 0,
+    **filters,
+) -> list[dict]:
+    """
+    Trade history scoped to the authenticated user, newest first.
+
+    Syncs the ``trades`` table first, then reads it with SQL filtering
+    (``symbol``, ``broker_ids``, ``start`` / ``end`` closing day, ``closed_only``).
+    """
+    await sync_user_trades(db, current_user)
+    rows = await get_trade_history_service().query_trades(
+        db, current_user.id, limit=limit, offset=offset, **filters
+    )
+    return [trade_to_dict(row) for row in rows]
 
 
 def apply_config_to_bot(config_dict: dict) -> None:
@@ -291,6 +193,10 @@ def apply_config_to_bot(config_dict: dict) -> None:
             pass
     if "analysis_interval_seconds" in config_dict:
         bot.config.analysis_interval_seconds = config_dict["analysis_interval_seconds"]
+    if "analysis_trigger" in config_dict:
+        bot.config.analysis_trigger = config_dict["analysis_trigger"]
+    if "analysis_timeframe" in config_dict:
+        bot.config.analysis_timeframe = config_dict["analysis_timeframe"]
     if "min_confidence" in config_dict:
         bot.config.min_confidence = config_dict["min_confidence"]
     if "min_models_agree" in config_dict:
@@ -361,6 +267,8 @@ class BotConfigRequest(BaseModel):
     symbols: list[str] | None = None
     analysis_mode: str | None = None
     analysis_interval_seconds: int | None = None
+    analysis_trigger: str | None = None  # "bar_close" | "interval"
+    analysis_timeframe: str | None = None
     min_confidence: float | None = None
     min_models_agree: int | None = None
     min_confluence: float | None = None
@@ -516,6 +424,16 @@ async def update_config(config: BotConfigRequest, db: AsyncSession = Depends(get
             raise HTTPException(status_code=400, detail="Interval must be at least 60 seconds")
         current_config.analysis_interval_seconds = config.analysis_interval_seconds
 
+    if config.analysis_trigger is not None:
+        if config.analysis_trigger not in ("bar_close", "interval"):
+            raise HTTPException(status_code=400, detail=f"Invalid analysis trigger: {config.analysis_trigger}")
+        current_config.analysis_trigger = config.analysis_trigger
+
+    if config.analysis_timeframe is not None:
+        if config.analysis_timeframe and timeframe_seconds(config.analysis_timeframe) is None:
+            raise HTTPException(status_code=400, detail=f"Invalid analysis timeframe: {config.analysis_timeframe}")
+        current_config.analysis_timeframe = config.analysis_timeframe or None
+
     if config.min_confidence is not None:
         if not 0 <= config.min_confidence <= 100:
             raise HTTPException(status_code=400, detail="Confidence must be between 0 and 100")
@@ -647,6 +565,8 @@ async def update_config(config: BotConfigRequest, db: AsyncSession = Depends(get
         "symbols": current_config.symbols,
         "analysis_mode": current_config.analysis_mode.value,
         "analysis_interval_seconds": current_config.analysis_interval_seconds,
+        "analysis_trigger": current_config.analysis_trigger,
+        "analysis_timeframe": current_config.analysis_timeframe,
         "min_confidence": current_config.min_confidence,
         "min_models_agree": current_config.min_models_agree,
         "min_confluence": current_config.min_confluence,
@@ -697,6 +617,8 @@ async def get_config():
         "symbols": config.symbols,
         "analysis_mode": config.analysis_mode.value,
         "analysis_interval_seconds": config.analysis_interval_seconds,
+        "analysis_trigger": config.analysis_trigger,
+        "analysis_timeframe": config.analysis_timeframe,
         "min_confidence": config.min_confidence,
         "min_models_agree": config.min_models_agree,
         "min_confluence": config.min_confluence,
@@ -736,24 +658,17 @@ async def get_config():
 @router.get("/trades")
 async def get_trades(
     limit: int = 50,
+    offset: int = 0,
+    symbol: str | None = None,
+    broker_id: int | None = None,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """Get trade history scoped to authenticated user."""
-    trades = await collect_user_trades(db, current_user)
-
-    # Persist a compact per-user cache for fast warm starts
-    try:
-        await _save_trade_history_to_db(
-            db,
-            trades,
-            settings_key=_trade_history_key_for_user(current_user.id),
-        )
-    except Exception as e:
-        print(f"[Bot/trades] Error saving per-user trade cache: {e}")
-
-    total = len(trades)
-    return {"trades": trades[:limit], "total": total}
+    """Get a page of trade history scoped to authenticated user."""
+    filters = {"symbol": symbol, "broker_ids": [broker_id] if broker_id is not None else None}
+    trades = await collect_user_trades(db, current_user, limit=max(0, limit), offset=max(0, offset), **filters)
+    total = await get_trade_history_service().count_trades(db, current_user.id, **filters)
+    return {"trades": trades, "total": total}
 
 
 @router.get("/positions")
@@ -780,26 +695,46 @@ async def get_open_positions():
 
 
 @router.get("/logs")
-async def get_analysis_logs(limit: int = 30):
-    """Get recent AI analysis logs from the bot."""
+async def get_analysis_logs(
+    limit: int = 30,
+    symbol: str | None = None,
+    log_type: str | None = None,
+    before: int | None = None,
+    after: int | None = None,
+):
+    """
+    Get AI analysis logs from the bot, oldest first.
+
+    Page back with ``before=<next_cursor>``; poll for new entries with ``after=<last_id>``.
+    """
     bot = get_auto_trader()
-    logs = bot.state.analysis_logs[-limit:]
+    store = bot.state.analysis_logs
+    page = store.query(symbol=symbol, log_type=log_type, limit=limit, before=before, after=after)
     return {
-        "logs": [
-            {
-                "timestamp": log.timestamp.isoformat(),
-                "symbol": log.symbol,
-                "type": log.log_type,
-                "message": log.message,
-                "details": log.details,
-            }
-            for log in logs
-        ],
-        "total": len(bot.state.analysis_logs),
+        "logs": page.to_dicts(),
+        "total": len(store),
+        "next_cursor": page.next_cursor,
+        "last_id": page.last_id,
         "bot_status": bot.state.status.value,
     }
 
 
+@router.get("/traces")
+async def get_cycle_traces(limit: int = 20):
+    """Recent analysis cycles with time spent per stage (newest first)."""
+    tracer = get_cycle_tracer()
+    return {"cycles": tracer.recent(limit), "buffer_size": tracer.max_cycles}
+
+
+@router.get("/traces/{cycle_id}")
+async def get_cycle_trace(cycle_id: str):
+    """Waterfall of one analysis cycle: every span with its offset and duration."""
+    trace = get_cycle_tracer().get(cycle_id)
+    if trace is None:
+        raise HTTPException(status_code=404, detail=f"Cycle trace not found: {cycle_id}")
+    return trace.waterfall()
+
+
 @router.get("/news/upcoming")
 async def get_upcoming_news(hours: int = 24, impact: str | None = None):
     """
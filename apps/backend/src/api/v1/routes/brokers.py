@@ -1135,15 +1135,19 @@ async def refresh_broker_config(
 async def get_broker_logs(
     broker_id: int,
     limit: int = 50,
+    symbol: str | None = None,
+    log_type: str | None = None,
+    before: int | None = None,
+    after: int | None = None,
     current_user: User = Depends(get_licensed_user),
     db: AsyncSession = Depends(get_db),
 ):
-    """Get AI analysis logs for a specific broker."""
+    """Get AI analysis logs for a specific broker (cursor pagination via ``before`` / ``after``)."""
     from src.engines.trading.multi_broker_manager import get_multi_broker_manager
 
     broker = await _get_user_broker_or_404(db, broker_id, current_user)
     manager = get_multi_broker_manager()
-    logs = manager.get_broker_logs(broker_id, limit)
+    logs = manager.get_broker_logs(broker_id, limit, symbol=symbol, log_type=log_type, before=before, after=after)
 
     if not logs:
         return {
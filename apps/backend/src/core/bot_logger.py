@@ -0,0 +1,274 @@
+"""
+Bot Logger - Non-blocking, level-gated logging pipeline for trading hot paths.
+
+``print`` blocks the event loop on every line and cannot be turned down.
+Component loggers keep the familiar ``[Component] message`` output but:
+
+- Calls below the component level return before any formatting. Levels come
+  from BOT_LOG_LEVEL, overridden per component by BOT_LOG_LEVELS
+  (e.g. ``"PriceStreaming=WARNING,MetaTrader=DEBUG"``).
+- Accepted calls enqueue a structured ``LogEvent`` (message template, args,
+  fields, exception). A daemon thread formats and writes them in batches,
+  as text or JSON lines (BOT_LOG_FORMAT), so the caller never waits on
+  stdout and %-style args are only rendered off the hot path.
+- ``sample=<key>`` lets a high-frequency message through at most once per
+  BOT_LOG_SAMPLE_SECONDS; the next emitted line carries the suppressed count.
+- The queue is bounded (BOT_LOG_BUFFER_LINES): when stdout cannot keep up,
+  the oldest events are dropped and counted instead of growing memory.
+"""
+
+import atexit
+import json
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any, TextIO
+
+from src.core.config import settings
+
+LEVELS = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40}
+
+# Seconds between flushes when the queue is not filling up.
+_FLUSH_INTERVAL = 0.25
+
+
+def level_value(name: str) -> int:
+    return LEVELS.get(str(name or "").strip().upper(), LEVELS["INFO"])
+
+
+def parse_component_levels(spec: str) -> dict[str, int]:
+    """``"PriceStreaming=WARNING,MetaTrader=DEBUG"`` -> {component: level}."""
+    levels = {}
+    for item in str(spec or "").split(","):
+        component, _, level = item.partition("=")
+        if component.strip() and level.strip():
+            levels[component.strip()] = level_value(level)
+    return levels
+
+
+@dataclass(slots=True)
+class LogEvent:
+    """One log call, rendered by the writer thread."""
+    ts: float
+    level: str
+    component: str
+    message: str
+    args: tuple = ()
+    fields: dict[str, Any] = field(default_factory=dict)
+    exc: BaseException | None = None
+
+    def render_message(self) -> str:
+        if not self.args:
+            return self.message
+        try:
+            return self.message % self.args
+        except Exception:
+            return f"{self.message} {self.args!r}"
+
+    def to_text(self) -> str:
+        line = f"[{self.component}] {self.render_message()}"
+        if self.fields:
+            line += " " + " ".join(f"{key}={value}" for key, value in self.fields.items())
+        if self.exc is not None:
+            line += "\n" + "".join(traceback.format_exception(self.exc)).rstrip()
+        return line
+
+    def to_json(self) -> str:
+        record = {
+            "ts": datetime.fromtimestamp(self.ts, tz=UTC).isoformat(),
+            "level": self.level,
+            "component": self.component,
+            "message": self.render_message(),
+            **self.fields,
+        }
+        if self.exc is not None:
+            record["exception"] = "".join(traceback.format_exception(self.exc)).rstrip()
+        return json.dumps(record, default=str, ensure_ascii=False)
+
+
+class BufferedLogWriter:
+    """Queues events in memory and writes them from a background thread."""
+
+    def __init__(
+        self,
+        stream: TextIO | None = None,
+        max_lines: int | None = None,
+        flush_interval: float = _FLUSH_INTERVAL,
+        background: bool = True,
+        json_format: bool | None = None,
+    ):
+        self._stream = stream
+        self.background = background  # False: events are written only by explicit flush()
+        self.max_lines = max(1, max_lines or settings.BOT_LOG_BUFFER_LINES)
+        self.flush_interval = flush_interval
+        self.json_format = (
+            settings.BOT_LOG_FORMAT.lower() == "json" if json_format is None else json_format
+        )
+        # deque appends/pops are atomic: producers never take a lock.
+        self._events: deque[LogEvent | str] = deque(maxlen=self.max_lines)
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.dropped = 0
+        self.written = 0
+
+    @property
+    def stream(self) -> TextIO:
+        # Resolved lazily so redirected stdout (tests, workers) is honoured.
+        return self._stream or sys.stdout
+
+    def emit(self, event: LogEvent | str) -> None:
+        queued = len(self._events)
+        if queued >= self.max_lines:
+            self.dropped += 1  # The full deque evicts the oldest event
+        self._events.append(event)
+        if queued + 1 >= self.max_lines // 2:
+            self._wake.set()
+        if self._thread is None:
+            self._ensure_thread()
+
+    def write(self, line: str) -> None:
+        """Queue an already formatted line."""
+        self.emit(line)
+
+    def _ensure_thread(self) -> None:
+        if not self.background:
+            return
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="bot-log-writer", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def _format(self, event: LogEvent | str) -> str:
+        if isinstance(event, str):
+            return event
+        return event.to_json() if self.json_format else event.to_text()
+
+    def flush(self) -> None:
+        with self._flush_lock:
+            lines = []
+            dropped, self.dropped = self.dropped, 0
+            if dropped:
+                lines.append(f"[BotLogger] {dropped} log lines dropped (stdout too slow)")
+            while True:
+                try:
+                    event = self._events.popleft()
+                except IndexError:
+                    break
+                try:
+                    lines.append(self._format(event))
+                except Exception as e:
+                    lines.append(f"[BotLogger] Could not format log event: {e}")
+            if not lines:
+                return
+            try:
+                self.stream.write("\n".join(lines) + "\n")
+                self.stream.flush()
+                self.written += len(lines)
+            except Exception:
+                pass
+
+
+class BotLogger:
+    """Logger for one component; text output looks like the ``print`` calls it replaces."""
+
+    def __init__(self, component: str, writer: BufferedLogWriter | None = None, level: str | None = None):
+        self.component = component
+        self._writer = writer
+        self._level = level_value(level) if level is not None else None
+        self._level_key: tuple[str, str] | None = None
+        self._resolved_level = LEVELS["INFO"]
+        self._samples: dict[str, list[float]] = {}  # key -> [last emitted, suppressed]
+
+    @property
+    def writer(self) -> BufferedLogWriter:
+        return self._writer or get_log_writer()
+
+    @property
+    def level(self) -> int:
+        if self._level is not None:
+            return self._level
+        key = (settings.BOT_LOG_LEVEL, settings.BOT_LOG_LEVELS)
+        if key != self._level_key:
+            self._level_key = key
+            self._resolved_level = parse_component_levels(key[1]).get(self.component, level_value(key[0]))
+        return self._resolved_level
+
+    def set_level(self, level: str | None) -> None:
+        """Pin this component's level (``None`` follows settings again)."""
+        self._level = level_value(level) if level is not None else None
+
+    def enabled(self, level: str) -> bool:
+        return LEVELS[level] >= self.level
+
+    def _sampled_out(self, key: str, now: float, fields: dict[str, Any]) -> bool:
+        state = self._samples.get(key)
+        if state is not None and now - state[0] < settings.BOT_LOG_SAMPLE_SECONDS:
+            state[1] += 1
+            return True
+        if state is not None and state[1]:
+            fields["suppressed"] = int(state[1])
+        self._samples[key] = [now, 0]
+        return False
+
+    def log(
+        self,
+        level: str,
+        message: str,
+        *args: object,
+        sample: str | None = None,
+        exc: BaseException | None = None,
+        **fields: Any,
+    ) -> None:
+        if LEVELS[level] < self.level:
+            return
+        now = time.time()
+        if sample is not None and self._sampled_out(sample, now, fields):
+            return
+        self.writer.emit(LogEvent(now, level, self.component, message, args, fields, exc))
+
+    def debug(self, message: str, *args: object, **kwargs: Any) -> None:
+        self.log("DEBUG", message, *args, **kwargs)
+
+    def info(self, message: str, *args: object, **kwargs: Any) -> None:
+        self.log("INFO", message, *args, **kwargs)
+
+    def warning(self, message: str, *args: object, **kwargs: Any) -> None:
+        self.log("WARNING", message, *args, **kwargs)
+
+    def error(self, message: str, *args: object, **kwargs: Any) -> None:
+        self.log("ERROR", message, *args, **kwargs)
+
+    def exception(self, message: str, *args: object, **kwargs: Any) -> None:
+        """Error with the exception being handled; the traceback is formatted by the writer."""
+        self.log("ERROR", message, *args, exc=sys.exc_info()[1], **kwargs)
+
+
+_writer: BufferedLogWriter | None = None
+_loggers: dict[str, BotLogger] = {}
+
+
+def get_log_writer() -> BufferedLogWriter:
+    """Process-wide writer, flushed at interpreter exit."""
+    global _writer
+    if _writer is None:
+        _writer = BufferedLogWriter()
+        atexit.register(_writer.flush)
+    return _writer
+
+
+def get_bot_logger(component: str) -> BotLogger:
+    """Shared logger for ``component`` (one sampling state per component)."""
+    logger = _loggers.get(component)
+    if logger is None:
+        logger = _loggers[component] = BotLogger(component)
+    return logger
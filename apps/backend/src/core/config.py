@@ -226,8 +226,46 @@ class Settings(BaseSettings):
     MAX_DAILY_LOSS_PERCENT: float = 5.0
     DEFAULT_RISK_PER_TRADE: float = 1.0  # Percentage of account
 
+    # Multi-broker execution
+    # inline: every AutoTrader shares the API event loop (default)
+    # process: each broker (or broker group) runs its AutoTrader in a worker process
+    BROKER_EXECUTION_MODE: str = Field(default="inline", description="inline|process")
+    BROKER_WORKER_MAX_PROCESSES: int = 0  # 0 = one process per broker, N = brokers grouped into N workers
+    BROKER_WORKER_HEALTH_INTERVAL_SECONDS: float = 5.0
+    BROKER_WORKER_RPC_TIMEOUT_SECONDS: float = 30.0
+    BROKER_WORKER_START_TIMEOUT_SECONDS: float = 300.0
+
+    # CPU-bound analysis / chart rendering offload
+    COMPUTE_EXECUTOR_MODE: str = Field(default="process", description="process|thread|inline")
+    COMPUTE_POOL_WORKERS: int = 0  # 0 = auto (cpu_count - 1, max 4)
+    COMPUTE_OFFLOAD_MIN_BARS: int = 50  # Smaller frames are analyzed inline
+    CHART_RENDERER: str = Field(default="raster", description="raster|matplotlib")
+    # Charts rendered ahead of time on bar close: "SYMBOL:TIMEFRAME:PRESET,..." (preset "vision" = vision chart)
+    CHART_PRERENDER_TARGETS: str = ""
+    CHART_PRERENDER_CACHE_SIZE: int = 256
+    CHART_PRERENDER_CLOSE_DELAY_SECONDS: float = 2.0  # Let the data source publish the closed bar
+
+    # AutoTrader cycle tracing: recent cycles kept in memory, optional OTLP/JSON lines export file
+    TRACE_BUFFER_CYCLES: int = 100
+    TRACE_EXPORT_PATH: str = ""
+
+    # Bot logging: analysis log entries kept per broker, console level and buffered lines
+    ANALYSIS_LOG_CAPACITY: int = 500
+    BOT_LOG_LEVEL: str = "INFO"  # DEBUG, INFO, WARNING, ERROR
+    BOT_LOG_LEVELS: str = ""  # Per component, e.g. "PriceStreaming=WARNING,MetaTrader=DEBUG"
+    BOT_LOG_FORMAT: str = "text"  # "text" or "json" (one structured record per line)
+    BOT_LOG_SAMPLE_SECONDS: float = 30.0  # Min interval between sampled high-frequency messages
+    BOT_LOG_BUFFER_LINES: int = 5000
+
+    # Trade history: background broker deal sync interval per broker, initial window for new brokers
+    TRADE_DEAL_SYNC_SECONDS: float = 60.0
+    TRADE_DEAL_HISTORY_DAYS: int = 30
+    ANALYTICS_CACHE_USERS: int = 256  # Users whose trade frames / analytics results stay cached
+
     # Market Data
     CMC_API_KEY: str | None = None
+    # Broker server time offset from UTC in minutes (e.g. 120 for GMT+2); anchors bars resampled locally
+    MARKET_SESSION_OFFSET_MINUTES: int = 0
 
     # Email Service (Resend)
     RESEND_API_KEY: str | None = None
@@ -0,0 +1,318 @@
+"""
+Cycle Tracer - Span-based timing of AutoTrader analysis cycles.
+
+Every AutoTrader cycle opens a trace; code running inside it (gating, news
+refresh, browser navigation, screenshots, LLM calls, consensus, broker
+calls, order placement) records spans carrying the cycle id, symbol, stage
+and duration. Child tasks inherit the active span through contextvars, so
+parallel model calls nest under the step that started them.
+
+- Outside a cycle ``trace_span`` / ``traced`` are no-ops.
+- Finished cycles are kept in an in-memory ring buffer (TRACE_BUFFER_CYCLES)
+  and served as per-cycle waterfalls by the bot API.
+- With TRACE_EXPORT_PATH set, each finished cycle is appended to that file
+  as one OTLP/JSON ``ExportTraceServiceRequest`` per line, written by a
+  background thread so the event loop never waits on the disk.
+
+Broker worker processes keep their own buffer; their cycles are not merged
+into the API process.
+"""
+
+import functools
+import json
+import os
+import time
+import uuid
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, TypeVar
+
+from src.core.bot_logger import get_bot_logger
+from src.core.config import settings
+
+T = TypeVar("T")
+
+logger = get_bot_logger("CycleTracer")
+
+# Spans kept per cycle; further spans are only counted.
+_MAX_SPANS = 2000
+
+_STATUS_CODES = {"ok": 1, "error": 2}
+
+
+@dataclass
+class TraceSpan:
+    """One timed step of a cycle."""
+    span_id: str
+    parent_id: str | None
+    stage: str
+    name: str
+    symbol: str | None
+    start_ns: int
+    started: float
+    duration_ms: float | None = None
+    status: str = "ok"
+    error: str | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class CycleTrace:
+    """All spans recorded during one AutoTrader cycle."""
+    cycle_id: str
+    label: str
+    started_at: datetime
+    start_ns: int
+    started: float
+    attributes: dict[str, Any] = field(default_factory=dict)
+    spans: list[TraceSpan] = field(default_factory=list)
+    duration_ms: float | None = None
+    dropped_spans: int = 0
+
+    def stage_totals(self) -> dict[str, float]:
+        """Milliseconds per stage, not double counting a stage nested in itself."""
+        stages = {span.span_id: span.stage for span in self.spans}
+        totals: dict[str, float] = {}
+        for span in self.spans:
+            if span.duration_ms is None or stages.get(span.parent_id) == span.stage:
+                continue
+            totals[span.stage] = round(totals.get(span.stage, 0.0) + span.duration_ms, 1)
+        return totals
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "cycle_id": self.cycle_id,
+            "label": self.label,
+            "started_at": self.started_at.isoformat(),
+            "duration_ms": self.duration_ms,
+            "symbols": sorted({span.symbol for span in self.spans if span.symbol}),
+            "spans": len(self.spans),
+            "errors": sum(1 for span in self.spans if span.status == "error"),
+            "stages": self.stage_totals(),
+            "attributes": self.attributes,
+        }
+
+    def waterfall(self) -> dict[str, Any]:
+        """Spans in start order with their offset from the cycle start and nesting depth."""
+        depth: dict[str | None, int] = {None: -1}
+        rows = []
+        for span in sorted(self.spans, key=lambda s: s.started):
+            depth[span.span_id] = depth.get(span.parent_id, -1) + 1
+            rows.append({
+                "span_id": span.span_id,
+                "parent_id": span.parent_id,
+                "depth": depth[span.span_id],
+                "stage": span.stage,
+                "name": span.name,
+                "symbol": span.symbol,
+                "offset_ms": round((span.started - self.started) * 1000, 1),
+                "duration_ms": span.duration_ms,
+                "status": span.status,
+                "error": span.error,
+                "attributes": span.attributes,
+            })
+        return {**self.summary(), "dropped_spans": self.dropped_spans, "waterfall": rows}
+
+    def to_otlp(self) -> dict[str, Any]:
+        """OTLP/JSON ExportTraceServiceRequest for this cycle."""
+        root_id = self.cycle_id[:16]
+        spans = [_otlp_span(
+            self.cycle_id, root_id, None, f"cycle:{self.label}", self.start_ns, self.duration_ms,
+            {"stage": "cycle", **self.attributes}, "ok",
+        )]
+        for span in self.spans:
+            spans.append(_otlp_span(
+                self.cycle_id, span.span_id, span.parent_id or root_id, f"{span.stage}:{span.name}",
+                span.start_ns, span.duration_ms,
+                {"stage": span.stage, "symbol": span.symbol, **span.attributes}, span.status,
+            ))
+        return {"resourceSpans": [{
+            "resource": {"attributes": [_otlp_attribute("service.name", "trading-agent-backend")]},
+            "scopeSpans": [{"scope": {"name": "autotrader"}, "spans": spans}],
+        }]}
+
+
+def _otlp_attribute(key: str, value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+def _otlp_span(
+    trace_id: str,
+    span_id: str,
+    parent_id: str | None,
+    name: str,
+    start_ns: int,
+    duration_ms: float | None,
+    attributes: dict[str, Any],
+    status: str,
+) -> dict[str, Any]:
+    span = {
+        "traceId": trace_id,
+        "spanId": span_id,
+        "name": name,
+        "kind": 1,
+        "startTimeUnixNano": str(start_ns),
+        "endTimeUnixNano": str(start_ns + int((duration_ms or 0.0) * 1_000_000)),
+        "attributes": [_otlp_attribute(k, v) for k, v in attributes.items() if v is not None],
+        "status": {"code": _STATUS_CODES.get(status, 0)},
+    }
+    if parent_id:
+        span["parentSpanId"] = parent_id
+    return span
+
+
+# (cycle, current span) for the running task
+_active: ContextVar[tuple[CycleTrace, TraceSpan | None] | None] = ContextVar("cycle_trace", default=None)
+
+
+class CycleTracer:
+    """Ring buffer of finished cycle traces, with optional OTLP/JSON file export."""
+
+    def __init__(self, max_cycles: int | None = None, export_path: str | None = None):
+        self.max_cycles = max(1, max_cycles or settings.TRACE_BUFFER_CYCLES)
+        self.export_path = settings.TRACE_EXPORT_PATH if export_path is None else export_path
+        self._cycles: deque[CycleTrace] = deque(maxlen=self.max_cycles)
+        # One thread keeps exported lines in cycle order.
+        self._exporter: ThreadPoolExecutor | None = None
+
+    @contextmanager
+    def cycle(self, label: str, **attributes: Any) -> Iterator[CycleTrace]:
+        """Trace everything run inside the block as one cycle."""
+        trace = CycleTrace(
+            cycle_id=uuid.uuid4().hex,
+            label=label,
+            started_at=datetime.utcnow(),
+            start_ns=time.time_ns(),
+            started=time.perf_counter(),
+            attributes={k: v for k, v in attributes.items() if v is not None},
+        )
+        token = _active.set((trace, None))
+        try:
+            yield trace
+        finally:
+            _active.reset(token)
+            trace.duration_ms = round((time.perf_counter() - trace.started) * 1000, 1)
+            self._cycles.append(trace)
+            if self.export_path:
+                self._export(trace)
+
+    def _export(self, trace: CycleTrace) -> None:
+        line = json.dumps(trace.to_otlp(), separators=(",", ":")) + "\n"
+        if self._exporter is None:
+            self._exporter = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cycle-trace-export")
+        self._exporter.submit(self._append, line)
+
+    def _append(self, line: str) -> None:
+        try:
+            directory = os.path.dirname(self.export_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.export_path, "a", encoding="utf-8") as handle:
+                handle.write(line)
+        except OSError as e:
+            logger.error("Export to %s failed: %s", self.export_path, e, sample="export")
+
+    def flush(self) -> None:
+        """Wait until every finished cycle has been written (blocking)."""
+        if self._exporter is not None:
+            self._exporter.submit(lambda: None).result()
+
+    def recent(self, limit: int = 20) -> list[dict[str, Any]]:
+        """Summaries of the most recent cycles, newest first."""
+        return [trace.summary() for trace in list(self._cycles)[::-1][:max(0, limit)]]
+
+    def get(self, cycle_id: str) -> CycleTrace | None:
+        return next((trace for trace in self._cycles if trace.cycle_id == cycle_id), None)
+
+    def clear(self) -> None:
+        self._cycles.clear()
+
+
+def current_cycle_id() -> str | None:
+    active = _active.get()
+    return active[0].cycle_id if active else None
+
+
+@contextmanager
+def trace_span(stage: str, name: str | None = None, symbol: str | None = None, **attributes: Any) -> Iterator[None]:
+    """Time the block as a span of the active cycle (no-op outside a cycle)."""
+    active = _active.get()
+    if active is None:
+        yield
+        return
+    trace, parent = active
+    if len(trace.spans) >= _MAX_SPANS:
+        trace.dropped_spans += 1
+        yield
+        return
+    span = TraceSpan(
+        span_id=os.urandom(8).hex(),
+        parent_id=parent.span_id if parent else None,
+        stage=stage,
+        name=name or stage,
+        symbol=symbol or (parent.symbol if parent else None),
+        start_ns=time.time_ns(),
+        started=time.perf_counter(),
+        attributes={k: v for k, v in attributes.items() if v is not None},
+    )
+    trace.spans.append(span)
+    token = _active.set((trace, span))
+    try:
+        yield
+    except BaseException as e:
+        span.status = "error"
+        span.error = str(e) or type(e).__name__
+        raise
+    finally:
+        _active.reset(token)
+        span.duration_ms = round((time.perf_counter() - span.started) * 1000, 2)
+
+
+async def traced_call(
+    stage: str,
+    name: str,
+    awaitable: Awaitable[T],
+    symbol: str | None = None,
+    **attributes: Any,
+) -> T:
+    """Await ``awaitable`` inside a span (for call sites that cannot use a ``with`` block)."""
+    with trace_span(stage, name, symbol=symbol, **attributes):
+        return await awaitable
+
+
+def traced(stage: str, name: str | None = None) -> Callable:
+    """Decorator: run an async function inside a span named after it."""
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        span_name = name or func.__name__
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            if _active.get() is None:
+                return await func(*args, **kwargs)
+            with trace_span(stage, span_name):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# Singleton instance
+_cycle_tracer: CycleTracer | None = None
+
+
+def get_cycle_tracer() -> CycleTracer:
+    """Get or create the cycle tracer singleton."""
+    global _cycle_tracer
+    if _cycle_tracer is None:
+        _cycle_tracer = CycleTracer()
+    return _cycle_tracer
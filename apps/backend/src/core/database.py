@@ -261,6 +261,8 @@ async def run_compat_migrations() -> None:
         END $$;
         """,
         "CREATE INDEX IF NOT EXISTS ix_broker_accounts_user_id ON broker_accounts (user_id)",
+        # Trade history listing sorts by entry time (newest first)
+        "CREATE INDEX IF NOT EXISTS ix_trades_user_timestamp ON trades (user_id, timestamp)",
         # Whop product -> license slot mapping support
         "ALTER TABLE whop_products ADD COLUMN IF NOT EXISTS license_broker_slots INTEGER NOT NULL DEFAULT 5",
     ]
@@ -0,0 +1,203 @@
+"""
+Analysis Log Store - Bounded, indexed in-memory store for bot analysis logs.
+
+Each AutoTrader keeps its analysis logs (AI reasoning, skips, trades shown
+in the frontend) in a fixed-capacity ring buffer instead of a growing list:
+
+- Records are compact slotted objects with an epoch timestamp and a
+  monotonically increasing ``seq`` that doubles as the pagination cursor.
+- Secondary indexes by symbol and log type keep filtered queries
+  proportional to the matches, not to the whole buffer.
+- ``query`` pages backwards with ``before`` (older pages) or forwards with
+  ``after`` (polling for new entries).
+
+The store is plain data, so it travels inside ``BotState`` when broker
+worker processes mirror their state to the API process.
+"""
+
+from bisect import bisect_left, bisect_right
+from collections import deque
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from src.core.config import settings
+
+
+@dataclass(slots=True)
+class LogRecord:
+    """One analysis log entry."""
+    seq: int
+    ts: float  # Epoch seconds
+    symbol: str
+    log_type: str  # "info", "analysis", "trade", "skip", "error", "news"
+    message: str
+    details: dict[str, Any] | None = None
+
+    @property
+    def timestamp(self) -> datetime:
+        """Naive UTC timestamp, as the rest of the bot state uses."""
+        return datetime.fromtimestamp(self.ts, tz=UTC).replace(tzinfo=None)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.seq,
+            "timestamp": self.timestamp.isoformat(),
+            "symbol": self.symbol,
+            "type": self.log_type,
+            "message": self.message,
+            "details": self.details,
+        }
+
+
+@dataclass
+class LogPage:
+    """Result of a store query, oldest record first."""
+    records: list[LogRecord]
+    next_cursor: int | None  # Pass as ``before`` to get the previous page
+    last_id: int | None  # Pass as ``after`` to poll for newer records
+
+    def to_dicts(self) -> list[dict[str, Any]]:
+        return [record.to_dict() for record in self.records]
+
+
+class AnalysisLogStore:
+    """Fixed-capacity ring buffer of ``LogRecord`` with symbol and type indexes."""
+
+    def __init__(self, capacity: int | None = None):
+        self.capacity = max(1, capacity or settings.ANALYSIS_LOG_CAPACITY)
+        self._slots: list[LogRecord | None] = [None] * self.capacity
+        self._next_seq = 1
+        self._size = 0
+        # Seqs per key, ascending; the oldest one is evicted first.
+        self._by_symbol: dict[str, deque[int]] = {}
+        self._by_type: dict[str, deque[int]] = {}
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def total(self) -> int:
+        """Records ever appended, including evicted ones."""
+        return self._next_seq - 1
+
+    @property
+    def first_seq(self) -> int:
+        return self._next_seq - self._size
+
+    def append(
+        self,
+        symbol: str,
+        log_type: str,
+        message: str,
+        details: dict[str, Any] | None = None,
+        ts: float | None = None,
+    ) -> LogRecord:
+        if self._size == self.capacity:
+            self._evict_oldest()
+        record = LogRecord(
+            seq=self._next_seq,
+            ts=datetime.now(UTC).timestamp() if ts is None else ts,
+            symbol=symbol,
+            log_type=log_type,
+            message=message,
+            details=details or None,
+        )
+        self._slots[record.seq % self.capacity] = record
+        self._by_symbol.setdefault(symbol, deque()).append(record.seq)
+        self._by_type.setdefault(log_type, deque()).append(record.seq)
+        self._next_seq += 1
+        self._size += 1
+        return record
+
+    def _evict_oldest(self) -> None:
+        seq = self.first_seq
+        record = self._slots[seq % self.capacity]
+        self._slots[seq % self.capacity] = None
+        self._size -= 1
+        for index, key in ((self._by_symbol, record.symbol), (self._by_type, record.log_type)):
+            seqs = index[key]
+            seqs.popleft()
+            if not seqs:
+                del index[key]
+
+    def get(self, seq: int) -> LogRecord | None:
+        if not self.first_seq <= seq < self._next_seq:
+            return None
+        return self._slots[seq % self.capacity]
+
+    def _candidates(self, symbol: str | None, log_type: str | None) -> tuple[Any, bool]:
+        """Smallest ascending seq sequence covering the filters, and whether it still needs filtering."""
+        indexes = []
+        if symbol is not None:
+            indexes.append(self._by_symbol.get(symbol, ()))
+        if log_type is not None:
+            indexes.append(self._by_type.get(log_type, ()))
+        if not indexes:
+            return range(self.first_seq, self._next_seq), False
+        return min(indexes, key=len), len(indexes) > 1
+
+    def query(
+        self,
+        symbol: str | None = None,
+        log_type: str | None = None,
+        limit: int = 50,
+        before: int | None = None,
+        after: int | None = None,
+    ) -> LogPage:
+        """
+        Matching records, oldest first.
+
+        Args:
+            symbol: Only records for this symbol
+            log_type: Only records of this type
+            limit: Maximum number of records
+            before: Only records older than this id (previous page)
+            after: Only records newer than this id, oldest first (polling)
+        """
+        limit = max(0, limit)
+        seqs, needs_filter = self._candidates(symbol, log_type)
+        lo = bisect_right(seqs, after) if after is not None else 0
+        hi = bisect_left(seqs, before) if before is not None else len(seqs)
+
+        picked: list[LogRecord] = []
+        if after is not None:
+            # Forward from the cursor so no record is skipped while polling.
+            position = lo
+            while position < hi and len(picked) < limit:
+                record = self._slots[seqs[position] % self.capacity]
+                position += 1
+                if not needs_filter or (record.symbol == symbol and record.log_type == log_type):
+                    picked.append(record)
+            more_older = False
+        else:
+            position = hi
+            while position > lo and len(picked) < limit:
+                position -= 1
+                record = self._slots[seqs[position] % self.capacity]
+                if not needs_filter or (record.symbol == symbol and record.log_type == log_type):
+                    picked.append(record)
+            picked.reverse()
+            more_older = position > lo
+
+        return LogPage(
+            records=picked,
+            next_cursor=picked[0].seq if picked and more_older else None,
+            last_id=picked[-1].seq if picked else after,
+        )
+
+    def latest(self, limit: int) -> list[LogRecord]:
+        return self.query(limit=limit).records
+
+    def counts(self) -> dict[str, dict[str, int]]:
+        """Buffered records per symbol and per log type."""
+        return {
+            "symbols": {key: len(seqs) for key, seqs in self._by_symbol.items()},
+            "types": {key: len(seqs) for key, seqs in self._by_type.items()},
+        }
+
+    def clear(self) -> None:
+        self._slots = [None] * self.capacity
+        self._size = 0
+        self._by_symbol.clear()
+        self._by_type.clear()
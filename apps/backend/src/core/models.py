@@ -12,6 +12,7 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -379,3 +380,50 @@ class BrokerAccount(Base):
 
     def __repr__(self) -> str:
         return f"<BrokerAccount(id={self.id}, name={self.name}, enabled={self.is_enabled})>"
+
+
+class Trade(Base):
+    """
+    Trade history per user and broker.
+
+    Rows come from the bot's in-memory trades and from broker deal history;
+    both are upserted on (user_id, broker_id, external_id), never rewritten wholesale.
+    """
+    __tablename__ = "trades"
+    __table_args__ = (
+        UniqueConstraint("user_id", "broker_id", "external_id", name="uq_trades_user_broker_external"),
+        Index("ix_trades_user_timestamp", "user_id", "timestamp"),
+        Index("ix_trades_user_exit_timestamp", "user_id", "exit_timestamp"),
+        Index("ix_trades_broker_symbol", "broker_id", "symbol"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
+    broker_id: Mapped[int] = mapped_column(Integer, nullable=False, default=0)  # 0: no broker account
+    broker_name: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    external_id: Mapped[str] = mapped_column(String(100), nullable=False)  # Order id or broker deal id
+    source: Mapped[str] = mapped_column(String(20), default="bot")  # "bot", "deal", "cache"
+
+    symbol: Mapped[str] = mapped_column(String(50), nullable=False)
+    direction: Mapped[str] = mapped_column(String(10), nullable=False)
+    entry_price: Mapped[float] = mapped_column(Float, default=0.0)
+    exit_price: Mapped[float | None] = mapped_column(Float, nullable=True)
+    stop_loss: Mapped[float] = mapped_column(Float, default=0.0)
+    take_profit: Mapped[float] = mapped_column(Float, default=0.0)
+    units: Mapped[float] = mapped_column(Float, default=0.0)
+    confidence: Mapped[float] = mapped_column(Float, default=0.0)
+    status: Mapped[str] = mapped_column(String(20), default="open")
+    profit_loss: Mapped[float | None] = mapped_column(Float, nullable=True)
+
+    timestamp: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    exit_timestamp: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    def __repr__(self) -> str:
+        return f"<Trade(id={self.id}, broker_id={self.broker_id}, symbol={self.symbol}, external_id={self.external_id})>"
@@ -24,6 +24,7 @@ from src.services.chart_generator_service import (
     ChartGeneratorService,
     get_chart_generator_service,
 )
+from src.services.chart_prerender_service import get_chart_prerender_service
 from src.services.market_data_service import MarketDataService, get_market_data_service
 from src.services.technical_analysis_service import (
     TechnicalAnalysisService,
@@ -299,9 +300,13 @@ class AutonomousAnalyst:
                 show_structure=True,
                 show_volume=True,
             )
-            chart_image, chart_meta = await self.chart_generator.generate_chart(
-                chart_config, chart_preset
-            )
+            prerendered = get_chart_prerender_service().get(symbol, timeframe, chart_preset)
+            if prerendered is not None:
+                chart_image, chart_meta = prerendered.image_base64, prerendered.metadata
+            else:
+                chart_image, chart_meta = await self.chart_generator.generate_chart(
+                    chart_config, chart_preset
+                )
 
             # 4. Format data for the AI
             market_data_text = self._format_market_data(market_data)
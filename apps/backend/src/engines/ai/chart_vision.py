@@ -10,17 +10,35 @@ import io
 from datetime import datetime, timedelta
 from typing import Any
 
+from src.core.config import settings
+
 # Optional imports for chart generation
 HAS_MPLFINANCE = False
+HAS_RASTER = False
 pd = None
 np = None
 mpf = None
 
 try:
-    import mplfinance as mpf
     import numpy as np
     import pandas as pd
-    HAS_MPLFINANCE = True
+except ImportError:
+    pass
+
+try:
+    import mplfinance as mpf
+    HAS_MPLFINANCE = pd is not None
+except ImportError:
+    pass
+
+try:
+    from src.services.chart_raster import (
+        RasterChartRenderer,
+        RasterChartSpec,
+        RasterSeries,
+        RasterTheme,
+    )
+    HAS_RASTER = pd is not None
 except ImportError:
     pass
 
@@ -68,7 +86,24 @@ class ChartVisionService:
         },
     }
 
+    # Same palette for the raster renderer
+    RASTER_THEME = {
+        "background": "#0f172a",
+        "grid": "#1e293b",
+        "text": "#94a3b8",
+        "candle_up": "#22c55e",
+        "candle_down": "#ef4444",
+        "volume_up": "#22c55e80",
+        "volume_down": "#ef444480",
+    }
+
     def __init__(self):
+        self._raster: Any = None
+        self._style = None
+        use_raster = (settings.CHART_RENDERER or "raster").strip().lower() != "matplotlib"
+        if use_raster and HAS_RASTER:
+            self._raster = RasterChartRenderer(RasterTheme(**self.RASTER_THEME))
+            return
         if not HAS_MPLFINANCE:
             raise ImportError(
                 "mplfinance is required for chart generation. "
@@ -103,6 +138,10 @@ class ChartVisionService:
         if ohlcv_data is None:
             ohlcv_data = self._generate_demo_data(symbol, timeframe)
 
+        title = f"{symbol} - {self.TIMEFRAMES.get(timeframe, {}).get('label', timeframe)}"
+        if self._raster is not None:
+            return self._render_raster(ohlcv_data, title, include_indicators, width, height)
+
         # Prepare additional plots (indicators)
         addplots = []
         if include_indicators:
@@ -120,7 +159,7 @@ class ChartVisionService:
             style=self._style,
             volume=True,
             addplot=addplots if addplots else None,
-            title=f"\n{symbol} - {self.TIMEFRAMES.get(timeframe, {}).get('label', timeframe)}",
+            title=f"\n{title}",
             figsize=fig_ratio,
             savefig=dict(fname=buf, format="png", dpi=100, bbox_inches="tight"),
             warn_too_much_data=1000,
@@ -218,28 +257,49 @@ class ChartVisionService:
 
         return df
 
+    def _render_raster(self, df: Any, title: str, include_indicators: bool, width: int, height: int) -> str:
+        """Render with the raster renderer (CHART_RENDERER=raster)."""
+        spec = RasterChartSpec(
+            title=title,
+            timestamps=list(pd.DatetimeIndex(df.index).to_pydatetime()),
+            open=df["Open"].to_numpy(dtype=float),
+            high=df["High"].to_numpy(dtype=float),
+            low=df["Low"].to_numpy(dtype=float),
+            close=df["Close"].to_numpy(dtype=float),
+            volume=df["Volume"].to_numpy(dtype=float) if "Volume" in df else None,
+            panels=["main", "volume"] if "Volume" in df else ["main"],
+            panel_labels={"volume": "Volume"},
+        )
+        if include_indicators:
+            for values, color, line_width, dashed in self._indicator_series(df):
+                spec.series.append(RasterSeries(values.to_numpy(), color, width=line_width, dash=4 if dashed else 0))
+        return self._raster.render_base64(spec, width, height)
+
+    def _indicator_series(self, df: Any) -> list[tuple[Any, str, int, bool]]:  # df: pd.DataFrame
+        """EMA 20/50 and Bollinger Bands as (series, color, width, dashed)."""
+        close = df["Close"]
+        ema20 = close.ewm(span=20, adjust=False).mean()
+        ema50 = close.ewm(span=50, adjust=False).mean()
+        sma20 = close.rolling(window=20).mean()
+        std20 = close.rolling(window=20).std()
+        return [
+            (ema20, "#6366f1", 2, False),
+            (ema50, "#f59e0b", 2, False),
+            (sma20 + (std20 * 2), "#94a3b8", 1, True),
+            (sma20 - (std20 * 2), "#94a3b8", 1, True),
+        ]
+
     def _calculate_indicators(self, df: Any) -> list:  # df: pd.DataFrame
         """Calculate technical indicators for chart overlay."""
-        addplots = []
-
-        # EMA 20
-        ema20 = df["Close"].ewm(span=20, adjust=False).mean()
-        addplots.append(mpf.make_addplot(ema20, color="#6366f1", width=1.5))
-
-        # EMA 50
-        ema50 = df["Close"].ewm(span=50, adjust=False).mean()
-        addplots.append(mpf.make_addplot(ema50, color="#f59e0b", width=1.5))
-
-        # Bollinger Bands
-        sma20 = df["Close"].rolling(window=20).mean()
-        std20 = df["Close"].rolling(window=20).std()
-        bb_upper = sma20 + (std20 * 2)
-        bb_lower = sma20 - (std20 * 2)
-
-        addplots.append(mpf.make_addplot(bb_upper, color="#94a3b8", width=0.8, linestyle="--"))
-        addplots.append(mpf.make_addplot(bb_lower, color="#94a3b8", width=0.8, linestyle="--"))
-
-        return addplots
+        return [
+            mpf.make_addplot(
+                values,
+                color=color,
+                width=1.5 if line_width > 1 else 0.8,
+                linestyle="--" if dashed else "-",
+            )
+            for values, color, line_width, dashed in self._indicator_series(df)
+        ]
 
     def create_vision_prompt(
         self,
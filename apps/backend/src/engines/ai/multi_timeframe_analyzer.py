@@ -6,6 +6,11 @@ This analyzer:
 2. Generates chart images for each timeframe
 3. Runs both numeric (text) and visual analysis in parallel
 4. Combines results using a consensus voting system
+
+Market data is planned once per call: the finest timeframe is fetched once
+and resampled into the coarser ones where the source history allows, and
+the technical analysis of each timeframe is shared by the text and vision
+paths.
 """
 
 import asyncio
@@ -17,7 +22,10 @@ from typing import Any
 from src.engines.ai.chart_vision import ChartVisionService, get_chart_vision_service
 from src.engines.ai.consensus_engine import ConsensusEngine
 from src.engines.ai.vision_analyzer import VisionAnalyzer, get_vision_analyzer
-from src.services.ai_service import AIService
+from src.services.ai_service import AIService, create_market_context
+from src.services.chart_prerender_service import VISION_PRESET, get_chart_prerender_service
+from src.services.market_data_service import MarketData, get_market_data_service
+from src.services.technical_analysis_service import FullAnalysis, get_technical_analysis_service
 
 
 class AnalysisMode(str, Enum):
@@ -28,6 +36,10 @@ class AnalysisMode(str, Enum):
     ULTRA = "ultra"          # Everything + more timeframes
 
 
+# AIService votes BUY/SELL; this analyzer counts LONG/SHORT.
+TEXT_DIRECTIONS = {"BUY": "LONG", "SELL": "SHORT", "HOLD": "HOLD"}
+
+
 @dataclass
 class TimeframeAnalysis:
     """Analysis result for a single timeframe."""
@@ -159,17 +171,22 @@ class MultiTimeframeAnalyzer:
             final_confidence=0,
         )
 
+        # Candles and technical analysis per timeframe, shared by every path
+        market_data, analyses = await self._load_timeframes(symbol, timeframes, result.errors)
+
         # Collect all tasks
         tasks = []
 
         # 1. Text-based AI analysis (for each timeframe)
         for tf in timeframes:
-            tasks.append(self._run_text_analysis(symbol, tf, config["text_models"]))
+            tasks.append(self._run_text_analysis(
+                symbol, tf, config["text_models"], market_data.get(tf), analyses.get(tf)
+            ))
 
         # 2. Vision-based AI analysis (enabled for all modes)
         if config["use_vision"] and self.chart_service:
             max_vision_models = config.get("vision_models", 6)
-            tasks.append(self._run_vision_analysis(symbol, timeframes, max_vision_models))
+            tasks.append(self._run_vision_analysis(symbol, timeframes, max_vision_models, market_data))
 
         # Run all analyses in parallel
         try:
@@ -224,30 +241,86 @@ class MultiTimeframeAnalyzer:
 
         return result
 
+    async def _load_timeframes(
+        self,
+        symbol: str,
+        timeframes: list[str],
+        errors: list[str],
+    ) -> tuple[dict[str, MarketData], dict[str, FullAnalysis]]:
+        """Fetch candles for all timeframes (1-2 source calls) and analyze each once."""
+        try:
+            market_data = await get_market_data_service().get_timeframe_plan(symbol, timeframes, bars=100)
+        except Exception as e:
+            errors.append(f"Market data for {symbol} failed: {str(e)}")
+            return {}, {}
+        market_data = {tf: data for tf, data in market_data.items() if data.candles}
+
+        ta_service = get_technical_analysis_service()
+        frames = list(market_data)
+        results = await asyncio.gather(
+            *(ta_service.full_analysis(market_data[tf], include_mtf=False) for tf in frames),
+            return_exceptions=True,
+        )
+        analyses = {}
+        for tf, analysis in zip(frames, results, strict=True):
+            if isinstance(analysis, Exception):
+                errors.append(f"Technical analysis for {tf} failed: {str(analysis)}")
+            else:
+                analyses[tf] = analysis
+        return market_data, analyses
+
     async def _run_text_analysis(
         self,
         symbol: str,
         timeframe: str,
-        models: list[str]
+        models: list[str],
+        market_data: MarketData | None = None,
+        analysis: FullAnalysis | None = None,
     ) -> dict[str, Any]:
         """Run text-based AI analysis for a single timeframe."""
         try:
             # Use existing AI service for text analysis
             if self.ai_service:
-                result = await self.ai_service.analyze(
-                    symbol=symbol,
-                    timeframe=timeframe,
-                )
+                providers = [
+                    key for key in self.ai_service.provider_names
+                    if any(key.startswith(model) for model in models)
+                ]
+                if not providers:
+                    return {"votes": []}
+                if market_data is not None and analysis is not None:
+                    context = await create_market_context(
+                        symbol=symbol,
+                        timeframe=timeframe,
+                        current_price=market_data.current_price,
+                        indicators=analysis.indicators.to_dict(),
+                        candles=[c.to_dict() for c in market_data.candles[-20:]],
+                        support_levels=analysis.smc.support_levels,
+                        resistance_levels=analysis.smc.resistance_levels,
+                        fetch_real_data=False,
+                    )
+                    context._full_analysis = analysis
+                else:
+                    context = await create_market_context(symbol=symbol, timeframe=timeframe.lower())
+                result = await self.ai_service.analyze(context, providers=providers)
                 return {
-                    "votes": result.get("individual_results", []),
+                    "votes": [
+                        {
+                            "provider": vote.provider_name,
+                            "direction": TEXT_DIRECTIONS[vote.direction.value],
+                            "confidence": vote.confidence,
+                            "reasoning": vote.reasoning,
+                        }
+                        for vote in result.individual_votes
+                        if vote.is_valid
+                    ],
                     "analysis": TimeframeAnalysis(
                         timeframe=timeframe,
-                        direction=result.get("consensus", {}).get("direction", "HOLD"),
-                        confidence=result.get("consensus", {}).get("confidence", 0),
-                        indicators=result.get("indicators", {}),
-                        patterns=result.get("patterns", []),
-                        support_levels=result.get("support_levels", []),
-                        resistance_levels=result.get("resistance_levels", []),
+                        direction=TEXT_DIRECTIONS[result.direction.value],
+                        confidence=result.confidence,
+                        indicators=context.indicators,
+                        patterns=result.key_factors,
+                        support_levels=[float(level) for level in context.support_levels],
+                        resistance_levels=[float(level) for level in context.resistance_levels],
                     )
                 }
         except Exception as e:
@@ -259,23 +332,36 @@ class MultiTimeframeAnalyzer:
         self,
         symbol: str,
         timeframes: list[str],
-        max_models: int = 6
+        max_models: int = 6,
+        market_data: dict[str, MarketData] | None = None,
     ) -> dict[str, Any]:
         """Run vision-based AI analysis across multiple timeframes."""
-        if not self.chart_service or not self.vision_analyzer:
+        if not self.vision_analyzer or not self.chart_service:
             return {"votes": []}
 
         try:
-            # Generate charts for all timeframes
-            charts = await self.chart_service.generate_multi_timeframe_charts(
-                symbol=symbol,
-                timeframes=timeframes
-            )
+            # Charts pre-rendered on bar close first, render the rest now
+            charts = get_chart_prerender_service().get_images(symbol, timeframes, VISION_PRESET)
+            missing = [tf for tf in timeframes if tf not in charts]
+            if missing:
+                charts.update(await self.chart_service.generate_multi_timeframe_charts(
+                    symbol=symbol,
+                    timeframes=missing,
+                    ohlcv_data_map={
+                        tf: market_data[tf].to_dataframe().rename(columns=str.capitalize)
+                        for tf in missing
+                        if market_data and tf in market_data
+                    },
+                ))
+            # Timeframes the renderer skipped (e.g. no candles) are left out
+            charts = {tf: charts[tf] for tf in timeframes if tf in charts}
+            if not charts:
+                return {"votes": []}
 
             # Create vision prompt
             prompt = self.chart_service.create_vision_prompt(
                 symbol=symbol,
-                timeframes=timeframes
+                timeframes=list(charts)
             )
 
             # Run vision analysis on specified number of models
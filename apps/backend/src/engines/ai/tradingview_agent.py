@@ -35,7 +35,12 @@ except ImportError:
     Page = None
     BrowserContext = None
 
+from src.core.bot_logger import get_bot_logger
 from src.core.config import settings
+from src.core.cycle_tracer import trace_span, traced, traced_call
+
+logger = get_bot_logger("TradingViewAgent")
+browser_logger = get_bot_logger("TradingViewBrowser")
 
 
 class DrawingTool(str, Enum):
@@ -295,7 +300,7 @@ class TradingViewBrowser:
 
         self.page = await self.context.new_page()
         self._initialized = True
-        print("[TradingViewBrowser] Initialized successfully")
+        browser_logger.info("Initialized successfully")
 
     async def close(self):
         """Close the browser and cleanup."""
@@ -309,12 +314,13 @@ class TradingViewBrowser:
             if self._playwright:
                 await self._playwright.stop()
         except Exception as e:
-            print(f"[TradingViewBrowser] Error closing: {e}")
+            browser_logger.error(f"Error closing: {e}")
         finally:
             self._initialized = False
             self._current_symbol = None
             self._current_timeframe = None
 
+    @traced("browser")
     async def open_chart(self, symbol: str = "EURUSD", timeframe: str = "15") -> bool:
         """
         Open TradingView chart for a symbol.
@@ -332,11 +338,11 @@ class TradingViewBrowser:
 
             # Build TradingView chart URL
             url = f"https://www.tradingview.com/chart/?symbol={encoded_symbol}&interval={tf_url}"
-            print(f"[TradingViewBrowser] Opening: {url}")
+            browser_logger.info(f"Opening: {url}")
 
             # Navigate with extended timeout
             response = await self.page.goto(url, wait_until="domcontentloaded", timeout=45000)
-            print(f"[TradingViewBrowser] Page loaded with status: {response.status if response else 'unknown'}")
+            browser_logger.info(f"Page loaded with status: {response.status if response else 'unknown'}")
 
             # Wait for chart to be ready - try multiple selectors
             chart_ready = False
@@ -344,10 +350,10 @@ class TradingViewBrowser:
                 try:
                     await self.page.wait_for_selector(selector, timeout=10000)
                     chart_ready = True
-                    print(f"[TradingViewBrowser] Chart found with selector: {selector}")
+                    browser_logger.info(f"Chart found with selector: {selector}")
                     break
                 except Exception as e:
-                    print(f"[TradingViewBrowser] Selector '{selector}' not found: {type(e).__name__}")
+                    browser_logger.debug("Selector '%s' not found: %s", selector, type(e).__name__)
                     continue
 
             if not chart_ready:
@@ -355,12 +361,12 @@ class TradingViewBrowser:
                 try:
                     await self.page.wait_for_selector("canvas", timeout=10000)
                     chart_ready = True
-                    print("[TradingViewBrowser] Chart found via canvas fallback")
+                    browser_logger.warning("Chart found via canvas fallback")
                 except:
-                    print("[TradingViewBrowser] WARNING: No chart canvas found!")
+                    browser_logger.warning("WARNING: No chart canvas found!")
 
             # Extra wait for chart rendering (candlesticks, indicators)
-            print("[TradingViewBrowser] Waiting 4 seconds for chart to fully render...")
+            browser_logger.info("Waiting 4 seconds for chart to fully render...")
             await asyncio.sleep(4)
 
             # Dismiss any popups/modals
@@ -368,7 +374,7 @@ class TradingViewBrowser:
 
             # Verify page content
             title = await self.page.title()
-            print(f"[TradingViewBrowser] Page title: {title}")
+            browser_logger.info(f"Page title: {title}")
 
             self._current_symbol = symbol
             self._current_timeframe = timeframe
@@ -376,9 +382,7 @@ class TradingViewBrowser:
             return chart_ready
 
         except Exception as e:
-            print(f"[TradingViewBrowser] Failed to open chart: {e}")
-            import traceback
-            traceback.print_exc()
+            browser_logger.exception(f"Failed to open chart: {e}")
             return False
 
     async def _dismiss_popups(self):
@@ -409,6 +413,7 @@ class TradingViewBrowser:
         except:
             pass
 
+    @traced("screenshot")
     async def take_screenshot(self) -> str:
         """Take a screenshot of the chart and return base64."""
         try:
@@ -416,8 +421,8 @@ class TradingViewBrowser:
             await self._dismiss_popups()
             await asyncio.sleep(0.5)
 
-            print("[TradingViewBrowser] Attempting to take screenshot...")
-            print(f"[TradingViewBrowser] Current URL: {self.page.url}")
+            browser_logger.info("Attempting to take screenshot...")
+            browser_logger.info(f"Current URL: {self.page.url}")
 
             # Try to screenshot the chart container
             for selector in self.selectors["chart"]:
@@ -426,40 +431,39 @@ class TradingViewBrowser:
                     if chart_element:
                         # Check if element is visible
                         box = await chart_element.bounding_box()
-                        print(f"[TradingViewBrowser] Found chart element with selector '{selector}', box: {box}")
+                        browser_logger.debug("Found chart element with selector '%s', box: %s", selector, box)
                         if box and box['width'] > 100 and box['height'] > 100:
                             screenshot = await chart_element.screenshot()
                             size_kb = len(screenshot) / 1024
-                            print(f"[TradingViewBrowser] Chart screenshot: {len(screenshot)} bytes ({size_kb:.1f} KB) - {box['width']}x{box['height']} px")
+                            browser_logger.info(f"Chart screenshot: {len(screenshot)} bytes ({size_kb:.1f} KB) - {box['width']}x{box['height']} px")
                             if size_kb < 10:
-                                print("[TradingViewBrowser] WARNING: Screenshot is very small, chart may not have loaded properly")
+                                browser_logger.warning("WARNING: Screenshot is very small, chart may not have loaded properly")
                             return base64.b64encode(screenshot).decode('utf-8')
                 except Exception as e:
-                    print(f"[TradingViewBrowser] Selector '{selector}' failed: {e}")
+                    browser_logger.debug("Selector '%s' failed: %s", selector, e)
                     continue
 
             # Fallback: full page screenshot
-            print("[TradingViewBrowser] No chart element found, taking full page screenshot")
+            browser_logger.info("No chart element found, taking full page screenshot")
             screenshot = await self.page.screenshot(full_page=True)
             size_kb = len(screenshot) / 1024
-            print(f"[TradingViewBrowser] Full page screenshot: {len(screenshot)} bytes ({size_kb:.1f} KB)")
+            browser_logger.info(f"Full page screenshot: {len(screenshot)} bytes ({size_kb:.1f} KB)")
             if size_kb < 50:
-                print("[TradingViewBrowser] WARNING: Full page screenshot is very small, page may not have loaded")
+                browser_logger.warning("WARNING: Full page screenshot is very small, page may not have loaded")
             return base64.b64encode(screenshot).decode('utf-8')
 
         except Exception as e:
-            print(f"[TradingViewBrowser] Screenshot failed: {e}")
-            import traceback
-            traceback.print_exc()
+            browser_logger.exception(f"Screenshot failed: {e}")
             return ""
 
+    @traced("browser")
     async def change_timeframe(self, timeframe: str) -> bool:
         """
         Change the chart timeframe.
         Uses keyboard shortcuts (faster than URL navigation).
         """
         try:
-            print(f"[TradingViewBrowser] Changing timeframe to {timeframe}...")
+            browser_logger.info(f"Changing timeframe to {timeframe}...")
 
             # Method 1: Try keyboard shortcut first (faster)
             tf_key = self.TIMEFRAME_KEYS.get(timeframe)
@@ -468,7 +472,7 @@ class TradingViewBrowser:
                 await asyncio.sleep(2)  # Wait for chart to update
                 await self._dismiss_popups()
                 self._current_timeframe = timeframe
-                print(f"[TradingViewBrowser] Timeframe changed to {timeframe} via keyboard (key: {tf_key})")
+                browser_logger.info(f"Timeframe changed to {timeframe} via keyboard (key: {tf_key})")
                 return True
 
             # Method 2: Fallback to URL navigation
@@ -480,31 +484,30 @@ class TradingViewBrowser:
                 tf_url = self.TIMEFRAME_URL.get(timeframe, timeframe)
                 url = f"https://www.tradingview.com/chart/?symbol={symbol}&interval={tf_url}"
 
-                print(f"[TradingViewBrowser] Using URL fallback: {url}")
+                browser_logger.warning(f"Using URL fallback: {url}")
                 await self.page.goto(url, wait_until="domcontentloaded", timeout=30000)
                 await asyncio.sleep(3)
                 await self._dismiss_popups()
 
                 self._current_timeframe = timeframe
-                print(f"[TradingViewBrowser] Timeframe changed to {timeframe} via URL")
+                browser_logger.info(f"Timeframe changed to {timeframe} via URL")
                 return True
 
-            print("[TradingViewBrowser] ERROR: Cannot change timeframe - no keyboard key and no current symbol")
+            browser_logger.error("ERROR: Cannot change timeframe - no keyboard key and no current symbol")
             return False
 
         except Exception as e:
-            print(f"[TradingViewBrowser] Failed to change timeframe: {e}")
-            import traceback
-            traceback.print_exc()
+            browser_logger.exception(f"Failed to change timeframe: {e}")
             return False
 
+    @traced("browser")
     async def add_indicator(self, indicator_name: str, params: dict[str, Any] = None) -> bool:
         """
         Add an indicator to the chart.
         Uses "/" search shortcut (most reliable).
         """
         try:
-            print(f"[TradingViewBrowser] Adding indicator: {indicator_name}")
+            browser_logger.info(f"Adding indicator: {indicator_name}")
 
             # Method 1: Use "/" shortcut to open search, then type indicator name
             await self.page.keyboard.press("/")
@@ -522,11 +525,11 @@ class TradingViewBrowser:
             await self.page.keyboard.press("Escape")
             await asyncio.sleep(0.3)
 
-            print(f"[TradingViewBrowser] Indicator {indicator_name} added")
+            browser_logger.info(f"Indicator {indicator_name} added")
             return True
 
         except Exception as e:
-            print(f"[TradingViewBrowser] Failed to add indicator {indicator_name}: {e}")
+            browser_logger.error(f"Failed to add indicator {indicator_name}: {e}")
             # Try to recover by pressing Escape
             try:
                 await self.page.keyboard.press("Escape")
@@ -534,6 +537,7 @@ class TradingViewBrowser:
                 pass
             return False
 
+    @traced("browser")
     async def remove_all_indicators(self) -> bool:
         """Remove all indicators from the chart."""
         try:
@@ -544,12 +548,12 @@ class TradingViewBrowser:
             # For now, just reload the clean chart
             if self._current_symbol and self._current_timeframe:
                 await self.open_chart(self._current_symbol, self._current_timeframe)
-                print("[TradingViewBrowser] Chart reloaded (indicators cleared)")
+                browser_logger.info("Chart reloaded (indicators cleared)")
                 return True
             return False
 
         except Exception as e:
-            print(f"[TradingViewBrowser] Failed to remove indicators: {e}")
+            browser_logger.error(f"Failed to remove indicators: {e}")
             return False
 
     async def _get_chart_bounds(self) -> dict[str, float] | None:
@@ -578,7 +582,7 @@ class TradingViewBrowser:
         Uses Alt+T shortcut to activate trendline tool.
         """
         try:
-            print(f"[TradingViewBrowser] Drawing trendline from ({start_x},{start_y}) to ({end_x},{end_y})")
+            browser_logger.info(f"Drawing trendline from ({start_x},{start_y}) to ({end_x},{end_y})")
 
             # Activate trendline tool with keyboard shortcut
             await self.page.keyboard.press("Alt+t")
@@ -597,11 +601,11 @@ class TradingViewBrowser:
             # Deselect tool
             await self.page.keyboard.press("Escape")
 
-            print("[TradingViewBrowser] Trendline drawn successfully")
+            browser_logger.info("Trendline drawn successfully")
             return True
 
         except Exception as e:
-            print(f"[TradingViewBrowser] Failed to draw trendline: {e}")
+            browser_logger.error(f"Failed to draw trendline: {e}")
             return False
 
     async def draw_horizontal_line(self, y: int) -> bool:
@@ -610,7 +614,7 @@ class TradingViewBrowser:
         Uses Alt+H shortcut to activate horizontal line tool.
         """
         try:
-            print(f"[TradingViewBrowser] Drawing horizontal line at y={y}")
+            browser_logger.info(f"Drawing horizontal line at y={y}")
 
             # Get chart center X
             bounds = await self._get_chart_bounds()
@@ -627,11 +631,11 @@ class TradingViewBrowser:
             # Deselect
             await self.page.keyboard.press("Escape")
 
-            print("[TradingViewBrowser] Horizontal line drawn successfully")
+            browser_logger.info("Horizontal line drawn successfully")
             return True
 
         except Exception as e:
-            print(f"[TradingViewBrowser] Failed to draw horizontal line: {e}")
+            browser_logger.error(f"Failed to draw horizontal line: {e}")
             return False
 
     async def draw_rectangle(self, x1: int, y1: int, x2: int, y2: int) -> bool:
@@ -640,7 +644,7 @@ class TradingViewBrowser:
         Uses keyboard navigation to find rectangle tool.
         """
         try:
-            print(f"[TradingViewBrowser] Drawing rectangle from ({x1},{y1}) to ({x2},{y2})")
+            browser_logger.info(f"Drawing rectangle from ({x1},{y1}) to ({x2},{y2})")
 
             # TradingView rectangle shortcut - try multiple approaches
             # First try direct shortcut
@@ -660,11 +664,11 @@ class TradingViewBrowser:
             # Deselect
             await self.page.keyboard.press("Escape")
 
-            print("[TradingViewBrowser] Rectangle drawn successfully")
+            browser_logger.info("Rectangle drawn successfully")
             return True
 
         except Exception as e:
-            print(f"[TradingViewBrowser] Failed to draw rectangle: {e}")
+            browser_logger.error(f"Failed to draw rectangle: {e}")
             return False
 
     async def draw_fibonacci(self, start_x: int, start_y: int, end_x: int, end_y: int) -> bool:
@@ -673,7 +677,7 @@ class TradingViewBrowser:
         Uses Alt+F shortcut to activate Fibonacci tool.
         """
         try:
-            print(f"[TradingViewBrowser] Drawing Fibonacci from ({start_x},{start_y}) to ({end_x},{end_y})")
+            browser_logger.info(f"Drawing Fibonacci from ({start_x},{start_y}) to ({end_x},{end_y})")
 
             # Activate Fibonacci tool
             await self.page.keyboard.press("Alt+f")
@@ -692,11 +696,11 @@ class TradingViewBrowser:
             # Deselect
             await self.page.keyboard.press("Escape")
 
-            print("[TradingViewBrowser] Fibonacci drawn successfully")
+            browser_logger.info("Fibonacci drawn successfully")
             return True
 
         except Exception as e:
-            print(f"[TradingViewBrowser] Failed to draw Fibonacci: {e}")
+            browser_logger.error(f"Failed to draw Fibonacci: {e}")
             return False
 
     async def draw_pitchfork(self, x1: int, y1: int, x2: int, y2: int, x3: int, y3: int) -> bool:
@@ -705,7 +709,7 @@ class TradingViewBrowser:
         Requires 3 points: pivot, then two reaction points.
         """
         try:
-            print("[TradingViewBrowser] Drawing Pitchfork with 3 points")
+            browser_logger.info("Drawing Pitchfork with 3 points")
 
             # Activate Pitchfork tool
             await self.page.keyboard.press("Alt+Shift+p")
@@ -726,11 +730,11 @@ class TradingViewBrowser:
             # Deselect
             await self.page.keyboard.press("Escape")
 
-            print("[TradingViewBrowser] Pitchfork drawn successfully")
+            browser_logger.info("Pitchfork drawn successfully")
             return True
 
         except Exception as e:
-            print(f"[TradingViewBrowser] Failed to draw Pitchfork: {e}")
+            browser_logger.error(f"Failed to draw Pitchfork: {e}")
             return False
 
     async def draw_supply_demand_zone(self, x1: int, y1: int, x2: int, y2: int, zone_type: str = "supply") -> bool:
@@ -757,7 +761,7 @@ class TradingViewBrowser:
                 await asyncio.sleep(0.2)
             return True
         except Exception as e:
-            print(f"[TradingViewBrowser] Failed to zoom: {e}")
+            browser_logger.error(f"Failed to zoom: {e}")
             return False
 
     async def scroll_chart(self, direction: str = "left", pixels: int = 200) -> bool:
@@ -777,7 +781,7 @@ class TradingViewBrowser:
 
             return True
         except Exception as e:
-            print(f"[TradingViewBrowser] Failed to scroll: {e}")
+            browser_logger.error(f"Failed to scroll: {e}")
             return False
 
     async def get_price_at_position(self, x: int, y: int) -> float | None:
@@ -1277,10 +1281,10 @@ class TradingViewAIAgent:
                             drawing["x3"], drawing["y3"]
                         )
                     else:
-                        print(f"[TradingViewAgent] Unknown drawing type: {drawing_type}")
+                        logger.info(f"Unknown drawing type: {drawing_type}")
                         continue
                 except KeyError as e:
-                    print(f"[TradingViewAgent] Missing key for {drawing_type}: {e}")
+                    logger.info(f"Missing key for {drawing_type}: {e}")
                     continue
 
                 if success:
@@ -1404,7 +1408,7 @@ Rispondi SOLO con un array JSON di nomi di indicatori (max {max_ind}), es.:
                 return fallback[:max_ind]
 
         except Exception as e:
-            print(f"Error asking AI for indicators: {e}")
+            logger.error(f"Error asking AI for indicators: {e}")
             return fallback[:max_ind]
 
     async def _select_indicators_for_model(
@@ -1516,7 +1520,7 @@ Rispondi SOLO con l'array JSON, nessun altro testo.
                 return []
 
         except Exception as e:
-            print(f"Error asking AI for drawings: {e}")
+            logger.error(f"Error asking AI for drawings: {e}")
             return []
 
     async def _ask_ai_for_analysis(
@@ -1604,7 +1608,7 @@ IMPORTANTE: break_even_trigger e trailing_stop_pips sono OPZIONALI. Usa null qua
                 return {"direction": "HOLD", "confidence": 0, "reasoning": text}
 
         except Exception as e:
-            print(f"Error asking AI for analysis: {e}")
+            logger.error(f"Error asking AI for analysis: {e}")
             return {"direction": "HOLD", "confidence": 0, "reasoning": str(e)}
 
     async def _analyze_model_from_screenshot(
@@ -1735,9 +1739,9 @@ IMPORTANTE: break_even_trigger e trailing_stop_pips sono OPZIONALI. Usa null qua
                 text = self._normalize_response_text(raw_content)
                 if not text:
                     # Some models (e.g. Kimi thinking mode) may return content=null
-                    print(f"[{display_name}] Response content was null, skipping")
+                    logger.warning(f"[{display_name}] Response content was null, skipping")
                 else:
-                    print(f"[{display_name}] Raw response length: {len(text)} chars")
+                    logger.debug("[%s] Raw response length: %d chars", display_name, len(text))
 
                 analysis = self._extract_json_object(text)
                 used_fallback = False
@@ -1793,14 +1797,14 @@ IMPORTANTE: break_even_trigger e trailing_stop_pips sono OPZIONALI. Usa null qua
                     result.indicators_used = selected_indicators
 
                     if used_fallback:
-                        print(
+                        logger.warning(
                             f"[{display_name}] Parsed fallback from non-JSON response: "
                             f"{result.direction} @ {result.confidence}% confidence"
                         )
                     else:
-                        print(f"[{display_name}] Parsed: {result.direction} @ {result.confidence}% confidence")
+                        logger.info(f"[{display_name}] Parsed: {result.direction} @ {result.confidence}% confidence")
                 else:
-                    print(f"[{display_name}] No parseable analysis found in response")
+                    logger.info(f"[{display_name}] No parseable analysis found in response")
                     result.direction = "HOLD"
                     result.confidence = 50
                     result.reasoning = f"No structured analysis returned. Raw: {text[:500]}"
@@ -1815,26 +1819,26 @@ IMPORTANTE: break_even_trigger e trailing_stop_pips sono OPZIONALI. Usa null qua
                 error_detail = f" - {e.response.text[:200]}"
             result.error = f"HTTP {e.response.status_code}{error_detail}"
             result.confidence = 0
-            print(f"[{display_name}] HTTP Error {e.response.status_code}{error_detail}")
-            print(f"[{display_name}] Model ID: {model_id}")
+            logger.error(f"[{display_name}] HTTP Error {e.response.status_code}{error_detail}")
+            logger.info(f"[{display_name}] Model ID: {model_id}")
 
             # Check for specific error types
             if e.response.status_code == 400:
-                print(f"[{display_name}] Bad Request - model may not support vision")
+                logger.info(f"[{display_name}] Bad Request - model may not support vision")
             elif e.response.status_code == 429:
-                print(f"[{display_name}] Rate limited - too many requests")
+                logger.warning(f"[{display_name}] Rate limited - too many requests")
             elif e.response.status_code == 401:
-                print(f"[{display_name}] Authentication failed - check API key")
+                logger.error(f"[{display_name}] Authentication failed - check API key")
 
         except httpx.TimeoutException:
             result.error = "Request timed out (90s)"
             result.confidence = 0
-            print(f"[{display_name}] Timeout after 90 seconds")
+            logger.warning(f"[{display_name}] Timeout after 90 seconds")
 
         except Exception as e:
             result.error = str(e)
             result.confidence = 0
-            print(f"[{display_name}] Unexpected error: {type(e).__name__}: {e}")
+            logger.error(f"[{display_name}] Unexpected error: {type(e).__name__}: {e}")
 
         result.latency_ms = int((datetime.now() - start_time).total_seconds() * 1000)
         result.screenshots.append(screenshot)
@@ -1852,7 +1856,7 @@ IMPORTANTE: break_even_trigger e trailing_stop_pips sono OPZIONALI. Usa null qua
         results = []
 
         for model_key in self.VISION_MODELS.keys():
-            print(f"Analyzing with {self.MODEL_DISPLAY_NAMES[model_key]}...")
+            logger.info(f"Analyzing with {self.MODEL_DISPLAY_NAMES[model_key]}...")
 
             # Clean up chart for next AI (remove drawings/indicators)
             if self.browser and self.browser._initialized:
@@ -1903,21 +1907,21 @@ IMPORTANTE: break_even_trigger e trailing_stop_pips sono OPZIONALI. Usa null qua
         all_results: list[TradingViewAnalysisResult] = []
         timeframe_analyses: dict[str, list[TradingViewAnalysisResult]] = {tf: [] for tf in timeframes}
 
-        print(f"\n{'='*60}")
-        print(f"TradingView AI Agent - Mode: {mode.upper()} (Parallel)")
-        print(f"Symbol: {symbol}")
-        print(f"Timeframes: {', '.join(timeframes)}")
-        print(f"AI Models: {', '.join([self.MODEL_DISPLAY_NAMES[k] for k in model_keys])}")
-        print(f"Max Indicators: {self.max_indicators} (TradingView Free plan)")
-        print(f"{'='*60}\n")
+        logger.info(f"\n{'='*60}")
+        logger.info(f"TradingView AI Agent - Mode: {mode.upper()} (Parallel)")
+        logger.info(f"Symbol: {symbol}")
+        logger.info(f"Timeframes: {', '.join(timeframes)}")
+        logger.info(f"AI Models: {', '.join([self.MODEL_DISPLAY_NAMES[k] for k in model_keys])}")
+        logger.info(f"Max Indicators: {self.max_indicators} (TradingView Free plan)")
+        logger.info(f"{'='*60}\n")
 
         # CRITICAL: Open the chart FIRST before any analysis
         if self.browser and self.browser._initialized:
             first_tf = timeframes[0]
-            print(f"[TradingViewAgent] Opening chart for {symbol} on {first_tf} timeframe...")
+            logger.info(f"Opening chart for {symbol} on {first_tf} timeframe...")
             chart_opened = await self.browser.open_chart(symbol, first_tf)
             if not chart_opened:
-                print(f"[TradingViewAgent] ERROR: Failed to open chart for {symbol}")
+                logger.error(f"ERROR: Failed to open chart for {symbol}")
                 return {
                     "direction": "HOLD",
                     "confidence": 0,
@@ -1926,9 +1930,9 @@ IMPORTANTE: break_even_trigger e trailing_stop_pips sono OPZIONALI. Usa null qua
                     "total_models": 0,
                     "error": "Failed to open TradingView chart"
                 }
-            print("[TradingViewAgent] Chart opened successfully!")
+            logger.info("Chart opened successfully!")
         else:
-            print("[TradingViewAgent] ERROR: Browser not initialized!")
+            logger.error("ERROR: Browser not initialized!")
             return {
                 "direction": "HOLD",
                 "confidence": 0,
@@ -1943,14 +1947,14 @@ IMPORTANTE: break_even_trigger e trailing_stop_pips sono OPZIONALI. Usa null qua
         # 2) Build one screenshot per-model with those indicators applied
         # 3) Run model analysis in parallel on those prepared screenshots
         for tf_index, tf in enumerate(timeframes):
-            print(f"\n--- Analyzing {symbol} on {tf} timeframe with {len(model_keys)} models ---")
+            logger.info(f"\n--- Analyzing {symbol} on {tf} timeframe with {len(model_keys)} models ---")
 
             # Prepare a clean chart snapshot for this timeframe
             base_screenshot = None
             if self.browser and self.browser._initialized:
                 # Only change timeframe if not the first one (already set in open_chart)
                 if tf_index > 0:
-                    print(f"[TradingViewAgent] Changing to {tf} timeframe...")
+                    logger.info(f"Changing to {tf} timeframe...")
                     await self.browser.change_timeframe(tf)
                     await asyncio.sleep(2)  # Wait for chart to fully update
 
@@ -1960,12 +1964,16 @@ IMPORTANTE: break_even_trigger e trailing_stop_pips sono OPZIONALI. Usa null qua
                 base_screenshot = await self.browser.take_screenshot()
 
             if not base_screenshot:
-                print(f"  [WARNING] Could not capture screenshot for {tf} timeframe")
+                logger.warning(f"  [WARNING] Could not capture screenshot for {tf} timeframe")
                 continue
 
             # Step 1: Ask each model which indicators it wants for this market/timeframe.
             indicator_tasks = [
-                self._select_indicators_for_model(model_key, base_screenshot, symbol, tf)
+                traced_call(
+                    "llm", "select_indicators",
+                    self._select_indicators_for_model(model_key, base_screenshot, symbol, tf),
+                    model=model_key, timeframe=tf,
+                )
                 for model_key in model_keys
             ]
             indicator_choices = await asyncio.gather(*indicator_tasks, return_exceptions=True)
@@ -1976,7 +1984,7 @@ IMPORTANTE: break_even_trigger e trailing_stop_pips sono OPZIONALI. Usa null qua
                 selected: list[str]
                 choice = indicator_choices[idx]
                 if isinstance(choice, Exception):
-                    print(f"  [WARNING] Indicator selection failed for {model_key}: {choice}")
+                    logger.warning(f"  [WARNING] Indicator selection failed for {model_key}: {choice}")
                     selected = self._default_indicators_for_model(model_key)
                 else:
                     selected = self._sanitize_indicators(choice, fallback=self._default_indicators_for_model(model_key))
@@ -1994,24 +2002,28 @@ IMPORTANTE: break_even_trigger e trailing_stop_pips sono OPZIONALI. Usa null qua
                     if success:
                         added.append(indicator)
                     else:
-                        print(f"  [!] {model_key}: failed to add indicator '{indicator}'")
+                        logger.warning(f"  [!] {model_key}: failed to add indicator '{indicator}'")
 
                 # Keep the model flowing even if one/all indicators fail to render.
                 await asyncio.sleep(0.6)
                 model_screenshot = await self.browser.take_screenshot() or base_screenshot
                 final_indicators = added if added else selected
-                print(f"  [{self.MODEL_DISPLAY_NAMES.get(model_key, model_key)}] indicators: {', '.join(final_indicators)}")
+                logger.info(f"  [{self.MODEL_DISPLAY_NAMES.get(model_key, model_key)}] indicators: {', '.join(final_indicators)}")
                 model_payloads.append((model_key, model_screenshot, final_indicators))
 
             # Clear chart before moving to next timeframe.
             if self.browser and self.browser._initialized and tf_index < len(timeframes) - 1:
-                print("[TradingViewAgent] Clearing indicators for next timeframe...")
+                logger.info("Clearing indicators for next timeframe...")
                 await self.browser.remove_all_indicators()
 
             # Step 3: Run all model analyses in parallel using model-specific screenshots.
-            print(f"  Sending {len(model_payloads)} model-specific screenshots to AI models...")
+            logger.info(f"  Sending {len(model_payloads)} model-specific screenshots to AI models...")
             tasks = [
-                self._analyze_model_from_screenshot(model_key, screenshot, symbol, tf, indicators_used=indicators)
+                traced_call(
+                    "llm", "analyze_screenshot",
+                    self._analyze_model_from_screenshot(model_key, screenshot, symbol, tf, indicators_used=indicators),
+                    model=model_key, timeframe=tf,
+                )
                 for model_key, screenshot, indicators in model_payloads
             ]
             tf_results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -2019,19 +2031,20 @@ IMPORTANTE: break_even_trigger e trailing_stop_pips sono OPZIONALI. Usa null qua
             # Process results
             for result in tf_results:
                 if isinstance(result, Exception):
-                    print(f"  [ERROR] Model analysis failed: {result}")
+                    logger.error(f"  [ERROR] Model analysis failed: {result}")
                     continue
                 all_results.append(result)
                 timeframe_analyses[tf].append(result)
-                print(f"  [{result.model_display_name}] {tf}: {result.direction} ({result.confidence}% confidence)")
+                logger.info(f"  [{result.model_display_name}] {tf}: {result.direction} ({result.confidence}% confidence)")
 
-        # Calculate consensus per timeframe
-        tf_consensus = {}
-        for tf, results in timeframe_analyses.items():
-            tf_consensus[tf] = self._calculate_timeframe_consensus(results)
+        with trace_span("consensus", "tradingview_consensus", models=len(all_results)):
+            # Calculate consensus per timeframe
+            tf_consensus = {}
+            for tf, results in timeframe_analyses.items():
+                tf_consensus[tf] = self._calculate_timeframe_consensus(results)
 
-        # Calculate overall consensus
-        overall_consensus = self.calculate_consensus(all_results)
+            # Calculate overall consensus
+            overall_consensus = self.calculate_consensus(all_results)
 
         # Add multi-timeframe specific data
         overall_consensus["mode"] = mode
@@ -2051,14 +2064,14 @@ IMPORTANTE: break_even_trigger e trailing_stop_pips sono OPZIONALI. Usa null qua
             overall_consensus["timeframe_alignment"] = 0
             overall_consensus["is_aligned"] = False
 
-        print(f"\n{'='*60}")
-        print(f"Analysis Complete - {mode.upper()} Mode")
-        print(f"Direction: {overall_consensus['direction']}")
-        print(f"Confidence: {overall_consensus['confidence']}%")
-        print(f"Models Agree: {overall_consensus['models_agree']}/{overall_consensus['total_models']}")
-        print(f"Timeframe Alignment: {overall_consensus.get('timeframe_alignment', 0)}%")
-        print(f"Strong Signal: {overall_consensus['is_strong_signal']}")
-        print(f"{'='*60}\n")
+        logger.info(f"\n{'='*60}")
+        logger.info(f"Analysis Complete - {mode.upper()} Mode")
+        logger.info(f"Direction: {overall_consensus['direction']}")
+        logger.info(f"Confidence: {overall_consensus['confidence']}%")
+        logger.info(f"Models Agree: {overall_consensus['models_agree']}/{overall_consensus['total_models']}")
+        logger.info(f"Timeframe Alignment: {overall_consensus.get('timeframe_alignment', 0)}%")
+        logger.info(f"Strong Signal: {overall_consensus['is_strong_signal']}")
+        logger.info(f"{'='*60}\n")
 
         return overall_consensus
 
@@ -2148,14 +2161,17 @@ IMPORTANTE: break_even_trigger e trailing_stop_pips sono OPZIONALI. Usa null qua
         trailing_stops = [r.trailing_stop_pips for r in agreeing if r.trailing_stop_pips]
 
         # Log raw AI model values BEFORE aggregation (debug)
-        print(f"\n[Consensus] Raw AI values for {direction}:")
+        logger.debug("\n[Consensus] Raw AI values for %s:", direction)
         for r in agreeing:
             tp_val = r.take_profit[0] if r.take_profit else None
-            print(f"  [{r.model_display_name}] Entry={r.entry_price}, SL={r.stop_loss}, TP={tp_val}, BE={r.break_even_trigger}")
+            logger.debug(
+                "  [%s] Entry=%s, SL=%s, TP=%s, BE=%s",
+                r.model_display_name, r.entry_price, r.stop_loss, tp_val, r.break_even_trigger,
+            )
         if stop_losses:
-            print(f"  [Aggregation] SL values: {stop_losses} → median: {statistics.median(stop_losses):.5f}")
+            logger.debug("  [Aggregation] SL values: %s → median: %.5f", stop_losses, statistics.median(stop_losses))
         if take_profits:
-            print(f"  [Aggregation] TP values: {take_profits} → median: {statistics.median(take_profits):.5f}")
+            logger.debug("  [Aggregation] TP values: %s → median: %.5f", take_profits, statistics.median(take_profits))
 
         # Collect all observations and reasoning (full text, no truncation here)
         all_observations = []
@@ -12,6 +12,7 @@ This bot:
 
 import asyncio
 import re
+import time
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -40,15 +41,21 @@ try:
 except ImportError:
     TRADINGVIEW_AGENT_AVAILABLE = False
     TradingViewAIAgent = None
+from src.core.bot_logger import get_bot_logger
 from src.core.config import settings
+from src.core.cycle_tracer import get_cycle_tracer, trace_span, traced_call
+from src.core.log_store import AnalysisLogStore
+from src.engines.trading.bar_close_scheduler import BarCloseScheduler
 from src.engines.trading.base_broker import (
     BaseBroker,
     OrderRequest,
     OrderSide,
     OrderStatus,
     OrderType,
+    default_pip_size,
 )
 from src.engines.trading.broker_factory import BrokerFactory
+from src.services.candle_resampler import timeframe_seconds
 from src.services.economic_calendar_service import (
     EconomicCalendarService,
     EconomicEvent,
@@ -57,6 +64,11 @@ from src.services.economic_calendar_service import (
 )
 from src.services.market_data_service import get_market_data_service
 
+logger = get_bot_logger("AutoTrader")
+
+# A quote younger than this is used for the order without a final re-fetch.
+FRESH_QUOTE_MAX_AGE_SECONDS = 2.0
+
 
 class BotStatus(str, Enum):
     """Bot status states."""
@@ -97,6 +109,30 @@ class TradeRecord:
     extreme_price: float | None = None  # Peak (LONG) / trough (SHORT) reached after entry
     max_favorable_rr: float = 0.0  # Best achieved R-multiple
 
+    # Execution latency (signal = consensus ready)
+    signal_to_order_ms: float | None = None  # Signal -> order sent
+    order_roundtrip_ms: float | None = None  # Order sent -> broker response
+
+
+@dataclass
+class ExecutionContext:
+    """Pre-trade data warmed while the AI analysis for a symbol is running.
+
+    Lets the order path run on local computation plus the order call itself.
+    """
+    symbol: str
+    warmed_at: datetime
+    warm_ms: float = 0.0
+    tick: Any | None = None
+    broker_spec: dict[str, Any] | None = None
+    account_info: Any | None = None
+    dynamic_rr: tuple[float, str] | None = None
+    tradable: dict[str, tuple[bool, str]] = field(default_factory=dict)  # "LONG"/"SHORT"
+    errors: list[str] = field(default_factory=list)
+
+    def age_seconds(self) -> float:
+        return (datetime.utcnow() - self.warmed_at).total_seconds()
+
 
 @dataclass
 class BotConfig:
@@ -107,6 +143,11 @@ class BotConfig:
     # Analysis settings
     analysis_mode: AnalysisMode = AnalysisMode.PREMIUM
     analysis_interval_seconds: int = 300  # 5 minutes
+    # "bar_close": analyze a symbol when a bar of the trigger timeframe closes
+    # (open positions are still managed every analysis_interval_seconds)
+    # "interval": analyze every symbol each analysis_interval_seconds
+    analysis_trigger: str = "bar_close"
+    analysis_timeframe: str | None = None  # Trigger timeframe, e.g. "15m" (default: fastest of the mode)
 
     # TradingView AI Agent - UNICO motore di analisi
     # Usa Playwright per aprire TradingView.com reale e fare screenshot
@@ -158,16 +199,7 @@ class BotConfig:
     metaapi_token: str | None = None
     metaapi_account_id: str | None = None
     broker_credentials: dict[str, str] = field(default_factory=dict)
-
-
-@dataclass
-class AnalysisLogEntry:
-    """Log entry for AI analysis activity."""
-    timestamp: datetime
-    symbol: str
-    log_type: str  # "info", "analysis", "trade", "skip", "error", "news"
-    message: str
-    details: dict[str, Any] | None = None
+    broker_label: str | None = None  # Order telemetry label (e.g. "broker-12")
 
 
 @dataclass
@@ -182,7 +214,8 @@ class BotState:
     open_positions: list[TradeRecord] = field(default_factory=list)
     trade_history: list[TradeRecord] = field(default_factory=list)
     errors: list[dict[str, Any]] = field(default_factory=list)
-    analysis_logs: list[AnalysisLogEntry] = field(default_factory=list)  # AI reasoning logs
+    analysis_logs: AnalysisLogStore = field(default_factory=AnalysisLogStore)  # AI reasoning logs
+    execution_latencies: list[dict[str, Any]] = field(default_factory=list)  # Per-order timings
 
 
 class AutoTrader:
@@ -206,30 +239,22 @@ class AutoTrader:
         self.broker: BaseBroker | None = None
         self.calendar_service: EconomicCalendarService | None = None
         self._task: asyncio.Task | None = None
+        self._bar_scheduler: BarCloseScheduler | None = None
         self._stop_event = asyncio.Event()
         self._callbacks: list[Callable] = []
         self._last_news_refresh: datetime | None = None
         self._start_stop_lock = asyncio.Lock()
         self._symbol_tradability_cache: dict[tuple[str, str], tuple[bool, str, datetime]] = {}
         self._symbol_price_guard_cache: dict[str, tuple[float, datetime]] = {}
+        self._symbol_spec_cache: dict[str, tuple[dict[str, Any] | None, datetime]] = {}
 
     def configure(self, config: BotConfig):
         """Update bot configuration."""
         self.config = config
 
     def _log_analysis(self, symbol: str, log_type: str, message: str, details: dict[str, Any] | None = None):
-        """Add an analysis log entry visible from the frontend."""
-        entry = AnalysisLogEntry(
-            timestamp=datetime.utcnow(),
-            symbol=symbol,
-            log_type=log_type,
-            message=message,
-            details=details,
-        )
-        self.state.analysis_logs.append(entry)
-        # Keep last 500 entries
-        if len(self.state.analysis_logs) > 500:
-            self.state.analysis_logs = self.state.analysis_logs[-500:]
+        """Add an analysis log entry visible from the frontend (oldest evicted past ANALYSIS_LOG_CAPACITY)."""
+        self.state.analysis_logs.append(symbol, log_type, message, details)
 
     def _get_price_decimals(self, symbol: str, broker_spec: dict[str, Any] | None = None) -> int:
         """Restituisce il numero di decimali corretto per il prezzo dello strumento.
@@ -266,28 +291,7 @@ class AutoTrader:
             pip_size = self._to_float(broker_spec.get("pipSize"))
             if pip_size and pip_size > 0:
                 return pip_size
-        sym = symbol.upper().replace("/", "").replace("_", "")
-
-        # JPY pairs: 1 pip = 0.01
-        if "JPY" in sym:
-            return 0.01
-        # Oro: 1 pip = 0.10 ($)
-        if "XAU" in sym or "GOLD" in sym:
-            return 0.10
-        # Argento: 1 pip = 0.01
-        if "XAG" in sym or "SILVER" in sym:
-            return 0.01
-        # Indici: 1 pip = 1.0 punto
-        if any(idx in sym for idx in ["US30", "US500", "NAS100", "DE40", "UK100", "JP225", "FR40", "EU50"]):
-            return 1.0
-        # Crypto: tipicamente 1 punto o 0.01
-        if any(crypto in sym for crypto in ["BTC", "ETH", "SOL", "BNB"]):
-            return 1.0
-        # Petrolio: 1 pip = 0.01
-        if any(oil in sym for oil in ["WTI", "BRENT", "OIL", "USOIL", "UKOIL"]):
-            return 0.01
-        # Forex standard: 1 pip = 0.0001
-        return 0.0001
+        return default_pip_size(symbol)
 
     def _calculate_pip_info(self, symbol: str, current_price: float, sl_distance: float, broker_spec: dict[str, Any] | None = None) -> tuple:
         """
@@ -803,22 +807,22 @@ class AutoTrader:
             self.state.errors = []
 
         try:
-            print("[AutoTrader] Starting bot initialization...")
+            logger.info("Starting bot initialization...")
 
             # Initialize analyzer (standard multi-timeframe - kept for potential future use)
-            print("[AutoTrader] Initializing multi-timeframe analyzer...")
+            logger.info("Initializing multi-timeframe analyzer...")
             self.analyzer = get_multi_timeframe_analyzer()
             await self.analyzer.initialize()
-            print("[AutoTrader] Multi-timeframe analyzer ready")
+            logger.info("Multi-timeframe analyzer ready")
 
             # Initialize TradingView Agent - UNICO motore di analisi
-            print("[AutoTrader] Initializing TradingView Agent (Playwright browser)...")
+            logger.info("Initializing TradingView Agent (Playwright browser)...")
             self._log_analysis("SYSTEM", "info", "🌐 Avvio TradingView Agent con browser Playwright...")
 
             if not TRADINGVIEW_AGENT_AVAILABLE:
                 error_msg = "❌ Playwright non disponibile. Installa con: pip install playwright && playwright install chromium"
                 self._log_analysis("SYSTEM", "error", error_msg)
-                print(f"[AutoTrader] FATAL: {error_msg}")
+                logger.error(f"FATAL: {error_msg}")
                 raise RuntimeError(error_msg)
 
             self.tradingview_agent = await get_tradingview_agent(
@@ -826,10 +830,10 @@ class AutoTrader:
                 max_indicators=self.config.tradingview_max_indicators
             )
             self._log_analysis("SYSTEM", "info", "✅ TradingView Agent pronto - analisi su dati reali TradingView")
-            print("[AutoTrader] TradingView Agent ready")
+            logger.info("TradingView Agent ready")
 
             # Initialize broker
-            print("[AutoTrader] Initializing broker connection...")
+            logger.info("Initializing broker connection...")
             broker_type = self.config.broker_type or "metatrader"
             broker_kwargs = dict(self.config.broker_credentials or {})
 
@@ -845,22 +849,28 @@ class AutoTrader:
                 }
 
             if broker_kwargs:
-                print(f"[AutoTrader] Using broker credentials from config ({broker_type})")
+                logger.info(f"Using broker credentials from config ({broker_type})")
                 self.broker = BrokerFactory.create(
                     broker_type=broker_type,
+                    telemetry_label=self.config.broker_label,
                     **broker_kwargs,
                 )
             else:
-                print("[AutoTrader] Using broker credentials from environment variables")
-                self.broker = BrokerFactory.create(broker_type=broker_type)
+                logger.info("Using broker credentials from environment variables")
+                self.broker = BrokerFactory.create(
+                    broker_type=broker_type,
+                    telemetry_label=self.config.broker_label,
+                )
             await self.broker.connect()
             self._symbol_tradability_cache.clear()
             self._symbol_price_guard_cache.clear()
-            print("[AutoTrader] Broker connected")
+            self._symbol_spec_cache.clear()
+            logger.info("Broker connected")
+            await self._warm_symbol_specs()
 
             # Initialize economic calendar service (news filter)
             if self.config.news_filter_enabled:
-                print("[AutoTrader] Initializing news filter...")
+                logger.info("Initializing news filter...")
                 self.calendar_service = get_economic_calendar_service()
                 self.calendar_service.configure(NewsFilterConfig(
                     enabled=self.config.news_filter_enabled,
@@ -872,34 +882,32 @@ class AutoTrader:
                 ))
                 try:
                     await self.calendar_service.fetch_events()
-                    print(f"[AutoTrader] News filter enabled: {self.config.news_minutes_before}min before, {self.config.news_minutes_after}min after")
+                    logger.info(f"News filter enabled: {self.config.news_minutes_before}min before, {self.config.news_minutes_after}min after")
                 except Exception as news_err:
                     # Non-critical error - continue without news filter
-                    print(f"[AutoTrader] Warning: Could not fetch news events: {news_err}")
+                    logger.warning(f"Warning: Could not fetch news events: {news_err}")
 
             # Check API key configuration and warn in logs
             if not settings.AIML_API_KEY:
                 warning_msg = "⚠️ AIML_API_KEY NON CONFIGURATA! Le analisi AI NON faranno chiamate API reali. I crediti API non scaleranno. Configura AIML_API_KEY nelle variabili d'ambiente."
-                print(f"[AutoTrader] {warning_msg}")
+                logger.warning(warning_msg)
                 self._log_analysis("SYSTEM", "error", warning_msg)
             else:
                 key_preview = settings.AIML_API_KEY[:8] + "..." if len(settings.AIML_API_KEY) > 8 else "***"
                 self._log_analysis("SYSTEM", "info", f"✅ AIML API Key configurata ({key_preview}) - Le chiamate AI saranno reali")
-                print(f"[AutoTrader] AIML API key configured: {key_preview}")
+                logger.info(f"AIML API key configured: {key_preview}")
 
             # Start main loop
-            print("[AutoTrader] Starting main trading loop...")
+            logger.info("Starting main trading loop...")
             self._stop_event.clear()
             self._task = asyncio.create_task(self._main_loop())
             self.state.status = BotStatus.RUNNING
 
             await self._notify(f"🤖 Bot started (TradingView AI Agent). Monitoring: {', '.join(self.config.symbols)}")
-            print("[AutoTrader] Bot started successfully with TradingView AI Agent")
+            logger.info("Bot started successfully with TradingView AI Agent")
 
         except Exception as e:
-            import traceback
-            print(f"[AutoTrader] ERROR during start: {str(e)}")
-            print(f"[AutoTrader] Full traceback:\n{traceback.format_exc()}")
+            logger.exception(f"ERROR during start: {str(e)}")
             self.state.status = BotStatus.ERROR
             self.state.errors.append({
                 "timestamp": datetime.utcnow().isoformat(),
@@ -951,6 +959,8 @@ class AutoTrader:
                 "smart_exit_min_rr": self.config.smart_exit_min_rr,
                 "smart_exit_drawdown_percent": self.config.smart_exit_drawdown_percent,
                 "analysis_engine": "TradingView AI Agent",
+                "analysis_trigger": self.config.analysis_trigger,
+                "analysis_timeframe": self.config.analysis_timeframe,
                 "enabled_models": self.config.enabled_models,
             },
             "statistics": {
@@ -970,51 +980,96 @@ class AutoTrader:
                 }
                 for p in self.state.open_positions
             ],
+            "bar_close_scheduler": self._bar_scheduler.get_stats() if self._bar_scheduler else None,
             "recent_errors": self.state.errors[-5:],
-            "analysis_logs": [
-                {
-                    "timestamp": log.timestamp.isoformat(),
-                    "symbol": log.symbol,
-                    "type": log.log_type,
-                    "message": log.message,
-                    "details": log.details,
-                }
-                for log in self.state.analysis_logs[-30:]  # Last 30 entries
-            ],
+            "recent_executions": self.state.execution_latencies[-10:],
+            "analysis_logs": [log.to_dict() for log in self.state.analysis_logs.latest(30)],
         }
 
+    def _trigger_timeframe_seconds(self) -> int:
+        """Bar length that triggers analysis (fastest timeframe of the mode by default)."""
+        timeframe = self.config.analysis_timeframe
+        if not timeframe and TradingViewAIAgent is not None:
+            mode = TradingViewAIAgent.MODE_CONFIG.get(self.config.analysis_mode.value.lower(), {})
+            timeframe = (mode.get("timeframes") or ["15"])[0]
+        # TradingView notation: "15" = 15 minutes, "D" = daily, "W" = weekly
+        timeframe = str(timeframe or "15m")
+        timeframe = {"D": "1d", "W": "1w"}.get(timeframe.upper(), timeframe)
+        if timeframe.isdigit():
+            timeframe = f"{timeframe}m"
+        return timeframe_seconds(timeframe) or 900
+
+    async def _sync_bar_scheduler(self) -> BarCloseScheduler | None:
+        """Bar-close scheduler matching the current config (rebuilt when symbols/timeframe change)."""
+        scheduler = self._bar_scheduler
+        wanted = None
+        if self.config.analysis_trigger == "bar_close":
+            symbols = list(dict.fromkeys(self._normalize_symbol(s) for s in self.config.symbols))
+            wanted = (symbols, self._trigger_timeframe_seconds())
+        if scheduler is not None and (wanted is None or (scheduler.symbols, scheduler.seconds) != wanted):
+            await scheduler.stop()
+            scheduler = self._bar_scheduler = None
+        if wanted is not None and scheduler is None:
+            scheduler = self._bar_scheduler = BarCloseScheduler(self.broker, *wanted)
+            scheduler.start()
+            self._log_analysis(
+                "ALL", "info",
+                f"Analisi alla chiusura di ogni candela ({scheduler.seconds // 60} min) per {len(scheduler.symbols)} asset",
+            )
+        return scheduler
+
     async def _main_loop(self):
         """Main trading loop."""
-        while not self._stop_event.is_set():
-            try:
-                # Check trading hours
-                if not self._is_trading_hours():
-                    await asyncio.sleep(60)  # Check every minute
-                    continue
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    scheduler = await self._sync_bar_scheduler()
+                    closed = None
+                    if scheduler is not None:
+                        # Bar closes of the trigger timeframe, or a timeout to manage open positions.
+                        closed = await scheduler.wait(timeout=self.config.analysis_interval_seconds)
+
+                    # Check trading hours
+                    if not self._is_trading_hours():
+                        if scheduler is None:
+                            await asyncio.sleep(60)  # Check every minute
+                        continue
 
-                # Check daily limits
-                if self._daily_limits_reached():
-                    await asyncio.sleep(300)  # Check every 5 minutes
-                    continue
+                    # Check daily limits
+                    if self._daily_limits_reached():
+                        if scheduler is None:
+                            await asyncio.sleep(300)  # Check every 5 minutes
+                        continue
 
-                # Only trade if running (not paused)
-                if self.state.status == BotStatus.RUNNING:
-                    await self._analyze_and_trade()
+                    # Only trade if running (not paused)
+                    if self.state.status == BotStatus.RUNNING:
+                        tracer = get_cycle_tracer()
+                        if closed == []:
+                            with tracer.cycle("positions", broker=self.config.broker_label):
+                                await traced_call("positions", "manage_open_positions", self._manage_open_positions())
+                            continue
+                        with tracer.cycle("analysis", broker=self.config.broker_label, trigger=self.config.analysis_trigger):
+                            await self._analyze_and_trade(closed)
 
-                self.state.last_analysis_at = datetime.utcnow()
-                self.state.analyses_today += 1
+                    self.state.last_analysis_at = datetime.utcnow()
+                    self.state.analyses_today += 1
 
-                # Wait for next interval
-                await asyncio.sleep(self.config.analysis_interval_seconds)
+                    # Wait for next interval
+                    if scheduler is None:
+                        await asyncio.sleep(self.config.analysis_interval_seconds)
 
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                self.state.errors.append({
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "error": str(e)
-                })
-                await asyncio.sleep(60)  # Wait before retrying
+                except asyncio.CancelledError:
+                    break
+                except Exception as e:
+                    self.state.errors.append({
+                        "timestamp": datetime.utcnow().isoformat(),
+                        "error": str(e)
+                    })
+                    await asyncio.sleep(60)  # Wait before retrying
+        finally:
+            if self._bar_scheduler is not None:
+                await self._bar_scheduler.stop()
+                self._bar_scheduler = None
 
     async def _manage_open_positions(self):
         """Manage open positions: sync broker state, BE, trailing stop, smart exit."""
@@ -1079,7 +1134,7 @@ class AutoTrader:
                 )
 
         except Exception as e:
-            print(f"[AutoTrader] Error syncing positions with broker: {e}")
+            logger.error(f"Error syncing positions with broker: {e}")
 
         # ====== Gestione posizioni aperte: BE, Trailing Stop, Smart Exit ======
         smart_exit_closed_trades: list[TradeRecord] = []
@@ -1247,7 +1302,7 @@ class AutoTrader:
         if self._last_news_refresh is None or (now - self._last_news_refresh).total_seconds() > 3600:
             await self.calendar_service.fetch_events()
             self._last_news_refresh = now
-            print("[AutoTrader] Economic calendar refreshed")
+            logger.info("Economic calendar refreshed")
 
     def _is_news_blocked(self, symbol: str) -> tuple[bool, EconomicEvent | None]:
         """
@@ -1443,18 +1498,20 @@ class AutoTrader:
         pending_market_orders = 0
         exposed_symbols = set(local_symbols)
 
-        try:
-            broker_positions = await self.broker.get_positions()
+        # Independent reads: issue both at once instead of back to back.
+        broker_positions, open_orders = await asyncio.gather(
+            self.broker.get_positions(),
+            self.broker.get_open_orders(),
+            return_exceptions=True,
+        )
+        if not isinstance(broker_positions, BaseException):
             broker_count = len(broker_positions)
             for pos in broker_positions:
                 canonical = self._canonical_symbol(getattr(pos, "symbol", ""))
                 if canonical:
                     exposed_symbols.add(canonical)
-        except Exception:
-            pass
 
-        try:
-            open_orders = await self.broker.get_open_orders()
+        if not isinstance(open_orders, BaseException):
             for order in open_orders:
                 if (
                     getattr(order, "status", None) == OrderStatus.PENDING
@@ -1464,8 +1521,6 @@ class AutoTrader:
                     canonical = self._canonical_symbol(getattr(order, "symbol", ""))
                     if canonical:
                         exposed_symbols.add(canonical)
-        except Exception:
-            pass
 
         effective_count = max(local_count, broker_count) + pending_market_orders
         return effective_count, exposed_symbols
@@ -1602,29 +1657,141 @@ class AutoTrader:
                 f"Prezzo broker non disponibile ({broker_exc}) e fallback esterno fallito ({external_exc})"
             )
 
-    async def _analyze_and_trade(self):
-        """Analyze all symbols and execute trades if conditions met."""
+    async def _get_symbol_spec_cached(self, symbol: str, max_age_seconds: int = 3600) -> dict[str, Any] | None:
+        """Broker symbol specification with a long-lived cache (specs rarely change)."""
+        key = self._normalize_symbol(symbol).upper()
+        cached = self._symbol_spec_cache.get(key)
+        if cached and (datetime.utcnow() - cached[1]).total_seconds() <= max_age_seconds:
+            return cached[0]
+        if not self.broker or not hasattr(self.broker, "get_symbol_specification"):
+            return None
+        spec = await self.broker.get_symbol_specification(symbol)
+        if spec:
+            # An empty spec means unavailable right now (bridge down, unknown symbol): ask again next time.
+            self._symbol_spec_cache[key] = (spec, datetime.utcnow())
+        return spec
+
+    async def _warm_symbol_specs(self) -> None:
+        """Prefill the spec cache for all configured symbols when the broker offers a bulk call."""
+        if not self.broker or not hasattr(self.broker, "get_symbol_specifications") or not self.config.symbols:
+            return
+        try:
+            specs = await self.broker.get_symbol_specifications(list(self.config.symbols))
+        except Exception as exc:
+            logger.warning(f"Symbol spec warm-up failed: {exc}")
+            return
+        now = datetime.utcnow()
+        for symbol, spec in specs.items():
+            if not spec:
+                continue
+            self._symbol_spec_cache[self._normalize_symbol(symbol).upper()] = (spec, now)
+        logger.info(f"Symbol specs warmed for {len(specs)}/{len(self.config.symbols)} symbols")
+
+    async def _warm_execution_context(self, symbol: str) -> ExecutionContext:
+        """
+        Fetch everything the order path needs while the AI analysis runs:
+        spec, tick, account, tradability per side and volatility RR.
+        Failures are recorded, not raised: the order path falls back to live fetches.
+        """
+        started = time.perf_counter()
+        ctx = ExecutionContext(symbol=symbol, warmed_at=datetime.utcnow())
+        if not self.broker:
+            ctx.errors.append("broker non inizializzato")
+            return ctx
+
+        spec_res, tick_res, account_res, long_res, short_res = await asyncio.gather(
+            self._get_symbol_spec_cached(symbol),
+            self._get_tick_with_external_fallback(symbol),
+            self.broker.get_account_info(),
+            self._check_symbol_side_tradable(symbol, "LONG"),
+            self._check_symbol_side_tradable(symbol, "SHORT"),
+            return_exceptions=True,
+        )
+        for label, value in (("spec", spec_res), ("tick", tick_res), ("account", account_res)):
+            if isinstance(value, BaseException):
+                ctx.errors.append(f"{label}: {value}")
+        ctx.broker_spec = None if isinstance(spec_res, BaseException) else spec_res
+        ctx.tick = None if isinstance(tick_res, BaseException) else tick_res
+        ctx.account_info = None if isinstance(account_res, BaseException) else account_res
+        if not isinstance(long_res, BaseException):
+            ctx.tradable["LONG"] = long_res
+        if not isinstance(short_res, BaseException):
+            ctx.tradable["SHORT"] = short_res
+
+        # Stop distance and margin depend on the live quote: the order path
+        # computes them from the fresh tick it fetches before sizing.
+        if ctx.tick is not None:
+            price = float(ctx.tick.mid)
+            min_rr = max(1.0, float(self.config.min_risk_reward_ratio))
+            max_rr = max(min_rr, float(self.config.max_risk_reward_ratio))
+            try:
+                ctx.dynamic_rr = await self._estimate_dynamic_rr_from_volatility(
+                    symbol=symbol,
+                    current_price=price,
+                    min_rr=min_rr,
+                    max_rr=max_rr,
+                )
+            except Exception as exc:
+                ctx.errors.append(f"rr: {exc}")
+
+        ctx.warm_ms = (time.perf_counter() - started) * 1000
+        return ctx
+
+    def _record_execution_latency(
+        self,
+        symbol: str,
+        signal_at: float | None,
+        order_sent_at: float,
+        order_done_at: float,
+        status: str,
+        warmed: bool,
+    ) -> tuple[float | None, float]:
+        """Store signal-to-order timings for one order (bounded history)."""
+        signal_to_order_ms = (order_sent_at - signal_at) * 1000 if signal_at is not None else None
+        roundtrip_ms = (order_done_at - order_sent_at) * 1000
+        self.state.execution_latencies.append({
+            "timestamp": datetime.utcnow().isoformat(),
+            "symbol": symbol,
+            "status": status,
+            "warm_context": warmed,
+            "signal_to_order_ms": round(signal_to_order_ms, 2) if signal_to_order_ms is not None else None,
+            "order_roundtrip_ms": round(roundtrip_ms, 2),
+        })
+        if len(self.state.execution_latencies) > 200:
+            self.state.execution_latencies = self.state.execution_latencies[-200:]
+        return signal_to_order_ms, roundtrip_ms
+
+    async def _analyze_and_trade(self, closed_symbols: list[str] | None = None):
+        """Analyze symbols (all, or only those whose bar closed) and execute trades if conditions met."""
         # First manage existing positions (BE, Trailing Stop)
-        await self._manage_open_positions()
+        await traced_call("positions", "manage_open_positions", self._manage_open_positions())
 
         # Refresh news calendar periodically
-        await self._refresh_news_calendar()
+        await traced_call("news", "refresh_news_calendar", self._refresh_news_calendar())
 
         # Normalizza simboli da formato UI (EUR/USD) a formato interno (EUR_USD)
         # Il formato interno corrisponde alle chiavi di SYMBOL_ALIASES del broker
         symbols = [self._normalize_symbol(s) for s in self.config.symbols]
+        if closed_symbols is not None:
+            symbols = [s for s in symbols if s in set(closed_symbols)]
 
         self._log_analysis("ALL", "info", f"Inizio ciclo analisi per {len(symbols)} asset: {', '.join(symbols)}")
 
         for symbol in symbols:
             try:
-                can_open, block_reason = await self._can_open_trade_for_symbol(symbol)
+                can_open, block_reason = await traced_call(
+                    "gating", "can_open_trade", self._can_open_trade_for_symbol(symbol), symbol=symbol
+                )
                 if not can_open:
                     self._log_analysis(symbol, "skip", f"Condizioni non soddisfatte: {block_reason}")
                     continue
 
-                long_tradable, long_reason = await self._check_symbol_side_tradable(symbol, "LONG")
-                short_tradable, short_reason = await self._check_symbol_side_tradable(symbol, "SHORT")
+                long_tradable, long_reason = await traced_call(
+                    "gating", "tradable_long", self._check_symbol_side_tradable(symbol, "LONG"), symbol=symbol
+                )
+                short_tradable, short_reason = await traced_call(
+                    "gating", "tradable_short", self._check_symbol_side_tradable(symbol, "SHORT"), symbol=symbol
+                )
                 if not long_tradable and not short_tradable:
                     self._log_analysis(
                         symbol,
@@ -1636,10 +1803,11 @@ class AutoTrader:
                     )
                     continue
                 # NEWS FILTER: Skip if blocked by upcoming/recent news
-                news_blocked, blocking_event = self._is_news_blocked(symbol)
+                with trace_span("gating", "news_filter", symbol=symbol):
+                    news_blocked, blocking_event = self._is_news_blocked(symbol)
                 if news_blocked and blocking_event:
                     self._log_analysis(symbol, "news", f"Bloccato per news: {blocking_event.title} ({blocking_event.currency}, {blocking_event.impact.value})")
-                    print(f"[AutoTrader] ⚠️ Skipping {symbol} due to news: {blocking_event.title} ({blocking_event.currency}, {blocking_event.impact.value})")
+                    logger.info(f"⚠️ Skipping {symbol} due to news: {blocking_event.title} ({blocking_event.currency}, {blocking_event.impact.value})")
                     continue
 
                 self._log_analysis(symbol, "info", f"Avvio analisi AI per {symbol}...")
@@ -1650,11 +1818,26 @@ class AutoTrader:
 
                 self._log_analysis(symbol, "analysis", f"TradingView Agent: analisi {mode_str} su {tv_symbol}")
 
-                consensus = await self.tradingview_agent.analyze_with_mode(
-                    symbol=tv_symbol,
-                    mode=mode_str,
-                    enabled_models=self.config.enabled_models
+                # Warm the pre-trade execution context while the AI models run.
+                warm_task = asyncio.create_task(
+                    traced_call("warm", "execution_context", self._warm_execution_context(symbol), symbol=symbol)
                 )
+                try:
+                    consensus = await traced_call(
+                        "analysis",
+                        "tradingview_agent",
+                        self.tradingview_agent.analyze_with_mode(
+                            symbol=tv_symbol,
+                            mode=mode_str,
+                            enabled_models=self.config.enabled_models
+                        ),
+                        symbol=symbol,
+                        mode=mode_str,
+                    )
+                except BaseException:
+                    warm_task.cancel()
+                    raise
+                signal_at = time.perf_counter()
                 results = consensus.get("all_results", [])
 
                 # Log ogni risultato di ciascun modello AI
@@ -1682,8 +1865,24 @@ class AutoTrader:
 
                 if self._should_enter_tradingview_trade(consensus):
                     self._log_analysis(symbol, "trade", f"TRADE: {consensus.get('direction')} {symbol} @ confidence {consensus.get('confidence', 0):.1f}%")
-                    await self._execute_tradingview_trade(symbol, consensus, results)
+                    try:
+                        execution_context = await warm_task
+                    except Exception:
+                        execution_context = None
+                    await traced_call(
+                        "order",
+                        "execute_trade",
+                        self._execute_tradingview_trade(
+                            symbol,
+                            consensus,
+                            results,
+                            execution_context=execution_context,
+                            signal_at=signal_at,
+                        ),
+                        symbol=symbol,
+                    )
                 else:
+                    warm_task.cancel()
                     rejection_reason = self._get_tradingview_rejection_reason(consensus)
                     self._log_analysis(
                         symbol,
@@ -1700,7 +1899,7 @@ class AutoTrader:
                 })
 
             # Pausa tra i simboli per evitare rate limit Yahoo Finance
-            await asyncio.sleep(2)
+            await traced_call("pause", "between_symbols", asyncio.sleep(2), symbol=symbol)
 
     def _should_enter_trade(self, result: MultiTimeframeResult) -> bool:
         """Check if analysis result meets trading criteria."""
@@ -1738,7 +1937,7 @@ class AutoTrader:
         if len(timeframes) > 1:
             # Require timeframe alignment for multi-TF modes
             if not consensus.get("is_aligned", False):
-                print(f"Trade rejected: Timeframe alignment too low ({consensus.get('timeframe_alignment', 0)}%)")
+                logger.info(f"Trade rejected: Timeframe alignment too low ({consensus.get('timeframe_alignment', 0)}%)")
                 return False
 
         return True
@@ -1785,22 +1984,58 @@ class AutoTrader:
         self,
         symbol: str,
         consensus: dict[str, Any],
-        results: list[TradingViewAnalysisResult]
+        results: list[TradingViewAnalysisResult],
+        execution_context: ExecutionContext | None = None,
+        signal_at: float | None = None,
     ):
-        """Execute a trade based on TradingView AI agent consensus."""
+        """Execute a trade based on TradingView AI agent consensus.
+
+        With a warmed ``execution_context`` the spec/tradability/RR lookups are
+        local; a fresh tick, the exposure check and fresh account equity are
+        fetched in one concurrent round-trip, then the order goes to the broker.
+        The order is never priced or sized from the pre-analysis tick/account.
+        """
         try:
-            import traceback
             from decimal import Decimal
 
+            if signal_at is None:
+                signal_at = time.perf_counter()
+            ctx = execution_context
+            if ctx is not None and ctx.errors:
+                self._log_analysis(symbol, "info", f"Contesto esecuzione parziale: {'; '.join(ctx.errors)}")
+            warm = ctx is not None and ctx.tick is not None and ctx.account_info is not None
+
             direction = consensus.get("direction", "HOLD")
             self._log_analysis(symbol, "trade", f"📋 Esecuzione trade {direction} su {symbol}...")
 
-            can_open, block_reason = await self._can_open_trade_for_symbol(symbol)
+            prefetched_tick = None
+            fresh_account_info = None
+            if warm:
+                # One concurrent round-trip: fresh quote + exposure gate + equity.
+                tick_res, gate_res, account_res = await asyncio.gather(
+                    self._get_tick_with_external_fallback(symbol),
+                    self._can_open_trade_for_symbol(symbol),
+                    self.broker.get_account_info(),
+                    return_exceptions=True,
+                )
+                if isinstance(gate_res, BaseException):
+                    raise gate_res
+                can_open, block_reason = gate_res
+                if not isinstance(tick_res, BaseException):
+                    prefetched_tick = tick_res
+                if not isinstance(account_res, BaseException):
+                    fresh_account_info = account_res
+            else:
+                can_open, block_reason = await self._can_open_trade_for_symbol(symbol)
             if not can_open:
                 self._log_analysis(symbol, "skip", f"Trade annullato prima dell'esecuzione: {block_reason}")
                 return
 
-            side_tradable, side_reason = await self._check_symbol_side_tradable(symbol, str(direction))
+            direction_key = str(direction).upper()
+            if ctx is not None and direction_key in ctx.tradable:
+                side_tradable, side_reason = ctx.tradable[direction_key]
+            else:
+                side_tradable, side_reason = await self._check_symbol_side_tradable(symbol, str(direction))
             if not side_tradable:
                 self._log_analysis(
                     symbol,
@@ -1820,9 +2055,19 @@ class AutoTrader:
             stop_loss = float(stop_loss)
             take_profit = float(take_profit)
 
-            # Get current price
-            self._log_analysis(symbol, "info", f"Recupero prezzo corrente per {symbol}...")
-            tick = await self._get_tick_with_external_fallback(symbol)
+            # Get current price (never the tick warmed before the analysis)
+            if prefetched_tick is not None:
+                tick = prefetched_tick
+            else:
+                self._log_analysis(symbol, "info", f"Recupero prezzo corrente per {symbol}...")
+                try:
+                    tick = await self._get_tick_with_external_fallback(symbol)
+                except Exception as tick_err:
+                    self._log_analysis(
+                        symbol, "error", f"❌ Trade annullato: prezzo aggiornato non disponibile ({tick_err})"
+                    )
+                    return
+            tick_fetched_at = time.perf_counter()
             current_price = float(tick.mid)
             self._log_analysis(symbol, "info", f"Prezzo corrente: {current_price}")
 
@@ -1841,26 +2086,31 @@ class AutoTrader:
             # ====== SPECIFICHE BROKER (fetch anticipato per usarlo in SL/TP rounding) ======
             broker_spec = None
             try:
-                if hasattr(self.broker, 'get_symbol_specification'):
-                    broker_spec = await self.broker.get_symbol_specification(symbol)
-                    if broker_spec:
-                        self._log_analysis(symbol, "info",
-                            f"📋 Specifiche broker: contractSize={broker_spec.get('contractSize')}, "
-                            f"tickValue={broker_spec.get('tickValue')}, tickSize={broker_spec.get('tickSize')}, "
-                            f"pipSize={broker_spec.get('pipSize')}, digits={broker_spec.get('digits')}, "
-                            f"profitCurrency={broker_spec.get('profitCurrency')}")
+                if ctx is not None and ctx.broker_spec is not None:
+                    broker_spec = ctx.broker_spec
+                elif hasattr(self.broker, 'get_symbol_specification'):
+                    broker_spec = await self._get_symbol_spec_cached(symbol)
+                if broker_spec:
+                    self._log_analysis(symbol, "info",
+                        f"📋 Specifiche broker: contractSize={broker_spec.get('contractSize')}, "
+                        f"tickValue={broker_spec.get('tickValue')}, tickSize={broker_spec.get('tickSize')}, "
+                        f"pipSize={broker_spec.get('pipSize')}, digits={broker_spec.get('digits')}, "
+                        f"profitCurrency={broker_spec.get('profitCurrency')}")
             except Exception as spec_err:
                 self._log_analysis(symbol, "info", f"⚠️ Specifiche broker non disponibili: {spec_err}")
 
             # ====== VALIDAZIONE SL/TP rispetto alla direzione ======
             MIN_RR_RATIO = max(1.0, float(self.config.min_risk_reward_ratio))
             MAX_RR_RATIO = max(MIN_RR_RATIO, float(self.config.max_risk_reward_ratio))
-            dynamic_target_rr, dynamic_rr_context = await self._estimate_dynamic_rr_from_volatility(
-                symbol=symbol,
-                current_price=current_price,
-                min_rr=MIN_RR_RATIO,
-                max_rr=MAX_RR_RATIO,
-            )
+            if ctx is not None and ctx.dynamic_rr is not None:
+                dynamic_target_rr, dynamic_rr_context = ctx.dynamic_rr
+            else:
+                dynamic_target_rr, dynamic_rr_context = await self._estimate_dynamic_rr_from_volatility(
+                    symbol=symbol,
+                    current_price=current_price,
+                    min_rr=MIN_RR_RATIO,
+                    max_rr=MAX_RR_RATIO,
+                )
             self._log_analysis(
                 symbol,
                 "info",
@@ -1968,7 +2218,10 @@ class AutoTrader:
                         )
 
             # ====== CALCOLO POSIZIONE (basato su valore pip) ======
-            account_info = await self.broker.get_account_info()
+            if fresh_account_info is not None:
+                account_info = fresh_account_info
+            else:
+                account_info = await self.broker.get_account_info()
             account_balance = float(account_info.balance)
 
             risk_amount = account_balance * (self.config.risk_per_trade_percent / 100)
@@ -2126,24 +2379,29 @@ class AutoTrader:
 
             self._log_analysis(symbol, "trade", f"📊 Ordine: {side.value} {lot_size} lotti | SL: {stop_loss} ({sl_pips:.1f} pips) | TP: {take_profit} | Rischio: ${actual_risk:.2f} ({risk_pct:.2f}%)")
 
-            can_open_now, block_reason_now = await self._can_open_trade_for_symbol(symbol)
-            if not can_open_now:
-                self._log_analysis(symbol, "skip", f"Trade annullato prima dell'invio ordine: {block_reason_now}")
-                return
+            # With a warm context, exposure and quote were fetched together just above
+            # and everything since has been local computation.
+            if not warm:
+                can_open_now, block_reason_now = await self._can_open_trade_for_symbol(symbol)
+                if not can_open_now:
+                    self._log_analysis(symbol, "skip", f"Trade annullato prima dell'invio ordine: {block_reason_now}")
+                    return
 
             # ====== GUARDRAIL FINALE: prezzo fresco + SL/TP dalla parte giusta ======
             # Ri-fetcha il prezzo corrente per evitare che uno stale price
             # faccia passare SL/TP invertiti attraverso la validazione.
-            try:
-                fresh_tick = await self.broker.get_current_price(symbol)
-                fresh_price = float(fresh_tick.mid)
-                if abs(fresh_price - current_price) / max(current_price, 1e-8) > 0.001:
-                    self._log_analysis(symbol, "info",
-                        f"Prezzo aggiornato prima dell'ordine: {current_price} → {fresh_price}")
-                    current_price = fresh_price
-                    tick = fresh_tick
-            except Exception:
-                pass  # Usa il prezzo precedente se il refresh fallisce
+            # Nel percorso warm si salta solo se la quotazione ha meno di FRESH_QUOTE_MAX_AGE_SECONDS.
+            if not warm or time.perf_counter() - tick_fetched_at > FRESH_QUOTE_MAX_AGE_SECONDS:
+                try:
+                    fresh_tick = await self.broker.get_current_price(symbol)
+                    fresh_price = float(fresh_tick.mid)
+                    if abs(fresh_price - current_price) / max(current_price, 1e-8) > 0.001:
+                        self._log_analysis(symbol, "info",
+                            f"Prezzo aggiornato prima dell'ordine: {current_price} → {fresh_price}")
+                        current_price = fresh_price
+                        tick = fresh_tick
+                except Exception:
+                    pass  # Usa il prezzo precedente se il refresh fallisce
 
             # Verifica ASSOLUTA: SL e TP devono essere dalla parte giusta
             if direction == "LONG":
@@ -2185,6 +2443,8 @@ class AutoTrader:
 
             # Retry automatico in caso di margine insufficiente o invalid stops
             order_result = None
+            first_signal_to_order_ms: float | None = None
+            first_roundtrip_ms: float | None = None
             attempt_lot_size = lot_size
             MAX_ORDER_RETRIES = 6
             invalid_stops_retries = 0
@@ -2199,7 +2459,33 @@ class AutoTrader:
                     take_profit=Decimal(str(take_profit)),
                 )
 
+                order_sent_at = time.perf_counter()
                 order_result = await self.broker.place_order(order)
+                signal_to_order_ms, order_roundtrip_ms = self._record_execution_latency(
+                    symbol,
+                    signal_at if attempt == 0 else None,
+                    order_sent_at,
+                    time.perf_counter(),
+                    order_result.status.value,
+                    warm,
+                )
+                if attempt == 0:
+                    self._log_analysis(
+                        symbol,
+                        "info",
+                        (
+                            f"⏱️ Latenza segnale→ordine: {signal_to_order_ms:.1f} ms | "
+                            f"round-trip broker: {order_roundtrip_ms:.1f} ms"
+                            f"{' (contesto pre-caricato)' if warm else ''}"
+                        ),
+                        {
+                            "signal_to_order_ms": signal_to_order_ms,
+                            "order_roundtrip_ms": order_roundtrip_ms,
+                            "warm_context": warm,
+                        },
+                    )
+                    first_signal_to_order_ms = signal_to_order_ms
+                    first_roundtrip_ms = order_roundtrip_ms
 
                 if not order_result.is_rejected:
                     lot_size = attempt_lot_size
@@ -2455,6 +2741,8 @@ class AutoTrader:
                     trailing_stop_pips=trailing_pips,
                     initial_stop_loss=stop_loss,
                     extreme_price=fill_price,
+                    signal_to_order_ms=first_signal_to_order_ms,
+                    order_roundtrip_ms=first_roundtrip_ms,
                 )
 
                 self.state.open_positions.append(trade)
@@ -2474,14 +2762,13 @@ class AutoTrader:
                     or "NESSUNA VARIANTE TRADABILE" in reject_upper
                 ):
                     self._mark_symbol_side_untradable(symbol, side, reject_msg)
-                print(f"[AutoTrader] Order REJECTED for {symbol}: status={order_result.status}, error={reject_msg}, order_id={order_result.order_id}")
+                logger.warning(f"Order REJECTED for {symbol}: status={order_result.status}, error={reject_msg}, order_id={order_result.order_id}")
             else:
                 self._log_analysis(symbol, "info", f"⏳ Ordine in stato: {order_result.status.value} — ID: {order_result.order_id or 'in attesa'}")
 
         except Exception as e:
-            error_detail = traceback.format_exc()
             self._log_analysis(symbol, "error", f"❌ Esecuzione trade fallita: {str(e)}")
-            print(f"[AutoTrader] Trade execution error for {symbol}:\n{error_detail}")
+            logger.exception(f"Trade execution error for {symbol}")
             self.state.errors.append({
                 "timestamp": datetime.utcnow().isoformat(),
                 "symbol": symbol,
@@ -0,0 +1,134 @@
+"""
+Bar Close Scheduler - Wakes the AutoTrader when a candle closes.
+
+Instead of analyzing every symbol on a fixed interval, the AutoTrader waits
+for bar-close events of its trigger timeframe:
+
+- Closes are derived from the broker tick stream: the first tick of a
+  symbol inside a new (session-anchored) bucket closes its previous bar.
+- If the broker cannot stream prices, closes come from a clock aligned to
+  the timeframe, for every symbol.
+- Closes are coalesced into a pending set, so a burst of closes (or closes
+  arriving while an analysis cycle runs) yields each symbol once.
+"""
+
+import asyncio
+import re
+import time
+from typing import Any
+
+from src.engines.trading.base_broker import BaseBroker
+from src.services.candle_resampler import session_shift
+
+
+def _compact(symbol: str) -> str:
+    return re.sub(r"[^A-Z0-9]", "", str(symbol or "").upper())
+
+
+class BarCloseScheduler:
+    """Tracks bar closes per symbol and hands them out as coalesced batches."""
+
+    def __init__(
+        self,
+        broker: BaseBroker | None,
+        symbols: list[str],
+        timeframe_seconds: int,
+        session_offset_minutes: int | None = None,
+        clock_delay_seconds: float = 2.0,
+    ):
+        self.broker = broker
+        self.symbols = list(dict.fromkeys(symbols))
+        self.seconds = timeframe_seconds
+        self.clock_delay = clock_delay_seconds
+        self._shift = session_shift(timeframe_seconds, session_offset_minutes)
+        self._aliases = {_compact(symbol): symbol for symbol in self.symbols}
+        self._buckets: dict[str, int] = {}
+        self._pending: dict[str, None] = {}  # Insertion-ordered set
+        self._event = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self.stats = {"ticks": 0, "closes": 0, "coalesced": 0, "source": "stream"}
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def _bucket(self, timestamp: float) -> int:
+        return (int(timestamp) + self._shift) // self.seconds
+
+    def _resolve(self, symbol: str) -> str | None:
+        """Map a broker tick symbol (e.g. "EURUSDm") back to the requested one."""
+        if symbol in self._aliases.values():
+            return symbol
+        compact = _compact(symbol)
+        if compact in self._aliases:
+            return self._aliases[compact]
+        return next((name for key, name in self._aliases.items() if key and compact.startswith(key)), None)
+
+    def on_tick(self, symbol: str, timestamp: float | None = None) -> None:
+        """Record a tick; the first one in a new bucket closes the previous bar."""
+        self.stats["ticks"] += 1
+        bucket = self._bucket(time.time() if timestamp is None else timestamp)
+        previous = self._buckets.get(symbol)
+        self._buckets[symbol] = bucket
+        if previous is not None and bucket > previous:
+            self.mark_closed(symbol)
+
+    def mark_closed(self, symbol: str) -> None:
+        self.stats["closes"] += 1
+        if symbol in self._pending:
+            self.stats["coalesced"] += 1
+        else:
+            self._pending[symbol] = None
+        self._event.set()
+
+    async def wait(self, timeout: float | None = None) -> list[str]:
+        """Symbols whose bar closed since the last call (empty on timeout)."""
+        if not self._pending:
+            try:
+                await asyncio.wait_for(self._event.wait(), timeout=timeout)
+            except TimeoutError:
+                pass
+        closed = list(self._pending)
+        self._pending.clear()
+        self._event.clear()
+        return closed
+
+    async def _run(self) -> None:
+        try:
+            if self.broker is None:
+                raise RuntimeError("no broker")
+            # Tick arrival time, not the broker's clock: it decides when the bar is over for us.
+            async for tick in self.broker.stream_prices(self.symbols):
+                symbol = self._resolve(tick.symbol)
+                if symbol is not None:
+                    self.on_tick(symbol)
+            reason = "stream ended"
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            reason = str(e) or type(e).__name__
+        print(f"[BarCloseScheduler] Tick stream unavailable ({reason}), following the {self.seconds}s clock")
+        self.stats["source"] = "clock"
+        while True:
+            now = time.time()
+            next_close = (self._bucket(now) + 1) * self.seconds - self._shift
+            await asyncio.sleep(max(0.0, next_close - now) + self.clock_delay)
+            for symbol in self.symbols:
+                self.mark_closed(symbol)
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "timeframe_seconds": self.seconds,
+            "symbols": len(self.symbols),
+            "pending": list(self._pending),
+            **self.stats,
+        }
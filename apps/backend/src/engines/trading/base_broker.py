@@ -192,6 +192,32 @@ class Instrument:
     trading_hours: str | None = None
 
 
+def default_pip_size(symbol: str) -> float:
+    """Fallback pip size by instrument family when the broker gives no spec."""
+    sym = symbol.upper().replace("/", "").replace("_", "")
+
+    # JPY pairs: 1 pip = 0.01
+    if "JPY" in sym:
+        return 0.01
+    # Oro: 1 pip = 0.10 ($)
+    if "XAU" in sym or "GOLD" in sym:
+        return 0.10
+    # Argento: 1 pip = 0.01
+    if "XAG" in sym or "SILVER" in sym:
+        return 0.01
+    # Indici: 1 pip = 1.0 punto
+    if any(idx in sym for idx in ["US30", "US500", "NAS100", "DE40", "UK100", "JP225", "FR40", "EU50"]):
+        return 1.0
+    # Crypto: tipicamente 1 punto o 0.01
+    if any(crypto in sym for crypto in ["BTC", "ETH", "SOL", "BNB"]):
+        return 1.0
+    # Petrolio: 1 pip = 0.01
+    if any(oil in sym for oil in ["WTI", "BRENT", "OIL", "USOIL", "UKOIL"]):
+        return 0.01
+    # Forex standard: 1 pip = 0.0001
+    return 0.0001
+
+
 class BaseBroker(ABC):
     """
     Abstract base class for all broker implementations.
@@ -219,6 +245,7 @@ class BaseBroker(ABC):
     def __init__(self):
         self._connected = False
         self._instruments_cache: dict[str, Instrument] = {}
+        self._order_retries = 0  # Internal resubmissions, read by broker telemetry
 
     @property
     def is_connected(self) -> bool:
@@ -424,6 +451,10 @@ class BaseBroker(ABC):
         """
         return symbol
 
+    def _record_retry(self) -> None:
+        """Count an internal resubmission (new filling mode, re-auth, ...)."""
+        self._order_retries += 1
+
     def denormalize_symbol(self, symbol: str) -> str:
         """
         Convert broker symbol format back to standard.
@@ -12,6 +12,7 @@ import os
 
 from src.engines.trading.alpaca_broker import AlpacaBroker
 from src.engines.trading.base_broker import BaseBroker
+from src.engines.trading.broker_telemetry import InstrumentedBroker
 from src.engines.trading.ig_broker import IGBroker
 from src.engines.trading.metatrader_bridge_broker import MetaTraderBridgeBroker
 from src.engines.trading.metatrader_broker import MetaTraderBroker
@@ -98,6 +99,7 @@ class BrokerFactory:
     def create(
         cls,
         broker_type: str | None = None,
+        telemetry_label: str | None = None,
         **kwargs,
     ) -> BaseBroker:
         """
@@ -106,10 +108,11 @@ class BrokerFactory:
         Args:
             broker_type: Type of broker (oanda, metatrader, ig, ib, alpaca)
                         If not specified, uses BROKER_TYPE from environment
+            telemetry_label: Label for order telemetry (defaults to broker name)
             **kwargs: Additional arguments passed to broker constructor
 
         Returns:
-            BaseBroker instance
+            BaseBroker instance wrapped with order telemetry
 
         Raises:
             NoBrokerConfiguredError: If broker credentials are not configured
@@ -117,6 +120,16 @@ class BrokerFactory:
 
         NOTE: Reads from os.environ directly to support dynamic credential updates.
         """
+        broker = cls._create_broker(broker_type, **kwargs)
+        return InstrumentedBroker(broker, label=telemetry_label)
+
+    @classmethod
+    def _create_broker(
+        cls,
+        broker_type: str | None = None,
+        **kwargs,
+    ) -> BaseBroker:
+        """Build the raw broker adapter for ``create``."""
         # Read from os.environ directly to get dynamically updated values
         broker_type = (broker_type or os.environ.get("BROKER_TYPE", "none")).lower()
 
@@ -0,0 +1,441 @@
+"""
+Broker Telemetry - Order latency, reject rate, slippage and retry metrics.
+
+``BrokerFactory`` wraps every broker it creates in an ``InstrumentedBroker``.
+The wrapper times ``place_order``, ``close_position`` and ``modify_position``,
+classifies the outcome (ok / rejected / error), counts internal resubmissions
+reported by the broker and, for filled orders, measures slippage in pips
+against the requested price (limit/stop orders) or the last quote seen for the
+symbol (market orders). Every other call is delegated untouched.
+
+Stats are kept in memory per (broker label, symbol, operation) and exposed:
+- as Prometheus metrics via ``render_metrics()`` (served at ``/metrics``);
+- as a JSON summary via ``BrokerTelemetry.summary()`` (broker status API).
+
+Inside an AutoTrader cycle every async broker call is also recorded as a
+span of the cycle trace (see cycle_tracer.py).
+
+Broker worker processes keep their own stats; the parent pulls them during
+health checks (``merge_remote``) so both surfaces cover every broker.
+"""
+
+import inspect
+import time
+from bisect import bisect_left
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Iterator
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any
+
+from prometheus_client import CollectorRegistry, generate_latest
+from prometheus_client.core import CounterMetricFamily, HistogramMetricFamily
+from prometheus_client.utils import floatToGoString
+
+from src.core.cycle_tracer import trace_span, traced
+from src.engines.trading.base_broker import (
+    BaseBroker,
+    OrderRequest,
+    OrderResult,
+    OrderSide,
+    OrderStatus,
+    OrderType,
+    Tick,
+    default_pip_size,
+)
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+SLIPPAGE_BUCKETS = (-5.0, -2.0, -1.0, -0.5, 0.0, 0.5, 1.0, 2.0, 5.0, 10.0)
+
+# Quotes older than this are not trusted as a slippage reference.
+_QUOTE_MAX_AGE_SECONDS = 30.0
+# Recent latency samples kept per key for percentiles in the status API.
+_RECENT_SAMPLES = 200
+
+StatsKey = tuple[str, str, str]  # (broker label, symbol, operation)
+
+
+def _percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[int(round(q * (len(ordered) - 1)))]
+
+
+@dataclass
+class OperationStats:
+    """Counters and histograms for one (broker, symbol, operation)."""
+    calls: int = 0
+    rejects: int = 0
+    errors: int = 0
+    retries: int = 0
+    latency_sum: float = 0.0
+    latency_counts: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+    recent_latency_ms: deque = field(default_factory=lambda: deque(maxlen=_RECENT_SAMPLES))
+    slippage_samples: int = 0
+    slippage_sum: float = 0.0
+    slippage_worst: float = 0.0
+    slippage_counts: list[int] = field(default_factory=lambda: [0] * (len(SLIPPAGE_BUCKETS) + 1))
+
+    @property
+    def ok(self) -> int:
+        return self.calls - self.rejects - self.errors
+
+    def observe(self, seconds: float, outcome: str, retries: int = 0) -> None:
+        self.calls += 1
+        if outcome == "rejected":
+            self.rejects += 1
+        elif outcome == "error":
+            self.errors += 1
+        self.retries += max(0, retries)
+        self.latency_sum += seconds
+        self.latency_counts[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.recent_latency_ms.append(seconds * 1000)
+
+    def observe_slippage(self, pips: float) -> None:
+        self.slippage_samples += 1
+        self.slippage_sum += pips
+        if self.slippage_samples == 1 or pips > self.slippage_worst:
+            self.slippage_worst = pips
+        self.slippage_counts[bisect_left(SLIPPAGE_BUCKETS, pips)] += 1
+
+    def merge(self, other: "OperationStats") -> None:
+        self.calls += other.calls
+        self.rejects += other.rejects
+        self.errors += other.errors
+        self.retries += other.retries
+        self.latency_sum += other.latency_sum
+        self.latency_counts = [a + b for a, b in zip(self.latency_counts, other.latency_counts)]
+        self.recent_latency_ms.extend(other.recent_latency_ms)
+        if other.slippage_samples:
+            if not self.slippage_samples or other.slippage_worst > self.slippage_worst:
+                self.slippage_worst = other.slippage_worst
+            self.slippage_samples += other.slippage_samples
+            self.slippage_sum += other.slippage_sum
+            self.slippage_counts = [a + b for a, b in zip(self.slippage_counts, other.slippage_counts)]
+
+    def summary(self) -> dict[str, Any]:
+        recent = list(self.recent_latency_ms)
+        return {
+            "calls": self.calls,
+            "rejects": self.rejects,
+            "errors": self.errors,
+            "reject_rate": round(self.rejects / self.calls, 4) if self.calls else 0.0,
+            "retries": self.retries,
+            "latency_ms": {
+                "avg": round(self.latency_sum * 1000 / self.calls, 1) if self.calls else None,
+                "p50": round(_percentile(recent, 0.50), 1) if recent else None,
+                "p95": round(_percentile(recent, 0.95), 1) if recent else None,
+                "max": round(max(recent), 1) if recent else None,
+            },
+            "slippage_pips": {
+                "samples": self.slippage_samples,
+                "avg": round(self.slippage_sum / self.slippage_samples, 2) if self.slippage_samples else None,
+                "worst": round(self.slippage_worst, 2) if self.slippage_samples else None,
+            },
+        }
+
+
+def _cumulative(bounds: tuple[float, ...], counts: list[int]) -> list[tuple[str, int]]:
+    buckets = []
+    running = 0
+    for bound, count in zip((*bounds, float("inf")), counts):
+        running += count
+        buckets.append((floatToGoString(bound), running))
+    return buckets
+
+
+class BrokerTelemetry:
+    """In-memory telemetry store shared by all instrumented brokers of a process."""
+
+    def __init__(self):
+        self._stats: dict[StatsKey, OperationStats] = {}
+        self._remote: dict[str, dict[StatsKey, OperationStats]] = {}
+
+    def record(
+        self,
+        broker: str,
+        symbol: str,
+        operation: str,
+        seconds: float,
+        outcome: str,
+        retries: int = 0,
+        slippage_pips: float | None = None,
+    ) -> None:
+        stats = self._stats.setdefault((broker, symbol, operation), OperationStats())
+        stats.observe(seconds, outcome, retries)
+        if slippage_pips is not None:
+            stats.observe_slippage(slippage_pips)
+
+    def export(self) -> dict[StatsKey, OperationStats]:
+        """Local stats, for shipping from a worker process to the parent."""
+        return dict(self._stats)
+
+    def merge_remote(self, source: str, stats: dict[StatsKey, OperationStats]) -> None:
+        """Replace the stats last reported by a worker process."""
+        self._remote[source] = dict(stats)
+
+    def items(self) -> Iterator[tuple[StatsKey, OperationStats]]:
+        yield from self._stats.items()
+        for stats in self._remote.values():
+            yield from stats.items()
+
+    def summary(self, broker: str) -> dict[str, Any]:
+        """Per-operation totals plus a per-symbol breakdown for one broker label."""
+        totals: dict[str, OperationStats] = {}
+        by_symbol: dict[str, dict[str, Any]] = {}
+        for (label, symbol, operation), stats in self.items():
+            if label != broker:
+                continue
+            totals.setdefault(operation, OperationStats()).merge(stats)
+            by_symbol.setdefault(symbol, {})[operation] = stats.summary()
+        return {
+            "operations": {operation: stats.summary() for operation, stats in totals.items()},
+            "symbols": by_symbol,
+        }
+
+    def reset(self) -> None:
+        self._stats.clear()
+        self._remote.clear()
+
+
+class _TelemetryCollector:
+    """Prometheus collector that renders ``BrokerTelemetry`` on each scrape."""
+
+    def __init__(self, telemetry: BrokerTelemetry):
+        self._telemetry = telemetry
+
+    def collect(self):
+        labels = ["broker", "symbol", "operation"]
+        latency = HistogramMetricFamily(
+            "broker_order_latency_seconds",
+            "Broker order operation round-trip latency",
+            labels=labels,
+        )
+        requests = CounterMetricFamily(
+            "broker_order_requests",
+            "Broker order operations by outcome",
+            labels=[*labels, "outcome"],
+        )
+        retries = CounterMetricFamily(
+            "broker_order_retries",
+            "Internal order resubmissions performed by the broker adapter",
+            labels=labels,
+        )
+        slippage = HistogramMetricFamily(
+            "broker_slippage_pips",
+            "Fill distance from the requested price in pips (positive = adverse)",
+            labels=labels,
+        )
+        for (broker, symbol, operation), stats in self._telemetry.items():
+            key = [broker, symbol, operation]
+            latency.add_metric(
+                key,
+                _cumulative(LATENCY_BUCKETS, stats.latency_counts),
+                sum_value=stats.latency_sum,
+            )
+            requests.add_metric([*key, "ok"], stats.ok)
+            requests.add_metric([*key, "rejected"], stats.rejects)
+            requests.add_metric([*key, "error"], stats.errors)
+            retries.add_metric(key, stats.retries)
+            if stats.slippage_samples:
+                slippage.add_metric(
+                    key,
+                    _cumulative(SLIPPAGE_BUCKETS, stats.slippage_counts),
+                    sum_value=stats.slippage_sum,
+                )
+        yield from (latency, requests, retries, slippage)
+
+
+def _classify(result: Any) -> str:
+    if isinstance(result, OrderResult):
+        return "rejected" if result.status == OrderStatus.REJECTED else "ok"
+    if result is False:
+        return "rejected"
+    return "ok"
+
+
+class InstrumentedBroker:
+    """
+    Delegating broker wrapper that records order telemetry.
+
+    Behaves like the wrapped ``BaseBroker``: unknown attributes are looked up
+    on the inner broker, so broker-specific extras (symbol specs, deal
+    history, ...) keep working, and public attribute writes go to the inner
+    broker too. Coroutine methods are traced, wrapped once per instance.
+    """
+
+    # Public attributes that live on the wrapper itself.
+    _OWN_ATTRIBUTES = frozenset({"telemetry_label"})
+
+    def __init__(
+        self,
+        broker: BaseBroker,
+        label: str | None = None,
+        telemetry: BrokerTelemetry | None = None,
+    ):
+        self._broker = broker
+        self.telemetry_label = label or broker.name
+        self._telemetry = telemetry or get_broker_telemetry()
+        self._last_quotes: dict[str, tuple[Tick, float]] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "_broker":
+            raise AttributeError(name)
+        attr = getattr(self._broker, name)
+        if name.startswith("_") or not inspect.iscoroutinefunction(attr):
+            return attr
+        wrapped = traced("broker", name)(attr)
+        # Later lookups find it in the instance dict without reaching __getattr__.
+        self.__dict__[name] = wrapped
+        return wrapped
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name.startswith("_") or name in self._OWN_ATTRIBUTES:
+            object.__setattr__(self, name, value)
+            return
+        self.__dict__.pop(name, None)
+        setattr(self._broker, name, value)
+
+    @property
+    def wrapped(self) -> BaseBroker:
+        return self._broker
+
+    async def __aenter__(self):
+        await self._broker.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self._broker.disconnect()
+        return False
+
+    # ==================== Quotes (slippage reference) ====================
+
+    def _remember_quote(self, symbol: str, tick: Tick | None) -> None:
+        if tick is not None:
+            self._last_quotes[symbol] = (tick, time.monotonic())
+
+    async def get_current_price(self, symbol: str) -> Tick:
+        with trace_span("broker", "get_current_price", symbol=symbol):
+            tick = await self._broker.get_current_price(symbol)
+        self._remember_quote(symbol, tick)
+        return tick
+
+    async def get_prices(self, symbols: list[str]) -> dict[str, Tick]:
+        with trace_span("broker", "get_prices"):
+            ticks = await self._broker.get_prices(symbols)
+        for symbol, tick in (ticks or {}).items():
+            self._remember_quote(symbol, tick)
+        return ticks
+
+    async def stream_prices(self, symbols: list[str]) -> AsyncIterator[Tick]:
+        async for tick in self._broker.stream_prices(symbols):
+            self._remember_quote(tick.symbol, tick)
+            yield tick
+
+    def _reference_price(self, order: OrderRequest) -> Decimal | None:
+        if order.order_type == OrderType.LIMIT and order.price is not None:
+            return order.price
+        if order.order_type in (OrderType.STOP, OrderType.STOP_LIMIT) and order.stop_price is not None:
+            return order.stop_price
+        quote = self._last_quotes.get(order.symbol)
+        if quote is None or time.monotonic() - quote[1] > _QUOTE_MAX_AGE_SECONDS:
+            return None
+        tick = quote[0]
+        return tick.ask if order.side == OrderSide.BUY else tick.bid
+
+    @staticmethod
+    def slippage_pips(order: OrderRequest, reference: Decimal, fill: Decimal) -> float:
+        """Signed slippage in pips; positive means the fill was worse than requested."""
+        diff = float(fill - reference)
+        if order.side == OrderSide.SELL:
+            diff = -diff
+        return diff / default_pip_size(order.symbol)
+
+    # ==================== Instrumented operations ====================
+
+    async def _instrumented(
+        self,
+        operation: str,
+        symbol: str,
+        call: Awaitable[Any],
+        order: OrderRequest | None = None,
+        reference: Decimal | None = None,
+    ) -> Any:
+        retries_before = getattr(self._broker, "_order_retries", 0)
+        started = time.perf_counter()
+        outcome = "error"
+        result: Any = None
+        try:
+            with trace_span("order", operation, symbol=symbol, broker=self.telemetry_label):
+                result = await call
+            outcome = _classify(result)
+            return result
+        finally:
+            elapsed = time.perf_counter() - started
+            slippage = None
+            if (
+                order is not None
+                and reference is not None
+                and outcome == "ok"
+                and isinstance(result, OrderResult)
+                and result.average_fill_price is not None
+            ):
+                slippage = self.slippage_pips(order, reference, result.average_fill_price)
+            self._telemetry.record(
+                self.telemetry_label,
+                symbol,
+                operation,
+                elapsed,
+                outcome,
+                retries=getattr(self._broker, "_order_retries", 0) - retries_before,
+                slippage_pips=slippage,
+            )
+
+    async def place_order(self, order: OrderRequest) -> OrderResult:
+        return await self._instrumented(
+            "place_order",
+            order.symbol,
+            self._broker.place_order(order),
+            order=order,
+            reference=self._reference_price(order),
+        )
+
+    async def close_position(self, symbol: str, size: Decimal | None = None) -> OrderResult:
+        return await self._instrumented(
+            "close_position",
+            symbol,
+            self._broker.close_position(symbol, size),
+        )
+
+    async def modify_position(
+        self,
+        symbol: str,
+        stop_loss: Decimal | None = None,
+        take_profit: Decimal | None = None,
+    ) -> bool:
+        return await self._instrumented(
+            "modify_position",
+            symbol,
+            self._broker.modify_position(symbol, stop_loss=stop_loss, take_profit=take_profit),
+        )
+
+
+# Singleton
+_broker_telemetry: BrokerTelemetry | None = None
+_registry: CollectorRegistry | None = None
+
+
+def get_broker_telemetry() -> BrokerTelemetry:
+    """Get or create BrokerTelemetry singleton."""
+    global _broker_telemetry
+    if _broker_telemetry is None:
+        _broker_telemetry = BrokerTelemetry()
+    return _broker_telemetry
+
+
+def render_metrics() -> bytes:
+    """Prometheus text exposition of all broker telemetry."""
+    global _registry
+    if _registry is None:
+        _registry = CollectorRegistry(auto_describe=False)
+        _registry.register(_TelemetryCollector(get_broker_telemetry()))
+    return generate_latest(_registry)
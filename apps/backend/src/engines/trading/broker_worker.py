@@ -0,0 +1,546 @@
+"""
+Broker Worker Processes - Runs AutoTrader instances outside the API event loop.
+
+In ``process`` execution mode every broker (or group of brokers) gets its own
+worker process with a private asyncio loop. CPU-heavy analysis and chart
+rendering for one broker can no longer stall quotes and order management of
+the others.
+
+Control plane:
+- Parent <-> worker traffic goes over a duplex ``multiprocessing`` pipe.
+- Messages are small dicts: ``{"id", "op", "broker_id", "payload"}`` and
+  replies ``{"id", "ok", "result" | "error"}``.
+- The parent keeps a mirrored ``BotState`` per broker so the API surface
+  (``get_broker_status``, ``get_broker_logs``, trade history) stays unchanged.
+  Order telemetry is pulled on every health check the same way.
+
+Workers are supervised: a dead or unresponsive worker is respawned and its
+brokers are reconfigured and restarted if they were running.
+"""
+
+import asyncio
+import itertools
+import multiprocessing
+import threading
+import traceback
+from datetime import datetime
+from multiprocessing.connection import Connection
+from typing import Any
+
+from src.core.config import settings
+from src.engines.trading.auto_trader import AutoTrader, BotConfig, BotState, BotStatus
+from src.engines.trading.base_broker import BaseBroker
+from src.engines.trading.broker_telemetry import get_broker_telemetry
+
+_MP_CONTEXT = multiprocessing.get_context("spawn")
+
+# Consecutive failed pings before an alive-but-stuck worker is recycled.
+_MAX_MISSED_PINGS = 3
+
+
+class BrokerWorkerError(RuntimeError):
+    """Raised when a worker process rejects or cannot serve a command."""
+
+
+# ============ Worker process side ============
+
+class _WorkerRuntime:
+    """Event loop running inside a worker process, hosting one or more AutoTraders."""
+
+    def __init__(self, conn: Connection, worker_key: str):
+        self._conn = conn
+        self._worker_key = worker_key
+        self._traders: dict[int, AutoTrader] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self._shutdown = asyncio.Event()
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        # Daemon thread: a blocking recv() must not hold up interpreter exit.
+        threading.Thread(
+            target=self._read_forever,
+            args=(loop,),
+            name=f"broker-worker-ipc-{self._worker_key}",
+            daemon=True,
+        ).start()
+        await self._shutdown.wait()
+        for trader in list(self._traders.values()):
+            try:
+                await trader.stop()
+            except Exception:
+                pass
+        try:
+            self._conn.close()
+        except Exception:
+            pass
+
+    def _read_forever(self, loop: asyncio.AbstractEventLoop) -> None:
+        while True:
+            try:
+                message = self._conn.recv()
+            except (EOFError, OSError):
+                # Parent went away: shut down instead of trading unsupervised.
+                loop.call_soon_threadsafe(self._shutdown.set)
+                return
+            loop.call_soon_threadsafe(self._dispatch, message)
+
+    def _dispatch(self, message: dict[str, Any]) -> None:
+        task = asyncio.create_task(self._handle(message))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _reply(self, payload: dict[str, Any]) -> None:
+        try:
+            self._conn.send(payload)
+        except (OSError, ValueError):
+            self._shutdown.set()
+
+    def _trader(self, broker_id: int) -> AutoTrader:
+        trader = self._traders.get(broker_id)
+        if trader is None:
+            trader = AutoTrader()
+            self._traders[broker_id] = trader
+        return trader
+
+    async def _handle(self, message: dict[str, Any]) -> None:
+        request_id = message.get("id")
+        op = message.get("op")
+        broker_id = message.get("broker_id")
+        payload = message.get("payload")
+        try:
+            result: Any = None
+            if op == "ping":
+                result = {"worker": self._worker_key, "brokers": sorted(self._traders)}
+            elif op == "configure":
+                self._trader(broker_id).configure(payload)
+            elif op == "start":
+                await self._trader(broker_id).start()
+                result = self._trader(broker_id).state
+            elif op == "stop":
+                await self._trader(broker_id).stop()
+                result = self._trader(broker_id).state
+            elif op == "pause":
+                await self._trader(broker_id).pause()
+                result = self._trader(broker_id).state
+            elif op == "resume":
+                await self._trader(broker_id).resume()
+                result = self._trader(broker_id).state
+            elif op == "snapshot":
+                result = {
+                    bid: trader.state
+                    for bid, trader in self._traders.items()
+                    if broker_id is None or bid == broker_id
+                }
+            elif op == "telemetry":
+                result = get_broker_telemetry().export()
+            elif op == "release":
+                trader = self._traders.pop(broker_id, None)
+                if trader is not None:
+                    await trader.stop()
+            elif op == "shutdown":
+                self._shutdown.set()
+            else:
+                raise BrokerWorkerError(f"Unknown worker op: {op}")
+            self._reply({"id": request_id, "ok": True, "result": result})
+        except Exception as exc:
+            self._reply({
+                "id": request_id,
+                "ok": False,
+                "error": f"{type(exc).__name__}: {exc}",
+                "traceback": traceback.format_exc(),
+            })
+
+
+def _worker_entry(conn: Connection, worker_key: str) -> None:
+    """Process entry point (must be importable for the spawn start method)."""
+    print(f"[BrokerWorker:{worker_key}] Worker process started")
+    try:
+        asyncio.run(_WorkerRuntime(conn, worker_key).run())
+    except KeyboardInterrupt:
+        pass
+    print(f"[BrokerWorker:{worker_key}] Worker process exited")
+
+
+# ============ Parent side ============
+
+class BrokerWorker:
+    """Parent-side handle for one worker process and its IPC pipe."""
+
+    def __init__(self, worker_key: str):
+        self.worker_key = worker_key
+        self.broker_ids: set[int] = set()
+        self.restarts = 0
+        self.started_at: datetime | None = None
+        self.missed_pings = 0
+        self._process: multiprocessing.process.BaseProcess | None = None
+        self._conn: Connection | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._pending: dict[int, asyncio.Future] = {}
+        self._ids = itertools.count(1)
+        self._send_lock = threading.Lock()
+
+    @property
+    def pid(self) -> int | None:
+        return self._process.pid if self._process else None
+
+    def is_alive(self) -> bool:
+        return bool(self._process and self._process.is_alive())
+
+    async def spawn(self) -> None:
+        """Start (or restart) the worker process."""
+        await self.stop_process()
+        self._loop = asyncio.get_running_loop()
+        parent_conn, child_conn = _MP_CONTEXT.Pipe(duplex=True)
+        process = _MP_CONTEXT.Process(
+            target=_worker_entry,
+            args=(child_conn, self.worker_key),
+            name=f"broker-worker-{self.worker_key}",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        self._process = process
+        self._conn = parent_conn
+        self.started_at = datetime.utcnow()
+        self.missed_pings = 0
+        threading.Thread(
+            target=self._read_forever,
+            args=(parent_conn,),
+            name=f"broker-worker-reader-{self.worker_key}",
+            daemon=True,
+        ).start()
+
+    def _read_forever(self, conn: Connection) -> None:
+        while True:
+            try:
+                message = conn.recv()
+            except (EOFError, OSError):
+                break
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self._resolve, message)
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._pipe_closed, conn)
+
+    def _pipe_closed(self, conn: Connection) -> None:
+        # Checked on the loop: the worker may have been respawned since this pipe closed.
+        if conn is self._conn:
+            self._fail_pending("worker pipe closed")
+
+    def _resolve(self, message: dict[str, Any]) -> None:
+        future = self._pending.pop(message.get("id"), None)
+        if future is None or future.done():
+            return
+        if message.get("ok"):
+            future.set_result(message.get("result"))
+        else:
+            future.set_exception(BrokerWorkerError(message.get("error") or "worker error"))
+
+    def _fail_pending(self, reason: str) -> None:
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(BrokerWorkerError(f"[{self.worker_key}] {reason}"))
+
+    async def call(
+        self,
+        op: str,
+        broker_id: int | None = None,
+        payload: Any = None,
+        timeout: float | None = None,
+    ) -> Any:
+        """Send a command and wait for the worker reply."""
+        if not self.is_alive() or self._conn is None:
+            raise BrokerWorkerError(f"Worker {self.worker_key} is not running")
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        message = {"id": request_id, "op": op, "broker_id": broker_id, "payload": payload}
+        try:
+            with self._send_lock:
+                self._conn.send(message)
+        except (OSError, ValueError) as exc:
+            self._pending.pop(request_id, None)
+            raise BrokerWorkerError(f"Worker {self.worker_key} send failed: {exc}")
+        try:
+            return await asyncio.wait_for(
+                future,
+                timeout=timeout or settings.BROKER_WORKER_RPC_TIMEOUT_SECONDS,
+            )
+        finally:
+            self._pending.pop(request_id, None)
+
+    def _detach(self) -> multiprocessing.process.BaseProcess | None:
+        """Close the pipe and fail pending calls; returns the process still to be reaped."""
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            try:
+                conn.close()
+            except Exception:
+                pass
+        self._fail_pending("worker terminated")
+        process, self._process = self._process, None
+        return process
+
+    @staticmethod
+    def _reap(process: multiprocessing.process.BaseProcess | None) -> None:
+        """Terminate and join the process (blocking, up to 5 s)."""
+        if process is not None and process.is_alive():
+            process.terminate()
+            process.join(timeout=5)
+            if process.is_alive():
+                process.kill()
+
+    def terminate(self) -> None:
+        """Kill the worker process and close the pipe (blocking)."""
+        self._reap(self._detach())
+
+    async def stop_process(self) -> None:
+        """Kill the worker process without blocking the event loop on join."""
+        process = self._detach()
+        if process is not None:
+            await asyncio.to_thread(self._reap, process)
+
+    def describe(self) -> dict[str, Any]:
+        return {
+            "worker": self.worker_key,
+            "pid": self.pid,
+            "alive": self.is_alive(),
+            "restarts": self.restarts,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+        }
+
+
+class RemoteAutoTrader:
+    """
+    Parent-side stand-in for an AutoTrader running in a worker process.
+
+    Exposes the same attributes MultiBrokerManager and the API routes read
+    (``config``, ``state``, ``broker``) and the same async control methods.
+    ``state`` is a mirror refreshed after every command and by the supervisor.
+    ``broker`` is a parent-local connection used only for read-side API calls
+    (account, positions, prices); trading happens in the worker.
+    """
+
+    def __init__(self, broker_id: int, pool: "BrokerWorkerPool"):
+        self.broker_id = broker_id
+        self.config = BotConfig()
+        self.state = BotState()
+        self.broker: BaseBroker | None = None
+        self._pool = pool
+        self._desired_status = BotStatus.STOPPED
+
+    @property
+    def desired_status(self) -> BotStatus:
+        return self._desired_status
+
+    @property
+    def worker(self) -> BrokerWorker:
+        return self._pool.worker_for(self.broker_id)
+
+    def configure(self, config: BotConfig):
+        """Update configuration locally and push it to the worker if it is up."""
+        self.config = config
+        worker = self.worker
+        if worker.is_alive():
+            try:
+                asyncio.get_running_loop().create_task(self._push_config(worker))
+            except RuntimeError:
+                # No running loop: config is pushed on the next start().
+                pass
+
+    async def _push_config(self, worker: BrokerWorker) -> None:
+        try:
+            await worker.call("configure", self.broker_id, self.config)
+        except Exception as exc:
+            print(f"[BrokerWorker:{worker.worker_key}] Config push failed for broker {self.broker_id}: {exc}")
+
+    async def _control(self, op: str, timeout: float | None = None) -> None:
+        worker = await self._pool.ensure_worker(self.broker_id)
+        try:
+            state = await worker.call(op, self.broker_id, timeout=timeout)
+        except BrokerWorkerError as exc:
+            raise RuntimeError(str(exc))
+        if isinstance(state, BotState):
+            self.state = state
+
+    async def start(self):
+        self._desired_status = BotStatus.RUNNING
+        worker = await self._pool.ensure_worker(self.broker_id)
+        await worker.call("configure", self.broker_id, self.config)
+        try:
+            await self._control("start", timeout=settings.BROKER_WORKER_START_TIMEOUT_SECONDS)
+        except Exception:
+            self._desired_status = BotStatus.STOPPED
+            await self.refresh_state()
+            raise
+
+    async def stop(self):
+        self._desired_status = BotStatus.STOPPED
+        if not self.worker.is_alive():
+            self.state.status = BotStatus.STOPPED
+            return
+        await self._control("stop")
+
+    async def pause(self):
+        self._desired_status = BotStatus.PAUSED
+        await self._control("pause")
+
+    async def resume(self):
+        self._desired_status = BotStatus.RUNNING
+        await self._control("resume")
+
+    async def refresh_state(self) -> None:
+        worker = self.worker
+        if not worker.is_alive():
+            return
+        try:
+            snapshot = await worker.call("snapshot", self.broker_id)
+        except Exception:
+            return
+        state = (snapshot or {}).get(self.broker_id)
+        if isinstance(state, BotState):
+            self.state = state
+
+    get_status = AutoTrader.get_status
+
+
+class BrokerWorkerPool:
+    """Owns worker processes, assigns brokers to them and supervises their health."""
+
+    def __init__(self, max_processes: int | None = None):
+        self._max_processes = (
+            settings.BROKER_WORKER_MAX_PROCESSES if max_processes is None else max_processes
+        )
+        self._workers: dict[str, BrokerWorker] = {}
+        self._traders: dict[int, RemoteAutoTrader] = {}
+        self._supervisor_task: asyncio.Task | None = None
+        self._lock = asyncio.Lock()
+
+    def _worker_key(self, broker_id: int) -> str:
+        if self._max_processes and self._max_processes > 0:
+            return f"group-{broker_id % self._max_processes}"
+        return f"broker-{broker_id}"
+
+    def worker_for(self, broker_id: int) -> BrokerWorker:
+        key = self._worker_key(broker_id)
+        worker = self._workers.get(key)
+        if worker is None:
+            worker = BrokerWorker(key)
+            self._workers[key] = worker
+        worker.broker_ids.add(broker_id)
+        return worker
+
+    def create_trader(self, broker_id: int) -> RemoteAutoTrader:
+        trader = self._traders.get(broker_id)
+        if trader is None:
+            trader = RemoteAutoTrader(broker_id, self)
+            self._traders[broker_id] = trader
+        return trader
+
+    async def ensure_worker(self, broker_id: int) -> BrokerWorker:
+        """Return a live worker for the broker, spawning it on first use."""
+        async with self._lock:
+            worker = self.worker_for(broker_id)
+            if not worker.is_alive():
+                await worker.spawn()
+            self._ensure_supervisor()
+            return worker
+
+    def _ensure_supervisor(self) -> None:
+        if self._supervisor_task is None or self._supervisor_task.done():
+            self._supervisor_task = asyncio.create_task(self._supervise())
+
+    async def _supervise(self) -> None:
+        while True:
+            try:
+                await asyncio.sleep(settings.BROKER_WORKER_HEALTH_INTERVAL_SECONDS)
+                for worker in list(self._workers.values()):
+                    await self._check_worker(worker)
+            except asyncio.CancelledError:
+                break
+            except Exception as exc:
+                print(f"[BrokerWorkerPool] Supervisor error: {exc}")
+
+    async def _check_worker(self, worker: BrokerWorker) -> None:
+        hosted = [self._traders[bid] for bid in worker.broker_ids if bid in self._traders]
+        wanted = [t for t in hosted if t.desired_status != BotStatus.STOPPED]
+        if not worker.is_alive():
+            if wanted:
+                await self._respawn(worker, hosted, reason="process exited")
+            return
+
+        try:
+            await worker.call("ping", timeout=settings.BROKER_WORKER_HEALTH_INTERVAL_SECONDS)
+            worker.missed_pings = 0
+        except Exception:
+            worker.missed_pings += 1
+            if worker.missed_pings >= _MAX_MISSED_PINGS:
+                await self._respawn(worker, hosted, reason="unresponsive")
+            return
+
+        try:
+            snapshot = await worker.call("snapshot")
+        except Exception:
+            return
+        for trader in hosted:
+            state = (snapshot or {}).get(trader.broker_id)
+            if isinstance(state, BotState):
+                trader.state = state
+
+        try:
+            get_broker_telemetry().merge_remote(worker.worker_key, await worker.call("telemetry"))
+        except Exception:
+            pass
+
+    async def _respawn(
+        self,
+        worker: BrokerWorker,
+        hosted: list[RemoteAutoTrader],
+        reason: str,
+    ) -> None:
+        print(f"[BrokerWorkerPool] Restarting worker {worker.worker_key} ({reason})")
+        async with self._lock:
+            await worker.spawn()
+            worker.restarts += 1
+        for trader in hosted:
+            try:
+                await worker.call("configure", trader.broker_id, trader.config)
+                if trader.desired_status == BotStatus.STOPPED:
+                    continue
+                state = await worker.call(
+                    "start",
+                    trader.broker_id,
+                    timeout=settings.BROKER_WORKER_START_TIMEOUT_SECONDS,
+                )
+                if trader.desired_status == BotStatus.PAUSED:
+                    state = await worker.call("pause", trader.broker_id)
+                if isinstance(state, BotState):
+                    trader.state = state
+            except Exception as exc:
+                trader.state.status = BotStatus.ERROR
+                trader.state.errors.append({
+                    "timestamp": datetime.utcnow().isoformat(),
+                    "error": f"Worker restart failed: {exc}",
+                })
+
+    def describe(self, broker_id: int) -> dict[str, Any] | None:
+        key = self._worker_key(broker_id)
+        worker = self._workers.get(key)
+        return worker.describe() if worker else None
+
+    async def shutdown(self) -> None:
+        """Stop the supervisor and all worker processes."""
+        if self._supervisor_task:
+            self._supervisor_task.cancel()
+            try:
+                await self._supervisor_task
+            except asyncio.CancelledError:
+                pass
+            self._supervisor_task = None
+        for worker in self._workers.values():
+            if worker.is_alive():
+                try:
+                    await worker.call("shutdown", timeout=5)
+                except Exception:
+                    pass
+            await worker.stop_process()
@@ -6,11 +6,12 @@ The bridge runs on Windows nodes and owns terminal sessions.
 """
 
 import asyncio
+import json
 from collections.abc import AsyncIterator
 from datetime import UTC, datetime
 from decimal import Decimal
 from typing import Any
-from urllib.parse import quote_plus, urljoin
+from urllib.parse import quote_plus
 
 import httpx
 
@@ -29,6 +30,13 @@ from src.engines.trading.base_broker import (
     Tick,
     TimeInForce,
 )
+from src.engines.trading.metatrader_bridge_pool import (
+    BridgeHostClient,
+    acquire_bridge_client,
+    bridge_url,
+    load_capabilities,
+    release_bridge_client,
+)
 
 
 def _to_decimal(value: Any, fallback: str = "0") -> Decimal:
@@ -130,6 +138,13 @@ class MetaTraderBridgeBroker(BaseBroker):
     """
 
     DEFAULT_TIMEOUT_SECONDS = 90.0
+    # Bridge sends a heartbeat every few seconds; silence longer than this is a dead stream.
+    STREAM_READ_TIMEOUT_SECONDS = 30.0
+    # Reconnect delay after a dropped stream: doubles per drop up to the cap, resets on the next tick.
+    STREAM_RECONNECT_MIN_SECONDS = 1.0
+    STREAM_RECONNECT_MAX_SECONDS = 30.0
+    # Bars requested per history page during range backfills.
+    HISTORY_PAGE_BARS = 5000
 
     def __init__(
         self,
@@ -148,9 +163,13 @@ class MetaTraderBridgeBroker(BaseBroker):
         disconnect_endpoint: str = "/api/v1/sessions/{session_id}/disconnect",
         account_endpoint: str = "/api/v1/sessions/{session_id}/account",
         positions_endpoint: str = "/api/v1/sessions/{session_id}/positions",
+        state_endpoint: str = "/api/v1/sessions/{session_id}/state",
         price_endpoint: str = "/api/v1/sessions/{session_id}/prices/{symbol}",
         prices_endpoint: str = "/api/v1/sessions/{session_id}/prices",
+        symbol_specs_endpoint: str = "/api/v1/sessions/{session_id}/symbols/specs",
+        stream_prices_endpoint: str = "/api/v1/sessions/{session_id}/stream/prices",
         candles_endpoint: str = "/api/v1/sessions/{session_id}/candles/{symbol}",
+        history_endpoint: str = "/api/v1/sessions/{session_id}/history/{symbol}",
         place_order_endpoint: str = "/api/v1/sessions/{session_id}/orders",
         open_orders_endpoint: str = "/api/v1/sessions/{session_id}/orders/open",
         order_endpoint: str = "/api/v1/sessions/{session_id}/orders/{order_id}",
@@ -189,9 +208,13 @@ class MetaTraderBridgeBroker(BaseBroker):
         self.disconnect_endpoint = disconnect_endpoint
         self.account_endpoint = account_endpoint
         self.positions_endpoint = positions_endpoint
+        self.state_endpoint = state_endpoint
         self.price_endpoint = price_endpoint
         self.prices_endpoint = prices_endpoint
+        self.symbol_specs_endpoint = symbol_specs_endpoint
+        self.stream_prices_endpoint = stream_prices_endpoint
         self.candles_endpoint = candles_endpoint
+        self.history_endpoint = history_endpoint
         self.place_order_endpoint = place_order_endpoint
         self.open_orders_endpoint = open_orders_endpoint
         self.order_endpoint = order_endpoint
@@ -201,7 +224,21 @@ class MetaTraderBridgeBroker(BaseBroker):
 
         self._session_id: str | None = None
         self._client: httpx.AsyncClient | None = None
+        # Shared per bridge host; None when a client was injected directly.
+        self._host: BridgeHostClient | None = None
+        # Features advertised by the bridge; None = unknown, probe optional endpoints.
+        self._bridge_features: frozenset[str] | None = None
         self._owns_session: bool = True
+        self._history_supported = True
+        # Normalized bridge symbol -> spec; specs are static for a session.
+        self._symbol_specs: dict[str, dict[str, Any]] = {}
+        # Mirror of the bridge's versioned account state, kept in sync with deltas.
+        self._state_supported = True
+        self._state_version = 0
+        self._state_account: dict[str, Any] = {}
+        self._state_rows: dict[str, dict[str, dict[str, Any]]] = {"position": {}, "order": {}}
+        self._state_parsed: dict[str, Any] = {}
+        self._state_sync: asyncio.Future | None = None
 
     @property
     def name(self) -> str:
@@ -222,10 +259,16 @@ class MetaTraderBridgeBroker(BaseBroker):
 
     async def _ensure_client(self) -> None:
         if self._client is None:
-            self._client = httpx.AsyncClient(
-                timeout=self.timeout_seconds,
-                verify=False,
-            )
+            # Accounts on the same bridge share one connection pool.
+            self._host = acquire_bridge_client(self.base_url)
+            self._client = self._host.client
+
+    async def _load_capabilities(self) -> None:
+        if self._host is not None:
+            self._bridge_features = await load_capabilities(self._host, self._headers(), self.timeout_seconds)
+
+    def _has_feature(self, feature: str) -> bool:
+        return self._bridge_features is None or feature in self._bridge_features
 
     def _headers(self) -> dict[str, str]:
         headers = {
@@ -238,7 +281,7 @@ class MetaTraderBridgeBroker(BaseBroker):
         return headers
 
     def _build_url(self, endpoint: str) -> str:
-        return urljoin(f"{self.base_url}/", endpoint.lstrip("/"))
+        return bridge_url(self.base_url, endpoint)
 
     def _fmt_endpoint(self, template: str, **params: Any) -> str:
         value = template
@@ -264,6 +307,7 @@ class MetaTraderBridgeBroker(BaseBroker):
             headers=self._headers(),
             params=params,
             json=data,
+            timeout=self.timeout_seconds,
         )
         if response.status_code >= 400:
             detail = response.text[:400]
@@ -354,6 +398,10 @@ class MetaTraderBridgeBroker(BaseBroker):
         )
         self._owns_session = not reused_existing
         self._session_id = session_id
+        self._symbol_specs.clear()
+        await self._load_capabilities()
+        self._history_supported = self._has_feature("history")
+        self._reset_state()
         self._connected = True
 
     async def disconnect(self) -> None:
@@ -363,17 +411,97 @@ class MetaTraderBridgeBroker(BaseBroker):
                 await self._request("POST", endpoint, data={"session_id": self._session_id})
             except Exception:
                 pass
-        if self._client:
+        if self._host is not None:
+            await release_bridge_client(self._host)
+        elif self._client:
             await self._client.aclose()
-            self._client = None
+        self._client = None
+        self._host = None
         self._session_id = None
         self._owns_session = True
+        self._symbol_specs.clear()
+        self._reset_state()
         self._connected = False
 
+    def _reset_state(self) -> None:
+        self._state_supported = self._has_feature("state_delta")
+        self._state_version = 0
+        self._state_account = {}
+        self._state_rows = {"position": {}, "order": {}}
+        self._state_parsed = {}
+
+    async def _sync_state(self) -> bool:
+        """
+        Bring the local account-state mirror up to date with one delta request.
+
+        Concurrent callers share the in-flight request. Returns False when the
+        bridge has no state endpoint, so callers use the per-resource endpoints.
+        """
+        if not self._state_supported:
+            return False
+        if self._state_sync is None or self._state_sync.done():
+            self._state_sync = asyncio.ensure_future(self._fetch_state())
+        return await asyncio.shield(self._state_sync)
+
+    async def _fetch_state(self) -> bool:
+        endpoint = self._fmt_endpoint(self.state_endpoint, session_id=self._require_session())
+        params = {"since": self._state_version} if self._state_version else None
+        try:
+            payload = await self._request("GET", endpoint, params=params)
+        except Exception as exc:
+            text = str(exc)
+            if ("(404)" in text and "Session not found" not in text) or "(405)" in text:
+                self._state_supported = False
+                return False
+            raise
+        if not isinstance(payload, dict) or "version" not in payload:
+            self._state_supported = False
+            return False
+        self._apply_state(payload)
+        return True
+
+    def _apply_state(self, payload: dict[str, Any]) -> None:
+        version = _to_int(payload.get("version"), 0)
+        if _to_bool(payload.get("full"), False):
+            account = payload.get("account")
+            self._state_account = account if isinstance(account, dict) else {}
+            self._state_rows = {"position": {}, "order": {}}
+            for kind, key, id_keys in (
+                ("position", "positions", ["position_id", "positionId", "ticket"]),
+                ("order", "orders", ["order_id", "orderId", "ticket"]),
+            ):
+                rows = payload.get(key)
+                for row in rows if isinstance(rows, list) else []:
+                    if isinstance(row, dict):
+                        self._state_rows[kind][str(_pick(row, id_keys, ""))] = row
+            self._state_parsed = {}
+        else:
+            for change in payload.get("changes") or []:
+                kind = str(change.get("kind") or "")
+                if kind == "account":
+                    data = change.get("data")
+                    self._state_account = data if isinstance(data, dict) else {}
+                elif kind in self._state_rows:
+                    row_id = str(change.get("id") or "")
+                    if change.get("op") == "remove":
+                        self._state_rows[kind].pop(row_id, None)
+                    elif isinstance(change.get("data"), dict):
+                        self._state_rows[kind][row_id] = change["data"]
+                else:
+                    continue
+                # Only the kinds that changed are re-parsed on the next read.
+                self._state_parsed.pop(kind, None)
+        self._state_version = version
+
     async def get_account_info(self) -> AccountInfo:
+        if await self._sync_state():
+            return self._parse_account(self._state_account)
         endpoint = self._fmt_endpoint(self.account_endpoint, session_id=self._require_session())
         payload = await self._request("GET", endpoint)
         source = payload[0] if isinstance(payload, list) and payload else payload
+        return self._parse_account(source)
+
+    def _parse_account(self, source: Any) -> AccountInfo:
         if not isinstance(source, dict):
             source = {}
 
@@ -486,9 +614,21 @@ class MetaTraderBridgeBroker(BaseBroker):
             return None
 
     async def get_open_orders(self, symbol: str | None = None) -> list[OrderResult]:
-        endpoint = self._fmt_endpoint(self.open_orders_endpoint, session_id=self._require_session())
-        payload = await self._request("GET", endpoint)
-        rows = payload if isinstance(payload, list) else _pick(payload, ["orders", "items", "data"], [])
+        if await self._sync_state():
+            if "order" not in self._state_parsed:
+                self._state_parsed["order"] = self._parse_open_orders(list(self._state_rows["order"].values()))
+            orders = self._state_parsed["order"]
+        else:
+            endpoint = self._fmt_endpoint(self.open_orders_endpoint, session_id=self._require_session())
+            payload = await self._request("GET", endpoint)
+            rows = payload if isinstance(payload, list) else _pick(payload, ["orders", "items", "data"], [])
+            orders = self._parse_open_orders(rows)
+        if not symbol:
+            return list(orders)
+        target = self.normalize_symbol(symbol)
+        return [order for order in orders if self.normalize_symbol(order.symbol) == target]
+
+    def _parse_open_orders(self, rows: Any) -> list[OrderResult]:
         if not isinstance(rows, list):
             return []
         result: list[OrderResult] = []
@@ -496,8 +636,6 @@ class MetaTraderBridgeBroker(BaseBroker):
             if not isinstance(item, dict):
                 continue
             item_symbol = self.denormalize_symbol(str(_pick(item, ["symbol"], "")))
-            if symbol and self.normalize_symbol(item_symbol) != self.normalize_symbol(symbol):
-                continue
             side = OrderSide.SELL if str(_pick(item, ["side"], "buy")).lower() == "sell" else OrderSide.BUY
             status = self._parse_order_status(str(_pick(item, ["status", "state"], "pending")))
             result.append(
@@ -514,9 +652,16 @@ class MetaTraderBridgeBroker(BaseBroker):
         return result
 
     async def get_positions(self) -> list[Position]:
+        if await self._sync_state():
+            if "position" not in self._state_parsed:
+                self._state_parsed["position"] = self._parse_positions(list(self._state_rows["position"].values()))
+            return list(self._state_parsed["position"])
         endpoint = self._fmt_endpoint(self.positions_endpoint, session_id=self._require_session())
         payload = await self._request("GET", endpoint)
         rows = payload if isinstance(payload, list) else _pick(payload, ["positions", "items", "data"], [])
+        return self._parse_positions(rows)
+
+    def _parse_positions(self, rows: Any) -> list[Position]:
         if not isinstance(rows, list):
             return []
         positions: list[Position] = []
@@ -605,13 +750,7 @@ class MetaTraderBridgeBroker(BaseBroker):
         except Exception:
             return False
 
-    async def get_current_price(self, symbol: str) -> Tick:
-        endpoint = self._fmt_endpoint(
-            self.price_endpoint,
-            session_id=self._require_session(),
-            symbol=self.normalize_symbol(symbol),
-        )
-        payload = await self._request("GET", endpoint)
+    def _parse_tick(self, symbol: str, payload: Any) -> Tick:
         bid = _to_decimal(_pick(payload, ["bid"], 0), "0")
         ask = _to_decimal(_pick(payload, ["ask"], 0), "0")
         if bid <= 0 or ask <= 0:
@@ -628,9 +767,43 @@ class MetaTraderBridgeBroker(BaseBroker):
             timestamp=_parse_timestamp(_pick(payload, ["timestamp", "time"], None)),
         )
 
+    async def get_current_price(self, symbol: str) -> Tick:
+        endpoint = self._fmt_endpoint(
+            self.price_endpoint,
+            session_id=self._require_session(),
+            symbol=self.normalize_symbol(symbol),
+        )
+        payload = await self._request("GET", endpoint)
+        return self._parse_tick(symbol, payload)
+
     async def get_prices(self, symbols: list[str]) -> dict[str, Tick]:
         result: dict[str, Tick] = {}
-        # Bridge bulk endpoint can be added later; for now use safe per-symbol polling.
+        if not symbols:
+            return result
+        requested = {self.normalize_symbol(symbol): symbol for symbol in symbols}
+        payload = None
+        if self._has_feature("prices_batch"):
+            try:
+                # One bridge round-trip for the whole batch; per-symbol errors are skipped.
+                endpoint = self._fmt_endpoint(self.prices_endpoint, session_id=self._require_session())
+                payload = await self._request("GET", endpoint, params={"symbols": ",".join(requested)})
+            except Exception as exc:
+                # 404/405 just mean an older bridge; anything else still gets a per-symbol poll.
+                if "(404)" not in str(exc) and "(405)" not in str(exc):
+                    print(f"[MetaTraderBridge] Bulk prices failed, polling per symbol: {exc}")
+        quotes = _pick(payload, ["prices"], None)
+        if isinstance(quotes, dict):
+            for bridge_symbol, symbol in requested.items():
+                quote = quotes.get(bridge_symbol)
+                if not isinstance(quote, dict):
+                    continue
+                try:
+                    result[symbol] = self._parse_tick(symbol, quote)
+                except Exception:
+                    continue
+            return result
+
+        # Older bridges without the bulk endpoint: per-symbol polling.
         for symbol in symbols:
             try:
                 result[symbol] = await self.get_current_price(symbol)
@@ -638,12 +811,130 @@ class MetaTraderBridgeBroker(BaseBroker):
                 continue
         return result
 
+    async def get_symbol_specifications(self, symbols: list[str]) -> dict[str, dict[str, Any]]:
+        """Specs for several symbols with one bridge call; already cached symbols are not refetched."""
+        requested = {self.normalize_symbol(symbol): symbol for symbol in symbols}
+        missing = [bridge_symbol for bridge_symbol in requested if bridge_symbol not in self._symbol_specs]
+        if missing and self._has_feature("symbol_specs"):
+            endpoint = self._fmt_endpoint(self.symbol_specs_endpoint, session_id=self._require_session())
+            try:
+                payload = await self._request("GET", endpoint, params={"symbols": ",".join(missing)})
+            except Exception as exc:
+                print(f"[MetaTraderBridge] Symbol specs unavailable: {exc}")
+                payload = None
+            specs = _pick(payload, ["specs"], None)
+            if isinstance(specs, dict):
+                for bridge_symbol, spec in specs.items():
+                    if isinstance(spec, dict):
+                        self._symbol_specs[bridge_symbol] = spec
+        return {
+            symbol: self._symbol_specs[bridge_symbol]
+            for bridge_symbol, symbol in requested.items()
+            if bridge_symbol in self._symbol_specs
+        }
+
+    async def get_symbol_specification(self, symbol: str) -> dict[str, Any]:
+        specs = await self.get_symbol_specifications([symbol])
+        return specs.get(symbol, {})
+
+    async def _stream_ticks(self, requested: dict[str, str]) -> AsyncIterator[Tick]:
+        """Consume the bridge's JSON-lines tick stream (changed quotes only)."""
+        await self._ensure_client()
+        if not self._client:
+            raise ConnectionError("Bridge HTTP client not initialized")
+        endpoint = self._fmt_endpoint(self.stream_prices_endpoint, session_id=self._require_session())
+        timeout = httpx.Timeout(self.timeout_seconds, read=self.STREAM_READ_TIMEOUT_SECONDS)
+        async with self._client.stream(
+            "GET",
+            self._build_url(endpoint),
+            headers=self._headers(),
+            params={"symbols": ",".join(requested)},
+            timeout=timeout,
+        ) as response:
+            if response.status_code >= 400:
+                detail = (await response.aread()).decode(errors="replace")[:400]
+                raise Exception(f"MT bridge error ({response.status_code}): {detail}")
+            async for line in response.aiter_lines():
+                if not line:
+                    continue
+                frame = json.loads(line)
+                symbol = requested.get(str(frame.get("s") or ""))
+                if symbol is None:
+                    continue  # Heartbeat or unrequested symbol
+                yield Tick(
+                    symbol=symbol,
+                    bid=_to_decimal(frame.get("b"), "0"),
+                    ask=_to_decimal(frame.get("a"), "0"),
+                    timestamp=datetime.fromtimestamp(float(frame.get("t") or 0) / 1000, tz=UTC),
+                )
+
     async def stream_prices(self, symbols: list[str]) -> AsyncIterator[Tick]:
+        requested = {self.normalize_symbol(symbol): symbol for symbol in symbols}
+        stream_supported = self._has_feature("stream_prices")
+        reconnect_delay = self.STREAM_RECONNECT_MIN_SECONDS
         while self._connected:
+            if stream_supported:
+                try:
+                    async for tick in self._stream_ticks(requested):
+                        reconnect_delay = self.STREAM_RECONNECT_MIN_SECONDS
+                        yield tick
+                except Exception as exc:
+                    message = str(exc)
+                    if ("(404)" in message and "Session not found" not in message) or "(405)" in message:
+                        # Older bridge without the push channel: fall back to polling.
+                        stream_supported = False
+                        continue
+                # Stream ended or dropped: serve one polling round, then reconnect with backoff.
             prices = await self.get_prices(symbols)
             for tick in prices.values():
                 yield tick
-            await asyncio.sleep(1)
+            if stream_supported:
+                await asyncio.sleep(reconnect_delay)
+                reconnect_delay = min(reconnect_delay * 2, self.STREAM_RECONNECT_MAX_SECONDS)
+            else:
+                await asyncio.sleep(1)
+
+    async def _get_candle_history(
+        self,
+        symbol: str,
+        timeframe: str,
+        count: int,
+        from_time: datetime,
+        to_time: datetime | None,
+    ) -> list[Candle]:
+        """Range backfill through the paged, columnar history endpoint."""
+        endpoint = self._fmt_endpoint(
+            self.history_endpoint,
+            session_id=self._require_session(),
+            symbol=self.normalize_symbol(symbol),
+        )
+        params: dict[str, Any] = {"timeframe": timeframe, "from": int(from_time.timestamp())}
+        if to_time:
+            params["to"] = int(to_time.timestamp())
+        candles: list[Candle] = []
+        while len(candles) < count:
+            params["limit"] = min(self.HISTORY_PAGE_BARS, count - len(candles))
+            page = await self._request("GET", endpoint, params=params)
+            columns = _pick(page, ["columns"], {}) or {}
+            for ts, o, h, low, c, v in zip(*(columns.get(name, []) for name in ("t", "o", "h", "l", "c", "v"))):
+                candles.append(
+                    Candle(
+                        symbol=symbol,
+                        timestamp=datetime.fromtimestamp(int(ts), tz=UTC),
+                        open=_to_decimal(o),
+                        high=_to_decimal(h),
+                        low=_to_decimal(low),
+                        close=_to_decimal(c),
+                        volume=_to_decimal(v),
+                        timeframe=timeframe,
+                    )
+                )
+            cursor = _pick(page, ["next_cursor"], None)
+            if not cursor:
+                break
+            params.pop("from", None)
+            params["cursor"] = cursor
+        return candles[:count]
 
     async def get_candles(
         self,
@@ -653,6 +944,15 @@ class MetaTraderBridgeBroker(BaseBroker):
         from_time: datetime | None = None,
         to_time: datetime | None = None,
     ) -> list[Candle]:
+        if from_time and self._history_supported:
+            try:
+                return await self._get_candle_history(symbol, timeframe, count, from_time, to_time)
+            except Exception as exc:
+                message = str(exc)
+                if not (("(404)" in message and "Session not found" not in message) or "(405)" in message):
+                    raise
+                # Older bridge without the history endpoint.
+                self._history_supported = False
         endpoint = self._fmt_endpoint(
             self.candles_endpoint,
             session_id=self._require_session(),
@@ -0,0 +1,117 @@
+"""
+MetaTrader Bridge Pool - Shared HTTP clients and capabilities per bridge host.
+
+Support module for ``MetaTraderBridgeBroker``:
+
+- ``BridgeHostClient``: one keep-alive ``httpx.AsyncClient`` per bridge base
+  URL, reference counted across every account connected through that bridge, so
+  adding accounts does not add connection pools. HTTP/2 is used when the
+  optional ``h2`` package is installed (negotiated over TLS, e.g. behind a
+  tunnel); plain HTTP stays on pooled HTTP/1.1 keep-alive connections.
+- Capabilities handshake: ``GET /api/v1/capabilities`` is asked once per bridge
+  and cached; brokers use the advertised features instead of probing optional
+  endpoints for 404s. Bridges without the endpoint keep the probing behaviour.
+"""
+
+import asyncio
+import importlib.util
+from typing import Any
+from urllib.parse import urljoin, urlsplit
+
+import httpx
+
+from src.core.bot_logger import get_bot_logger
+
+logger = get_bot_logger("MetaTraderBridge")
+
+CAPABILITIES_ENDPOINT = "/api/v1/capabilities"
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+BRIDGE_LIMITS = httpx.Limits(
+    max_connections=64,
+    max_keepalive_connections=32,
+    keepalive_expiry=60.0,
+)
+
+
+class BridgeHostClient:
+    """Keep-alive HTTP client and cached capabilities for one bridge (base URL)."""
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url
+        self.client = httpx.AsyncClient(verify=False, limits=BRIDGE_LIMITS, http2=HTTP2_AVAILABLE)
+        self.refs = 0
+        # None until the handshake ran; stays None for bridges without the endpoint.
+        self.features: frozenset[str] | None = None
+        self.capabilities_checked = False
+        self.lock = asyncio.Lock()
+
+
+_host_clients: dict[tuple[str, int], BridgeHostClient] = {}
+
+
+def normalize_bridge_url(base_url: str) -> str:
+    """Scheme and host lowercased, path kept: bridges behind one proxy under different prefixes stay apart."""
+    parts = urlsplit(base_url.strip())
+    return f"{parts.scheme}://{parts.netloc}".lower() + parts.path.rstrip("/")
+
+
+def bridge_url(base_url: str, endpoint: str) -> str:
+    """Absolute URL of ``endpoint`` under the bridge's base URL (path prefix included)."""
+    return urljoin(f"{normalize_bridge_url(base_url)}/", endpoint.lstrip("/"))
+
+
+def acquire_bridge_client(base_url: str) -> BridgeHostClient:
+    """Get (or open) the shared client for the bridge at ``base_url`` on the running loop."""
+    key = (normalize_bridge_url(base_url), id(asyncio.get_running_loop()))
+    host = _host_clients.get(key)
+    if host is None or host.client.is_closed:
+        host = BridgeHostClient(key[0])
+        _host_clients[key] = host
+    host.refs += 1
+    return host
+
+
+async def release_bridge_client(host: BridgeHostClient) -> None:
+    """Drop one reference; the connection pool closes with the last user."""
+    host.refs -= 1
+    if host.refs > 0:
+        return
+    for key, value in list(_host_clients.items()):
+        if value is host:
+            del _host_clients[key]
+    await host.client.aclose()
+
+
+async def load_capabilities(host: BridgeHostClient, headers: dict[str, str], timeout: float) -> frozenset[str] | None:
+    """Advertised bridge features, fetched once per bridge (single-flight)."""
+    if host.capabilities_checked:
+        return host.features
+    async with host.lock:
+        if host.capabilities_checked:
+            return host.features
+        try:
+            response = await host.client.get(
+                bridge_url(host.base_url, CAPABILITIES_ENDPOINT),
+                headers=headers,
+                timeout=timeout,
+            )
+        except httpx.HTTPError as exc:
+            # Transient: ask again on the next connect.
+            logger.warning(f"Capabilities handshake failed for {host.base_url}: {exc}")
+            return None
+        payload: Any = None
+        if response.status_code < 400:
+            try:
+                payload = response.json()
+            except ValueError:
+                payload = None
+        features = payload.get("features") if isinstance(payload, dict) else None
+        if isinstance(features, list):
+            host.features = frozenset(str(item) for item in features)
+        elif response.status_code in (401, 403):
+            # Wrong key for this account: let its own requests surface the error.
+            return None
+        host.capabilities_checked = True
+        return host.features
@@ -21,6 +21,7 @@ from urllib.parse import quote
 
 import httpx
 
+from src.core.bot_logger import get_bot_logger
 from src.core.config import settings
 from src.engines.trading.base_broker import (
     AccountInfo,
@@ -36,6 +37,8 @@ from src.engines.trading.base_broker import (
     Tick,
 )
 
+logger = get_bot_logger("MetaTrader")
+
 
 class RateLimitError(Exception):
     """Raised when API rate limit is exceeded."""
@@ -318,12 +321,12 @@ class MetaTraderBroker(BaseBroker):
             retry_dt = datetime.fromisoformat(retry_time.replace("Z", "+00:00"))
             self._rate_limit_until = retry_dt.timestamp()
             self._rate_limit_endpoint = endpoint
-            print(f"[MetaTrader] Rate limited until {retry_time} for endpoint: {endpoint}")
+            logger.warning(f"Rate limited until {retry_time} for endpoint: {endpoint}")
         except Exception as e:
             # If parsing fails, set a 5 minute backoff
             self._rate_limit_until = time.time() + 300
             self._rate_limit_endpoint = endpoint
-            print(f"[MetaTrader] Rate limited (parse error: {e}), backing off for 5 minutes")
+            logger.warning(f"Rate limited (parse error: {e}), backing off for 5 minutes")
 
     def _is_metaapi_routing_or_connection_error(self, error_text: str) -> bool:
         """Detect MetaApi errors which are usually resolved by region/account-state refresh."""
@@ -360,7 +363,7 @@ class MetaTraderBroker(BaseBroker):
         conn_status = account.get("connectionStatus", "UNKNOWN")
 
         if state != "DEPLOYED":
-            print(f"[MetaTrader] Account state={state}, deploying before retry...")
+            logger.warning(f"Account state={state}, deploying before retry...")
             await self._request(
                 "POST",
                 f"/users/current/accounts/{self.account_id}/deploy",
@@ -393,8 +396,8 @@ class MetaTraderBroker(BaseBroker):
             conn_status = account.get("connectionStatus", "UNKNOWN")
             if conn_status == "CONNECTED":
                 return True
-            print(
-                f"[MetaTrader] Waiting terminal connection {i + 1}/{max_wait_checks}: "
+            logger.info(
+                f"Waiting terminal connection {i + 1}/{max_wait_checks}: "
                 f"{conn_status}"
             )
 
@@ -439,8 +442,8 @@ class MetaTraderBroker(BaseBroker):
                 and self._is_metaapi_routing_or_connection_error(error_text)
             )
             if should_retry_routing:
-                print(
-                    f"[MetaTrader] MetaApi {response.status_code} indicates routing/connection issue. "
+                logger.warning(
+                    f"MetaApi {response.status_code} indicates routing/connection issue. "
                     "Refreshing account routing and retrying once..."
                 )
                 try:
@@ -462,13 +465,13 @@ class MetaTraderBroker(BaseBroker):
                         **kwargs,
                     )
                 except Exception as refresh_error:
-                    print(f"[MetaTrader] Routing refresh failed: {refresh_error}")
+                    logger.error(f"Routing refresh failed: {refresh_error}")
 
             # For trade endpoints, try to return JSON body so caller can parse error details
             if "/trade" in endpoint:
                 try:
                     error_json = response.json()
-                    print(f"[MetaApi] Trade error ({response.status_code}): {error_json}")
+                    logger.error(f"MetaApi trade error ({response.status_code}): {error_json}")
                     # Return the JSON so place_order can parse stringCode/numericCode
                     return error_json
                 except Exception:
@@ -1163,8 +1166,8 @@ class MetaTraderBroker(BaseBroker):
             if mapped_score >= (top_score - 40):
                 ordered = [mapped, *[item for item in ordered if item != mapped]]
             else:
-                print(
-                    f"[MetaTrader] Ignoring stale mapped symbol {mapped} for {lookup} "
+                logger.info(
+                    f"Ignoring stale mapped symbol {mapped} for {lookup} "
                     f"(mappedScore={mapped_score}, bestScore={top_score})"
                 )
 
@@ -1263,7 +1266,7 @@ class MetaTraderBroker(BaseBroker):
             )
             return True
         except Exception as exc:
-            print(f"[MetaTrader] Failed to apply SL/TP via positionId={position_id}: {exc}")
+            logger.error(f"Failed to apply SL/TP via positionId={position_id}: {exc}")
             return False
 
     async def _get_symbol_specification_for_broker_symbol(self, broker_symbol: str) -> dict[str, Any]:
@@ -1318,7 +1321,7 @@ class MetaTraderBroker(BaseBroker):
             try:
                 spec = await self._get_symbol_specification_for_broker_symbol(broker_symbol)
             except Exception as exc:
-                print(f"[MetaTrader] Symbol spec lookup failed for {broker_symbol}: {exc}")
+                logger.error(f"Symbol spec lookup failed for {broker_symbol}: {exc}")
                 unresolved_spec_candidates.append(broker_symbol)
                 continue
 
@@ -1348,8 +1351,8 @@ class MetaTraderBroker(BaseBroker):
         if unresolved_spec_candidates:
             broker_symbol = unresolved_spec_candidates[0]
             self._symbol_map[lookup] = broker_symbol
-            print(
-                f"[MetaTrader] Falling back to unresolved-spec candidate for {lookup}: "
+            logger.info(
+                f"Falling back to unresolved-spec candidate for {lookup}: "
                 f"{broker_symbol}"
             )
             return broker_symbol, {}, None
@@ -1408,8 +1411,8 @@ class MetaTraderBroker(BaseBroker):
         fallback = lookup.replace("_", "")
         if lookup not in self._symbol_map:
             aliases = self.SYMBOL_ALIASES.get(lookup, [])
-            print(f"[MetaTrader] WARNING: Could not resolve symbol '{lookup}' to broker format")
-            print(f"[MetaTrader] Tried aliases: {aliases[:5]}...")
+            logger.warning(f"WARNING: Could not resolve symbol '{lookup}' to broker format")
+            logger.info(f"Tried aliases: {aliases[:5]}...")
         self._symbol_map[lookup] = fallback
         return fallback
 
@@ -1448,7 +1451,7 @@ class MetaTraderBroker(BaseBroker):
             for token in self._broker_token_collisions:
                 self._broker_token_map.pop(token, None)
 
-            print(f"[MetaTrader] Broker has {len(self._broker_symbols)} symbols available")
+            logger.info(f"Broker has {len(self._broker_symbols)} symbols available")
 
             # Log indices found on broker (helpful for debugging)
             index_keywords = ['30', '40', '50', '100', '200', '225', '500', 'DAX', 'FTSE', 'CAC',
@@ -1456,11 +1459,11 @@ class MetaTraderBroker(BaseBroker):
             found_indices = [s for s in self._broker_symbols
                              if any(kw in s.upper() for kw in index_keywords)]
             if found_indices:
-                print(f"[MetaTrader] Indices found on broker: {found_indices[:15]}")
+                logger.info(f"Indices found on broker: {found_indices[:15]}")
                 if len(found_indices) > 15:
-                    print(f"[MetaTrader] ... and {len(found_indices) - 15} more indices")
+                    logger.info(f"... and {len(found_indices) - 15} more indices")
             else:
-                print("[MetaTrader] WARNING: No indices found on broker!")
+                logger.warning("WARNING: No indices found on broker!")
 
             # Pre-map common symbols
             mapped_count = 0
@@ -1469,10 +1472,10 @@ class MetaTraderBroker(BaseBroker):
                 if resolved != our_symbol.replace('_', ''):
                     mapped_count += 1
 
-            print(f"[MetaTrader] Successfully mapped {mapped_count}/{len(self.SYMBOL_ALIASES)} symbols to broker format")
+            logger.info(f"Successfully mapped {mapped_count}/{len(self.SYMBOL_ALIASES)} symbols to broker format")
 
         except Exception as e:
-            print(f"Warning: Could not build symbol map: {e}")
+            logger.warning(f"Warning: Could not build symbol map: {e}")
 
     async def _ensure_symbol_inventory(self, *, force_reload: bool = False) -> None:
         """
@@ -1489,9 +1492,9 @@ class MetaTraderBroker(BaseBroker):
         await self._build_symbol_map()
         after = len(self._broker_symbols)
         if after == 0:
-            print("[MetaTrader] WARNING: Broker symbol inventory still empty after refresh")
+            logger.warning("WARNING: Broker symbol inventory still empty after refresh")
         elif force_reload and after != before:
-            print(f"[MetaTrader] Symbol inventory refreshed: {before} -> {after}")
+            logger.info(f"Symbol inventory refreshed: {before} -> {after}")
 
     async def connect(self) -> None:
         """Connect to MetaTrader account via MetaApi."""
@@ -1534,11 +1537,11 @@ class MetaTraderBroker(BaseBroker):
 
             # Check connection status
             conn_status = account.get("connectionStatus", "UNKNOWN")
-            print(f"[MetaTrader] Account state: {account.get('state')} | connectionStatus: {conn_status}")
+            logger.info(f"Account state: {account.get('state')} | connectionStatus: {conn_status}")
 
             if conn_status != "CONNECTED":
                 # Wait for terminal to connect to broker
-                print(f"[MetaTrader] Terminal status is {conn_status}, waiting for connection...")
+                logger.info(f"Terminal status is {conn_status}, waiting for connection...")
                 for wait_attempt in range(6):
                     await asyncio.sleep(5)
                     account = await self._request(
@@ -1547,12 +1550,12 @@ class MetaTraderBroker(BaseBroker):
                         base_url=self.PROVISIONING_URL,
                     )
                     conn_status = account.get("connectionStatus", "UNKNOWN")
-                    print(f"[MetaTrader] Connection status check {wait_attempt + 1}/6: {conn_status}")
+                    logger.info(f"Connection status check {wait_attempt + 1}/6: {conn_status}")
                     if conn_status == "CONNECTED":
                         break
                 if conn_status != "CONNECTED":
-                    print(
-                        f"[MetaTrader] Account still '{conn_status}' after initial wait. "
+                    logger.info(
+                        f"Account still '{conn_status}' after initial wait. "
                         "Refreshing routing and waiting longer..."
                     )
                     connected = await self._refresh_metaapi_routing(
@@ -1594,17 +1597,17 @@ class MetaTraderBroker(BaseBroker):
             state = account.get("state", "UNKNOWN")
 
             # Log full diagnostic info for debugging
-            print("[MetaTrader] === ACCOUNT DIAGNOSTICS ===")
-            print(f"[MetaTrader] state={state} | connectionStatus={conn_status}")
-            print(f"[MetaTrader] platform={account.get('platform')} | type={account.get('type')}")
-            print(f"[MetaTrader] server={account.get('server')} | login={account.get('login')}")
-            print(f"[MetaTrader] region={account.get('region')} | reliability={account.get('reliability')}")
-            print(f"[MetaTrader] manualTrades={account.get('manualTrades')} | magic={account.get('magic')}")
-            print(f"[MetaTrader] accessRights={account.get('accessRights')} | tradeMode={account.get('tradeMode')}")
-            print("[MetaTrader] === END DIAGNOSTICS ===")
+            logger.info("=== ACCOUNT DIAGNOSTICS ===")
+            logger.info(f"state={state} | connectionStatus={conn_status}")
+            logger.info(f"platform={account.get('platform')} | type={account.get('type')}")
+            logger.info(f"server={account.get('server')} | login={account.get('login')}")
+            logger.info(f"region={account.get('region')} | reliability={account.get('reliability')}")
+            logger.info(f"manualTrades={account.get('manualTrades')} | magic={account.get('magic')}")
+            logger.info(f"accessRights={account.get('accessRights')} | tradeMode={account.get('tradeMode')}")
+            logger.info("=== END DIAGNOSTICS ===")
 
             if state != "DEPLOYED":
-                print(f"[MetaTrader] Account not deployed (state={state}), deploying...")
+                logger.info(f"Account not deployed (state={state}), deploying...")
                 await self._request(
                     "POST",
                     f"/users/current/accounts/{self.account_id}/deploy",
@@ -1613,7 +1616,7 @@ class MetaTraderBroker(BaseBroker):
                 await asyncio.sleep(5)
 
             if conn_status != "CONNECTED":
-                print(f"[MetaTrader] Terminal not connected ({conn_status}), waiting...")
+                logger.warning(f"Terminal not connected ({conn_status}), waiting...")
                 for i in range(12):  # Wait up to 60 seconds
                     await asyncio.sleep(5)
                     account = await self._request(
@@ -1622,16 +1625,16 @@ class MetaTraderBroker(BaseBroker):
                         base_url=self.PROVISIONING_URL,
                     )
                     conn_status = account.get("connectionStatus", "UNKNOWN")
-                    print(f"[MetaTrader] Connection wait {i+1}/12: {conn_status}")
+                    logger.info(f"Connection wait {i+1}/12: {conn_status}")
                     if conn_status == "CONNECTED":
                         return True
 
-                print(f"[MetaTrader] WARNING: Terminal still {conn_status} after waiting")
+                logger.warning(f"WARNING: Terminal still {conn_status} after waiting")
                 return False
 
             return True
         except Exception as e:
-            print(f"[MetaTrader] Error checking connection status: {e}")
+            logger.error(f"Error checking connection status: {e}")
             return False
 
     async def disconnect(self) -> None:
@@ -1672,7 +1675,7 @@ class MetaTraderBroker(BaseBroker):
         if self._is_rate_limited():
             # Return last known data if available, or raise error
             if cache_key in self._cache:
-                print("[MetaTrader] Rate limited, returning stale cached account info")
+                logger.warning("Rate limited, returning stale cached account info", sample="stale_account_info")
                 return self._cache[cache_key]["data"]
             raise RateLimitError("Rate limited and no cached data available")
 
@@ -1694,7 +1697,7 @@ class MetaTraderBroker(BaseBroker):
                     realized_today += Decimal(str(deal.get("swap", 0)))
                     realized_today += Decimal(str(deal.get("commission", 0)))
             except Exception as e:
-                print(f"[MetaTrader] Error calculating daily P&L: {e}")
+                logger.error(f"Error calculating daily P&L: {e}")
 
             account_info = AccountInfo(
                 account_id=self.account_id,
@@ -1715,7 +1718,7 @@ class MetaTraderBroker(BaseBroker):
         except RateLimitError:
             # Return stale cache if available
             if cache_key in self._cache:
-                print("[MetaTrader] Rate limited, returning stale cached account info")
+                logger.warning("Rate limited, returning stale cached account info", sample="stale_account_info")
                 return self._cache[cache_key]["data"]
             raise
 
@@ -1735,10 +1738,10 @@ class MetaTraderBroker(BaseBroker):
         if self._is_rate_limited():
             # Return last known data if available
             if cache_key in self._cache:
-                print("[MetaTrader] Rate limited, returning stale cached positions")
+                logger.warning("Rate limited, returning stale cached positions", sample="stale_positions")
                 return self._cache[cache_key]["data"]
             # Return empty list if no cache (better than failing)
-            print("[MetaTrader] Rate limited and no cached positions, returning empty list")
+            logger.warning("Rate limited and no cached positions, returning empty list", sample="stale_positions_empty")
             return []
 
         try:
@@ -1770,9 +1773,9 @@ class MetaTraderBroker(BaseBroker):
         except RateLimitError:
             # Return stale cache if available
             if cache_key in self._cache:
-                print("[MetaTrader] Rate limited, returning stale cached positions")
+                logger.warning("Rate limited, returning stale cached positions", sample="stale_positions")
                 return self._cache[cache_key]["data"]
-            print("[MetaTrader] Rate limited and no cached positions, returning empty list")
+            logger.warning("Rate limited and no cached positions, returning empty list", sample="stale_positions_empty")
             return []
 
     async def get_position(self, symbol: str) -> Position | None:
@@ -1804,7 +1807,7 @@ class MetaTraderBroker(BaseBroker):
                 self._set_cache(cache_key, spec, 300)  # Cache for 5 minutes
                 return spec
             except Exception as e:
-                print(f"[MetaTrader] Could not fetch symbol specification for {lookup} via {broker_symbol}: {e}")
+                logger.warning(f"Could not fetch symbol specification for {lookup} via {broker_symbol}: {e}")
 
         return {}
 
@@ -1854,7 +1857,7 @@ class MetaTraderBroker(BaseBroker):
             order.side,
         )
         if symbol_resolution_error:
-            print(f"[MetaTrader] {symbol_resolution_error}")
+            logger.error(symbol_resolution_error)
             return OrderResult(
                 order_id="",
                 symbol=order.symbol,
@@ -1867,7 +1870,7 @@ class MetaTraderBroker(BaseBroker):
             )
 
         if spec:
-            print(f"[MetaTrader] Symbol spec for {broker_symbol}: "
+            logger.info(f"Symbol spec for {broker_symbol}: "
                   f"fillingModes={spec.get('fillingModes')}, "
                   f"minVol={spec.get('minVolume')}, maxVol={spec.get('maxVolume')}, "
                   f"volStep={spec.get('volumeStep')}, "
@@ -1881,7 +1884,7 @@ class MetaTraderBroker(BaseBroker):
                 f"Trading non consentito su {broker_symbol} per side={order.side.value} "
                 f"(tradeMode={trade_mode})."
             )
-            print(f"[MetaTrader] {error_msg}")
+            logger.error(error_msg)
             return OrderResult(
                 order_id="",
                 symbol=order.symbol,
@@ -1897,7 +1900,7 @@ class MetaTraderBroker(BaseBroker):
         raw_volume = float(order.size)
         volume = self._normalize_volume(raw_volume, spec) if spec else raw_volume
         if volume != raw_volume:
-            print(f"[MetaTrader] Volume adjusted: {raw_volume} → {volume} "
+            logger.info(f"Volume adjusted: {raw_volume} → {volume} "
                   f"(min={spec.get('minVolume')}, max={spec.get('maxVolume')}, step={spec.get('volumeStep')})")
 
         # Map order type
@@ -1938,7 +1941,7 @@ class MetaTraderBroker(BaseBroker):
                 FILLING_MODE_MAP.get(mode, mode) for mode in symbol_filling_modes
             ]
             payload["fillingModes"] = order_filling_modes
-            print(f"[MetaTrader] Using symbol's fillingModes: {symbol_filling_modes} → {order_filling_modes}")
+            logger.info(f"Using symbol's fillingModes: {symbol_filling_modes} → {order_filling_modes}")
 
         # Add SL/TP
         if order.stop_loss:
@@ -2008,8 +2011,8 @@ class MetaTraderBroker(BaseBroker):
 
             # For MARKET orders: require positionId or explicit success code.
             if order.order_type == OrderType.MARKET and not is_filled and not is_success_code and has_order:
-                print(
-                    f"[MetaTrader] Market order has orderId={order_id} but no positionId "
+                logger.info(
+                    f"Market order has orderId={order_id} but no positionId "
                     f"and stringCode='{string_code}' - treating as rejection"
                 )
                 has_order = False
@@ -2026,6 +2029,8 @@ class MetaTraderBroker(BaseBroker):
             )
 
         for attempt in range(MAX_RETRIES):
+            if attempt > 0:
+                self._record_retry()
             # Apply filling mode override for retries
             override = RETRY_FILLING_OVERRIDES[attempt]
             if override == "REMOVE":
@@ -2035,13 +2040,13 @@ class MetaTraderBroker(BaseBroker):
 
             try:
                 filling_info = payload.get('fillingModes', 'default')
-                print(f"[MetaTrader] Placing order (attempt {attempt + 1}/{MAX_RETRIES}, filling={filling_info}): {payload}")
+                logger.info(f"Placing order (attempt {attempt + 1}/{MAX_RETRIES}, filling={filling_info}): {payload}")
                 result = await self._request(
                     "POST",
                     f"/users/current/accounts/{self.account_id}/trade",
                     json=payload,
                 )
-                print(f"[MetaTrader] Order response: {result}")
+                logger.info(f"Order response: {result}")
 
                 (
                     order_id,
@@ -2056,10 +2061,10 @@ class MetaTraderBroker(BaseBroker):
                 # Success path
                 if accepted:
                     if has_order and not is_filled and string_code not in SUCCESS_CODES:
-                        print(f"[MetaTrader] WARNING: Unknown stringCode '{string_code}' (numericCode={numeric_code}) but order exists - treating as success")
+                        logger.warning(f"WARNING: Unknown stringCode '{string_code}' (numericCode={numeric_code}) but order exists - treating as success")
 
                     order_status = OrderStatus.FILLED if is_filled else (OrderStatus.PENDING if has_order else OrderStatus.REJECTED)
-                    print(f"[MetaTrader] Order {order_status.value} | stringCode: {string_code} | orderId: {order_id}")
+                    logger.info(f"Order {order_status.value} | stringCode: {string_code} | orderId: {order_id}")
 
                     return OrderResult(
                         order_id=order_id,
@@ -2098,8 +2103,8 @@ class MetaTraderBroker(BaseBroker):
                     fallback_payload.pop("stopLoss", None)
                     fallback_payload.pop("takeProfit", None)
 
-                    print(
-                        f"[MetaTrader] INVALID_STOPS on {broker_symbol}. "
+                    logger.warning(
+                        f"INVALID_STOPS on {broker_symbol}. "
                         "Retrying market order without SL/TP and applying protection after fill..."
                     )
                     try:
@@ -2108,7 +2113,7 @@ class MetaTraderBroker(BaseBroker):
                             f"/users/current/accounts/{self.account_id}/trade",
                             json=fallback_payload,
                         )
-                        print(f"[MetaTrader] Fallback order response (no SL/TP): {fallback_result}")
+                        logger.warning(f"Fallback order response (no SL/TP): {fallback_result}")
 
                         (
                             fb_order_id,
@@ -2145,8 +2150,8 @@ class MetaTraderBroker(BaseBroker):
                                         "impossibile applicare SL/TP post-fill"
                                     )
 
-                            print(
-                                f"[MetaTrader] Fallback order {order_status.value} | "
+                            logger.warning(
+                                f"Fallback order {order_status.value} | "
                                 f"stringCode: {fb_string_code} | orderId: {fb_order_id}"
                             )
                             return OrderResult(
@@ -2178,24 +2183,24 @@ class MetaTraderBroker(BaseBroker):
                         )
                         if fb_string_code in RETRYABLE_CODES and attempt < MAX_RETRIES - 1:
                             wait_secs = 2
-                            print(
-                                f"[MetaTrader] Retryable fallback error ({fb_string_code}), "
+                            logger.warning(
+                                f"Retryable fallback error ({fb_string_code}), "
                                 f"trying different filling in {wait_secs}s..."
                             )
                             await asyncio.sleep(wait_secs)
                             continue
                     except Exception as fallback_exc:
-                        print(f"[MetaTrader] Fallback order without SL/TP failed: {fallback_exc}")
+                        logger.error(f"Fallback order without SL/TP failed: {fallback_exc}")
 
                 # If retryable and not last attempt, wait and retry with different filling
                 if string_code in RETRYABLE_CODES and attempt < MAX_RETRIES - 1:
                     wait_secs = 2
-                    print(f"[MetaTrader] Retryable error ({string_code}), trying different filling in {wait_secs}s...")
+                    logger.warning(f"Retryable error ({string_code}), trying different filling in {wait_secs}s...")
                     await asyncio.sleep(wait_secs)
                     continue
 
                 # Non-retryable or last attempt
-                print(f"[MetaTrader] Order REJECTED - {reject_reason}")
+                logger.error(f"Order REJECTED - {reject_reason}")
                 return OrderResult(
                     order_id=order_id if order_id else "",
                     symbol=order.symbol,
@@ -2208,13 +2213,11 @@ class MetaTraderBroker(BaseBroker):
                 )
 
             except Exception as e:
-                import traceback
-                print(f"[MetaTrader] Order EXCEPTION (attempt {attempt + 1}): {str(e)}")
-                print(f"[MetaTrader] Traceback: {traceback.format_exc()}")
+                logger.exception(f"Order EXCEPTION (attempt {attempt + 1}): {str(e)}")
 
                 if attempt < MAX_RETRIES - 1:
                     wait_secs = (attempt + 1) * 3
-                    print(f"[MetaTrader] Retrying in {wait_secs}s...")
+                    logger.warning(f"Retrying in {wait_secs}s...")
                     await asyncio.sleep(wait_secs)
                     continue
 
@@ -2230,7 +2233,7 @@ class MetaTraderBroker(BaseBroker):
                 )
 
         # Should not reach here, but just in case
-        print(f"[MetaTrader] All retries exhausted. Last: {last_reject_reason}")
+        logger.error(f"All retries exhausted. Last: {last_reject_reason}")
         return OrderResult(
             order_id="",
             symbol=order.symbol,
@@ -2375,7 +2378,7 @@ class MetaTraderBroker(BaseBroker):
         # Check if we're rate limited
         if self._is_rate_limited():
             if cache_key in self._cache:
-                print("[MetaTrader] Rate limited, returning stale cached orders")
+                logger.warning("Rate limited, returning stale cached orders", sample="stale_orders")
                 all_orders = self._cache[cache_key]["data"]
                 if symbol:
                     broker_symbol = self._resolve_symbol(symbol)
@@ -2425,7 +2428,7 @@ class MetaTraderBroker(BaseBroker):
 
         except RateLimitError:
             if cache_key in self._cache:
-                print("[MetaTrader] Rate limited, returning stale cached orders")
+                logger.warning("Rate limited, returning stale cached orders", sample="stale_orders")
                 all_orders = self._cache[cache_key]["data"]
                 if symbol:
                     broker_symbol = self._resolve_symbol(symbol)
@@ -2486,7 +2489,7 @@ class MetaTraderBroker(BaseBroker):
             return deals
 
         except Exception as e:
-            print(f"[MetaTrader] Error fetching deal history: {e}")
+            logger.error(f"Error fetching deal history: {e}")
             if cache_key in self._cache:
                 return self._cache[cache_key]["data"]
             return []
@@ -2525,10 +2528,12 @@ class MetaTraderBroker(BaseBroker):
 
         # Log errors for first few symbols only (to avoid spam)
         if errors and len(prices) == 0:
-            print(f"[MetaTrader] get_prices failed for ALL {len(errors)} symbols!")
-            print(f"[MetaTrader] First 3 errors: {errors[:3]}")
+            logger.error(
+                "get_prices failed for ALL %d symbols! First 3 errors: %s",
+                len(errors), errors[:3], sample="get_prices_failed",
+            )
         elif errors:
-            print(f"[MetaTrader] get_prices: {len(prices)} OK, {len(errors)} failed")
+            logger.warning("get_prices: %d OK, %d failed", len(prices), len(errors), sample="get_prices_partial")
 
         return prices
 
@@ -2653,7 +2658,7 @@ class MetaTraderBroker(BaseBroker):
                     )
                     normalized = _normalize_payload(payload)
                     if normalized:
-                        print(f"[MetaTrader] Price fallback endpoint used for {candidate}: {endpoint}")
+                        logger.debug("Price fallback endpoint used for %s: %s", candidate, endpoint)
                         return normalized
                     last_error = Exception(f"Invalid payload for {candidate} via {endpoint}: {payload}")
                 except Exception as exc:
@@ -2686,7 +2691,7 @@ class MetaTraderBroker(BaseBroker):
         # Check if we're rate limited
         if self._is_rate_limited():
             if cache_key in self._cache:
-                print(f"[MetaTrader] Rate limited, returning stale cached price for {symbol}")
+                logger.warning("Rate limited, returning stale cached price for %s", symbol, sample=f"stale_price:{symbol}")
                 return self._cache[cache_key]["data"]
             raise RateLimitError(f"Rate limited and no cached price for {symbol}")
 
@@ -2754,7 +2759,7 @@ class MetaTraderBroker(BaseBroker):
                             continue
 
                         if candidate != broker_symbol:
-                            print(f"[MetaTrader] Price fallback resolved {lookup} -> {candidate}")
+                            logger.warning(f"Price fallback resolved {lookup} -> {candidate}")
                             self._symbol_map[lookup] = candidate
 
                         tick = Tick(
@@ -2812,13 +2817,13 @@ class MetaTraderBroker(BaseBroker):
 
         except RateLimitError:
             if cache_key in self._cache:
-                print(f"[MetaTrader] Rate limited, returning stale cached price for {symbol}")
+                logger.warning("Rate limited, returning stale cached price for %s", symbol, sample=f"stale_price:{symbol}")
                 return self._cache[cache_key]["data"]
             raise
         except Exception as e:
             # For other errors, still try to return cached data
             if cache_key in self._cache:
-                print(f"[MetaTrader] Error getting price for {symbol}, returning cached: {e}")
+                logger.warning("Error getting price for %s, returning cached: %s", symbol, e, sample=f"price_error:{symbol}")
                 return self._cache[cache_key]["data"]
             raise Exception(f"Failed to get price for {symbol}: {e}")
 
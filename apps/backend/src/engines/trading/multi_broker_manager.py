@@ -17,9 +17,12 @@ from fastapi import HTTPException
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.config import settings
 from src.core.models import BrokerAccount
 from src.engines.trading.auto_trader import AnalysisMode, AutoTrader, BotConfig, BotStatus
 from src.engines.trading.broker_factory import BrokerFactory, NoBrokerConfiguredError
+from src.engines.trading.broker_telemetry import get_broker_telemetry
+from src.engines.trading.broker_worker import BrokerWorkerPool, RemoteAutoTrader
 from src.services.broker_credentials_service import (
     normalize_credentials,
     resolve_alpaca_runtime_credentials,
@@ -51,6 +54,10 @@ def _symbol_token(value: Any) -> str:
     return "".join(ch for ch in text if ch.isalnum())
 
 
+def _telemetry_label(broker_id: int) -> str:
+    return f"broker-{broker_id}"
+
+
 @dataclass
 class BrokerInstance:
     """Represents a running broker instance.
@@ -65,8 +72,8 @@ class BrokerInstance:
     symbols: list[str]
     runtime_credentials: dict[str, str]
 
-    # AutoTrader instance
-    trader: AutoTrader
+    # AutoTrader instance (RemoteAutoTrader proxy in process execution mode)
+    trader: AutoTrader | RemoteAutoTrader
 
     # Status tracking
     status: str = "stopped"
@@ -87,11 +94,25 @@ class MultiBrokerManager:
     - Own risk settings
     - Own analysis interval
     - Own AI model selection
+
+    With BROKER_EXECUTION_MODE=process each AutoTrader runs in a supervised
+    worker process (see broker_worker.py); the public surface is unchanged.
     """
 
-    def __init__(self):
+    def __init__(self, execution_mode: str | None = None):
         self._instances: dict[int, BrokerInstance] = {}
         self._lock = asyncio.Lock()
+        mode = (execution_mode or settings.BROKER_EXECUTION_MODE or "inline").strip().lower()
+        self._worker_pool: BrokerWorkerPool | None = BrokerWorkerPool() if mode == "process" else None
+
+    @property
+    def execution_mode(self) -> str:
+        return "process" if self._worker_pool else "inline"
+
+    def _create_trader(self, broker_id: int) -> AutoTrader | RemoteAutoTrader:
+        if self._worker_pool:
+            return self._worker_pool.create_trader(broker_id)
+        return AutoTrader()
 
     async def load_brokers(self, db: AsyncSession) -> list[BrokerAccount]:
         """Load all broker accounts from database."""
@@ -110,7 +131,7 @@ class MultiBrokerManager:
                 return self._instances[broker_account.id]
 
             # Create AutoTrader with broker-specific config
-            trader = AutoTrader()
+            trader = self._create_trader(broker_account.id)
             config = self._create_config_from_account(broker_account)
             trader.configure(config)
 
@@ -257,6 +278,7 @@ class MultiBrokerManager:
             metaapi_token=runtime_credentials.get("access_token"),
             metaapi_account_id=runtime_credentials.get("account_id"),
             broker_credentials=runtime_credentials,
+            broker_label=_telemetry_label(account.id),
         )
 
     async def start_broker(self, broker_id: int, db: AsyncSession) -> dict:
@@ -514,7 +536,12 @@ class MultiBrokerManager:
                 "analysis_mode": trader.config.analysis_mode.value,
                 "analysis_interval": trader.config.analysis_interval_seconds,
                 "enabled_models": trader.config.enabled_models,
-            }
+            },
+            "execution": {
+                "mode": self.execution_mode,
+                "worker": self._worker_pool.describe(broker_id) if self._worker_pool else None,
+            },
+            "telemetry": get_broker_telemetry().summary(_telemetry_label(broker_id)),
         }
 
     async def _ensure_broker_connection(
@@ -676,6 +703,7 @@ class MultiBrokerManager:
         try:
             broker = BrokerFactory.create(
                 broker_type=instance.broker_type,
+                telemetry_label=_telemetry_label(broker_id),
                 **broker_kwargs,
             )
         except (NoBrokerConfiguredError, NotImplementedError) as exc:
@@ -704,9 +732,13 @@ class MultiBrokerManager:
                 return dict(instance.last_account_snapshot)
             return None
 
-        try:
-            account_info = await broker.get_account_info()
-        except Exception:
+        # Positions are only counted, but fetching them alongside the account saves a round trip.
+        account_info, open_positions = await asyncio.gather(
+            broker.get_account_info(),
+            broker.get_positions(),
+            return_exceptions=True,
+        )
+        if isinstance(account_info, BaseException):
             if instance and instance.last_account_snapshot:
                 return dict(instance.last_account_snapshot)
             return None
@@ -728,14 +760,10 @@ class MultiBrokerManager:
 
         # Open positions should not block account balance/equity visibility.
         open_positions_count = 0
-        try:
-            open_positions = await broker.get_positions()
+        if not isinstance(open_positions, BaseException):
             open_positions_count = len(open_positions or [])
-        except Exception:
-            if instance and instance.last_account_snapshot:
-                open_positions_count = int(instance.last_account_snapshot.get("open_positions", 0) or 0)
-            else:
-                open_positions_count = 0
+        elif instance and instance.last_account_snapshot:
+            open_positions_count = int(instance.last_account_snapshot.get("open_positions", 0) or 0)
 
         payload = {
             "broker_id": broker_id,
@@ -888,29 +916,30 @@ class MultiBrokerManager:
         """Get a specific broker instance."""
         return self._instances.get(broker_id)
 
-    def get_broker_logs(self, broker_id: int, limit: int = 50) -> dict | None:
-        """Get analysis logs for a specific broker."""
+    def get_broker_logs(
+        self,
+        broker_id: int,
+        limit: int = 50,
+        symbol: str | None = None,
+        log_type: str | None = None,
+        before: int | None = None,
+        after: int | None = None,
+    ) -> dict | None:
+        """Get a page of analysis logs for a specific broker (see ``AnalysisLogStore.query``)."""
         if broker_id not in self._instances:
             return None
 
         instance = self._instances[broker_id]
-        trader = instance.trader
-        logs = trader.state.analysis_logs[-limit:]
+        store = instance.trader.state.analysis_logs
+        page = store.query(symbol=symbol, log_type=log_type, limit=limit, before=before, after=after)
 
         return {
             "broker_id": broker_id,
             "name": instance.broker_name,
-            "logs": [
-                {
-                    "timestamp": log.timestamp.isoformat(),
-                    "symbol": log.symbol,
-                    "type": log.log_type,
-                    "message": log.message,
-                    "details": log.details
-                }
-                for log in logs
-            ],
-            "total": len(trader.state.analysis_logs)
+            "logs": page.to_dicts(),
+            "total": len(store),
+            "next_cursor": page.next_cursor,
+            "last_id": page.last_id,
         }
 
     async def refresh_broker_config(self, broker_id: int, db: AsyncSession) -> dict:
@@ -976,6 +1005,11 @@ class MultiBrokerManager:
             }
         }
 
+    async def shutdown(self) -> None:
+        """Stop worker processes (process execution mode only)."""
+        if self._worker_pool:
+            await self._worker_pool.shutdown()
+
 
 # Singleton instance
 _multi_broker_manager: MultiBrokerManager | None = None
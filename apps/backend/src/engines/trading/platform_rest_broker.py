@@ -7,6 +7,9 @@ Reusable broker adapter for platforms exposing HTTP APIs with:
 - quote and candle endpoints
 
 Used for: cTrader, DXtrade, MatchTrader.
+
+HTTP clients, auth tokens and rate limits are shared between instances
+(see ``platform_rest_session``).
 """
 
 import asyncio
@@ -35,6 +38,13 @@ from src.engines.trading.base_broker import (
     Tick,
     TimeInForce,
 )
+from src.engines.trading.platform_rest_session import (
+    EXPIRES_IN_KEYS,
+    RestHostClient,
+    acquire_host_client,
+    get_token_session,
+    release_host_client,
+)
 
 
 def _to_decimal(value: Any, fallback: str = "0") -> Decimal:
@@ -266,8 +276,13 @@ class PlatformRestBroker(BaseBroker):
         self.timeout_seconds = max(5.0, _to_float(kwargs.get("request_timeout_seconds"), 20.0))
         self.auth_header_name = str(kwargs.get("auth_header_name") or "Authorization").strip() or "Authorization"
         self.auth_scheme = str(kwargs.get("auth_scheme") or "Bearer").strip() or "Bearer"
-        self._token: str | None = str(kwargs.get("access_token") or "").strip() or None
-        self._client: httpx.AsyncClient | None = None
+        self._session = get_token_session(
+            self.platform, self.base_url, self.account_id, self.server_name, self.password
+        )
+        initial_token = str(kwargs.get("access_token") or "").strip() or None
+        if initial_token and not self._session.token:
+            self._session.set_token(initial_token)
+        self._host: RestHostClient | None = None
 
         self.endpoints = dict(self.DEFAULT_ENDPOINTS[self.platform])
         for key in list(self.endpoints.keys()):
@@ -295,6 +310,14 @@ class PlatformRestBroker(BaseBroker):
     def name(self) -> str:
         return self.platform.upper()
 
+    @property
+    def _token(self) -> str | None:
+        return self._session.token
+
+    @property
+    def _client(self) -> httpx.AsyncClient | None:
+        return self._host.client if self._host else None
+
     @property
     def supported_markets(self) -> list[str]:
         return ["forex", "indices", "commodities", "stocks", "crypto"]
@@ -354,11 +377,8 @@ class PlatformRestBroker(BaseBroker):
         return urljoin(f"{self.base_url}/", cleaned.lstrip("/"))
 
     async def _ensure_client(self) -> None:
-        if self._client is None:
-            self._client = httpx.AsyncClient(
-                timeout=self.timeout_seconds,
-                verify=False,
-            )
+        if self._host is None or self._host.client.is_closed:
+            self._host = acquire_host_client(self.base_url)
 
     async def _request(
         self,
@@ -369,11 +389,17 @@ class PlatformRestBroker(BaseBroker):
         json_data: dict[str, Any] | None = None,
         form_data: dict[str, Any] | None = None,
         retry_auth: bool = True,
+        retry_rate_limit: bool = True,
     ) -> tuple[int, Any]:
         await self._ensure_client()
         if not self._client:
             raise ConnectionError("HTTP client not initialized")
 
+        if self._session.needs_refresh():
+            await self._refresh_token(stale_token=self._token)
+        await self._host.limiter.wait()
+
+        token_used = self._token
         headers = self._auth_headers()
         if form_data is not None and json_data is None:
             headers["Content-Type"] = "application/x-www-form-urlencoded"
@@ -385,16 +411,31 @@ class PlatformRestBroker(BaseBroker):
             params=params,
             json=json_data,
             data=form_data,
+            timeout=self.timeout_seconds,
         )
         status_code = response.status_code
+        self._host.limiter.update(status_code, response.headers)
         try:
             payload = response.json() if response.content else {}
         except Exception:
             payload = {"raw": response.text} if response.text else {}
 
-        if status_code in {401, 403} and retry_auth and self._token:
-            self._token = None
-            await self._login()
+        if status_code == 429 and retry_rate_limit:
+            # The limiter now holds the Retry-After window; wait it out once.
+            self._record_retry()
+            return await self._request(
+                method,
+                endpoint,
+                params=params,
+                json_data=json_data,
+                form_data=form_data,
+                retry_auth=retry_auth,
+                retry_rate_limit=False,
+            )
+
+        if status_code in {401, 403} and retry_auth and token_used:
+            self._record_retry()
+            await self._refresh_token(stale_token=token_used)
             return await self._request(
                 method,
                 endpoint,
@@ -402,6 +443,7 @@ class PlatformRestBroker(BaseBroker):
                 json_data=json_data,
                 form_data=form_data,
                 retry_auth=False,
+                retry_rate_limit=retry_rate_limit,
             )
 
         if status_code >= 400:
@@ -518,6 +560,14 @@ class PlatformRestBroker(BaseBroker):
             opened_at=_parse_timestamp(_pick(payload, ["openTime", "openedAt", "createdAt"], datetime.now(UTC).isoformat())),
         )
 
+    async def _refresh_token(self, stale_token: str | None) -> None:
+        """Re-login once for everyone sharing the session (single-flight)."""
+        async with self._session.lock:
+            if self._session.token and self._session.token != stale_token and not self._session.needs_refresh():
+                return  # Another instance already refreshed it
+            self._session.set_token(None)
+            await self._login()
+
     async def _login(self) -> bool:
         endpoint = self._endpoint("login_endpoint")
         if not endpoint:
@@ -545,11 +595,13 @@ class PlatformRestBroker(BaseBroker):
             "server": self.server_name,
         }
 
+        await self._host.limiter.wait()
         response = await self._client.request(
             method=method,
             url=url,
             headers=self._auth_headers(),
             json=login_payload,
+            timeout=self.timeout_seconds,
         )
         if response.status_code in {404, 405}:
             form_headers = self._auth_headers()
@@ -559,7 +611,9 @@ class PlatformRestBroker(BaseBroker):
                 url=url,
                 headers=form_headers,
                 data=login_form,
+                timeout=self.timeout_seconds,
             )
+        self._host.limiter.update(response.status_code, response.headers)
         if response.status_code in {404, 405}:
             return False
         if response.status_code in {401, 403}:
@@ -576,7 +630,9 @@ class PlatformRestBroker(BaseBroker):
 
         token = self._extract_token(payload)
         if token:
-            self._token = token
+            expires_in = _pick(payload, EXPIRES_IN_KEYS)
+            self._session.set_token(token, _to_float(expires_in) if expires_in is not None else None)
+            self._session.logins += 1
         return True
 
     async def connect(self) -> None:
@@ -589,18 +645,25 @@ class PlatformRestBroker(BaseBroker):
 
         health_endpoint = self._endpoint("health_endpoint")
         if health_endpoint:
-            response = await self._client.get(self._build_url(health_endpoint), headers=self._auth_headers())
+            response = await self._client.get(
+                self._build_url(health_endpoint),
+                headers=self._auth_headers(),
+                timeout=self.timeout_seconds,
+            )
             if response.status_code >= 500:
                 raise ConnectionError(f"{self.platform} health endpoint error ({response.status_code})")
 
-        await self._login()
+        # Reuse a live token from another instance with the same credentials.
+        async with self._session.lock:
+            if not self._session.token or self._session.needs_refresh():
+                await self._login()
         self._connected = True
 
     async def disconnect(self) -> None:
-        if self._client:
-            await self._client.aclose()
-            self._client = None
-        self._token = None
+        # The token stays with the shared session for other instances.
+        if self._host:
+            host, self._host = self._host, None
+            await release_host_client(host)
         self._connected = False
 
     async def get_account_info(self) -> AccountInfo:
@@ -0,0 +1,186 @@
+"""
+Platform REST Sessions - Shared HTTP clients, tokens and rate limits.
+
+Support module for ``PlatformRestBroker`` (cTrader, DXtrade, MatchTrader):
+
+- ``RestTokenSession``: one auth token per credential set, shared by every
+  broker instance logging in with the same account/server. Token lifetime is
+  read from the login payload (``expires_in``) or the JWT ``exp`` claim and the
+  token is refreshed shortly before it expires. Logins are single-flight, so a
+  burst of 401s triggers one re-login instead of one per request.
+- ``RestHostClient``: one keep-alive ``httpx.AsyncClient`` per host, reference
+  counted across broker instances.
+- ``RestRateLimiter``: per-host limiter fed by ``X-RateLimit-*`` /
+  ``RateLimit-*`` / ``Retry-After`` headers; requests wait instead of
+  hammering the API into 429s.
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import time
+import weakref
+from typing import Any
+from urllib.parse import urlsplit
+
+import httpx
+
+# Refresh tokens this many seconds before they expire.
+TOKEN_REFRESH_MARGIN_SECONDS = 60.0
+# Upper bound for a single rate-limit wait.
+MAX_RATE_LIMIT_WAIT_SECONDS = 60.0
+
+KEEPALIVE_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+
+EXPIRES_IN_KEYS = ["expires_in", "expiresIn", "data.expires_in", "data.expiresIn", "result.expires_in"]
+REMAINING_HEADERS = ("x-ratelimit-remaining", "ratelimit-remaining", "x-rate-limit-remaining")
+RESET_HEADERS = ("x-ratelimit-reset", "ratelimit-reset", "x-rate-limit-reset")
+
+
+def _header_float(headers: Any, names: tuple[str, ...]) -> float | None:
+    for name in names:
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            return float(str(value).split(",")[0].strip())
+        except ValueError:
+            continue
+    return None
+
+
+def _seconds_until(value: float | None) -> float | None:
+    """Normalize reset values sent either as a delay or as an epoch timestamp."""
+    if value is None:
+        return None
+    if value > 1e9:
+        return max(0.0, value - time.time())
+    return max(0.0, value)
+
+
+def _jwt_expiry(token: str) -> float | None:
+    """Return the JWT ``exp`` claim (epoch seconds) without verifying the token."""
+    parts = token.split(".")
+    if len(parts) != 3:
+        return None
+    try:
+        padded = parts[1] + "=" * (-len(parts[1]) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(padded))
+        exp = claims.get("exp")
+        return float(exp) if exp is not None else None
+    except Exception:
+        return None
+
+
+class RestRateLimiter:
+    """Shared per-host limiter driven by the API's own rate-limit headers."""
+
+    def __init__(self):
+        self.remaining: float | None = None
+        self.throttled = 0
+        self._blocked_until = 0.0
+
+    @property
+    def blocked_for(self) -> float:
+        return max(0.0, self._blocked_until - time.monotonic())
+
+    async def wait(self) -> None:
+        delay = self.blocked_for
+        if delay > 0:
+            self.throttled += 1
+            await asyncio.sleep(min(delay, MAX_RATE_LIMIT_WAIT_SECONDS))
+
+    def update(self, status_code: int, headers: Any) -> None:
+        self.remaining = _header_float(headers, REMAINING_HEADERS)
+        reset = _seconds_until(_header_float(headers, RESET_HEADERS))
+        if status_code == 429:
+            retry_after = _seconds_until(_header_float(headers, ("retry-after",)))
+            delay = retry_after if retry_after is not None else reset if reset is not None else 1.0
+        elif self.remaining is not None and self.remaining <= 0 and reset is not None:
+            delay = reset
+        else:
+            return
+        delay = min(delay, MAX_RATE_LIMIT_WAIT_SECONDS)
+        self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+
+
+class RestHostClient:
+    """Keep-alive HTTP client shared by all brokers talking to one host."""
+
+    def __init__(self, origin: str):
+        self.origin = origin
+        self.client = httpx.AsyncClient(verify=False, limits=KEEPALIVE_LIMITS)
+        self.limiter = RestRateLimiter()
+        self.refs = 0
+
+
+class RestTokenSession:
+    """Auth token shared by broker instances using the same credentials."""
+
+    def __init__(self, key: str):
+        self.key = key
+        self.token: str | None = None
+        self.expires_at: float | None = None  # epoch seconds
+        self.logins = 0
+        self.lock = asyncio.Lock()
+
+    def set_token(self, token: str | None, expires_in: float | None = None) -> None:
+        self.token = token
+        if not token:
+            self.expires_at = None
+        elif expires_in is not None and expires_in > 0:
+            self.expires_at = time.time() + expires_in
+        else:
+            self.expires_at = _jwt_expiry(token)
+
+    def needs_refresh(self) -> bool:
+        if not self.token or self.expires_at is None:
+            return False
+        return time.time() >= self.expires_at - TOKEN_REFRESH_MARGIN_SECONDS
+
+
+_host_clients: dict[tuple[str, int], RestHostClient] = {}
+_token_sessions: "weakref.WeakValueDictionary[str, RestTokenSession]" = weakref.WeakValueDictionary()
+
+
+def _origin(base_url: str) -> str:
+    parts = urlsplit(base_url)
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
+
+def acquire_host_client(base_url: str) -> RestHostClient:
+    """Get (or open) the shared client for ``base_url``'s host on the running loop."""
+    key = (_origin(base_url), id(asyncio.get_running_loop()))
+    host = _host_clients.get(key)
+    if host is None or host.client.is_closed:
+        host = RestHostClient(key[0])
+        _host_clients[key] = host
+    host.refs += 1
+    return host
+
+
+async def release_host_client(host: RestHostClient) -> None:
+    """Drop one reference; the connection pool closes with the last user."""
+    host.refs -= 1
+    if host.refs > 0:
+        return
+    for key, value in list(_host_clients.items()):
+        if value is host:
+            del _host_clients[key]
+    await host.client.aclose()
+
+
+def get_token_session(platform: str, base_url: str, account_id: str, server_name: str, password: str) -> RestTokenSession:
+    """Get the token session shared by brokers with these credentials."""
+    digest = hashlib.sha256(password.encode()).hexdigest()[:16]
+    key = f"{platform}|{_origin(base_url)}|{server_name}|{account_id}|{digest}"
+    session = _token_sessions.get(key)
+    if session is None:
+        session = RestTokenSession(key)
+        _token_sessions[key] = session
+    return session
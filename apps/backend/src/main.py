@@ -5,8 +5,9 @@ FastAPI application entry point
 
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from prometheus_client import CONTENT_TYPE_LATEST
 
 from src.api.v1.routes import (
     admin,
@@ -26,6 +27,10 @@ from src.api.v1.routes import settings as settings_routes
 from src.core.config import settings
 from src.core.database import init_db
 from src.core.email import email_service
+from src.engines.trading.broker_telemetry import render_metrics
+from src.services.chart_prerender_service import get_chart_prerender_service
+from src.services.compute_executor import get_compute_executor
+from src.services.deal_sync_service import get_deal_sync_service
 
 
 @asynccontextmanager
@@ -61,6 +66,15 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"⚠️ Could not load bot configuration from database: {e}")
 
+    if get_chart_prerender_service().targets:
+        get_chart_prerender_service().start()
+
+    try:
+        started = await get_deal_sync_service().start_all()
+        print(f"✅ Deal history sync started for {started} broker(s)")
+    except Exception as e:
+        print(f"⚠️ Could not start deal history sync: {e}")
+
     print(f"🔥 Prometheus Trading Platform v{settings.VERSION} started")
     print(f"📊 Environment: {settings.ENVIRONMENT}")
     if email_service.is_configured:
@@ -70,6 +84,15 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown
     print("👋 Shutting down...")
+    await get_chart_prerender_service().stop()
+    await get_deal_sync_service().stop_all()
+    try:
+        from src.engines.trading.multi_broker_manager import get_multi_broker_manager
+
+        await get_multi_broker_manager().shutdown()
+    except Exception as e:
+        print(f"⚠️ Could not stop broker workers cleanly: {e}")
+    get_compute_executor().shutdown()
 
 
 app = FastAPI(
@@ -114,9 +137,16 @@ async def health_check():
         "status": "healthy",
         "version": settings.VERSION,
         "environment": settings.ENVIRONMENT,
+        "compute": get_compute_executor().get_stats(),
     }
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus scrape endpoint (broker order telemetry)."""
+    return Response(content=render_metrics(), media_type=CONTENT_TYPE_LATEST)
+
+
 @app.get("/")
 async def root():
     """Root endpoint."""
@@ -14,6 +14,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Any
 
+from src.core.cycle_tracer import trace_span, traced_call
 from src.engines.ai.base_ai import AIAnalysis, BaseAIProvider, MarketContext, TradeDirection
 from src.engines.ai.consensus_engine import (
     ConsensusMethod,
@@ -237,7 +238,8 @@ class AIService:
             analyses = await self._run_sequential(context, selected, mode, trading_style)
 
         # Calculate consensus
-        result = self._consensus_engine.calculate_consensus(analyses)
+        with trace_span("consensus", "ai_consensus", symbol=context.symbol, providers=len(analyses)):
+            result = self._consensus_engine.calculate_consensus(analyses)
 
         return result
 
@@ -287,7 +289,7 @@ class AIService:
                 )
 
         tasks = [
-            analyze_with_provider(key, provider)
+            traced_call("llm", key, analyze_with_provider(key, provider), symbol=context.symbol)
             for key, provider in providers.items()
         ]
 
@@ -305,9 +307,15 @@ class AIService:
                     break
 
                 retry_tasks = [
-                    analyze_with_provider(
+                    traced_call(
+                        "llm",
                         list(providers.keys())[i],
-                        list(providers.values())[i],
+                        analyze_with_provider(
+                            list(providers.keys())[i],
+                            list(providers.values())[i],
+                        ),
+                        symbol=context.symbol,
+                        retry=attempt + 1,
                     )
                     for i in failed_indices
                 ]
@@ -338,17 +346,18 @@ class AIService:
 
         for key, provider in providers.items():
             try:
-                # Check if provider supports mode parameter
-                if hasattr(provider, 'analyze') and 'mode' in provider.analyze.__code__.co_varnames:
-                    analysis = await asyncio.wait_for(
-                        provider.analyze(context, mode=mode, trading_style=trading_style),
-                        timeout=self.config.timeout_seconds,
-                    )
-                else:
-                    analysis = await asyncio.wait_for(
-                        provider.analyze(context),
-                        timeout=self.config.timeout_seconds,
-                    )
+                with trace_span("llm", key, symbol=context.symbol):
+                    # Check if provider supports mode parameter
+                    if hasattr(provider, 'analyze') and 'mode' in provider.analyze.__code__.co_varnames:
+                        analysis = await asyncio.wait_for(
+                            provider.analyze(context, mode=mode, trading_style=trading_style),
+                            timeout=self.config.timeout_seconds,
+                        )
+                    else:
+                        analysis = await asyncio.wait_for(
+                            provider.analyze(context),
+                            timeout=self.config.timeout_seconds,
+                        )
                 analyses.append(analysis)
             except Exception as e:
                 analyses.append(AIAnalysis(
@@ -739,6 +739,7 @@ def resolve_mt_bridge_runtime_credentials(broker: BrokerAccount) -> dict[str, st
         "disconnect_endpoint": ["disconnect_endpoint", "mt_bridge_disconnect_endpoint"],
         "account_endpoint": ["account_endpoint", "mt_bridge_account_endpoint"],
         "positions_endpoint": ["positions_endpoint", "mt_bridge_positions_endpoint"],
+        "state_endpoint": ["state_endpoint", "mt_bridge_state_endpoint"],
         "price_endpoint": ["price_endpoint", "mt_bridge_price_endpoint"],
         "prices_endpoint": ["prices_endpoint", "mt_bridge_prices_endpoint"],
         "candles_endpoint": ["candles_endpoint", "mt_bridge_candles_endpoint"],
@@ -0,0 +1,246 @@
+"""
+Candle Resampler - Builds higher-timeframe bars locally from a base timeframe.
+
+Candles are held column-wise (epoch seconds plus float64 OHLCV arrays), so
+a resample is a handful of numpy reductions instead of a Python loop over
+Decimal candles:
+
+- Buckets are aligned to the UTC epoch shifted by the broker session offset
+  (MARKET_SESSION_OFFSET_MINUTES), so 4h/daily bars open where the broker's
+  do; weekly bars open on Monday.
+- A partial first bucket (data starting mid-bar) is dropped. The last bucket
+  is flagged as forming until the base bars reach its end.
+- ``IncrementalResampler`` keeps only the base bars of the forming bucket and
+  folds new base bars in as they arrive.
+"""
+
+import calendar
+import re
+from dataclasses import dataclass
+from datetime import UTC, datetime, tzinfo
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from src.core.config import settings
+
+if TYPE_CHECKING:
+    from src.services.market_data_service import OHLCV
+
+_WEEK = 7 * 86400
+# 1970-01-01 was a Thursday: weekly buckets are shifted to open on Monday.
+_WEEK_ANCHOR = 4 * 86400
+
+_COLUMNS = ("time", "open", "high", "low", "close", "volume")
+_TIMEFRAME_UNITS = {"m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+
+def timeframe_seconds(timeframe: str) -> int | None:
+    """Bar length for "15m" / "1H" / "1d" style (or "M15" / "H1") timeframes."""
+    value = (timeframe or "").strip().lower()
+    match = re.fullmatch(r"(\d+)([mhdw])", value) or re.fullmatch(r"([mhdw])(\d+)", value)
+    if not match:
+        return None
+    count, unit = match.groups() if match.group(1).isdigit() else match.groups()[::-1]
+    seconds = int(count) * _TIMEFRAME_UNITS[unit]
+    return seconds or None
+
+
+def _empty(dtype) -> np.ndarray:
+    return np.empty(0, dtype=dtype)
+
+
+@dataclass
+class CandleColumns:
+    """OHLCV candles as parallel arrays; ``time`` is the bar open in epoch seconds."""
+    time: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    forming: bool = False  # The last bar is still in progress
+
+    @classmethod
+    def empty(cls) -> "CandleColumns":
+        return cls(_empty(np.int64), *(_empty(np.float64) for _ in range(5)))
+
+    @classmethod
+    def from_candles(cls, candles: list["OHLCV"]) -> "CandleColumns":
+        """Columns from chronological candles; naive timestamps are taken as UTC."""
+        count = len(candles)
+        return cls(
+            time=np.fromiter(
+                (calendar.timegm(c.timestamp.utctimetuple()) for c in candles), dtype=np.int64, count=count
+            ),
+            open=np.fromiter((float(c.open) for c in candles), dtype=np.float64, count=count),
+            high=np.fromiter((float(c.high) for c in candles), dtype=np.float64, count=count),
+            low=np.fromiter((float(c.low) for c in candles), dtype=np.float64, count=count),
+            close=np.fromiter((float(c.close) for c in candles), dtype=np.float64, count=count),
+            volume=np.fromiter((float(c.volume) for c in candles), dtype=np.float64, count=count),
+        )
+
+    @classmethod
+    def concat(cls, *parts: "CandleColumns") -> "CandleColumns":
+        parts = tuple(part for part in parts if len(part))
+        if not parts:
+            return cls.empty()
+        if len(parts) == 1:
+            return parts[0]
+        return cls(
+            *(np.concatenate([getattr(part, name) for part in parts]) for name in _COLUMNS),
+            forming=parts[-1].forming,
+        )
+
+    def to_candles(self, tz: tzinfo | None = None) -> list["OHLCV"]:
+        """Decimal candles; timestamps are naive UTC unless ``tz`` is given."""
+        from src.services.market_data_service import OHLCV
+
+        candles = []
+        for t, o, h, low, c, v in zip(
+            self.time.tolist(), self.open.tolist(), self.high.tolist(),
+            self.low.tolist(), self.close.tolist(), self.volume.tolist(), strict=True,
+        ):
+            timestamp = datetime.fromtimestamp(t, tz=UTC)
+            candles.append(OHLCV(
+                timestamp=timestamp.astimezone(tz) if tz else timestamp.replace(tzinfo=None),
+                open=Decimal(str(o)),
+                high=Decimal(str(h)),
+                low=Decimal(str(low)),
+                close=Decimal(str(c)),
+                volume=v,
+            ))
+        return candles
+
+    def tail(self, count: int) -> "CandleColumns":
+        return self[-count:] if count < len(self) else self
+
+    def __len__(self) -> int:
+        return len(self.time)
+
+    def __getitem__(self, index: slice | np.ndarray) -> "CandleColumns":
+        """Slice or boolean-mask the bars; ``forming`` follows the last bar."""
+        columns = CandleColumns(*(getattr(self, name)[index] for name in _COLUMNS))
+        if len(columns) and len(self):
+            columns.forming = self.forming and columns.time[-1] == self.time[-1]
+        return columns
+
+
+def session_shift(seconds: int, session_offset_minutes: int | None = None) -> int:
+    """Seconds added to epoch time so that ``seconds``-long buckets open on session boundaries."""
+    offset = settings.MARKET_SESSION_OFFSET_MINUTES if session_offset_minutes is None else session_offset_minutes
+    shift = offset * 60
+    if seconds % _WEEK == 0:
+        shift -= _WEEK_ANCHOR
+    return shift
+
+
+def resample(
+    columns: CandleColumns,
+    seconds: int,
+    base_seconds: int | None = None,
+    session_offset_minutes: int | None = None,
+    drop_partial: bool = True,
+    now: float | None = None,
+) -> CandleColumns:
+    """
+    Aggregate chronological base bars into ``seconds``-long bars.
+
+    Args:
+        columns: Base bars, oldest first
+        seconds: Target bar length
+        base_seconds: Base bar length (inferred from the data if omitted)
+        session_offset_minutes: Broker offset from UTC (default from settings)
+        drop_partial: Drop the first bucket when the data starts inside it
+        now: Epoch time; a bucket ending after it is still forming
+    """
+    count = len(columns)
+    if not count:
+        return CandleColumns.empty()
+
+    shift = session_shift(seconds, session_offset_minutes)
+    keys = (columns.time + shift) // seconds
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    ends = np.r_[starts[1:], count] - 1
+    bars = CandleColumns(
+        time=keys[starts] * seconds - shift,
+        open=columns.open[starts],
+        high=np.maximum.reduceat(columns.high, starts),
+        low=np.minimum.reduceat(columns.low, starts),
+        close=columns.close[ends],
+        volume=np.add.reduceat(columns.volume, starts),
+    )
+
+    if base_seconds is None:
+        gaps = np.diff(columns.time)
+        gaps = gaps[gaps > 0]
+        base_seconds = int(gaps.min()) if len(gaps) else seconds
+    bar_end = int(bars.time[-1]) + seconds
+    bars.forming = bool(
+        columns.forming
+        or int(columns.time[-1]) + base_seconds < bar_end
+        or (now is not None and now < bar_end)
+    )
+
+    if drop_partial and columns.time[0] != bars.time[0]:
+        bars = bars[1:]
+    return bars
+
+
+class IncrementalResampler:
+    """
+    Keeps ``seconds``-long bars up to date from base bars fed in as they arrive.
+
+    Each ``update`` only re-aggregates the base bars of the forming bucket
+    plus the new ones. A base bar with the timestamp of one already seen
+    replaces it (e.g. the base bar in progress).
+    """
+
+    def __init__(
+        self,
+        seconds: int,
+        base_seconds: int,
+        session_offset_minutes: int | None = None,
+        max_bars: int = 1000,
+    ):
+        self.seconds = seconds
+        self.base_seconds = base_seconds
+        self.session_offset_minutes = session_offset_minutes
+        self.max_bars = max_bars
+        self.completed = CandleColumns.empty()
+        self._pending = CandleColumns.empty()
+        self._forming = CandleColumns.empty()
+
+    @property
+    def bars(self) -> CandleColumns:
+        """Completed bars followed by the forming one, if any."""
+        return CandleColumns.concat(self.completed, self._forming)
+
+    def update(self, base: CandleColumns, now: float | None = None) -> CandleColumns:
+        """Fold new base bars in; returns the bars completed by this update."""
+        if len(self._pending):
+            base = base[base.time >= self._pending.time[-1]]
+            if len(base):
+                base = CandleColumns.concat(self._pending[self._pending.time < base.time[0]], base)
+        elif len(self.completed):
+            base = base[base.time >= self.completed.time[-1] + self.seconds]
+        if not len(base):
+            return CandleColumns.empty()
+
+        bars = resample(
+            base,
+            self.seconds,
+            base_seconds=self.base_seconds,
+            session_offset_minutes=self.session_offset_minutes,
+            drop_partial=not (len(self.completed) or len(self._pending)),
+            now=now,
+        )
+        done = bars[:-1] if bars.forming else bars
+        if bars.forming:
+            self._forming = bars[-1:]
+            self._pending = base[base.time >= bars.time[-1]]
+        else:
+            self._forming = self._pending = CandleColumns.empty()
+        self.completed = CandleColumns.concat(self.completed, done).tail(self.max_bars)
+        return done
@@ -8,10 +8,19 @@ This service generates professional trading charts with:
 - Support/Resistance levels
 
 Each AI model can request specific indicators for their analysis.
+
+Several presets of the same symbol/timeframe are rendered as one batch
+(``generate_charts``): market data and analysis are loaded once, and every
+preset is redrawn on cached per-layout templates (raster base layers or
+reused matplotlib figures) instead of starting from a blank figure.
 """
 
 import base64
 import io
+import math
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
@@ -25,12 +34,33 @@ import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
 from matplotlib.patches import Rectangle
 
+from src.core.config import settings
+from src.services.chart_raster import (
+    RasterBand,
+    RasterChartRenderer,
+    RasterChartSpec,
+    RasterHistogram,
+    RasterLevel,
+    RasterSeries,
+    RasterText,
+    RasterTheme,
+    RasterZone,
+)
+from src.services.compute_executor import (
+    SharedFrameHandle,
+    SharedOHLCVFrame,
+    get_compute_executor,
+    load_shared_frame,
+)
 from src.services.market_data_service import MarketDataService, get_market_data_service
 from src.services.technical_analysis_service import (
     TechnicalAnalysisService,
     get_technical_analysis_service,
 )
 
+# Matplotlib figures kept for reuse, one per panel layout / size / theme.
+_FIGURE_TEMPLATE_CACHE_SIZE = 6
+
 
 @dataclass
 class IndicatorConfig:
@@ -114,6 +144,13 @@ class ChartGeneratorService:
         self.ta_service: TechnicalAnalysisService = None
         self._initialized = False
 
+        # Render state reused across charts (see render_charts). Matplotlib figures are
+        # mutated while drawing, so each render thread keeps its own templates.
+        self._raster_renderers: dict[str, RasterChartRenderer] = {}
+        self._thread_state = threading.local()
+        # Guards the cache lookups only; charts render concurrently.
+        self._template_lock = threading.Lock()
+
         # Theme colors
         self.themes = {
             "dark": {
@@ -165,47 +202,332 @@ class ChartGeneratorService:
         if indicator_preset and indicator_preset in INDICATOR_PRESETS:
             config.indicators = INDICATOR_PRESETS[indicator_preset]
 
-        # Fetch market data
-        market_data = await self.market_data.get_market_data(
-            config.symbol,
-            config.timeframe,
-            config.bars
-        )
+        market_data, df, analysis = await self._load_chart_inputs(config.symbol, config.timeframe, config.bars)
+
+        # Rendering is CPU-bound: run it in the shared compute pool
+        executor = get_compute_executor()
+        if executor.enabled:
+            with SharedOHLCVFrame(df) as frame:
+                image_base64 = await executor.run(
+                    "chart_render", _render_chart_job, frame.handle, config, analysis
+                )
+        else:
+            image_base64 = self.render_chart(config, df, analysis)
+
+        return image_base64, self._chart_metadata(config, df, market_data)
+
+    async def generate_charts(self, configs: dict[str, ChartConfig]) -> dict[str, tuple[str, dict[str, Any]]]:
+        """
+        Generate several charts of the same symbol/timeframe/bars as one batch.
+
+        Market data is fetched and analyzed once; all charts are rendered in a
+        single compute job sharing the OHLCV frame, indicator series and
+        layout templates.
+
+        Args:
+            configs: Chart configurations keyed by name (e.g. preset name)
+
+        Returns:
+            Dict mapping name to (base64 image, metadata); charts that failed
+            to render are left out.
+        """
+        if not configs:
+            return {}
+        first = next(iter(configs.values()))
+        if any(
+            (c.symbol, c.timeframe, c.bars) != (first.symbol, first.timeframe, first.bars)
+            for c in configs.values()
+        ):
+            raise ValueError("Batch charts must share symbol, timeframe and bars")
+
+        await self.initialize()
+        market_data, df, analysis = await self._load_chart_inputs(first.symbol, first.timeframe, first.bars)
+
+        names = list(configs)
+        batch = [configs[name] for name in names]
+        executor = get_compute_executor()
+        if executor.enabled:
+            with SharedOHLCVFrame(df) as frame:
+                images = await executor.run("chart_render", _render_charts_job, frame.handle, batch, analysis)
+        else:
+            images = self.render_charts(batch, df, analysis)
+
+        return {
+            name: (image, self._chart_metadata(config, df, market_data))
+            for name, config, image in zip(names, batch, images, strict=True)
+            if image is not None
+        }
+
+    async def _load_chart_inputs(self, symbol: str, timeframe: str, bars: int) -> tuple[Any, pd.DataFrame, Any]:
+        """Market data, OHLCV frame and full analysis for one chart (or batch)."""
+        market_data = await self.market_data.get_market_data(symbol, timeframe, bars)
 
         if not market_data or not market_data.candles:
-            raise ValueError(f"No market data available for {config.symbol}")
+            raise ValueError(f"No market data available for {symbol}")
 
         # Calculate technical analysis
         analysis = await self.ta_service.full_analysis(market_data, include_mtf=False)
 
-        # Create the chart
+        return market_data, self._candles_to_dataframe(market_data.candles), analysis
+
+    def _chart_metadata(self, config: ChartConfig, df: pd.DataFrame, market_data: Any) -> dict[str, Any]:
+        return {
+            "symbol": config.symbol,
+            "timeframe": config.timeframe,
+            "bars": len(df),
+            "last_bar_time": df.index[-1].isoformat() if len(df.index) else None,
+            "current_price": float(market_data.current_price),
+            "indicators_shown": [ind.name for ind in config.indicators if ind.enabled],
+            "smc_enabled": {
+                "order_blocks": config.show_order_blocks,
+                "fvg": config.show_fvg,
+                "liquidity": config.show_liquidity,
+                "structure": config.show_structure,
+            },
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+
+    async def generate_multi_indicator_charts(
+        self,
+        symbol: str,
+        timeframe: str = "15m",
+        bars: int = 100,
+    ) -> dict[str, tuple[str, dict[str, Any]]]:
+        """
+        Generate multiple chart images with different indicator sets.
+        This allows each AI to see charts with different perspectives.
+
+        Returns:
+            Dict mapping preset name to (base64 image, metadata)
+        """
+        configs = {}
+
+        for preset_name in ["momentum", "trend", "smc", "complete"]:
+            configs[preset_name] = ChartConfig(
+                symbol=symbol,
+                timeframe=timeframe,
+                bars=bars,
+                indicators=INDICATOR_PRESETS[preset_name],
+                show_order_blocks=(preset_name in ["smc", "complete"]),
+                show_fvg=(preset_name in ["smc", "complete"]),
+                show_liquidity=(preset_name in ["smc", "complete"]),
+                show_structure=(preset_name in ["smc", "complete"]),
+            )
+
+        try:
+            return await self.generate_charts(configs)
+        except Exception as e:
+            print(f"Failed to generate indicator charts for {symbol}: {e}")
+            return {}
+
+    def render_chart(self, config: ChartConfig, df: pd.DataFrame, analysis: Any) -> str:
+        """Render a chart to a base64 PNG (synchronous, safe to run in a worker process or thread)."""
+        return self._render_chart(config, df, analysis, {})
+
+    def render_charts(self, configs: list[ChartConfig], df: pd.DataFrame, analysis: Any) -> list[str | None]:
+        """
+        Render several charts of one OHLCV frame (synchronous, worker-safe).
+
+        Indicator series are computed once per batch and every chart reuses
+        the layout template of its panel set. A chart that fails is logged
+        and returned as None.
+        """
+        images: list[str | None] = []
+        series_cache: dict[tuple, Any] = {}
+        for config in configs:
+            try:
+                images.append(self._render_chart(config, df, analysis, series_cache))
+            except Exception as e:
+                print(f"[ChartGenerator] Failed to render {config.symbol} chart: {e}")
+                images.append(None)
+        return images
+
+    @property
+    def _figure_templates(self) -> OrderedDict[tuple, tuple[Any, list]]:
+        """Matplotlib figure templates of the calling thread."""
+        templates = getattr(self._thread_state, "figure_templates", None)
+        if templates is None:
+            templates = self._thread_state.figure_templates = OrderedDict()
+        return templates
+
+    def _render_chart(self, config: ChartConfig, df: pd.DataFrame, analysis: Any, series_cache: dict) -> str:
+        if (settings.CHART_RENDERER or "raster").strip().lower() == "matplotlib":
+            return self._render_chart_matplotlib(config, df, analysis)
         theme = self.themes.get(config.theme, self.themes["dark"])
+        with self._template_lock:
+            renderer = self._raster_renderers.get(config.theme)
+            if renderer is None:
+                renderer = self._raster_renderers[config.theme] = RasterChartRenderer(RasterTheme(
+                    background=theme["bg"],
+                    grid=theme["grid"],
+                    text=theme["text"],
+                    candle_up=theme["candle_up"],
+                    candle_down=theme["candle_down"],
+                    volume_up=theme["volume_up"],
+                    volume_down=theme["volume_down"],
+                ))
+        spec = self._build_raster_spec(config, df, analysis, theme, series_cache)
+        return renderer.render_base64(spec, config.width, config.height)
+
+    def _build_raster_spec(
+        self,
+        config: ChartConfig,
+        df: pd.DataFrame,
+        analysis: Any,
+        theme: dict,
+        series_cache: dict | None = None,
+    ) -> RasterChartSpec:
+        """Translate the chart config (indicators, SMC, S/R) into a raster chart spec."""
+        cache = {} if series_cache is None else series_cache
+
+        def cached(key: tuple, compute: Callable[..., Any], *args: Any) -> Any:
+            if key not in cache:
+                cache[key] = compute(*args)
+            return cache[key]
 
-        # Determine subplot layout based on indicators
         panels = self._get_panel_layout(config)
-
-        fig, axes = plt.subplots(
-            len(panels), 1,
-            figsize=(config.width/100, config.height/100),
-            gridspec_kw={'height_ratios': [3] + [1]*(len(panels)-1)},
-            facecolor=theme["bg"]
+        spec = RasterChartSpec(
+            title=f"{config.symbol} - {config.timeframe}",
+            timestamps=list(df.index.to_pydatetime()),
+            open=df['open'].to_numpy(),
+            high=df['high'].to_numpy(),
+            low=df['low'].to_numpy(),
+            close=df['close'].to_numpy(),
+            volume=df['volume'].to_numpy() if config.show_volume else None,
+            panels=panels,
+            panel_labels={panel: panel.upper() if len(panel) <= 4 else panel.title() for panel in panels[1:]},
         )
+        close = df['close']
+        for ind in config.indicators:
+            if not ind.enabled or ind.panel not in panels:
+                continue
+            if ind.name in ("EMA", "SMA"):
+                period = ind.params.get("period", 20)
+                if ind.name == "EMA":
+                    line = cached(("EMA", period), lambda p: close.ewm(span=p).mean(), period)
+                else:
+                    line = cached(("SMA", period), lambda p: close.rolling(p).mean(), period)
+                spec.series.append(RasterSeries(line.to_numpy(), ind.color, ind.panel, label=f"{ind.name} {period}"))
+            elif ind.name == "RSI":
+                period = ind.params.get("period", 14)
+                rsi = cached(("RSI", period), self._rsi, close, period)
+                spec.ranges[ind.panel] = (0.0, 100.0)
+                spec.series.append(RasterSeries(rsi.to_numpy(), ind.color, ind.panel, width=2))
+                spec.levels.append(RasterLevel(70, "#ff6b6b80", ind.panel, dash=6))
+                spec.levels.append(RasterLevel(30, "#6bcb7780", ind.panel, dash=6))
+                spec.levels.append(RasterLevel(50, f"{theme['text']}4d", ind.panel, dash=6))
+            elif ind.name == "MACD":
+                fast, slow, signal = (ind.params.get(k, d) for k, d in (("fast", 12), ("slow", 26), ("signal", 9)))
+                macd_line = cached(
+                    ("MACD", fast, slow),
+                    lambda f, s: close.ewm(span=f).mean() - close.ewm(span=s).mean(),
+                    fast,
+                    slow,
+                )
+                signal_line = cached(
+                    ("MACD signal", fast, slow, signal), lambda m, n: m.ewm(span=n).mean(), macd_line, signal,
+                )
+                histogram = (macd_line - signal_line).to_numpy()
+                spec.histograms.append(RasterHistogram(
+                    histogram,
+                    ["#6bcb7780" if h >= 0 else "#ff6b6b80" for h in histogram],
+                    ind.panel,
+                ))
+                spec.series.append(RasterSeries(macd_line.to_numpy(), "#3498db", ind.panel))
+                spec.series.append(RasterSeries(signal_line.to_numpy(), "#e74c3c", ind.panel))
+                spec.levels.append(RasterLevel(0, f"{theme['text']}4d", ind.panel))
+            elif ind.name == "Bollinger":
+                period = ind.params.get("period", 20)
+                sma = cached(("SMA", period), lambda p: close.rolling(p).mean(), period)
+                std = cached(("STD", period), lambda p: close.rolling(p).std(), period) * ind.params.get("std", 2)
+                upper, lower = (sma + std).to_numpy(), (sma - std).to_numpy()
+                spec.bands.append(RasterBand(lower, upper, f"{ind.color}1a", ind.panel))
+                spec.series.append(RasterSeries(sma.to_numpy(), f"{ind.color}cc", ind.panel))
+                spec.series.append(RasterSeries(upper, f"{ind.color}80", ind.panel))
+                spec.series.append(RasterSeries(lower, f"{ind.color}80", ind.panel))
+
+        smc = getattr(analysis, "smc", None)
+        if smc is not None:
+            self._add_raster_smc(spec, smc, config, len(df))
+        return spec
+
+    @staticmethod
+    def _rsi(close: pd.Series, period: int) -> pd.Series:
+        delta = close.diff()
+        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
+        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+        return 100 - (100 / (1 + gain / loss))
+
+    def _add_raster_smc(self, spec: RasterChartSpec, smc: Any, config: ChartConfig, bars: int) -> None:
+        """SMC zones, liquidity, structure labels and supply/demand areas from an SMCAnalysis."""
+
+        def kind(zone: Any) -> str:
+            value = getattr(zone, "zone_type", "")
+            return str(getattr(value, "value", value))
+
+        def price(value: Any) -> float:
+            try:
+                result = float(value)
+            except (TypeError, ValueError):
+                return math.nan
+            return result
+
+        if config.show_order_blocks:
+            for ob in list(getattr(smc, "order_blocks", None) or [])[:5]:
+                bullish = "bullish" in kind(ob)
+                edge = "#00ff88" if bullish else "#ff4757"
+                spec.zones.append(RasterZone(
+                    price(ob.price_low), price(ob.price_high), f"{edge}44", edge,
+                    dash=4, start=bars - 20, label="OB bull" if bullish else "OB bear",
+                ))
+        if config.show_fvg:
+            for fvg in list(getattr(smc, "fair_value_gaps", None) or [])[:5]:
+                edge = "#ffd93d" if "bullish" in kind(fvg) else "#9b59b6"
+                spec.zones.append(RasterZone(
+                    price(fvg.price_low), price(fvg.price_high), f"{edge}44", edge,
+                    start=bars - 15, label="FVG",
+                ))
+        if config.show_liquidity:
+            for pool in list(getattr(smc, "liquidity_pools", None) or [])[:3]:
+                level = price(pool.price_high if kind(pool) == "liquidity_high" else pool.price_low)
+                spec.levels.append(RasterLevel(level, "#e74c3c", dash=2, label=f"LIQ {level:.5f}"))
+        if config.show_structure:
+            labels = {"higher_high": "HH", "lower_high": "LH", "higher_low": "HL", "lower_low": "LL",
+                      "break_of_structure": "BOS", "change_of_character": "CHoCH"}
+            for point in list(getattr(smc, "structure_points", None) or [])[-5:]:
+                value = getattr(point.structure_type, "value", point.structure_type)
+                color = "#ffd93d" if value in ("higher_high", "lower_high") else "#3498db"
+                spec.texts.append(RasterText(labels.get(value, str(value)), bars - 10, price(point.price), color))
+        if config.show_sr_levels:
+            for zone in list(getattr(smc, "demand_zones", None) or [])[:3]:
+                spec.zones.append(RasterZone(price(zone.price_low), price(zone.price_high), "#00ff881a"))
+            for zone in list(getattr(smc, "supply_zones", None) or [])[:3]:
+                spec.zones.append(RasterZone(price(zone.price_low), price(zone.price_high), "#ff47571a"))
 
-        if len(panels) == 1:
-            axes = [axes]
+    def _render_chart_matplotlib(self, config: ChartConfig, df: pd.DataFrame, analysis: Any) -> str:
+        """Original matplotlib renderer (CHART_RENDERER=matplotlib)."""
+        # Create the chart
+        theme = self.themes.get(config.theme, self.themes["dark"])
 
-        # Style all axes
-        for ax in axes:
-            ax.set_facecolor(theme["bg"])
-            ax.tick_params(colors=theme["text"])
-            ax.spines['bottom'].set_color(theme["grid"])
-            ax.spines['top'].set_color(theme["grid"])
-            ax.spines['left'].set_color(theme["grid"])
-            ax.spines['right'].set_color(theme["grid"])
-            ax.grid(True, color=theme["grid"], alpha=0.3)
+        # Determine subplot layout based on indicators
+        panels = self._get_panel_layout(config)
 
-        # Prepare OHLC data for plotting
-        df = self._candles_to_dataframe(market_data.candles)
+        # Reuse the figure of this layout: only the data artists are replaced.
+        # The price magnitude is part of the key since it sizes the tick labels.
+        key = (tuple(panels), config.width, config.height, config.theme, len(f"{df['high'].max():.0f}"))
+        templates = self._figure_templates
+        fresh = key not in templates
+        if fresh:
+            # pyplot's figure registry is global: create and close figures one thread at a time.
+            with self._template_lock:
+                templates[key] = self._new_figure_template(panels, config, theme)
+                while len(templates) > _FIGURE_TEMPLATE_CACHE_SIZE:
+                    plt.close(templates.popitem(last=False)[1][0])
+        templates.move_to_end(key)
+        fig, axes = templates[key]
+        if not fresh:
+            for ax in axes:
+                self._clear_axes(ax)
 
         # Draw candlesticks on main panel
         main_ax = axes[0]
@@ -242,67 +564,50 @@ class ChartGeneratorService:
         # Format x-axis with dates
         main_ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
 
-        plt.tight_layout()
+        if fresh:
+            fig.tight_layout()
 
         # Convert to base64
         buffer = io.BytesIO()
-        plt.savefig(buffer, format='png', facecolor=theme["bg"], edgecolor='none', dpi=100)
+        fig.savefig(buffer, format='png', facecolor=theme["bg"], edgecolor='none', dpi=100)
         buffer.seek(0)
-        image_base64 = base64.b64encode(buffer.getvalue()).decode('utf-8')
-        plt.close(fig)
+        return base64.b64encode(buffer.getvalue()).decode('utf-8')
 
-        # Build metadata
-        metadata = {
-            "symbol": config.symbol,
-            "timeframe": config.timeframe,
-            "bars": len(df),
-            "current_price": float(market_data.current_price),
-            "indicators_shown": [ind.name for ind in config.indicators if ind.enabled],
-            "smc_enabled": {
-                "order_blocks": config.show_order_blocks,
-                "fvg": config.show_fvg,
-                "liquidity": config.show_liquidity,
-                "structure": config.show_structure,
-            },
-            "timestamp": datetime.utcnow().isoformat(),
-        }
-
-        return image_base64, metadata
-
-    async def generate_multi_indicator_charts(
-        self,
-        symbol: str,
-        timeframe: str = "15m",
-        bars: int = 100,
-    ) -> dict[str, tuple[str, dict[str, Any]]]:
-        """
-        Generate multiple chart images with different indicator sets.
-        This allows each AI to see charts with different perspectives.
+    def _new_figure_template(self, panels: list[str], config: ChartConfig, theme: dict) -> tuple[Any, list]:
+        """Styled figure and axes for a panel layout."""
+        fig, axes = plt.subplots(
+            len(panels), 1,
+            figsize=(config.width/100, config.height/100),
+            gridspec_kw={'height_ratios': [3] + [1]*(len(panels)-1)},
+            facecolor=theme["bg"]
+        )
 
-        Returns:
-            Dict mapping preset name to (base64 image, metadata)
-        """
-        results = {}
+        if len(panels) == 1:
+            axes = [axes]
 
-        for preset_name in ["momentum", "trend", "smc", "complete"]:
-            config = ChartConfig(
-                symbol=symbol,
-                timeframe=timeframe,
-                bars=bars,
-                indicators=INDICATOR_PRESETS[preset_name],
-                show_order_blocks=(preset_name in ["smc", "complete"]),
-                show_fvg=(preset_name in ["smc", "complete"]),
-                show_liquidity=(preset_name in ["smc", "complete"]),
-                show_structure=(preset_name in ["smc", "complete"]),
-            )
+        # Style all axes
+        for ax in axes:
+            ax.set_facecolor(theme["bg"])
+            ax.tick_params(colors=theme["text"])
+            ax.spines['bottom'].set_color(theme["grid"])
+            ax.spines['top'].set_color(theme["grid"])
+            ax.spines['left'].set_color(theme["grid"])
+            ax.spines['right'].set_color(theme["grid"])
+            ax.grid(True, color=theme["grid"], alpha=0.3)
 
-            try:
-                image, metadata = await self.generate_chart(config, preset_name)
-                results[preset_name] = (image, metadata)
-            except Exception as e:
-                print(f"Failed to generate {preset_name} chart: {e}")
+        return fig, list(axes)
 
-        return results
+    @staticmethod
+    def _clear_axes(ax) -> None:
+        """Drop the data artists of a reused axes, keeping its styling and formatters."""
+        for artist in [*ax.lines, *ax.patches, *ax.collections, *ax.texts, *ax.images]:
+            artist.remove()
+        ax.containers.clear()
+        legend = ax.get_legend()
+        if legend is not None:
+            legend.remove()
+        ax.ignore_existing_data_limits = True
+        ax.set_autoscale_on(True)
 
     def _get_panel_layout(self, config: ChartConfig) -> list[str]:
         """Determine which panels are needed based on indicators."""
@@ -567,6 +872,18 @@ class ChartGeneratorService:
         ax.set_xlim(-1, len(df))
 
 
+def _render_chart_job(handle: SharedFrameHandle, config: ChartConfig, analysis: Any) -> str:
+    """Compute-pool entry point for chart rendering."""
+    df = load_shared_frame(handle)
+    return get_chart_generator_service().render_chart(config, df, analysis)
+
+
+def _render_charts_job(handle: SharedFrameHandle, configs: list[ChartConfig], analysis: Any) -> list[str | None]:
+    """Compute-pool entry point for batch chart rendering."""
+    df = load_shared_frame(handle)
+    return get_chart_generator_service().render_charts(configs, df, analysis)
+
+
 # Singleton instance
 _chart_generator: ChartGeneratorService | None = None
 
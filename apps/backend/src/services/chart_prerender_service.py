@@ -0,0 +1,292 @@
+"""
+Chart Prerender Service - Renders analysis charts ahead of time on bar close.
+
+Vision analysis needs chart images at decision time. Instead of rendering
+them on the request path, this service renders every configured
+(symbol, timeframe, preset) as soon as a bar closes and keeps the encoded
+image in a bounded cache keyed by the last bar timestamp:
+
+- Presets are ChartGeneratorService indicator presets ("momentum", "trend",
+  "smc", "complete", ...) rendered as one batch per symbol/timeframe, plus
+  "vision" for the ChartVisionService chart used by multi-timeframe analysis.
+- Bar closes come from a ``BarCloseScheduler`` per timeframe, the same
+  source the AutoTrader follows: broker ticks when a broker is given to
+  ``start``, otherwise its clock (session-anchored buckets, plus a short
+  delay for the data source to publish the bar). Other event sources can
+  call ``on_bar_close`` directly.
+- ``get`` is a dict lookup: an image counts as ready only if it was
+  rendered after the latest bar close of its timeframe, otherwise callers
+  render on demand as before.
+
+Configure with CHART_PRERENDER_TARGETS, e.g. "EUR_USD:15m:complete,EUR_USD:1H:vision".
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from src.core.config import settings
+from src.services.candle_resampler import session_shift, timeframe_seconds
+
+VISION_PRESET = "vision"
+
+def last_bar_close(timeframe: str, now: float | None = None) -> float | None:
+    """Epoch time of the most recent bar boundary for ``timeframe``."""
+    seconds = timeframe_seconds(timeframe)
+    if seconds is None:
+        return None
+    now = time.time() if now is None else now
+    return now - ((now + session_shift(seconds)) % seconds)
+
+
+@dataclass(frozen=True)
+class PrerenderTarget:
+    """One chart kept pre-rendered."""
+    symbol: str
+    timeframe: str
+    preset: str
+
+
+@dataclass
+class PrerenderedChart:
+    """An encoded chart image and the bar it was rendered for."""
+    target: PrerenderTarget
+    image_base64: str
+    bar_time: datetime | None
+    rendered_at: float
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+
+def parse_targets(value: str) -> list[PrerenderTarget]:
+    """Parse "SYMBOL:TIMEFRAME:PRESET" entries separated by commas."""
+    targets: list[PrerenderTarget] = []
+    for entry in (value or "").split(","):
+        parts = [part.strip() for part in entry.split(":")]
+        if len(parts) != 3 or not all(parts):
+            if entry.strip():
+                print(f"[ChartPrerender] Ignoring invalid target '{entry.strip()}' (expected SYMBOL:TIMEFRAME:PRESET)")
+            continue
+        target = PrerenderTarget(*parts)
+        if target not in targets:
+            targets.append(target)
+    return targets
+
+
+class ChartPrerenderService:
+    """Background chart renderer with a bounded cache of the latest images."""
+
+    def __init__(
+        self,
+        targets: list[PrerenderTarget] | None = None,
+        cache_size: int | None = None,
+        close_delay_seconds: float | None = None,
+        bars: int = 100,
+    ):
+        self.targets = list(targets) if targets is not None else parse_targets(settings.CHART_PRERENDER_TARGETS)
+        self.cache_size = max(1, cache_size or settings.CHART_PRERENDER_CACHE_SIZE)
+        self.close_delay = (
+            settings.CHART_PRERENDER_CLOSE_DELAY_SECONDS if close_delay_seconds is None else close_delay_seconds
+        )
+        self.bars = bars
+        self._cache: OrderedDict[tuple[PrerenderTarget, datetime | None], PrerenderedChart] = OrderedDict()
+        self._latest: dict[PrerenderTarget, tuple[PrerenderTarget, datetime | None]] = {}
+        self._inflight: set[tuple[str, str]] = set()
+        self._task: asyncio.Task | None = None
+        self.stats = {"renders": 0, "failures": 0, "hits": 0, "misses": 0}
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def get(self, symbol: str, timeframe: str, preset: str) -> PrerenderedChart | None:
+        """Ready image for the current bar, or None if missing or stale."""
+        target = PrerenderTarget(symbol, timeframe, preset)
+        key = self._latest.get(target)
+        chart = self._cache.get(key) if key is not None else None
+        boundary = last_bar_close(timeframe)
+        if chart is None or (boundary is not None and chart.rendered_at < boundary):
+            self.stats["misses"] += 1
+            return None
+        self.stats["hits"] += 1
+        return chart
+
+    def get_images(self, symbol: str, timeframes: list[str], preset: str) -> dict[str, str]:
+        """Ready images by timeframe; timeframes without one are left out."""
+        images = {}
+        for timeframe in timeframes:
+            chart = self.get(symbol, timeframe, preset)
+            if chart is not None:
+                images[timeframe] = chart.image_base64
+        return images
+
+    def store(self, chart: PrerenderedChart) -> None:
+        key = (chart.target, chart.bar_time)
+        self._cache[key] = chart
+        self._cache.move_to_end(key)
+        self._latest[chart.target] = key
+        while len(self._cache) > self.cache_size:
+            old_key, _ = self._cache.popitem(last=False)
+            if self._latest.get(old_key[0]) == old_key:
+                del self._latest[old_key[0]]
+
+    # ------------------------------------------------------------------
+    # Rendering
+    # ------------------------------------------------------------------
+
+    async def on_bar_close(self, symbol: str, timeframe: str) -> None:
+        """Render every target of ``symbol``/``timeframe`` (skipped if already rendering)."""
+        pair = (symbol, timeframe)
+        if pair in self._inflight:
+            return
+        presets = [t.preset for t in self.targets if (t.symbol, t.timeframe) == pair]
+        if not presets:
+            return
+        self._inflight.add(pair)
+        try:
+            from src.services.market_data_service import get_market_data_service
+
+            # The closed bar must come from the source, not from the short-lived data cache.
+            market_data = get_market_data_service()
+            for variant in {timeframe, timeframe.lower()}:
+                market_data.invalidate(symbol, variant)
+            chart_presets = [preset for preset in presets if preset != VISION_PRESET]
+            if chart_presets:
+                await self._render_presets(symbol, timeframe, chart_presets)
+            if VISION_PRESET in presets:
+                await self._render_vision(symbol, timeframe)
+        finally:
+            self._inflight.discard(pair)
+
+    async def _render_presets(self, symbol: str, timeframe: str, presets: list[str]) -> None:
+        from src.services.chart_generator_service import (
+            INDICATOR_PRESETS,
+            ChartConfig,
+            get_chart_generator_service,
+        )
+
+        configs = {}
+        for preset in presets:
+            if preset not in INDICATOR_PRESETS:
+                print(f"[ChartPrerender] Unknown preset '{preset}' for {symbol} {timeframe}")
+                continue
+            configs[preset] = ChartConfig(
+                symbol=symbol, timeframe=timeframe, bars=self.bars, indicators=INDICATOR_PRESETS[preset],
+            )
+        if not configs:
+            return
+        try:
+            charts = await get_chart_generator_service().generate_charts(configs)
+        except Exception as e:
+            self.stats["failures"] += len(configs)
+            print(f"[ChartPrerender] Failed to render {symbol} {timeframe}: {e}")
+            return
+        rendered_at = time.time()
+        for preset, (image, metadata) in charts.items():
+            bar_time = metadata.get("last_bar_time")
+            self.store(PrerenderedChart(
+                target=PrerenderTarget(symbol, timeframe, preset),
+                image_base64=image,
+                bar_time=datetime.fromisoformat(bar_time) if bar_time else None,
+                rendered_at=rendered_at,
+                metadata=metadata,
+            ))
+            self.stats["renders"] += 1
+        self.stats["failures"] += len(configs) - len(charts)
+
+    async def _render_vision(self, symbol: str, timeframe: str) -> None:
+        from src.engines.ai.chart_vision import get_chart_vision_service
+        from src.services.market_data_service import get_market_data_service
+
+        try:
+            market_data = await get_market_data_service().get_market_data(symbol, timeframe.lower(), self.bars)
+            if not market_data or not market_data.candles:
+                raise ValueError(f"No market data available for {symbol}")
+            df = market_data.to_dataframe().rename(columns=str.capitalize)
+            image = await get_chart_vision_service().generate_chart_image(
+                symbol=symbol, timeframe=timeframe, ohlcv_data=df,
+            )
+        except Exception as e:
+            self.stats["failures"] += 1
+            print(f"[ChartPrerender] Failed to render vision chart {symbol} {timeframe}: {e}")
+            return
+        bar_time = df.index[-1].to_pydatetime() if len(df.index) else None
+        self.store(PrerenderedChart(
+            target=PrerenderTarget(symbol, timeframe, VISION_PRESET),
+            image_base64=image,
+            bar_time=bar_time,
+            rendered_at=time.time(),
+            metadata={"symbol": symbol, "timeframe": timeframe, "bars": len(df)},
+        ))
+        self.stats["renders"] += 1
+
+    # ------------------------------------------------------------------
+    # Bar-close events
+    # ------------------------------------------------------------------
+
+    def start(self, broker: Any = None) -> None:
+        """Follow bar closes: ticks of ``broker`` if given, otherwise the clock."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(broker))
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self, broker: Any) -> None:
+        pairs = sorted({(t.symbol, t.timeframe) for t in self.targets})
+        for symbol, timeframe in [p for p in pairs if timeframe_seconds(p[1]) is None]:
+            print(f"[ChartPrerender] Unsupported timeframe '{timeframe}' for {symbol}, not pre-rendering")
+        pairs = [p for p in pairs if timeframe_seconds(p[1]) is not None]
+        if not pairs:
+            return
+        print(f"[ChartPrerender] Pre-rendering {len(self.targets)} chart(s) on bar close")
+        # Warm the cache for the bar in progress, then follow bar closes.
+        await asyncio.gather(*(self.on_bar_close(*pair) for pair in pairs))
+        symbols_by_timeframe: dict[str, list[str]] = {}
+        for symbol, timeframe in pairs:
+            symbols_by_timeframe.setdefault(timeframe, []).append(symbol)
+        await asyncio.gather(*(
+            self._follow(broker, timeframe, symbols) for timeframe, symbols in symbols_by_timeframe.items()
+        ))
+
+    async def _follow(self, broker: Any, timeframe: str, symbols: list[str]) -> None:
+        from src.engines.trading.bar_close_scheduler import BarCloseScheduler
+
+        scheduler = BarCloseScheduler(
+            broker, symbols, timeframe_seconds(timeframe), clock_delay_seconds=self.close_delay,
+        )
+        scheduler.start()
+        try:
+            while True:
+                closed = await scheduler.wait()
+                await asyncio.gather(*(self.on_bar_close(symbol, timeframe) for symbol in closed))
+        finally:
+            await scheduler.stop()
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "targets": len(self.targets),
+            "cached": len(self._cache),
+            "running": self._task is not None and not self._task.done(),
+            **self.stats,
+        }
+
+
+# Singleton instance
+_chart_prerender_service: ChartPrerenderService | None = None
+
+
+def get_chart_prerender_service() -> ChartPrerenderService:
+    """Get or create the chart prerender singleton."""
+    global _chart_prerender_service
+    if _chart_prerender_service is None:
+        _chart_prerender_service = ChartPrerenderService()
+    return _chart_prerender_service
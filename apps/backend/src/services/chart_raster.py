@@ -0,0 +1,561 @@
+"""
+Chart Raster - Lightweight candlestick renderer on a NumPy RGB buffer.
+
+Replacement for a full matplotlib figure per chart in ChartGeneratorService
+and ChartVisionService:
+
+- Candles, volume, indicator lines, bands, histograms, levels and zones are
+  drawn straight into a ``(height, width, 3)`` uint8 array (vectorized line
+  sampling and alpha blending, no artists, no layout pass).
+- Text (title, axis ticks, legend, zone labels) is drawn with Pillow, which
+  also encodes the PNG once at the end.
+
+A chart is described by a ``RasterChartSpec``; callers translate their own
+configuration (presets, SMC analysis, vision style) into it.
+
+The layer that only depends on layout and data (background, grid, axis
+labels, volume, candles) is kept as a template per panel layout, so charts
+of the same data with different overlays (indicator presets) only redraw
+their overlays.
+"""
+
+import base64
+import io
+import math
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+# zlib level for the final PNG: flat-colour charts compress well even at low levels.
+PNG_COMPRESS_LEVEL = 3
+
+_TITLE_HEIGHT = 26
+_AXIS_HEIGHT = 18
+_AXIS_WIDTH = 70
+_PAD = 8
+_PANEL_GAP = 6
+_GRID_ALPHA = 0.6
+# Layout templates kept per renderer (one per panel layout / size in use).
+_TEMPLATE_CACHE_SIZE = 8
+
+
+@dataclass(frozen=True)
+class RasterTheme:
+    """Colours as ``#rrggbb`` or ``#rrggbbaa``."""
+    background: str
+    grid: str
+    text: str
+    candle_up: str
+    candle_down: str
+    volume_up: str
+    volume_down: str
+
+
+@dataclass
+class RasterSeries:
+    """Line over the bars (NaN = gap)."""
+    values: Any
+    color: str
+    panel: str = "main"
+    width: int = 1
+    dash: int = 0  # Dash length in pixels, 0 = solid
+    label: str | None = None
+
+
+@dataclass
+class RasterBand:
+    """Translucent fill between two series."""
+    lower: Any
+    upper: Any
+    color: str
+    panel: str = "main"
+
+
+@dataclass
+class RasterHistogram:
+    """Bars from zero; ``colors`` is one colour or one per bar."""
+    values: Any
+    colors: str | list[str]
+    panel: str
+
+
+@dataclass
+class RasterLevel:
+    """Horizontal line across the panel."""
+    price: float
+    color: str
+    panel: str = "main"
+    dash: int = 0
+    label: str | None = None
+
+
+@dataclass
+class RasterZone:
+    """Price zone; ``start``/``end`` are bar indexes (None = panel edge)."""
+    low: float
+    high: float
+    color: str
+    edge: str | None = None
+    dash: int = 0
+    start: int | None = None
+    end: int | None = None
+    label: str | None = None
+    panel: str = "main"
+
+
+@dataclass
+class RasterText:
+    text: str
+    bar: int
+    price: float
+    color: str
+    panel: str = "main"
+
+
+@dataclass
+class RasterChartSpec:
+    title: str
+    timestamps: list[datetime]
+    open: Any
+    high: Any
+    low: Any
+    close: Any
+    volume: Any | None = None
+    # Panel names top to bottom; "main" holds the candles, "volume" the volume bars.
+    panels: list[str] = field(default_factory=lambda: ["main"])
+    # Fixed value ranges (e.g. RSI 0-100); other panels fit their data.
+    ranges: dict[str, tuple[float, float]] = field(default_factory=dict)
+    panel_labels: dict[str, str] = field(default_factory=dict)
+    series: list[RasterSeries] = field(default_factory=list)
+    bands: list[RasterBand] = field(default_factory=list)
+    histograms: list[RasterHistogram] = field(default_factory=list)
+    levels: list[RasterLevel] = field(default_factory=list)
+    zones: list[RasterZone] = field(default_factory=list)
+    texts: list[RasterText] = field(default_factory=list)
+    time_format: str = "%H:%M"
+
+
+def parse_color(value: str) -> tuple[np.ndarray, float]:
+    """``#rrggbb[aa]`` -> (rgb float array, alpha)."""
+    text = value.lstrip("#")
+    rgb = np.array([int(text[i:i + 2], 16) for i in (0, 2, 4)], dtype=np.float32)
+    alpha = int(text[6:8], 16) / 255.0 if len(text) >= 8 else 1.0
+    return rgb, alpha
+
+
+def _rgb_tuple(value: str) -> tuple[int, int, int]:
+    rgb, _ = parse_color(value)
+    return int(rgb[0]), int(rgb[1]), int(rgb[2])
+
+
+def _nice_ticks(lo: float, hi: float, target: int = 5) -> list[float]:
+    span = hi - lo
+    if span <= 0 or not math.isfinite(span):
+        return [lo]
+    raw = span / target
+    magnitude = 10 ** math.floor(math.log10(raw))
+    step = next(m * magnitude for m in (1, 2, 2.5, 5, 10) if m * magnitude >= raw)
+    first = math.ceil(lo / step) * step
+    return [first + i * step for i in range(int((hi - first) / step) + 1)]
+
+
+def _format_price(value: float, step: float) -> str:
+    decimals = max(0, min(6, -math.floor(math.log10(step)) + 1)) if step > 0 else 2
+    return f"{value:.{decimals}f}"
+
+
+class RasterCanvas:
+    """RGB pixel buffer with clipped, alpha-blended primitives."""
+
+    def __init__(self, width: int, height: int, background: str):
+        self.width = width
+        self.height = height
+        self.pixels = np.empty((height, width, 3), dtype=np.uint8)
+        self.pixels[:] = parse_color(background)[0].astype(np.uint8)
+
+    @classmethod
+    def from_pixels(cls, pixels: np.ndarray) -> "RasterCanvas":
+        canvas = cls.__new__(cls)
+        canvas.height, canvas.width = pixels.shape[:2]
+        canvas.pixels = pixels
+        return canvas
+
+    def fill_rect(self, x0: float, y0: float, x1: float, y1: float, color: str, alpha: float | None = None) -> None:
+        rgb, a = parse_color(color)
+        a = a if alpha is None else alpha
+        left, right = sorted((int(round(x0)), int(round(x1))))
+        top, bottom = sorted((int(round(y0)), int(round(y1))))
+        left, top = max(0, left), max(0, top)
+        right, bottom = min(self.width, max(right, left + 1)), min(self.height, max(bottom, top + 1))
+        if left >= right or top >= bottom:
+            return
+        region = self.pixels[top:bottom, left:right]
+        if a >= 1.0:
+            region[:] = rgb.astype(np.uint8)
+        else:
+            region[:] = (region * (1.0 - a) + rgb * a).astype(np.uint8)
+
+    def points(self, xs: np.ndarray, ys: np.ndarray, color: str, alpha: float | None = None) -> None:
+        rgb, a = parse_color(color)
+        a = a if alpha is None else alpha
+        xi = np.rint(xs).astype(np.int64)
+        yi = np.rint(ys).astype(np.int64)
+        keep = (xi >= 0) & (xi < self.width) & (yi >= 0) & (yi < self.height)
+        xi, yi = xi[keep], yi[keep]
+        if a >= 1.0:
+            self.pixels[yi, xi] = rgb.astype(np.uint8)
+        else:
+            self.pixels[yi, xi] = (self.pixels[yi, xi] * (1.0 - a) + rgb * a).astype(np.uint8)
+
+    def hline(self, y: float, x0: float, x1: float, color: str, dash: int = 0, alpha: float | None = None) -> None:
+        xs = np.arange(int(round(x0)), int(round(x1)))
+        if dash:
+            xs = xs[(xs // dash) % 2 == 0]
+        self.points(xs, np.full(xs.shape, y), color, alpha)
+
+    def polyline(self, xs: np.ndarray, ys: np.ndarray, color: str, width: int = 1, dash: int = 0) -> None:
+        """Connected segments between consecutive finite points."""
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        valid = np.isfinite(ys[:-1]) & np.isfinite(ys[1:])
+        if len(xs) < 2 or not valid.any():
+            return
+        x0, x1, y0, y1 = xs[:-1][valid], xs[1:][valid], ys[:-1][valid], ys[1:][valid]
+        steps = np.maximum(np.ceil(np.maximum(np.abs(x1 - x0), np.abs(y1 - y0))), 1).astype(np.int64)
+        seg = np.repeat(np.arange(len(steps)), steps + 1)
+        offsets = np.arange(len(seg)) - np.repeat(np.cumsum(steps + 1) - (steps + 1), steps + 1)
+        t = offsets / np.repeat(steps, steps + 1)
+        px = x0[seg] + (x1[seg] - x0[seg]) * t
+        py = y0[seg] + (y1[seg] - y0[seg]) * t
+        if dash:
+            travelled = np.cumsum(np.hypot(np.diff(px, prepend=px[0]), np.diff(py, prepend=py[0])))
+            on = (travelled // dash) % 2 == 0
+            px, py = px[on], py[on]
+        for dy in range(-(width // 2), width - width // 2):
+            self.points(px, py + dy, color)
+
+    def fill_between(self, xs: np.ndarray, lower: np.ndarray, upper: np.ndarray, color: str) -> None:
+        """Vertical fill between two pixel-space curves, one column at a time (vectorized)."""
+        xs = np.asarray(xs, dtype=np.float64)
+        valid = np.isfinite(lower) & np.isfinite(upper)
+        if valid.sum() < 2:
+            return
+        columns = np.arange(max(0, int(xs[valid][0])), min(self.width, int(xs[valid][-1]) + 1))
+        top = np.interp(columns, xs[valid], np.minimum(lower, upper)[valid])
+        bottom = np.interp(columns, xs[valid], np.maximum(lower, upper)[valid])
+        first = max(0, int(np.floor(top.min())))
+        rows = np.arange(first, min(self.height, int(np.ceil(bottom.max())) + 1))[:, None]
+        mask = (rows >= top[None, :]) & (rows <= bottom[None, :])
+        ys, cols = np.nonzero(mask)
+        self.points(columns[cols], ys + first, color)
+
+
+@dataclass
+class _Panel:
+    name: str
+    top: int
+    bottom: int
+    lo: float
+    hi: float
+
+    def y(self, values: Any) -> Any:
+        span = (self.hi - self.lo) or 1.0
+        return self.bottom - (np.asarray(values, dtype=np.float64) - self.lo) / span * (self.bottom - self.top)
+
+
+@dataclass
+class _RasterTemplate:
+    """Pixels and labels shared by every chart of one layout and one data set."""
+
+    panels: list[_Panel]
+    left: int
+    right: int
+    xs: np.ndarray
+    slot: float
+    body_half: float
+    # Background, grid, axis labels and volume bars.
+    base: np.ndarray
+    # Candles, composited over the per-chart zones and bands.
+    candles: np.ndarray
+    candle_mask: np.ndarray
+    data: tuple
+
+    def matches(self, data: tuple) -> bool:
+        return all(
+            (a is None and b is None)
+            or (a is not None and b is not None and np.array_equal(a, b, equal_nan=True))
+            for a, b in zip(self.data, data, strict=True)
+        )
+
+
+_fonts: dict[int, Any] = {}
+
+
+def _font(size: int) -> Any:
+    if size not in _fonts:
+        try:
+            _fonts[size] = ImageFont.load_default(size=size)
+        except (TypeError, OSError):
+            # Older Pillow / no FreeType: fixed-size bitmap font.
+            _fonts[size] = ImageFont.load_default()
+    return _fonts[size]
+
+
+def _draw_texts(canvas: RasterCanvas, texts: list) -> Any:
+    """Draw ``(xy, text, color, size)`` entries onto the canvas; returns the PIL image."""
+    image = Image.fromarray(canvas.pixels, "RGB")
+    if texts:
+        draw = ImageDraw.Draw(image)
+        for xy, text, color, size in texts:
+            draw.text(xy, text, fill=_rgb_tuple(color), font=_font(size))
+        canvas.pixels = np.array(image)
+    return image
+
+
+class RasterChartRenderer:
+    """Renders a ``RasterChartSpec`` to PNG bytes."""
+
+    def __init__(self, theme: RasterTheme):
+        self.theme = theme
+        self._templates: OrderedDict[tuple, _RasterTemplate] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def render_png(self, spec: RasterChartSpec, width: int, height: int) -> bytes:
+        canvas, texts = self._draw(spec, width, height)
+        image = _draw_texts(canvas, texts)
+        buffer = io.BytesIO()
+        image.save(buffer, format="PNG", compress_level=PNG_COMPRESS_LEVEL)
+        return buffer.getvalue()
+
+    def render_base64(self, spec: RasterChartSpec, width: int, height: int) -> str:
+        return base64.b64encode(self.render_png(spec, width, height)).decode("utf-8")
+
+    def _layout(self, spec: RasterChartSpec, width: int, height: int) -> tuple[list[_Panel], int, int]:
+        top = _TITLE_HEIGHT if spec.title else _PAD
+        bottom = height - _AXIS_HEIGHT
+        ratios = [3 if name == "main" else 1 for name in spec.panels]
+        usable = bottom - top - _PANEL_GAP * (len(spec.panels) - 1)
+        panels: list[_Panel] = []
+        cursor = top
+        for name, ratio in zip(spec.panels, ratios, strict=True):
+            panel_height = int(usable * ratio / sum(ratios))
+            lo, hi = self._panel_range(spec, name)
+            panels.append(_Panel(name, cursor, cursor + panel_height, lo, hi))
+            cursor += panel_height + _PANEL_GAP
+        return panels, _PAD, width - _AXIS_WIDTH
+
+    def _panel_range(self, spec: RasterChartSpec, name: str) -> tuple[float, float]:
+        if name in spec.ranges:
+            return spec.ranges[name]
+        if name == "main":
+            lo = float(np.nanmin(spec.low))
+            hi = float(np.nanmax(spec.high))
+        elif name == "volume" and spec.volume is not None:
+            lo, hi = 0.0, float(np.nanmax(spec.volume) or 1.0)
+        else:
+            values = [np.asarray(s.values, dtype=np.float64) for s in spec.series if s.panel == name]
+            values += [np.asarray(h.values, dtype=np.float64) for h in spec.histograms if h.panel == name]
+            if any(h.panel == name for h in spec.histograms):
+                values.append(np.zeros(1))
+            finite = np.concatenate(values) if values else np.zeros(1)
+            finite = finite[np.isfinite(finite)]
+            if not len(finite):
+                return 0.0, 1.0
+            lo, hi = float(finite.min()), float(finite.max())
+        pad = (hi - lo) * 0.05 or abs(hi) * 0.001 or 1.0
+        return lo - pad, hi + pad
+
+    def _template(self, spec: RasterChartSpec, width: int, height: int) -> _RasterTemplate:
+        """Cached base layer for this layout, rebuilt when the candles differ."""
+        panels, left, right = self._layout(spec, width, height)
+        key = (
+            width,
+            height,
+            bool(spec.title),
+            spec.time_format,
+            tuple((panel.name, panel.top, panel.bottom, panel.lo, panel.hi) for panel in panels),
+        )
+        data = (
+            np.asarray(spec.open, dtype=np.float64),
+            np.asarray(spec.high, dtype=np.float64),
+            np.asarray(spec.low, dtype=np.float64),
+            np.asarray(spec.close, dtype=np.float64),
+            None if spec.volume is None else np.asarray(spec.volume, dtype=np.float64),
+            np.asarray([stamp.timestamp() for stamp in spec.timestamps], dtype=np.float64),
+        )
+        with self._lock:
+            template = self._templates.get(key)
+            if template is not None and template.matches(data):
+                self._templates.move_to_end(key)
+                return template
+        # Built outside the lock; templates are read-only once cached (renders copy the base).
+        template = self._build_template(spec, panels, left, right, width, height, data)
+        with self._lock:
+            self._templates[key] = template
+            self._templates.move_to_end(key)
+            while len(self._templates) > _TEMPLATE_CACHE_SIZE:
+                self._templates.popitem(last=False)
+        return template
+
+    def _build_template(
+        self,
+        spec: RasterChartSpec,
+        panels: list[_Panel],
+        left: int,
+        right: int,
+        width: int,
+        height: int,
+        data: tuple,
+    ) -> _RasterTemplate:
+        theme = self.theme
+        canvas = RasterCanvas(width, height, theme.background)
+        texts: list[tuple[tuple[int, int], str, str, int]] = []
+        by_name = {panel.name: panel for panel in panels}
+        opens, highs, lows, closes, volumes, _ = data
+        count = len(closes)
+        slot = (right - left) / (count + 1)
+        xs = left + (np.arange(count) + 1) * slot
+        body_half = max(1.0, slot * 0.4)
+
+        # Grid and axes
+        for panel in panels:
+            ticks = _nice_ticks(panel.lo, panel.hi)
+            tick_step = (ticks[1] - ticks[0]) if len(ticks) > 1 else panel.hi - panel.lo
+            for tick in ticks:
+                y = float(panel.y(tick))
+                canvas.hline(y, left, right, theme.grid, alpha=_GRID_ALPHA)
+                texts.append(((right + 4, int(y) - 6), _format_price(tick, tick_step), theme.text, 10))
+            canvas.fill_rect(left, panel.top, right, panel.top + 1, theme.grid)
+            canvas.fill_rect(left, panel.bottom, right, panel.bottom + 1, theme.grid)
+        every = max(1, count // 8)
+        for index in range(0, count, every):
+            x = float(xs[index])
+            for panel in panels:
+                canvas.fill_rect(x, panel.top, x + 1, panel.bottom, theme.grid, alpha=_GRID_ALPHA * 0.5)
+            stamp = spec.timestamps[index] if index < len(spec.timestamps) else None
+            if stamp is not None:
+                texts.append(((int(x) - 14, height - _AXIS_HEIGHT + 3), stamp.strftime(spec.time_format), theme.text, 10))
+
+        # Volume
+        volume_panel = by_name.get("volume")
+        if volume_panel is not None and volumes is not None:
+            y_volume = volume_panel.y(volumes)
+            for index in range(count):
+                color = theme.volume_up if closes[index] >= opens[index] else theme.volume_down
+                x = float(xs[index])
+                canvas.fill_rect(x - body_half + 0.5, y_volume[index], x + body_half + 0.5, volume_panel.bottom, color)
+        # Axis labels sit outside the plot area, so they can be rasterized once here.
+        _draw_texts(canvas, texts)
+        base = canvas.pixels.copy()
+
+        # Candles
+        main = by_name["main"]
+        y_high, y_low = main.y(highs), main.y(lows)
+        y_open, y_close = main.y(opens), main.y(closes)
+        for index in range(count):
+            color = theme.candle_up if closes[index] >= opens[index] else theme.candle_down
+            x = float(xs[index])
+            canvas.fill_rect(x, y_high[index], x + 1, y_low[index] + 1, color)
+            canvas.fill_rect(x - body_half + 0.5, y_open[index], x + body_half + 0.5, y_close[index] + 1, color)
+        candle_mask = (canvas.pixels != base).any(axis=2)
+
+        return _RasterTemplate(
+            panels=panels,
+            left=left,
+            right=right,
+            xs=xs,
+            slot=slot,
+            body_half=body_half,
+            base=base,
+            candles=canvas.pixels,
+            candle_mask=candle_mask,
+            data=data,
+        )
+
+    def _draw(self, spec: RasterChartSpec, width: int, height: int) -> tuple[RasterCanvas, list]:
+        theme = self.theme
+        template = self._template(spec, width, height)
+        canvas = RasterCanvas.from_pixels(template.base.copy())
+        texts: list[tuple[tuple[int, int], str, str, int]] = []
+        panels, left, right = template.panels, template.left, template.right
+        by_name = {panel.name: panel for panel in panels}
+        count = len(template.xs)
+        xs, slot, body_half = template.xs, template.slot, template.body_half
+
+        def bar_x(index: int | None, default: float) -> float:
+            return default if index is None else left + (max(0, min(count - 1, index)) + 1) * slot
+
+        for panel in panels:
+            label = spec.panel_labels.get(panel.name)
+            if label:
+                texts.append(((left + 4, panel.top + 2), label, theme.text, 10))
+
+        # Zones and bands sit behind the price action
+        for zone in spec.zones:
+            panel = by_name.get(zone.panel)
+            if panel is None:
+                continue
+            x0, x1 = bar_x(zone.start, left), bar_x(zone.end, right)
+            y_top, y_bottom = float(panel.y(zone.high)), float(panel.y(zone.low))
+            canvas.fill_rect(x0, y_top, x1, y_bottom, zone.color)
+            if zone.edge:
+                canvas.hline(y_top, x0, x1, zone.edge, dash=zone.dash)
+                canvas.hline(y_bottom, x0, x1, zone.edge, dash=zone.dash)
+            if zone.label:
+                texts.append(((int(x0) + 2, int(y_top) - 12), zone.label, zone.edge or theme.text, 10))
+        for band in spec.bands:
+            panel = by_name.get(band.panel)
+            if panel is not None:
+                canvas.fill_between(xs, panel.y(band.lower), panel.y(band.upper), band.color)
+
+        canvas.pixels[template.candle_mask] = template.candles[template.candle_mask]
+        main = by_name["main"]
+
+        for histogram in spec.histograms:
+            panel = by_name.get(histogram.panel)
+            if panel is None:
+                continue
+            values = np.asarray(histogram.values, dtype=np.float64)
+            zero = float(panel.y(0.0))
+            y_values = panel.y(values)
+            for index in range(min(count, len(values))):
+                if not math.isfinite(values[index]):
+                    continue
+                color = histogram.colors if isinstance(histogram.colors, str) else histogram.colors[index]
+                x = float(xs[index])
+                canvas.fill_rect(x - body_half + 0.5, zero, x + body_half + 0.5, y_values[index], color)
+
+        # Lines and levels on top
+        legend: list[tuple[str, str]] = []
+        for series in spec.series:
+            panel = by_name.get(series.panel)
+            if panel is None:
+                continue
+            canvas.polyline(xs, panel.y(series.values), series.color, width=series.width, dash=series.dash)
+            if series.label and series.panel == "main":
+                legend.append((series.label, series.color))
+        for level in spec.levels:
+            panel = by_name.get(level.panel)
+            if panel is None:
+                continue
+            y = float(panel.y(level.price))
+            canvas.hline(y, left, right, level.color, dash=level.dash)
+            if level.label:
+                texts.append(((int(right) - 90, int(y) - 12), level.label, level.color, 10))
+        for text in spec.texts:
+            panel = by_name.get(text.panel)
+            if panel is not None:
+                texts.append(((int(bar_x(text.bar, right)), int(panel.y(text.price)) - 6), text.text, text.color, 10))
+
+        for row, (label, color) in enumerate(legend):
+            y = main.top + 4 + row * 14
+            canvas.fill_rect(left + 6, y + 5, left + 20, y + 7, color)
+            texts.append(((left + 24, y), label, theme.text, 10))
+        if spec.title:
+            texts.append(((left, 5), spec.title, theme.text, 14))
+        return canvas, texts
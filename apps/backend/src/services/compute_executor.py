@@ -0,0 +1,235 @@
+"""
+Compute Executor - Runs CPU-bound analysis and chart rendering off the event loop.
+
+pandas indicators, SMC detection and matplotlib rendering are pure CPU work.
+Running them inline freezes WebSocket ticks and order management, so this
+module provides a shared process pool for them:
+
+- OHLCV arrays are handed to workers through ``multiprocessing.shared_memory``
+  (one block per frame) instead of being pickled through the pool pipe. This
+  is not zero-copy: the owner copies the columns into the block and the
+  worker copies them out into its own DataFrame, so the block can be
+  released as soon as the frame is loaded.
+- Queue depth, in-flight jobs and timings are tracked for monitoring.
+- Inside daemonic processes (e.g. broker workers) a thread pool is used
+  instead, since daemons cannot spawn children.
+- Any pool failure falls back to running the job inline.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from src.core.config import settings
+
+OHLCV_COLUMNS = ("open", "high", "low", "close", "volume")
+
+
+@dataclass(frozen=True)
+class SharedFrameHandle:
+    """Picklable reference to an OHLCV frame stored in shared memory."""
+    name: str
+    rows: int
+    tz: str | None = None
+
+
+class SharedOHLCVFrame:
+    """
+    Owner side of a shared-memory OHLCV frame.
+
+    Layout: a (6, rows) float64 block; row 0 holds int64 epoch nanoseconds
+    (viewed in place), rows 1-5 hold open/high/low/close/volume.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        index = pd.DatetimeIndex(df.index)
+        rows = len(df)
+        self._shm = shared_memory.SharedMemory(create=True, size=max(1, rows) * 6 * 8)
+        block = np.ndarray((6, rows), dtype=np.float64, buffer=self._shm.buf)
+        block[0].view(np.int64)[:] = index.as_unit("ns").asi8
+        for i, column in enumerate(OHLCV_COLUMNS, start=1):
+            block[i][:] = df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+        self.handle = SharedFrameHandle(
+            name=self._shm.name,
+            rows=rows,
+            tz=str(index.tz) if index.tz is not None else None,
+        )
+
+    def release(self) -> None:
+        try:
+            self._shm.close()
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self) -> "SharedOHLCVFrame":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.release()
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13: pool workers share the parent's resource tracker, so
+        # the extra registration is dropped when the owner unlinks the block.
+        return shared_memory.SharedMemory(name=name)
+
+
+def load_shared_frame(handle: SharedFrameHandle) -> pd.DataFrame:
+    """Rebuild a timestamp-indexed OHLCV DataFrame from shared memory (worker side)."""
+    shm = _attach(handle.name)
+    try:
+        block = np.ndarray((6, handle.rows), dtype=np.float64, buffer=shm.buf)
+        index = pd.DatetimeIndex(block[0].view(np.int64).astype("datetime64[ns]"), name="timestamp")
+        if handle.tz:
+            index = index.tz_localize("UTC").tz_convert(handle.tz)
+        # copy=True detaches the frame from the block before it is closed.
+        df = pd.DataFrame(
+            {column: np.array(block[i], copy=True) for i, column in enumerate(OHLCV_COLUMNS, start=1)},
+            index=index,
+        )
+        del block
+        return df
+    finally:
+        shm.close()
+
+
+@dataclass
+class ComputeStats:
+    """Counters exposed for monitoring."""
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    inline_fallbacks: int = 0
+    in_flight: int = 0
+    max_in_flight: int = 0
+    total_seconds: float = 0.0
+    by_kind: dict[str, int] = field(default_factory=dict)
+
+
+class ComputeExecutor:
+    """Shared pool for CPU-bound jobs with queue-depth accounting."""
+
+    def __init__(self, mode: str | None = None, max_workers: int | None = None):
+        self.mode = (mode or settings.COMPUTE_EXECUTOR_MODE or "process").strip().lower()
+        workers = max_workers if max_workers is not None else settings.COMPUTE_POOL_WORKERS
+        if workers <= 0:
+            workers = max(1, min(4, (os.cpu_count() or 2) - 1))
+        self.max_workers = workers
+        self.stats = ComputeStats()
+        self._executor: Executor | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode in {"process", "thread"}
+
+    @property
+    def uses_processes(self) -> bool:
+        return self.mode == "process" and not multiprocessing.current_process().daemon
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.uses_processes:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="compute",
+                )
+        return self._executor
+
+    @property
+    def queue_depth(self) -> int:
+        """Jobs submitted but not yet picked up by a worker."""
+        return max(0, self.stats.in_flight - self.max_workers)
+
+    async def run(self, kind: str, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run ``fn(*args)`` in the pool, falling back inline if the pool is unusable."""
+        if not self.enabled:
+            return fn(*args)
+
+        stats = self.stats
+        stats.submitted += 1
+        stats.by_kind[kind] = stats.by_kind.get(kind, 0) + 1
+        stats.in_flight += 1
+        stats.max_in_flight = max(stats.max_in_flight, stats.in_flight)
+        started = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            try:
+                future = loop.run_in_executor(self._get_executor(), fn, *args)
+                result = await future
+            except (BrokenProcessPool, OSError) as exc:
+                result = self._run_inline(kind, exc, fn, *args)
+            except RuntimeError as exc:
+                # Only submission failures ("cannot schedule new futures") fall back;
+                # errors raised by the job itself propagate unchanged.
+                if "schedule" not in str(exc):
+                    raise
+                result = self._run_inline(kind, exc, fn, *args)
+            stats.completed += 1
+            return result
+        except Exception:
+            stats.failed += 1
+            raise
+        finally:
+            stats.in_flight -= 1
+            stats.total_seconds += time.perf_counter() - started
+
+    def _run_inline(self, kind: str, exc: Exception, fn: Callable[..., Any], *args: Any) -> Any:
+        print(f"[ComputeExecutor] Pool unavailable for {kind} ({exc}), running inline")
+        self._reset()
+        self.stats.inline_fallbacks += 1
+        return fn(*args)
+
+    def _reset(self) -> None:
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_stats(self) -> dict[str, Any]:
+        stats = self.stats
+        return {
+            "mode": self.mode if not (self.mode == "process" and not self.uses_processes) else "thread",
+            "max_workers": self.max_workers,
+            "in_flight": stats.in_flight,
+            "queue_depth": self.queue_depth,
+            "max_in_flight": stats.max_in_flight,
+            "submitted": stats.submitted,
+            "completed": stats.completed,
+            "failed": stats.failed,
+            "inline_fallbacks": stats.inline_fallbacks,
+            "avg_seconds": round(stats.total_seconds / stats.completed, 4) if stats.completed else 0.0,
+            "by_kind": dict(stats.by_kind),
+        }
+
+    def shutdown(self) -> None:
+        self._reset()
+
+
+# Singleton
+_compute_executor: ComputeExecutor | None = None
+
+
+def get_compute_executor() -> ComputeExecutor:
+    """Get or create ComputeExecutor singleton."""
+    global _compute_executor
+    if _compute_executor is None:
+        _compute_executor = ComputeExecutor()
+    return _compute_executor
@@ -0,0 +1,222 @@
+"""
+Deal Sync Service - Background, incremental sync of broker deal history.
+
+Analytics and trade history reads are served from the ``trades`` table; they
+never call the broker. One worker per (user, broker) keeps the table current:
+
+- The high-water mark is the closing time of the newest stored deal, loaded
+  from the table once and then advanced in memory after each sync.
+- Each sync asks the broker only for deals since the mark (minus a small
+  overlap for late corrections), floored to the hour so the broker's deal
+  cache key stays stable, and upserts them. A broker with no stored deals
+  starts from a TRADE_DEAL_HISTORY_DAYS window.
+- Workers run every TRADE_DEAL_SYNC_SECONDS; they are started for owned,
+  enabled brokers at startup and on demand when a user reads trade history,
+  and stop on their own when the broker account is deleted.
+"""
+
+import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.bot_logger import get_bot_logger
+from src.core.config import settings
+from src.core.database import async_session_maker
+from src.core.models import BrokerAccount
+from src.services.trade_history_service import deal_to_trade, get_trade_history_service
+
+logger = get_bot_logger("DealSync")
+
+# Re-read this much before the newest stored deal to pick up late corrections.
+DEAL_OVERLAP = timedelta(hours=1)
+
+# Spread the first sync of workers started together (seconds).
+_START_JITTER = 10.0
+
+SessionFactory = Callable[[], AsyncSession]
+ConnectionResolver = Callable[[BrokerAccount], Awaitable[Any]]
+
+
+def fetch_start(high_water: datetime | None, now: datetime | None = None) -> datetime:
+    """Start of the deal window for a sync, floored to the hour."""
+    now = now or datetime.now(UTC)
+    floor = now - timedelta(days=settings.TRADE_DEAL_HISTORY_DAYS)
+    start = floor if high_water is None else max(floor, high_water - DEAL_OVERLAP)
+    return start.replace(minute=0, second=0, microsecond=0)
+
+
+async def _manager_connection(broker: BrokerAccount) -> Any:
+    from src.engines.trading.multi_broker_manager import get_multi_broker_manager
+
+    return await get_multi_broker_manager()._ensure_broker_connection(broker.id, broker_account=broker)
+
+
+class BrokerGone(Exception):
+    """The broker account no longer exists."""
+
+
+class DealSyncWorker:
+    """Keeps one broker's deal history in the ``trades`` table of one user."""
+
+    def __init__(
+        self,
+        user_id: int,
+        broker_id: int,
+        session_factory: SessionFactory | None = None,
+        connect: ConnectionResolver | None = None,
+    ):
+        self.user_id = user_id
+        self.broker_id = broker_id
+        self._session_factory = session_factory or async_session_maker
+        self._connect = connect or _manager_connection
+        self._task: asyncio.Task | None = None
+        self.high_water: datetime | None = None
+        self._high_water_loaded = False
+        self.stats: dict[str, Any] = {
+            "syncs": 0,
+            "deals": 0,
+            "errors": 0,
+            "last_sync_at": None,
+            "last_duration_ms": None,
+            "last_error": None,
+        }
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self, delay: float = 0.0) -> None:
+        if not self.running:
+            self._task = asyncio.create_task(self._run(delay))
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self, delay: float) -> None:
+        if delay:
+            await asyncio.sleep(delay)
+        while True:
+            try:
+                await self.sync_once()
+            except BrokerGone:
+                logger.info("Broker %s removed, stopping deal sync", self.broker_id)
+                return
+            except Exception as e:
+                self.stats["errors"] += 1
+                self.stats["last_error"] = str(e)
+                logger.warning("Deal sync failed for broker %s: %s", self.broker_id, e, sample=f"error:{self.broker_id}")
+            await asyncio.sleep(max(1.0, settings.TRADE_DEAL_SYNC_SECONDS))
+
+    async def sync_once(self) -> int:
+        """Fetch deals since the high-water mark and upsert them; returns rows written."""
+        started = time.perf_counter()
+        history = get_trade_history_service()
+        async with self._session_factory() as db:
+            broker = (await db.execute(
+                select(BrokerAccount).where(BrokerAccount.id == self.broker_id)
+            )).scalar_one_or_none()
+            if broker is None:
+                raise BrokerGone(self.broker_id)
+
+            connection = await self._connect(broker)
+            if not connection or not hasattr(connection, "get_deals_history"):
+                return 0
+
+            if not self._high_water_loaded:
+                self.high_water = await history.newest_deal_time(db, self.user_id, self.broker_id)
+                self._high_water_loaded = True
+
+            deals = await connection.get_deals_history(fetch_start(self.high_water).isoformat())
+            trades = [t for t in (deal_to_trade(d, broker.id, broker.name) for d in deals or []) if t]
+            written = await history.upsert_trades(db, self.user_id, trades, source="deal")
+            await db.commit()
+
+        newest = max((datetime.fromisoformat(t["exit_timestamp"]) for t in trades), default=None)
+        if newest is not None and (self.high_water is None or newest > self.high_water):
+            self.high_water = newest
+        self.stats["syncs"] += 1
+        self.stats["deals"] += written
+        self.stats["last_sync_at"] = datetime.now(UTC).isoformat()
+        self.stats["last_duration_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        self.stats["last_error"] = None
+        return written
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "user_id": self.user_id,
+            "broker_id": self.broker_id,
+            "running": self.running,
+            "high_water": self.high_water.isoformat() if self.high_water else None,
+            **self.stats,
+        }
+
+
+class DealSyncService:
+    """Owns the deal sync workers, one per (user_id, broker_id)."""
+
+    def __init__(self, session_factory: SessionFactory | None = None, connect: ConnectionResolver | None = None):
+        self._session_factory = session_factory
+        self._connect = connect
+        self._workers: dict[tuple[int, int], DealSyncWorker] = {}
+
+    def ensure(self, user_id: int, broker_id: int, delay: float = 0.0) -> DealSyncWorker:
+        """Start the worker for a user's broker unless it is already running."""
+        worker = self._workers.get((user_id, broker_id))
+        if worker is None:
+            worker = DealSyncWorker(user_id, broker_id, self._session_factory, self._connect)
+            self._workers[(user_id, broker_id)] = worker
+        worker.start(delay)
+        return worker
+
+    async def start_all(self) -> int:
+        """Start workers for every enabled broker that belongs to a user."""
+        async with (self._session_factory or async_session_maker)() as db:
+            brokers = (await db.execute(
+                select(BrokerAccount.id, BrokerAccount.user_id).where(
+                    BrokerAccount.user_id.is_not(None),
+                    BrokerAccount.is_enabled.is_(True),
+                )
+            )).all()
+        for broker_id, user_id in brokers:
+            self.ensure(user_id, broker_id, delay=random.uniform(0, _START_JITTER))
+        return len(brokers)
+
+    async def stop(self, user_id: int, broker_id: int) -> None:
+        worker = self._workers.pop((user_id, broker_id), None)
+        if worker is not None:
+            await worker.stop()
+
+    async def stop_all(self) -> None:
+        workers, self._workers = self._workers, {}
+        await asyncio.gather(*(worker.stop() for worker in workers.values()))
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "workers": len(self._workers),
+            "running": sum(1 for worker in self._workers.values() if worker.running),
+            "brokers": [worker.get_stats() for worker in self._workers.values()],
+        }
+
+
+# Singleton instance
+_deal_sync_service: DealSyncService | None = None
+
+
+def get_deal_sync_service() -> DealSyncService:
+    """Get or create the deal sync service singleton."""
+    global _deal_sync_service
+    if _deal_sync_service is None:
+        _deal_sync_service = DealSyncService()
+    return _deal_sync_service
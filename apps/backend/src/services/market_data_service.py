@@ -6,8 +6,8 @@ Provides unified interface for market data across the platform.
 """
 
 import asyncio
-from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from dataclasses import dataclass, field, replace
+from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 from enum import Enum
 from typing import Any
@@ -15,6 +15,11 @@ from typing import Any
 import httpx
 import pandas as pd
 
+from src.core.bot_logger import get_bot_logger
+from src.services.candle_resampler import CandleColumns, resample
+
+logger = get_bot_logger("MarketData")
+
 
 class DataSource(str, Enum):
     """Available data sources."""
@@ -124,6 +129,42 @@ TIMEFRAME_MAPPINGS = {
     "1w": "1wk",
 }
 
+# Bar length per internal timeframe
+TIMEFRAME_SECONDS = {
+    "1m": 60,
+    "5m": 300,
+    "15m": 900,
+    "30m": 1800,
+    "1h": 3600,
+    "4h": 14400,
+    "1d": 86400,
+    "1w": 604800,
+}
+
+# Intraday bars can be rebuilt from a finer timeframe; daily/weekly bars follow
+# the source's session boundaries and are always fetched as such.
+MAX_RESAMPLED_SECONDS = 4 * 3600
+# Upper bound on base bars fetched to rebuild coarser timeframes locally
+MAX_PLAN_BARS = 5000
+
+
+def resample_candles(
+    candles: list["OHLCV"],
+    seconds: int,
+    session_offset_minutes: int | None = None,
+) -> list["OHLCV"]:
+    """
+    Aggregate candles into ``seconds``-long, session-anchored bars.
+
+    See candle_resampler: the first bucket is dropped when the input starts
+    inside it; the last one may be the bar in progress.
+    """
+    if not candles:
+        return []
+    tz = UTC if candles[0].timestamp.tzinfo else None
+    columns = CandleColumns.from_candles(candles)
+    return resample(columns, seconds, session_offset_minutes=session_offset_minutes).to_candles(tz)
+
 
 class MarketDataService:
     """
@@ -166,6 +207,10 @@ class MarketDataService:
         """Generate cache key."""
         return f"{symbol}:{timeframe}"
 
+    def invalidate(self, symbol: str, timeframe: str) -> None:
+        """Drop cached data for symbol/timeframe (e.g. right after a bar close)."""
+        self._cache.pop(self._get_cache_key(symbol, timeframe), None)
+
     def _is_cache_valid(self, cache_key: str) -> bool:
         """Check if cached data is still valid."""
         if cache_key not in self._cache:
@@ -205,7 +250,7 @@ class MarketDataService:
             try:
                 data = await self._fetch_twelve_data(symbol, timeframe, bars)
             except Exception as e:
-                print(f"Twelve Data fetch failed: {e}")
+                logger.error(f"Twelve Data fetch failed: {e}")
 
         if data is None:
             # Fallback to Yahoo Finance - con retry per 429 rate limit
@@ -215,18 +260,18 @@ class MarketDataService:
                 try:
                     if attempt > 0:
                         wait_time = 2 ** attempt  # 2s, 4s
-                        print(f"[MarketData] Retry {attempt+1}/{max_retries} per {symbol} dopo {wait_time}s...")
+                        logger.warning(f"Retry {attempt+1}/{max_retries} per {symbol} dopo {wait_time}s...")
                         await asyncio.sleep(wait_time)
-                    print(f"[MarketData] Fetching {symbol} from Yahoo Finance (yahoo_symbol={yahoo_sym}, timeframe={timeframe})")
+                    logger.info(f"Fetching {symbol} from Yahoo Finance (yahoo_symbol={yahoo_sym}, timeframe={timeframe})")
                     data = await self._fetch_yahoo(symbol, timeframe, bars)
                     if data and data.candles:
-                        print(f"[MarketData] Got {len(data.candles)} candles for {symbol} from Yahoo")
+                        logger.info(f"Got {len(data.candles)} candles for {symbol} from Yahoo")
                     else:
-                        print(f"[MarketData] Yahoo returned no candles for {symbol}")
+                        logger.info(f"Yahoo returned no candles for {symbol}")
                     break  # Successo, esci dal retry loop
                 except Exception as e:
                     error_msg = str(e)
-                    print(f"[MarketData] Yahoo Finance fetch failed for {symbol} (attempt {attempt+1}): {e}")
+                    logger.error(f"Yahoo Finance fetch failed for {symbol} (attempt {attempt+1}): {e}")
                     if "429" in error_msg and attempt < max_retries - 1:
                         continue  # Ritenta
                     # Ultimo tentativo fallito o errore non-429
@@ -301,7 +346,7 @@ class MarketDataService:
 
         # Aggregate to 4h if needed
         if timeframe == "4h" and candles:
-            candles = self._aggregate_candles(candles, 4)
+            candles = resample_candles(candles, TIMEFRAME_SECONDS["4h"])
 
         # Limit to requested bars
         candles = candles[-bars:] if len(candles) > bars else candles
@@ -371,30 +416,6 @@ class MarketDataService:
             source=DataSource.TWELVE_DATA,
         )
 
-    def _aggregate_candles(self, candles: list[OHLCV], hours: int) -> list[OHLCV]:
-        """Aggregate hourly candles to larger timeframe."""
-        if not candles:
-            return []
-
-        aggregated = []
-        chunk_size = hours
-
-        for i in range(0, len(candles), chunk_size):
-            chunk = candles[i:i + chunk_size]
-            if not chunk:
-                continue
-
-            aggregated.append(OHLCV(
-                timestamp=chunk[0].timestamp,
-                open=chunk[0].open,
-                high=max(c.high for c in chunk),
-                low=min(c.low for c in chunk),
-                close=chunk[-1].close,
-                volume=sum(c.volume for c in chunk),
-            ))
-
-        return aggregated
-
     def _get_fallback_data(self, symbol: str, timeframe: str) -> MarketData:
         """Return fallback data when all sources fail."""
         # Static fallback prices
@@ -425,6 +446,55 @@ class MarketDataService:
         data = await self.get_market_data(symbol, timeframe="1m", bars=1)
         return data.current_price
 
+    async def get_timeframe_plan(
+        self,
+        symbol: str,
+        timeframes: list[str],
+        bars: int = 100,
+    ) -> dict[str, MarketData]:
+        """
+        Data for several timeframes from as few source calls as possible.
+
+        The finest timeframe is fetched once with enough history to rebuild
+        the coarser intraday ones locally (session-anchored, see
+        candle_resampler). Daily/weekly bars, timeframes the base history
+        does not cover and those that are not a multiple of the base are
+        fetched directly in one parallel round.
+        Keys are the timeframes as passed (e.g. "15m", "1H").
+        """
+        normalized = {tf: tf.lower() for tf in timeframes}
+        known = sorted(
+            {tf for tf in normalized.values() if tf in TIMEFRAME_SECONDS},
+            key=TIMEFRAME_SECONDS.__getitem__,
+        )
+        results: dict[str, MarketData] = {}
+        if known:
+            finest = known[0]
+            finest_seconds = TIMEFRAME_SECONDS[finest]
+            # One extra bucket covers a partial first bar dropped by resampling.
+            needed = {
+                tf: (bars + 1) * TIMEFRAME_SECONDS[tf] // finest_seconds
+                for tf in known[1:]
+                if TIMEFRAME_SECONDS[tf] <= MAX_RESAMPLED_SECONDS and TIMEFRAME_SECONDS[tf] % finest_seconds == 0
+            }
+            derived = [tf for tf, count in needed.items() if count <= MAX_PLAN_BARS]
+            span = max([bars] + [needed[tf] for tf in derived])
+            base = await self.get_market_data(symbol, finest, span)
+            if base and base.candles:
+                results[finest] = replace(base, candles=base.candles[-bars:])
+                columns = CandleColumns.from_candles(base.candles)
+                tz = UTC if base.candles[0].timestamp.tzinfo else None
+                for tf in derived:
+                    resampled = resample(columns, TIMEFRAME_SECONDS[tf], base_seconds=finest_seconds)
+                    if len(resampled) >= bars:
+                        results[tf] = replace(base, timeframe=tf, candles=resampled.tail(bars).to_candles(tz))
+
+        missing = sorted({tf for tf in normalized.values() if tf not in results})
+        if missing:
+            results.update(await self.get_multiple_timeframes(symbol, missing, bars))
+
+        return {tf: results[internal] for tf, internal in normalized.items() if internal in results}
+
     async def get_multiple_timeframes(
         self,
         symbol: str,
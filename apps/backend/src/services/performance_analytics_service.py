@@ -0,0 +1,346 @@
+"""
+Performance Analytics Service - Vectorized trade performance metrics.
+
+A user's closed trades are loaded from the ``trades`` table once into sorted
+NumPy columns (entry / exit time as int64 nanoseconds, P&L as float64) and
+every metric is computed with array operations on that frame:
+
+- date ranges are ``searchsorted`` slices on the exit times (closing day, UTC);
+- per-day P&L and equity curves group runs of equal day / bucket indexes with
+  ``reduceat``; drawdown uses a running ``maximum.accumulate`` of equity;
+- Sharpe and Sortino are annualized from daily returns over every calendar
+  day in the range (days without trades count as flat).
+
+Equity starts at ``initial_balance``. With a balance of 0 the curve is the
+cumulative P&L and drawdown % is measured against its peak, and the ratios
+use daily P&L instead of returns.
+
+Frames and computed results are cached per user and keyed on the trade
+history data version, so a new or updated trade invalidates them.
+"""
+
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, date, datetime
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.core.models import Trade
+from src.services.trade_history_service import get_trade_history_service
+
+_NS_PER_MINUTE = 60 * 1_000_000_000
+_NS_PER_DAY = 24 * 60 * _NS_PER_MINUTE
+_NS_PER_HOUR = 60 * _NS_PER_MINUTE
+
+# Equity curve bucket widths
+EQUITY_RESOLUTIONS = {
+    "1m": _NS_PER_MINUTE,
+    "5m": 5 * _NS_PER_MINUTE,
+    "15m": 15 * _NS_PER_MINUTE,
+    "1h": _NS_PER_HOUR,
+    "4h": 4 * _NS_PER_HOUR,
+    "1d": _NS_PER_DAY,
+}
+
+# FX and crypto trade on calendar days; ratios are annualized accordingly.
+_DAYS_PER_YEAR = 365
+
+# Computed results kept per user (summaries, curves for different ranges).
+_RESULTS_PER_USER = 32
+
+
+def _to_ns(values: list[Any]) -> np.ndarray:
+    """int64 UTC nanoseconds for datetimes (naive values are taken as UTC)."""
+    if not values:
+        return np.empty(0, dtype=np.int64)
+    index = pd.to_datetime(pd.Series(values), utc=True)
+    return index.dt.tz_localize(None).to_numpy("datetime64[ns]").view(np.int64)
+
+
+def _day_ns(day: date) -> int:
+    return int(datetime(day.year, day.month, day.day, tzinfo=UTC).timestamp()) * 1_000_000_000
+
+
+def _iso(ns: int) -> str:
+    return datetime.fromtimestamp(ns / 1_000_000_000, tz=UTC).isoformat()
+
+
+def _runs(keys: np.ndarray) -> np.ndarray:
+    """Start index of each run of equal values in a sorted array."""
+    return np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+
+
+@dataclass(slots=True)
+class TradeFrame:
+    """Closed trades as columns, sorted by exit time."""
+    entry_ns: np.ndarray
+    exit_ns: np.ndarray
+    pnl: np.ndarray
+
+    @classmethod
+    def from_rows(cls, rows: list[tuple[Any, Any, Any]]) -> "TradeFrame":
+        """Build from ``(timestamp, exit_timestamp, profit_loss)`` rows."""
+        entry_ns = _to_ns([row[0] for row in rows])
+        exit_ns = _to_ns([row[1] for row in rows])
+        pnl = np.asarray([row[2] for row in rows], dtype=np.float64)
+        order = np.argsort(exit_ns, kind="stable")
+        return cls(entry_ns[order], exit_ns[order], pnl[order])
+
+    def __len__(self) -> int:
+        return len(self.pnl)
+
+    def window(self, start: date | None = None, end: date | None = None) -> "TradeFrame":
+        """Trades closed between ``start`` and ``end`` (inclusive days)."""
+        lo = 0 if start is None else int(np.searchsorted(self.exit_ns, _day_ns(start), side="left"))
+        hi = len(self) if end is None else int(np.searchsorted(self.exit_ns, _day_ns(end) + _NS_PER_DAY, side="left"))
+        return TradeFrame(self.entry_ns[lo:hi], self.exit_ns[lo:hi], self.pnl[lo:hi])
+
+
+@dataclass(slots=True)
+class PerformanceSummary:
+    total_trades: int = 0
+    winning_trades: int = 0
+    losing_trades: int = 0
+    win_rate: float = 0.0
+    profit_factor: float = 0.0
+    total_pnl: float = 0.0
+    average_win: float = 0.0
+    average_loss: float = 0.0
+    largest_win: float = 0.0
+    largest_loss: float = 0.0
+    max_drawdown: float = 0.0
+    max_drawdown_percent: float = 0.0
+    sharpe_ratio: float | None = None
+    sortino_ratio: float | None = None
+    expectancy: float = 0.0
+    average_hold_hours: float | None = None
+
+
+def _drawdown(equity: np.ndarray, initial_balance: float) -> tuple[np.ndarray, np.ndarray]:
+    """Absolute and percent drawdown from the running equity peak."""
+    peak = np.maximum.accumulate(np.maximum(equity, initial_balance))
+    drawdown = peak - equity
+    with np.errstate(divide="ignore", invalid="ignore"):
+        percent = np.where(peak > 0, drawdown / peak * 100, 0.0)
+    return drawdown, percent
+
+
+def _daily_ratios(frame: TradeFrame, initial_balance: float) -> tuple[float | None, float | None]:
+    """Annualized Sharpe and Sortino ratios of daily returns (risk-free rate 0)."""
+    days = frame.exit_ns // _NS_PER_DAY
+    if len(days) == 0 or days[-1] == days[0]:
+        return None, None
+    daily = np.zeros(int(days[-1] - days[0]) + 1)
+    np.add.at(daily, days - days[0], frame.pnl)
+
+    if initial_balance > 0:
+        start_equity = initial_balance + np.r_[0.0, np.cumsum(daily)[:-1]]
+        returns = daily[start_equity > 0] / start_equity[start_equity > 0]
+    else:
+        returns = daily
+    if len(returns) < 2:
+        return None, None
+
+    mean = returns.mean()
+    std = returns.std(ddof=1)
+    downside = np.sqrt(np.mean(np.minimum(returns, 0.0) ** 2))
+    scale = np.sqrt(_DAYS_PER_YEAR)
+    sharpe = float(mean / std * scale) if std > 0 else None
+    sortino = float(mean / downside * scale) if downside > 0 else None
+    return sharpe, sortino
+
+
+def summarize(frame: TradeFrame, initial_balance: float = 0.0) -> PerformanceSummary:
+    """Overall performance metrics of a trade frame."""
+    total = len(frame)
+    if total == 0:
+        return PerformanceSummary()
+
+    pnl = frame.pnl
+    wins = pnl[pnl > 0]
+    losses = pnl[pnl < 0]
+    total_wins = float(wins.sum())
+    total_losses = float(-losses.sum())
+    if total_losses > 0:
+        profit_factor = total_wins / total_losses
+    else:
+        profit_factor = float("inf") if total_wins > 0 else 0.0
+
+    equity = initial_balance + np.cumsum(pnl)
+    drawdown, drawdown_percent = _drawdown(equity, initial_balance)
+
+    hold = frame.exit_ns - frame.entry_ns
+    hold = hold[hold >= 0]
+    sharpe, sortino = _daily_ratios(frame, initial_balance)
+
+    return PerformanceSummary(
+        total_trades=total,
+        winning_trades=len(wins),
+        losing_trades=len(losses),
+        win_rate=len(wins) / total * 100,
+        profit_factor=profit_factor,
+        total_pnl=float(pnl.sum()),
+        average_win=total_wins / len(wins) if len(wins) else 0.0,
+        average_loss=total_losses / len(losses) if len(losses) else 0.0,
+        largest_win=float(wins.max()) if len(wins) else 0.0,
+        largest_loss=float(losses.min()) if len(losses) else 0.0,
+        max_drawdown=float(drawdown.max()),
+        max_drawdown_percent=float(drawdown_percent.max()),
+        sharpe_ratio=sharpe,
+        sortino_ratio=sortino,
+        expectancy=float(pnl.mean()),
+        average_hold_hours=float(hold.mean()) / _NS_PER_HOUR if len(hold) else None,
+    )
+
+
+def daily_performance(frame: TradeFrame) -> list[dict[str, Any]]:
+    """P&L, trade count, win rate and cumulative P&L per closing day with trades."""
+    if len(frame) == 0:
+        return []
+    days = frame.exit_ns // _NS_PER_DAY
+    starts = _runs(days)
+    pnl = np.add.reduceat(frame.pnl, starts)
+    trades = np.diff(np.r_[starts, len(days)])
+    wins = np.add.reduceat((frame.pnl > 0).astype(np.int64), starts)
+    cumulative = np.cumsum(pnl)
+    return [
+        {
+            "date": date.fromordinal(date(1970, 1, 1).toordinal() + int(day)),
+            "pnl": float(day_pnl),
+            "trades": int(count),
+            "win_rate": float(won / count * 100),
+            "cumulative_pnl": float(total),
+        }
+        for day, day_pnl, count, won, total in zip(days[starts], pnl, trades, wins, cumulative, strict=True)
+    ]
+
+
+def equity_curve(frame: TradeFrame, resolution: str = "1h", initial_balance: float = 0.0) -> list[dict[str, Any]]:
+    """Equity and drawdown at the close of each bucket that has closed trades."""
+    if len(frame) == 0:
+        return []
+    width = EQUITY_RESOLUTIONS[resolution]
+    equity = initial_balance + np.cumsum(frame.pnl)
+    drawdown, drawdown_percent = _drawdown(equity, initial_balance)
+    buckets = frame.exit_ns // width
+    last = np.r_[_runs(buckets)[1:], len(buckets)] - 1
+    return [
+        {
+            "timestamp": _iso(int(bucket) * width),
+            "equity": float(value),
+            "drawdown": float(dd),
+            "drawdown_percent": float(dd_percent),
+        }
+        for bucket, value, dd, dd_percent in zip(
+            buckets[last], equity[last], drawdown[last], drawdown_percent[last], strict=True
+        )
+    ]
+
+
+@dataclass(slots=True)
+class _UserCache:
+    version: int
+    frame: TradeFrame
+    results: OrderedDict
+
+
+class PerformanceAnalyticsService:
+    """Per-user trade frames and analytics results, rebuilt when trades change."""
+
+    def __init__(self, max_users: int | None = None):
+        self.max_users = max(1, max_users or settings.ANALYTICS_CACHE_USERS)
+        self._users: OrderedDict[int, _UserCache] = OrderedDict()
+        self.stats = {"frame_loads": 0, "hits": 0, "misses": 0}
+
+    async def _user_cache(self, db: AsyncSession, user_id: int) -> _UserCache:
+        version = get_trade_history_service().data_version(user_id)
+        cached = self._users.get(user_id)
+        if cached is None or cached.version != version:
+            rows = (await db.execute(
+                select(Trade.timestamp, Trade.exit_timestamp, Trade.profit_loss).where(
+                    Trade.user_id == user_id,
+                    Trade.profit_loss.is_not(None),
+                    Trade.exit_timestamp.is_not(None),
+                )
+            )).all()
+            cached = _UserCache(version, TradeFrame.from_rows(rows), OrderedDict())
+            self._users[user_id] = cached
+            self.stats["frame_loads"] += 1
+        self._users.move_to_end(user_id)
+        while len(self._users) > self.max_users:
+            self._users.popitem(last=False)
+        return cached
+
+    async def _compute(self, db: AsyncSession, user_id: int, key: tuple, compute: Callable[[TradeFrame], Any]) -> Any:
+        cached = await self._user_cache(db, user_id)
+        if key in cached.results:
+            self.stats["hits"] += 1
+            cached.results.move_to_end(key)
+            return cached.results[key]
+        self.stats["misses"] += 1
+        result = cached.results[key] = compute(cached.frame)
+        if len(cached.results) > _RESULTS_PER_USER:
+            cached.results.popitem(last=False)
+        return result
+
+    async def frame(self, db: AsyncSession, user_id: int) -> TradeFrame:
+        return (await self._user_cache(db, user_id)).frame
+
+    async def summary(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        start: date | None = None,
+        end: date | None = None,
+        initial_balance: float = 0.0,
+    ) -> PerformanceSummary:
+        return await self._compute(
+            db, user_id, ("summary", start, end, initial_balance),
+            lambda frame: summarize(frame.window(start, end), initial_balance),
+        )
+
+    async def daily(
+        self, db: AsyncSession, user_id: int, start: date | None = None, end: date | None = None
+    ) -> list[dict[str, Any]]:
+        return await self._compute(
+            db, user_id, ("daily", start, end),
+            lambda frame: daily_performance(frame.window(start, end)),
+        )
+
+    async def equity_curve(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        start: date | None = None,
+        end: date | None = None,
+        resolution: str = "1h",
+        initial_balance: float = 0.0,
+    ) -> list[dict[str, Any]]:
+        return await self._compute(
+            db, user_id, ("equity", start, end, resolution, initial_balance),
+            lambda frame: equity_curve(frame.window(start, end), resolution, initial_balance),
+        )
+
+    def invalidate(self, user_id: int) -> None:
+        self._users.pop(user_id, None)
+
+    def get_stats(self) -> dict[str, Any]:
+        return {"users": len(self._users), **self.stats}
+
+
+# Singleton instance
+_performance_analytics_service: PerformanceAnalyticsService | None = None
+
+
+def get_performance_analytics_service() -> PerformanceAnalyticsService:
+    """Get or create the performance analytics singleton."""
+    global _performance_analytics_service
+    if _performance_analytics_service is None:
+        _performance_analytics_service = PerformanceAnalyticsService()
+    return _performance_analytics_service
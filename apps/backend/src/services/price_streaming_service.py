@@ -12,9 +12,12 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Any
 
+from src.core.bot_logger import get_bot_logger
 from src.engines.trading.base_broker import BaseBroker, Tick
 from src.engines.trading.broker_factory import NoBrokerConfiguredError, get_broker
 
+logger = get_bot_logger("PriceStreaming")
+
 
 class PriceStreamingService:
     """
@@ -140,26 +143,26 @@ class PriceStreamingService:
     async def initialize(self):
         """Initialize the service and try to connect to broker."""
         try:
-            print("[PriceStreaming] Initializing price streaming service...")
+            logger.info("Initializing price streaming service...")
             self._broker = await get_broker()
 
             if self._broker:
-                print(f"[PriceStreaming] Got broker: {self._broker.name}")
-                print(f"[PriceStreaming] Broker connected: {self._broker.is_connected}")
+                logger.info(f"Got broker: {self._broker.name}")
+                logger.info(f"Broker connected: {self._broker.is_connected}")
 
                 # If broker exists but not connected, try to connect
                 if not self._broker.is_connected:
-                    print("[PriceStreaming] Broker not connected, attempting to connect...")
+                    logger.warning("Broker not connected, attempting to connect...")
                     await self._broker.connect()
-                    print(f"[PriceStreaming] Broker connected after retry: {self._broker.is_connected}")
+                    logger.warning(f"Broker connected after retry: {self._broker.is_connected}")
 
                 if self._broker.is_connected:
-                    print(f"✅ Price streaming: Using broker real-time data from {self._broker.name}")
+                    logger.info(f"✅ Price streaming: Using broker real-time data from {self._broker.name}")
                 else:
-                    print("⚠️ Price streaming: Broker exists but not connected, using simulated data")
+                    logger.warning("⚠️ Price streaming: Broker exists but not connected, using simulated data")
                     self._broker = None
             else:
-                print("⚠️ Price streaming: No broker instance, using simulated data")
+                logger.warning("⚠️ Price streaming: No broker instance, using simulated data")
 
         except NoBrokerConfiguredError as e:
             fallback_mode = (
@@ -167,7 +170,7 @@ class PriceStreamingService:
                 if self._disable_simulation
                 else "using simulated data"
             )
-            print(f"⚠️ Price streaming: No default broker configured ({e}), {fallback_mode}")
+            logger.warning(f"⚠️ Price streaming: No default broker configured ({e}), {fallback_mode}")
             self._broker = None
         except Exception as e:
             fallback_mode = (
@@ -175,13 +178,11 @@ class PriceStreamingService:
                 if self._disable_simulation
                 else "using simulated data"
             )
-            print(f"⚠️ Price streaming: Could not get broker ({e}), {fallback_mode}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"⚠️ Price streaming: Could not get broker ({e}), {fallback_mode}")
             self._broker = None
         finally:
             self._initialized = True
-            print(f"[PriceStreaming] Service initialized. Broker: {self._broker.name if self._broker else 'None'}, Connected: {self.is_broker_connected}")
+            logger.info(f"Service initialized. Broker: {self._broker.name if self._broker else 'None'}, Connected: {self.is_broker_connected}")
 
     @property
     def is_broker_connected(self) -> bool:
@@ -250,7 +251,7 @@ class PriceStreamingService:
     async def start_streaming(self):
         """Start the price streaming loop."""
         if self._streaming:
-            print("[PriceStreaming] Already streaming, skipping start")
+            logger.warning("Already streaming, skipping start")
             return
 
         # Wait for initialization to complete before starting
@@ -258,30 +259,30 @@ class PriceStreamingService:
         max_wait = 10  # Maximum 10 seconds wait
         waited = 0
         while not self._initialized and waited < max_wait:
-            print(f"[PriceStreaming] Waiting for initialization... ({waited}s)")
+            logger.info(f"Waiting for initialization... ({waited}s)")
             await asyncio.sleep(0.5)
             waited += 0.5
 
         if not self._initialized:
-            print("[PriceStreaming] WARNING: Initialization not complete after timeout, proceeding anyway")
+            logger.warning("WARNING: Initialization not complete after timeout, proceeding anyway")
 
         self._streaming = True
 
-        print(f"[PriceStreaming] Starting streaming. Broker connected: {self.is_broker_connected}")
-        print(f"[PriceStreaming] Data source: {self.data_source}")
+        logger.info(f"Starting streaming. Broker connected: {self.is_broker_connected}")
+        logger.info(f"Data source: {self.data_source}")
 
         if self.is_broker_connected:
-            print("[PriceStreaming] Starting BROKER price stream")
+            logger.info("Starting BROKER price stream")
             self._stream_task = asyncio.create_task(self._stream_from_broker())
         else:
             if self._disable_simulation:
-                print(
-                    "[PriceStreaming] Broker-only mode active and no broker connected. "
+                logger.info(
+                    "Broker-only mode active and no broker connected. "
                     "Price stream is idle until a real broker becomes available."
                 )
                 self._stream_task = asyncio.create_task(self._stream_idle())
             else:
-                print("[PriceStreaming] Starting SIMULATED price stream (no broker connected)")
+                logger.info("Starting SIMULATED price stream (no broker connected)")
                 self._stream_task = asyncio.create_task(self._stream_simulated())
 
     async def stop_streaming(self):
@@ -297,7 +298,7 @@ class PriceStreamingService:
 
     async def _stream_from_broker(self):
         """Stream prices from connected broker using polling for real-time sync."""
-        print(f"[PriceStreaming] _stream_from_broker started for broker: {self._broker.name if self._broker else 'None'}")
+        logger.info(f"_stream_from_broker started for broker: {self._broker.name if self._broker else 'None'}")
         tick_count = 0
         base_poll_interval = 5.0  # Poll every 5 seconds to avoid rate limiting
         poll_interval = base_poll_interval
@@ -311,9 +312,9 @@ class PriceStreamingService:
         if hasattr(self._broker, 'get_supported_symbols'):
             supported_symbols = set(self._broker.get_supported_symbols())
             if supported_symbols:
-                print(f"[PriceStreaming] Broker supports {len(supported_symbols)} symbols: {list(supported_symbols)[:10]}...")
+                logger.info(f"Broker supports {len(supported_symbols)} symbols: {list(supported_symbols)[:10]}...")
             else:
-                print("[PriceStreaming] No pre-mapped symbols yet, will discover during polling")
+                logger.info("No pre-mapped symbols yet, will discover during polling")
 
         while self._streaming and self.is_broker_connected:
             try:
@@ -333,9 +334,10 @@ class PriceStreamingService:
                 # Get prices from broker for available symbols
                 if broker_symbols and not self._rate_limited:
                     try:
-                        # Log every 50 cycles (less frequent)
-                        if tick_count % 50 == 0:
-                            print(f"[PriceStreaming] Polling {len(broker_symbols)} symbols from broker (interval: {poll_interval}s)...")
+                        logger.info(
+                            "Polling %d symbols from broker (interval: %ss)...",
+                            len(broker_symbols), poll_interval, sample="poll",
+                        )
 
                         prices = await self._broker.get_prices(broker_symbols)
 
@@ -343,9 +345,7 @@ class PriceStreamingService:
                         consecutive_errors = 0
                         poll_interval = base_poll_interval
 
-                        # Log result
-                        if tick_count == 0 or tick_count % 50 == 0:
-                            print(f"[PriceStreaming] Broker returned {len(prices)} prices")
+                        logger.info("Broker returned %d prices", len(prices), sample="poll_result")
 
                         # Track which symbols we got prices for
                         received_symbols = set(prices.keys())
@@ -353,9 +353,9 @@ class PriceStreamingService:
                         for symbol, tick in prices.items():
                             tick_count += 1
 
-                            # Log first few ticks and then every 100th
-                            if tick_count <= 5 or tick_count % 100 == 0:
-                                print(f"[PriceStreaming] Broker #{tick_count}: {tick.symbol} bid={tick.bid} ask={tick.ask}")
+                            logger.debug(
+                                "Broker #%d: %s bid=%s ask=%s", tick_count, tick.symbol, tick.bid, tick.ask, sample="tick",
+                            )
 
                             # Update cache
                             self._current_prices[tick.symbol] = tick
@@ -370,12 +370,14 @@ class PriceStreamingService:
                         for symbol in broker_symbols:
                             if symbol not in received_symbols:
                                 if symbol not in self._failed_symbols:
-                                    print(f"[PriceStreaming] Symbol {symbol} not available from broker, using simulation")
+                                    logger.warning(f"Symbol {symbol} not available from broker, using simulation")
                                     self._failed_symbols.add(symbol)
 
                         # If broker returned NO prices at all, something is wrong
                         if len(prices) == 0 and len(broker_symbols) > 0:
-                            print(f"[PriceStreaming] WARNING: Broker returned 0 prices for {len(broker_symbols)} symbols!")
+                            logger.warning(
+                                "WARNING: Broker returned 0 prices for %d symbols!", len(broker_symbols), sample="empty_poll",
+                            )
                             consecutive_errors += 1
                             # Exponential backoff up to 30 seconds
                             poll_interval = min(base_poll_interval * (2 ** consecutive_errors), 30.0)
@@ -386,15 +388,15 @@ class PriceStreamingService:
 
                         # Check if it's a rate limit error
                         if "rate limit" in error_str.lower() or "429" in error_str or "RateLimitError" in error_str:
-                            print("[PriceStreaming] Rate limit detected! Switching to simulation mode for 5 minutes...")
+                            logger.warning("Rate limit detected! Switching to simulation mode for 5 minutes...")
                             self._rate_limited = True
                             # Schedule to re-enable broker after 5 minutes
                             asyncio.create_task(self._re_enable_broker_after_delay(300))
                         else:
-                            print(f"[PriceStreaming] Broker polling error: {poll_error}")
+                            logger.error("Broker polling error: %s", poll_error, sample="poll_error")
                             # Exponential backoff up to 30 seconds
                             poll_interval = min(base_poll_interval * (2 ** consecutive_errors), 30.0)
-                            print(f"[PriceStreaming] Backing off, next poll in {poll_interval}s")
+                            logger.debug("Backing off, next poll in %ss", poll_interval)
 
                 # Generate simulated prices for symbols not available from broker
                 # Only if simulation is enabled
@@ -410,17 +412,15 @@ class PriceStreamingService:
                 await asyncio.sleep(poll_interval if not self._rate_limited else 1.0)
 
             except Exception as e:
-                print(f"[PriceStreaming] Broker error: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.exception("Broker error: %s", e, sample="broker_stream_error")
                 await asyncio.sleep(2)
 
     async def _re_enable_broker_after_delay(self, delay_seconds: int):
         """Re-enable broker polling after a delay."""
-        print(f"[PriceStreaming] Will re-enable broker polling in {delay_seconds} seconds...")
+        logger.info(f"Will re-enable broker polling in {delay_seconds} seconds...")
         await asyncio.sleep(delay_seconds)
         self._rate_limited = False
-        print("[PriceStreaming] Re-enabled broker polling")
+        logger.info("Re-enabled broker polling")
 
     def _generate_simulated_tick(self, symbol: str) -> Tick | None:
         """Generate a simulated tick for a single symbol."""
@@ -443,7 +443,7 @@ class PriceStreamingService:
 
     async def _stream_simulated(self):
         """Stream simulated prices when no broker is connected."""
-        print("[PriceStreaming] Starting simulated price stream for all symbols")
+        logger.info("Starting simulated price stream for all symbols")
 
         while self._streaming:
             try:
@@ -480,7 +480,7 @@ class PriceStreamingService:
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                print(f"Simulated streaming error: {e}")
+                logger.error(f"Simulated streaming error: {e}")
                 await asyncio.sleep(1)
 
     async def _stream_idle(self):
@@ -604,7 +604,7 @@ class PriceStreamingService:
                 else:
                     callback(tick)
             except Exception as e:
-                print(f"Error in price callback: {e}")
+                logger.error(f"Error in price callback: {e}")
 
 
 # Singleton instance
@@ -635,11 +635,11 @@ async def get_price_streaming_service() -> PriceStreamingService:
             # Disable simulation by default - only use real broker data
             # Set ENABLE_PRICE_SIMULATION=true to enable simulated prices
             disable_simulation = os.getenv("ENABLE_PRICE_SIMULATION", "false").lower() != "true"
-            print(f"[PriceStreaming] Creating new PriceStreamingService instance (simulation {'disabled' if disable_simulation else 'enabled'})...")
+            logger.info(f"Creating new PriceStreamingService instance (simulation {'disabled' if disable_simulation else 'enabled'})...")
             _price_service = PriceStreamingService(disable_simulation=disable_simulation)
             await _price_service.initialize()
             _init_complete.set()  # Signal that initialization is complete
-            print(f"[PriceStreaming] Initialization complete. Broker connected: {_price_service.is_broker_connected}")
+            logger.info(f"Initialization complete. Broker connected: {_price_service.is_broker_connected}")
 
     # Wait for initialization to complete (in case we didn't hold the lock)
     await _init_complete.wait()
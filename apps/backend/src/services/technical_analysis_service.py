@@ -24,6 +24,13 @@ try:
 except ImportError:
     HAS_TA = False
 
+from src.core.config import settings
+from src.services.compute_executor import (
+    SharedFrameHandle,
+    SharedOHLCVFrame,
+    get_compute_executor,
+    load_shared_frame,
+)
 from src.services.market_data_service import MarketData
 
 
@@ -1255,30 +1262,81 @@ class TechnicalAnalysisService:
         """
         Perform complete technical analysis.
 
+        The CPU-bound part runs in the shared compute pool (see
+        compute_executor.py) so the event loop stays responsive; small
+        frames are analyzed inline where the IPC hop would cost more.
+
         Args:
             market_data: OHLCV data for primary timeframe
             include_mtf: Include multi-timeframe analysis
             mtf_data: Data for other timeframes (optional)
         """
         df = market_data.to_dataframe()
-
+        mtf_frames: dict[str, pd.DataFrame] = {}
+        if include_mtf and mtf_data:
+            mtf_frames = {tf: data.to_dataframe() for tf, data in mtf_data.items()}
+
+        executor = get_compute_executor()
+        if not executor.enabled or len(df) < settings.COMPUTE_OFFLOAD_MIN_BARS:
+            return self.analyze_frame(
+                df,
+                market_data.symbol,
+                market_data.timeframe,
+                market_data.current_price,
+                market_data.last_updated,
+                mtf_frames,
+            )
+
+        shared: list[SharedOHLCVFrame] = []
+        try:
+            primary = SharedOHLCVFrame(df)
+            shared.append(primary)
+            mtf_handles = {}
+            for tf, tf_df in mtf_frames.items():
+                if tf_df.empty:
+                    continue
+                frame = SharedOHLCVFrame(tf_df)
+                shared.append(frame)
+                mtf_handles[tf] = frame.handle
+            return await executor.run(
+                "analysis",
+                _full_analysis_job,
+                primary.handle,
+                market_data.symbol,
+                market_data.timeframe,
+                market_data.current_price,
+                market_data.last_updated,
+                mtf_handles,
+            )
+        finally:
+            for frame in shared:
+                frame.release()
+
+    def analyze_frame(
+        self,
+        df: pd.DataFrame,
+        symbol: str,
+        timeframe: str,
+        current_price: Decimal,
+        timestamp: datetime,
+        mtf_frames: dict[str, pd.DataFrame] | None = None,
+    ) -> FullAnalysis:
+        """Synchronous core of full_analysis (safe to run in a worker process)."""
         # Calculate indicators
         indicators = self.calculate_indicators(df)
 
         # SMC analysis
-        smc = self.analyze_smc(df, market_data.current_price)
+        smc = self.analyze_smc(df, current_price)
 
         # Detect candle patterns
         patterns = self._detect_candle_patterns(df)
 
         # MTF analysis
         mtf_trend = {}
-        if include_mtf and mtf_data:
-            for tf, data in mtf_data.items():
-                tf_df = data.to_dataframe()
-                if not tf_df.empty:
-                    trend, _ = self._detect_trend(tf_df)
-                    mtf_trend[tf] = trend
+        for tf, tf_df in (mtf_frames or {}).items():
+            if not tf_df.empty:
+                trend, _ = self._detect_trend(tf_df)
+                mtf_trend[tf] = trend
 
         # Determine overall MTF bias
         mtf_bias = "neutral"
@@ -1291,10 +1349,10 @@ class TechnicalAnalysisService:
                 mtf_bias = "bearish"
 
         return FullAnalysis(
-            symbol=market_data.symbol,
-            timeframe=market_data.timeframe,
-            current_price=market_data.current_price,
-            timestamp=market_data.last_updated,
+            symbol=symbol,
+            timeframe=timeframe,
+            current_price=current_price,
+            timestamp=timestamp,
             indicators=indicators,
             candle_patterns=patterns,
             smc=smc,
@@ -1362,6 +1420,22 @@ class TechnicalAnalysisService:
         return patterns[:5]  # Limit to 5 patterns
 
 
+def _full_analysis_job(
+    handle: SharedFrameHandle,
+    symbol: str,
+    timeframe: str,
+    current_price: Decimal,
+    timestamp: datetime,
+    mtf_handles: dict[str, SharedFrameHandle],
+) -> FullAnalysis:
+    """Compute-pool entry point for full_analysis."""
+    df = load_shared_frame(handle)
+    mtf_frames = {tf: load_shared_frame(h) for tf, h in mtf_handles.items()}
+    return get_technical_analysis_service().analyze_frame(
+        df, symbol, timeframe, current_price, timestamp, mtf_frames
+    )
+
+
 # Singleton
 _ta_service: TechnicalAnalysisService | None = None
 
@@ -0,0 +1,394 @@
+"""
+Trade History Service - Persisted trade history in the ``trades`` table.
+
+Trades reach the table from two sources, both written as upserts keyed on
+(user_id, broker_id, external_id):
+- the in-memory trade history of each broker's AutoTrader; rows whose
+  content did not change since the last committed write are skipped;
+- broker deal history, synced in the background by DealSyncService.
+
+Reads are SQL queries with filters and pagination, served by the
+(user_id, timestamp), (user_id, exit_timestamp) and (broker_id, symbol)
+indexes. Closed trades
+always carry an exit timestamp (falling back to the entry time), so
+date-range performance queries stay on the index.
+
+The legacy per-user JSON cache in AppSettings is imported once and removed.
+``data_version(user_id)`` changes on every committed write, so derived
+per-user caches (performance analytics) know when to rebuild.
+"""
+
+import json
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import delete, event, func, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.core.models import AppSettings, Trade
+
+LEGACY_CACHE_KEY_PREFIX = "trade_history_user_"
+
+# Rows per INSERT statement (SQLite caps bound parameters per statement).
+_BATCH_SIZE = 200
+# Fingerprints of written rows kept to skip unchanged rewrites (least recently written evicted first).
+_MAX_FINGERPRINTS = 50_000
+
+_KEY_COLUMNS = ("user_id", "broker_id", "external_id")
+_VALUE_COLUMNS = (
+    "broker_name", "source", "symbol", "direction", "entry_price", "exit_price", "stop_loss",
+    "take_profit", "units", "confidence", "status", "profit_loss", "timestamp", "exit_timestamp",
+)
+
+
+def _float(value: Any, default: float | None = 0.0) -> float | None:
+    try:
+        if value is None:
+            return default
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _timestamp(value: Any) -> datetime | None:
+    """UTC datetime from a datetime or ISO string (naive values are taken as UTC)."""
+    if isinstance(value, str) and value:
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
+
+
+def normalize_direction(raw_direction: str) -> str:
+    """Normalize direction labels from different providers."""
+    upper = raw_direction.upper()
+    if "BUY" in upper:
+        return "LONG"
+    if "SELL" in upper:
+        return "SHORT"
+    return raw_direction
+
+
+def deal_to_trade(deal: dict[str, Any], broker_id: int, broker_name: str | None) -> dict[str, Any] | None:
+    """API-shaped trade for a broker deal, or ``None`` for non-trade deals (deposits, ...)."""
+    deal_id = str(deal.get("id") or deal.get("dealId") or "")
+    if not deal_id:
+        return None
+
+    deal_type = str(deal.get("type", ""))
+    total_pnl = _float(deal.get("profit")) + _float(deal.get("swap")) + _float(deal.get("commission"))
+    if total_pnl == 0 and "BUY" not in deal_type.upper() and "SELL" not in deal_type.upper():
+        return None
+
+    deal_time = (_timestamp(deal.get("time") or deal.get("brokerTime")) or datetime.now(UTC)).isoformat()
+    return {
+        "id": deal_id,
+        "broker_id": broker_id,
+        "broker_name": broker_name,
+        "symbol": deal.get("symbol", "UNKNOWN"),
+        "direction": normalize_direction(deal_type),
+        "entry_price": _float(deal.get("price")),
+        "exit_price": _float(deal.get("price")),
+        "stop_loss": 0.0,
+        "take_profit": 0.0,
+        "units": _float(deal.get("volume")),
+        "timestamp": deal_time,
+        "exit_timestamp": deal_time,
+        "confidence": 0.0,
+        "status": "filled",
+        "profit_loss": total_pnl,
+    }
+
+
+_AFTER_COMMIT_KEY = "trade_history_after_commit"
+
+
+def _run_after_commit(session: Session) -> None:
+    callbacks, session.info[_AFTER_COMMIT_KEY] = session.info[_AFTER_COMMIT_KEY], []
+    for callback in callbacks:
+        callback()
+
+
+def _drop_after_commit(session: Session) -> None:
+    session.info[_AFTER_COMMIT_KEY] = []
+
+
+def _after_commit(db: AsyncSession, callback: Callable[[], None]) -> None:
+    """Run ``callback`` once ``db``'s current transaction commits; a rollback discards it."""
+    session = db.sync_session
+    callbacks = session.info.get(_AFTER_COMMIT_KEY)
+    if callbacks is None:
+        callbacks = session.info[_AFTER_COMMIT_KEY] = []
+        event.listen(session, "after_commit", _run_after_commit)
+        event.listen(session, "after_rollback", _drop_after_commit)
+    callbacks.append(callback)
+
+
+def _day_start(day: date) -> datetime:
+    return datetime(day.year, day.month, day.day, tzinfo=UTC)
+
+
+def trade_row(user_id: int, trade: dict[str, Any], source: str) -> dict[str, Any] | None:
+    """Column values for an API-shaped trade dict, or ``None`` if it has no id."""
+    external_id = str(trade.get("id") or "").strip()
+    if not external_id:
+        return None
+    timestamp = _timestamp(trade.get("timestamp")) or datetime.now(UTC)
+    profit_loss = _float(trade.get("profit_loss"), None)
+    exit_timestamp = _timestamp(trade.get("exit_timestamp"))
+    if exit_timestamp is None and profit_loss is not None:
+        exit_timestamp = timestamp
+    return {
+        "user_id": user_id,
+        "broker_id": int(trade.get("broker_id") or 0),
+        "external_id": external_id[:100],
+        "broker_name": trade.get("broker_name"),
+        "source": source,
+        "symbol": str(trade.get("symbol") or "UNKNOWN")[:50],
+        "direction": str(trade.get("direction") or "")[:10],
+        "entry_price": _float(trade.get("entry_price")),
+        "exit_price": _float(trade.get("exit_price"), None),
+        "stop_loss": _float(trade.get("stop_loss")),
+        "take_profit": _float(trade.get("take_profit")),
+        "units": _float(trade.get("units")),
+        "confidence": _float(trade.get("confidence")),
+        "status": str(trade.get("status") or "open")[:20],
+        "profit_loss": profit_loss,
+        "timestamp": timestamp,
+        "exit_timestamp": exit_timestamp,
+    }
+
+
+def trade_to_dict(trade: Trade) -> dict[str, Any]:
+    """API shape of a stored trade (same keys the JSON cache used)."""
+    exit_timestamp = _timestamp(trade.exit_timestamp)
+    return {
+        "id": trade.external_id,
+        "broker_id": trade.broker_id or None,
+        "broker_name": trade.broker_name,
+        "symbol": trade.symbol,
+        "direction": trade.direction,
+        "entry_price": trade.entry_price,
+        "exit_price": trade.exit_price,
+        "stop_loss": trade.stop_loss,
+        "take_profit": trade.take_profit,
+        "units": trade.units,
+        "timestamp": _timestamp(trade.timestamp).isoformat(),
+        "exit_timestamp": exit_timestamp.isoformat() if exit_timestamp else None,
+        "confidence": trade.confidence,
+        "status": trade.status,
+        "profit_loss": trade.profit_loss,
+    }
+
+
+class TradeHistoryService:
+    """Upserts and queries rows of the ``trades`` table."""
+
+    def __init__(self):
+        # (user_id, broker_id, external_id) -> hash of the last committed values, oldest first
+        self._written: OrderedDict[tuple[int, int, str], int] = OrderedDict()
+        self._legacy_checked: set[int] = set()
+        # user_id -> counter bumped when a write commits; keys derived caches (analytics)
+        self._versions: dict[int, int] = {}
+
+    def data_version(self, user_id: int) -> int:
+        """Changes whenever the user's stored trades may have changed."""
+        return self._versions.get(user_id, 0)
+
+    def _touch(self, user_id: int) -> None:
+        self._versions[user_id] = self._versions.get(user_id, 0) + 1
+
+    # ---------- writes ----------
+
+    async def upsert_trades(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        trades: Iterable[dict[str, Any]],
+        source: str,
+        overwrite: bool = True,
+    ) -> int:
+        """
+        Insert or update trades; returns the number of rows sent to the database.
+
+        Args:
+            overwrite: Update existing rows; ``False`` only inserts missing ones
+        """
+        rows = []
+        fingerprints = []
+        for trade in trades:
+            row = trade_row(user_id, trade, source)
+            if row is None:
+                continue
+            key = (row["user_id"], row["broker_id"], row["external_id"])
+            fingerprint = hash(tuple(row[column] for column in _VALUE_COLUMNS))
+            if self._written.get(key) == fingerprint:
+                continue
+            rows.append(row)
+            fingerprints.append((key, fingerprint))
+        if not rows:
+            return 0
+
+        for start in range(0, len(rows), _BATCH_SIZE):
+            await self._upsert_batch(db, rows[start:start + _BATCH_SIZE], overwrite)
+        if overwrite:
+            _after_commit(db, lambda: self._remember(fingerprints))
+        _after_commit(db, lambda: self._touch(user_id))
+        return len(rows)
+
+    def _remember(self, fingerprints: list[tuple[tuple[int, int, str], int]]) -> None:
+        for key, fingerprint in fingerprints:
+            self._written[key] = fingerprint
+            self._written.move_to_end(key)
+        while len(self._written) > _MAX_FINGERPRINTS:
+            self._written.popitem(last=False)
+
+    async def _upsert_batch(self, db: AsyncSession, rows: list[dict[str, Any]], overwrite: bool) -> None:
+        dialect = db.get_bind().dialect.name
+        if dialect in ("postgresql", "sqlite"):
+            insert = postgresql_insert if dialect == "postgresql" else sqlite_insert
+            statement = insert(Trade).values(rows)
+            if overwrite:
+                statement = statement.on_conflict_do_update(
+                    index_elements=list(_KEY_COLUMNS),
+                    set_={column: statement.excluded[column] for column in _VALUE_COLUMNS},
+                )
+            else:
+                statement = statement.on_conflict_do_nothing(index_elements=list(_KEY_COLUMNS))
+            await db.execute(statement)
+            return
+
+        # Other databases: look the batch up, then update or add.
+        existing = {
+            (trade.user_id, trade.broker_id, trade.external_id): trade
+            for trade in (await db.execute(
+                select(Trade).where(
+                    Trade.user_id == rows[0]["user_id"],
+                    Trade.external_id.in_([row["external_id"] for row in rows]),
+                )
+            )).scalars()
+        }
+        for row in rows:
+            trade = existing.get((row["user_id"], row["broker_id"], row["external_id"]))
+            if trade is None:
+                db.add(Trade(**row))
+            elif overwrite:
+                for column in _VALUE_COLUMNS:
+                    setattr(trade, column, row[column])
+        await db.flush()
+
+    async def newest_deal_time(self, db: AsyncSession, user_id: int, broker_id: int) -> datetime | None:
+        """Closing time of the newest stored broker deal (deal sync high-water mark)."""
+        newest = (await db.execute(
+            select(func.max(Trade.exit_timestamp)).where(
+                Trade.user_id == user_id,
+                Trade.broker_id == broker_id,
+                Trade.source == "deal",
+            )
+        )).scalar_one_or_none()
+        return _timestamp(newest)
+
+    async def import_legacy_cache(self, db: AsyncSession, user_id: int) -> int:
+        """Move the user's AppSettings JSON trade cache into the table (once)."""
+        if user_id in self._legacy_checked:
+            return 0
+        setting = (await db.execute(
+            select(AppSettings).where(AppSettings.key == f"{LEGACY_CACHE_KEY_PREFIX}{user_id}")
+        )).scalar_one_or_none()
+        imported = 0
+        if setting is not None:
+            try:
+                trades = json.loads(setting.value or "[]")
+            except (TypeError, ValueError):
+                trades = []
+            if isinstance(trades, list):
+                imported = await self.upsert_trades(
+                    db, user_id, (t for t in trades if isinstance(t, dict)), source="cache", overwrite=False,
+                )
+            await db.delete(setting)
+            await db.flush()
+        self._legacy_checked.add(user_id)
+        return imported
+
+    async def clear_user(self, db: AsyncSession, user_id: int) -> None:
+        """Drop every stored trade of a user (e.g. a new account reusing an id)."""
+        await db.execute(delete(Trade).where(Trade.user_id == user_id))
+        for key in [key for key in self._written if key[0] == user_id]:
+            del self._written[key]
+        self._legacy_checked.discard(user_id)
+        _after_commit(db, lambda: self._touch(user_id))
+
+    # ---------- reads ----------
+
+    def _filtered(
+        self,
+        statement,
+        user_id: int,
+        broker_ids: list[int] | None = None,
+        symbol: str | None = None,
+        start: date | None = None,
+        end: date | None = None,
+        closed_only: bool = False,
+    ):
+        statement = statement.where(Trade.user_id == user_id)
+        if broker_ids is not None:
+            statement = statement.where(Trade.broker_id.in_(broker_ids))
+        if symbol:
+            statement = statement.where(Trade.symbol == symbol)
+        if closed_only:
+            statement = statement.where(Trade.profit_loss.is_not(None))
+        if start is not None:
+            statement = statement.where(Trade.exit_timestamp >= _day_start(start))
+        if end is not None:
+            statement = statement.where(Trade.exit_timestamp < _day_start(end) + timedelta(days=1))
+        return statement
+
+    async def query_trades(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        limit: int | None = None,
+        offset: int = 0,
+        **filters: Any,
+    ) -> list[Trade]:
+        """
+        Stored trades of a user, newest first.
+
+        Args:
+            limit: Page size (all rows if omitted)
+            offset: Rows to skip
+            **filters: broker_ids, symbol, start / end (closing day, inclusive), closed_only
+        """
+        statement = self._filtered(select(Trade), user_id, **filters).order_by(
+            Trade.timestamp.desc(), Trade.id.desc()
+        )
+        if offset:
+            statement = statement.offset(offset)
+        if limit is not None:
+            statement = statement.limit(limit)
+        return list((await db.execute(statement)).scalars().all())
+
+    async def count_trades(self, db: AsyncSession, user_id: int, **filters: Any) -> int:
+        statement = self._filtered(select(func.count(Trade.id)), user_id, **filters)
+        return int((await db.execute(statement)).scalar_one())
+
+
+_trade_history_service: TradeHistoryService | None = None
+
+
+def get_trade_history_service() -> TradeHistoryService:
+    """Get or create the trade history service singleton."""
+    global _trade_history_service
+    if _trade_history_service is None:
+        _trade_history_service = TradeHistoryService()
+    return _trade_history_service
@@ -5,6 +5,7 @@ High-level service that coordinates trading operations.
 Integrates broker, risk management, and market data.
 """
 
+import asyncio
 from dataclasses import dataclass
 from decimal import Decimal
 
@@ -238,12 +239,12 @@ class TradingService:
             )
 
         try:
-            # Get current account and positions
-            account = await self._broker.get_account_info()
-            positions = await self._broker.get_positions()
-
-            # Get current price
-            price_update = await self._market_data.get_price(order.symbol)
+            # Account, positions and current price are independent: fetch them concurrently
+            account, positions, price_update = await asyncio.gather(
+                self._broker.get_account_info(),
+                self._broker.get_positions(),
+                self._market_data.get_price(order.symbol),
+            )
             if not price_update:
                 return TradeResult(
                     success=False,
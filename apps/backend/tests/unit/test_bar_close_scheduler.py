@@ -0,0 +1,112 @@
+import asyncio
+from datetime import datetime
+from decimal import Decimal
+
+import src.engines.trading.bar_close_scheduler as scheduler_module
+from src.engines.trading.auto_trader import AutoTrader, BotStatus
+from src.engines.trading.bar_close_scheduler import BarCloseScheduler
+from src.engines.trading.base_broker import Tick
+
+T0 = 1_767_600_000  # 2026-01-05 08:00:00 UTC, on a 15m boundary
+
+
+class _StreamBroker:
+    def __init__(self, symbols: list[str] | None = None) -> None:
+        self.symbols = symbols or []
+
+    async def stream_prices(self, symbols: list[str]):
+        for symbol in self.symbols:
+            yield Tick(symbol=symbol, bid=Decimal("1.1"), ask=Decimal("1.1"), timestamp=datetime.utcnow())
+        await asyncio.Event().wait()
+
+
+class _BrokenBroker:
+    async def stream_prices(self, symbols: list[str]):
+        raise RuntimeError("streaming not supported")
+        yield  # pragma: no cover
+
+
+async def test_first_tick_of_a_new_bar_closes_the_previous_one():
+    scheduler = BarCloseScheduler(None, ["EUR_USD", "XAU_USD"], 900, session_offset_minutes=0)
+
+    scheduler.on_tick("EUR_USD", T0 + 10)
+    scheduler.on_tick("EUR_USD", T0 + 899)
+    assert await scheduler.wait(timeout=0) == []
+
+    scheduler.on_tick("EUR_USD", T0 + 901)
+    scheduler.on_tick("XAU_USD", T0 + 905)  # First XAU_USD tick: nothing to close yet
+    assert await scheduler.wait(timeout=0) == ["EUR_USD"]
+    scheduler.on_tick("XAU_USD", T0 + 1800)
+
+    assert await scheduler.wait(timeout=0) == ["XAU_USD"]
+
+
+async def test_bursts_of_closes_are_coalesced():
+    scheduler = BarCloseScheduler(None, ["EUR_USD", "GBP_USD"], 60, session_offset_minutes=0)
+
+    for minute in range(5):
+        scheduler.on_tick("EUR_USD", T0 + minute * 60)
+    scheduler.mark_closed("GBP_USD")
+
+    assert await scheduler.wait(timeout=0) == ["EUR_USD", "GBP_USD"]
+    assert scheduler.stats["closes"] == 5
+    assert scheduler.stats["coalesced"] == 3
+    assert await scheduler.wait(timeout=0.01) == []
+
+
+async def test_broker_tick_symbols_are_mapped_back(monkeypatch):
+    clock = iter([T0 + 10, T0 + 20, T0 + 910])
+    monkeypatch.setattr(scheduler_module.time, "time", lambda: next(clock))
+    scheduler = BarCloseScheduler(
+        _StreamBroker(["EURUSDm", "UNKNOWN", "EURUSDm", "EURUSDm"]), ["EUR_USD"], 900, session_offset_minutes=0,
+    )
+
+    scheduler.start()
+    try:
+        assert await asyncio.wait_for(scheduler.wait(), timeout=1) == ["EUR_USD"]
+    finally:
+        await scheduler.stop()
+    assert scheduler.stats["ticks"] == 3
+
+
+async def test_falls_back_to_clock_without_tick_stream():
+    scheduler = BarCloseScheduler(_BrokenBroker(), ["EUR_USD"], 1, clock_delay_seconds=0)
+
+    scheduler.start()
+    try:
+        assert await asyncio.wait_for(scheduler.wait(), timeout=2) == ["EUR_USD"]
+    finally:
+        await scheduler.stop()
+    assert scheduler.stats["source"] == "clock"
+
+
+async def test_auto_trader_analyzes_only_symbols_whose_bar_closed(monkeypatch):
+    trader = AutoTrader()
+    trader.config.symbols = ["EUR/USD", "GBP/USD", "XAU/USD"]
+    trader.config.analysis_timeframe = "15m"
+    trader.state.status = BotStatus.RUNNING
+    monkeypatch.setattr(trader, "_is_trading_hours", lambda: True)
+    monkeypatch.setattr(trader, "_daily_limits_reached", lambda: False)
+    analyzed: list[list[str] | None] = []
+    done = asyncio.Event()
+
+    async def analyze(closed=None):
+        analyzed.append(closed)
+        done.set()
+
+    monkeypatch.setattr(trader, "_analyze_and_trade", analyze)
+    trader.broker = _StreamBroker()
+    scheduler = await trader._sync_bar_scheduler()
+    scheduler.mark_closed("XAU_USD")
+    scheduler.mark_closed("XAU_USD")
+
+    task = asyncio.create_task(trader._main_loop())
+    try:
+        await asyncio.wait_for(done.wait(), timeout=1)
+    finally:
+        trader._stop_event.set()
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    assert analyzed == [["XAU_USD"]]
+    assert trader._bar_scheduler is None
@@ -0,0 +1,103 @@
+import io
+import json
+
+from src.core import bot_logger as bot_logger_module
+from src.core.bot_logger import BotLogger, BufferedLogWriter, parse_component_levels
+from src.core.config import settings
+
+
+def _writer(**kwargs) -> tuple[BufferedLogWriter, io.StringIO]:
+    stream = io.StringIO()
+    return BufferedLogWriter(stream=stream, background=False, **kwargs), stream
+
+
+def test_component_levels_override_the_global_level(monkeypatch):
+    writer, stream = _writer(json_format=False)
+    monkeypatch.setattr(settings, "BOT_LOG_LEVEL", "WARNING")
+    monkeypatch.setattr(settings, "BOT_LOG_LEVELS", "PriceStreaming=DEBUG, MetaTrader = error")
+    streaming = BotLogger("PriceStreaming", writer=writer)
+    broker = BotLogger("MetaTrader", writer=writer)
+    agent = BotLogger("TradingViewAgent", writer=writer)
+
+    streaming.debug("tick %s", "EURUSD")
+    broker.warning("stale price")
+    agent.info("hidden")
+    agent.warning("shown")
+    writer.flush()
+
+    assert stream.getvalue().splitlines() == ["[PriceStreaming] tick EURUSD", "[TradingViewAgent] shown"]
+    assert parse_component_levels("A=debug,broken,B=") == {"A": 10}
+
+
+def test_args_are_rendered_by_the_writer_not_the_caller():
+    class _Probe:
+        renders = 0
+
+        def __str__(self):
+            _Probe.renders += 1
+            return "probe"
+
+    writer, stream = _writer(json_format=False)
+    logger = BotLogger("PriceStreaming", writer=writer, level="INFO")
+
+    logger.debug("skipped %s", _Probe())
+    logger.info("value %s", _Probe())
+    assert _Probe.renders == 0
+
+    writer.flush()
+    assert stream.getvalue() == "[PriceStreaming] value probe\n"
+    assert _Probe.renders == 1
+
+
+def test_sampling_lets_one_message_through_per_interval(monkeypatch):
+    writer, stream = _writer(json_format=False)
+    logger = BotLogger("PriceStreaming", writer=writer, level="DEBUG")
+    clock = iter([100.0, 101.0, 102.0, 131.0, 132.0])
+    monkeypatch.setattr(bot_logger_module.time, "time", lambda: next(clock))
+    monkeypatch.setattr(settings, "BOT_LOG_SAMPLE_SECONDS", 30.0)
+
+    for i in range(4):
+        logger.debug("tick %d", i, sample="tick")
+    logger.debug("other", sample="poll")
+    writer.flush()
+
+    assert stream.getvalue().splitlines() == [
+        "[PriceStreaming] tick 0",
+        "[PriceStreaming] tick 3 suppressed=2",
+        "[PriceStreaming] other",
+    ]
+
+
+def test_json_records_carry_fields_and_traceback():
+    writer, stream = _writer(json_format=True)
+    logger = BotLogger("MetaTrader", writer=writer, level="INFO")
+
+    try:
+        raise ValueError("bad fill")
+    except ValueError:
+        logger.exception("Order EXCEPTION (attempt %d)", 2, symbol="EURUSD")
+    writer.flush()
+
+    record = json.loads(stream.getvalue())
+    assert record["level"] == "ERROR" and record["component"] == "MetaTrader"
+    assert record["message"] == "Order EXCEPTION (attempt 2)"
+    assert record["symbol"] == "EURUSD"
+    assert record["exception"].endswith("ValueError: bad fill")
+
+
+def test_logger_gates_levels_and_bounds_the_buffer():
+    stream = io.StringIO()
+    writer = BufferedLogWriter(stream=stream, max_lines=3, background=False)
+    logger = BotLogger("AutoTrader", writer=writer, level="INFO")
+
+    logger.debug("hidden %s", "detail")
+    for i in range(5):
+        logger.info("tick %d", i)
+    writer.flush()
+
+    assert stream.getvalue().splitlines() == [
+        "[BotLogger] 2 log lines dropped (stdout too slow)",
+        "[AutoTrader] tick 2",
+        "[AutoTrader] tick 3",
+        "[AutoTrader] tick 4",
+    ]
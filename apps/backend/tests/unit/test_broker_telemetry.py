@@ -0,0 +1,111 @@
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from src.engines.trading.base_broker import (
+    OrderRequest,
+    OrderResult,
+    OrderSide,
+    OrderStatus,
+    OrderType,
+    Tick,
+)
+from src.engines.trading.broker_telemetry import (
+    BrokerTelemetry,
+    InstrumentedBroker,
+    _TelemetryCollector,
+)
+
+
+class _FakeBroker:
+    name = "fake"
+
+    def __init__(self) -> None:
+        self._order_retries = 0
+        self.fill = Decimal("1.10030")
+        self.reject = False
+
+    async def get_current_price(self, symbol: str) -> Tick:
+        return Tick(symbol=symbol, bid=Decimal("1.10000"), ask=Decimal("1.10010"), timestamp=datetime.utcnow())
+
+    async def place_order(self, order: OrderRequest) -> OrderResult:
+        self._order_retries += 1
+        if self.reject:
+            return OrderResult(order_id="", symbol=order.symbol, status=OrderStatus.REJECTED)
+        return OrderResult(
+            order_id="1",
+            symbol=order.symbol,
+            side=order.side,
+            status=OrderStatus.FILLED,
+            average_fill_price=self.fill,
+        )
+
+    async def modify_position(self, symbol, stop_loss=None, take_profit=None) -> bool:
+        raise ConnectionError("down")
+
+    async def get_symbol_specification(self, symbol: str) -> dict:
+        return {"digits": 5}
+
+
+def _market(side: OrderSide = OrderSide.BUY) -> OrderRequest:
+    return OrderRequest(symbol="EUR_USD", side=side, order_type=OrderType.MARKET, size=Decimal("1"))
+
+
+@pytest.mark.asyncio
+async def test_instrumented_broker_records_latency_slippage_and_rejects() -> None:
+    telemetry = BrokerTelemetry()
+    inner = _FakeBroker()
+    broker = InstrumentedBroker(inner, label="broker-1", telemetry=telemetry)
+
+    await broker.get_current_price("EUR_USD")
+    await broker.place_order(_market())  # ask 1.10010 -> fill 1.10030 = 2 pips adverse
+    inner.reject = True
+    await broker.place_order(_market())
+    with pytest.raises(ConnectionError):
+        await broker.modify_position("EUR_USD", stop_loss=Decimal("1.09"))
+
+    # Non-instrumented calls are delegated to the wrapped broker.
+    assert await broker.get_symbol_specification("EUR_USD") == {"digits": 5}
+
+    summary = telemetry.summary("broker-1")
+    place = summary["operations"]["place_order"]
+    assert place["calls"] == 2
+    assert place["rejects"] == 1
+    assert place["reject_rate"] == 0.5
+    assert place["retries"] == 2
+    assert place["slippage_pips"]["samples"] == 1
+    assert place["slippage_pips"]["avg"] == pytest.approx(2.0)
+    assert summary["operations"]["modify_position"]["errors"] == 1
+    assert "EUR_USD" in summary["symbols"]
+
+
+def test_sell_slippage_sign_and_remote_merge() -> None:
+    pips = InstrumentedBroker.slippage_pips(_market(OrderSide.SELL), Decimal("1.10000"), Decimal("1.10020"))
+    assert pips == pytest.approx(-2.0)  # Sold higher than the bid: favourable
+
+    telemetry = BrokerTelemetry()
+    remote = BrokerTelemetry()
+    remote.record("broker-2", "XAUUSD", "close_position", 0.3, "ok")
+    telemetry.merge_remote("broker-2", remote.export())
+
+    assert telemetry.summary("broker-2")["operations"]["close_position"]["calls"] == 1
+    families = {f.name: f for f in _TelemetryCollector(telemetry).collect()}
+    requests = families["broker_order_requests"].samples
+    assert any(s.labels["outcome"] == "ok" and s.value == 1 for s in requests)
+    latency = families["broker_order_latency_seconds"].samples
+    assert any(s.name.endswith("_count") and s.value == 1 for s in latency)
+
+
+@pytest.mark.asyncio
+async def test_instrumented_broker_wraps_once_and_forwards_writes() -> None:
+    inner = _FakeBroker()
+    broker = InstrumentedBroker(inner, label="broker-1", telemetry=BrokerTelemetry())
+
+    assert broker.get_symbol_specification is broker.get_symbol_specification
+
+    broker.reject = True
+    assert inner.reject is True
+    assert "reject" not in vars(broker)
+    assert (await broker.place_order(_market())).status == OrderStatus.REJECTED
+    assert broker.telemetry_label == "broker-1"
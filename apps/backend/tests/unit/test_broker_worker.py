@@ -0,0 +1,107 @@
+import asyncio
+
+import pytest
+
+from src.engines.trading.auto_trader import BotConfig, BotStatus
+from src.engines.trading.broker_worker import BrokerWorkerError, BrokerWorkerPool
+
+
+@pytest.mark.asyncio
+async def test_worker_roundtrip_mirrors_state() -> None:
+    pool = BrokerWorkerPool(max_processes=0)
+    trader = pool.create_trader(7)
+    try:
+        worker = await pool.ensure_worker(7)
+        await worker.call("configure", 7, BotConfig(symbols=["EUR/USD"]))
+
+        pong = await worker.call("ping", timeout=60)
+        assert pong["brokers"] == [7]
+
+        await trader.stop()
+        assert trader.state.status == BotStatus.STOPPED
+        assert trader.desired_status == BotStatus.STOPPED
+    finally:
+        await pool.shutdown()
+
+    assert not worker.is_alive()
+
+
+@pytest.mark.asyncio
+async def test_brokers_share_worker_when_grouped() -> None:
+    pool = BrokerWorkerPool(max_processes=2)
+    assert pool.worker_for(1) is pool.worker_for(3)
+    assert pool.worker_for(1) is not pool.worker_for(2)
+
+
+@pytest.mark.asyncio
+async def test_dead_worker_is_respawned_and_reconfigured() -> None:
+    pool = BrokerWorkerPool(max_processes=0)
+    trader = pool.create_trader(9)
+    try:
+        worker = await pool.ensure_worker(9)
+        await worker.call("ping", timeout=60)
+        pid_before = worker.pid
+        worker._process.kill()
+        await asyncio.to_thread(worker._process.join, 10)
+        assert not worker.is_alive()
+
+        # Stopped brokers are only reconfigured, so no real bot is launched here.
+        await pool._respawn(worker, [trader], reason="test")
+
+        assert worker.is_alive()
+        assert worker.pid != pid_before
+        assert worker.restarts == 1
+        pong = await worker.call("ping", timeout=60)
+        assert pong["brokers"] == [9]
+    finally:
+        await pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_stopping_a_worker_does_not_block_the_event_loop(monkeypatch) -> None:
+    pool = BrokerWorkerPool(max_processes=0)
+    worker = pool.worker_for(4)
+    await pool.ensure_worker(4)
+    reap = worker._reap
+
+    def slow_reap(process) -> None:
+        import time
+
+        time.sleep(0.3)
+        reap(process)
+
+    monkeypatch.setattr(worker, "_reap", slow_reap)
+    ticks = 0
+
+    async def ticker() -> None:
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    task = asyncio.create_task(ticker())
+    try:
+        await worker.stop_process()
+    finally:
+        task.cancel()
+        await pool.shutdown()
+
+    assert ticks >= 10
+    assert not worker.is_alive()
+
+
+@pytest.mark.asyncio
+async def test_closed_pipe_of_a_replaced_worker_does_not_fail_new_calls() -> None:
+    pool = BrokerWorkerPool(max_processes=0)
+    worker = pool.worker_for(5)
+    old_conn, new_conn = object(), object()
+    worker._conn = new_conn
+    pending = asyncio.get_running_loop().create_future()
+    worker._pending[1] = pending
+
+    worker._pipe_closed(old_conn)
+    assert not pending.done()
+
+    worker._pipe_closed(new_conn)
+    assert isinstance(pending.exception(), BrokerWorkerError)
+    worker._conn = None
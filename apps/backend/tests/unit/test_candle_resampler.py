@@ -0,0 +1,129 @@
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+
+from src.services.candle_resampler import (
+    CandleColumns,
+    IncrementalResampler,
+    resample,
+    timeframe_seconds,
+)
+
+
+def _columns(start: datetime, count: int, seconds: int) -> CandleColumns:
+    time = int(start.replace(tzinfo=UTC).timestamp()) + np.arange(count, dtype=np.int64) * seconds
+    prices = 100.0 + np.arange(count, dtype=np.float64)
+    return CandleColumns(
+        time=time,
+        open=prices,
+        high=prices + 1.0,
+        low=prices - 1.0,
+        close=prices + 0.5,
+        volume=np.ones(count),
+    )
+
+
+def _utc(epoch: int) -> datetime:
+    return datetime.fromtimestamp(epoch, tz=UTC).replace(tzinfo=None)
+
+
+def test_resample_aggregates_ohlcv_per_bucket():
+    base = _columns(datetime(2026, 1, 5, 0, 0), 60, 60)
+
+    bars = resample(base, 900, session_offset_minutes=0)
+
+    assert len(bars) == 4
+    assert [_utc(t).minute for t in bars.time] == [0, 15, 30, 45]
+    assert bars.open[1] == base.open[15]
+    assert bars.close[1] == base.close[29]
+    assert bars.high[1] == base.high[15:30].max()
+    assert bars.low[1] == base.low[15:30].min()
+    assert bars.volume[1] == 15.0
+    assert not bars.forming
+
+
+def test_resample_anchors_daily_bars_to_broker_session():
+    # Broker on GMT+2: the trading day opens at 22:00 UTC.
+    base = _columns(datetime(2026, 1, 5, 22, 0), 50, 3600)
+
+    bars = resample(base, 86400, session_offset_minutes=120)
+
+    assert [_utc(t) for t in bars.time] == [
+        datetime(2026, 1, 5, 22), datetime(2026, 1, 6, 22), datetime(2026, 1, 7, 22),
+    ]
+    assert bars.close[0] == base.close[23]
+    # 50 hours cover two full days; the third one is still forming.
+    assert bars.forming
+
+
+def test_resample_drops_partial_first_bucket_and_anchors_weeks_on_monday():
+    # Wednesday 12:00, hourly bars for three weeks.
+    base = _columns(datetime(2026, 1, 7, 12, 0), 21 * 24, 3600)
+
+    weeks = resample(base, 7 * 86400, session_offset_minutes=0)
+
+    assert [_utc(t) for t in weeks.time] == [datetime(2026, 1, 12), datetime(2026, 1, 19), datetime(2026, 1, 26)]
+    assert weeks.forming
+
+
+def test_forming_follows_clock():
+    base = _columns(datetime(2026, 1, 5, 0, 0), 15, 60)
+    end = base.time[0] + 900
+
+    assert not resample(base, 900, session_offset_minutes=0, now=end + 1).forming
+    assert resample(base, 900, session_offset_minutes=0, now=end - 1).forming
+
+
+def test_incremental_updates_match_batch_resample():
+    base = _columns(datetime(2026, 1, 5, 0, 7), 200, 60)
+    resampler = IncrementalResampler(900, 60, session_offset_minutes=0)
+
+    completed = []
+    for start in range(0, len(base), 37):
+        # Re-send the last base bar of the previous chunk, as a live feed would.
+        chunk = base[max(0, start - 1):start + 37]
+        completed.extend(resampler.update(chunk).time.tolist())
+
+    expected = resample(base, 900, base_seconds=60, session_offset_minutes=0)
+    bars = resampler.bars
+    assert completed == expected.time[:-1].tolist()
+    np.testing.assert_array_equal(bars.time, expected.time)
+    np.testing.assert_array_equal(bars.high, expected.high)
+    np.testing.assert_array_equal(bars.close, expected.close)
+    np.testing.assert_array_equal(bars.volume, expected.volume)
+    assert bars.forming
+
+
+def test_incremental_update_replaces_base_bar_in_progress():
+    base = _columns(datetime(2026, 1, 5, 0, 0), 10, 60)
+    resampler = IncrementalResampler(900, 60, session_offset_minutes=0)
+    resampler.update(base)
+
+    revised = base[-1:]
+    revised.close = revised.close + 5.0
+    revised.high = revised.high + 10.0
+    resampler.update(revised)
+
+    bar = resampler.bars
+    assert len(bar) == 1 and bar.forming
+    assert bar.close[0] == base.close[-1] + 5.0
+    assert bar.high[0] == base.high[-1] + 10.0
+    assert bar.volume[0] == 10.0
+
+
+def test_round_trip_to_candles_keeps_timezone_and_prices():
+    base = _columns(datetime(2026, 1, 5, 0, 0), 2, 60)
+
+    candles = base.to_candles(UTC)
+
+    assert candles[0].timestamp == datetime(2026, 1, 5, tzinfo=UTC)
+    assert candles[1].timestamp - candles[0].timestamp == timedelta(minutes=1)
+    np.testing.assert_array_equal(CandleColumns.from_candles(candles).close, base.close)
+
+
+def test_timeframe_seconds_parses_both_notations():
+    assert timeframe_seconds("15m") == 900
+    assert timeframe_seconds("1H") == 3600
+    assert timeframe_seconds("H4") == 14400
+    assert timeframe_seconds("1D") == 86400
+    assert timeframe_seconds("tick") is None
@@ -0,0 +1,144 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+import src.services.chart_generator_service as chart_module
+from src.core.config import settings
+from src.services.chart_generator_service import (
+    INDICATOR_PRESETS,
+    ChartConfig,
+    ChartGeneratorService,
+)
+from src.services.chart_raster import RasterChartRenderer
+from src.services.compute_executor import ComputeExecutor
+from src.services.technical_analysis_service import SMCAnalysis
+
+
+def _candles(bars: int = 60) -> list[SimpleNamespace]:
+    rng = np.random.default_rng(3)
+    close = 1.1 + np.cumsum(rng.normal(0, 0.001, bars))
+    start = datetime(2026, 1, 5)
+    candles = []
+    for i in range(bars):
+        open_ = close[i - 1] if i else close[0]
+        candles.append(SimpleNamespace(
+            timestamp=start + timedelta(minutes=15 * i),
+            open=open_,
+            high=max(open_, close[i]) + 0.0004,
+            low=min(open_, close[i]) - 0.0004,
+            close=close[i],
+            volume=float(rng.integers(100, 1000)),
+        ))
+    return candles
+
+
+class _MarketData:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def get_market_data(self, symbol: str, timeframe: str, bars: int) -> SimpleNamespace:
+        self.calls += 1
+        return SimpleNamespace(candles=_candles(bars), current_price=1.1)
+
+
+class _Analysis:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def full_analysis(self, market_data, include_mtf: bool = False) -> SimpleNamespace:
+        self.calls += 1
+        return SimpleNamespace(smc=SMCAnalysis())
+
+
+@pytest.fixture
+def service(monkeypatch) -> ChartGeneratorService:
+    monkeypatch.setattr(chart_module, "get_compute_executor", lambda: ComputeExecutor(mode="inline"))
+    svc = ChartGeneratorService()
+    svc.market_data = _MarketData()
+    svc.ta_service = _Analysis()
+    svc._initialized = True
+    return svc
+
+
+async def test_multi_indicator_charts_fetch_and_analyze_once(service, monkeypatch) -> None:
+    monkeypatch.setattr(settings, "CHART_RENDERER", "raster")
+
+    charts = await service.generate_multi_indicator_charts("EURUSD", "15m", 60)
+
+    assert set(charts) == {"momentum", "trend", "smc", "complete"}
+    assert service.market_data.calls == 1
+    assert service.ta_service.calls == 1
+    image, metadata = charts["momentum"]
+    assert image
+    assert metadata["bars"] == 60
+    assert metadata["indicators_shown"] == ["RSI", "MACD", "EMA", "EMA"]
+
+
+async def test_batch_rejects_mixed_symbols(service) -> None:
+    with pytest.raises(ValueError):
+        await service.generate_charts({
+            "a": ChartConfig("EURUSD"),
+            "b": ChartConfig("GBPUSD"),
+        })
+
+
+def test_batch_render_matches_single_renders(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "CHART_RENDERER", "raster")
+    svc = ChartGeneratorService()
+    df = svc._candles_to_dataframe(_candles())
+    analysis = SimpleNamespace(smc=SMCAnalysis())
+    configs = [
+        ChartConfig("EURUSD", width=500, height=350, indicators=INDICATOR_PRESETS[name])
+        for name in ("momentum", "trend", "complete")
+    ]
+
+    batch = svc.render_charts(configs, df, analysis)
+
+    singles = [ChartGeneratorService().render_chart(config, df, analysis) for config in configs]
+    assert batch == singles
+
+
+def test_matplotlib_figure_templates_are_reused(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "CHART_RENDERER", "matplotlib")
+    svc = ChartGeneratorService()
+    df = svc._candles_to_dataframe(_candles())
+    analysis = SimpleNamespace(smc=SMCAnalysis())
+    momentum = ChartConfig("EURUSD", width=500, height=350, indicators=INDICATOR_PRESETS["momentum"])
+    trend = ChartConfig("EURUSD", width=500, height=350, indicators=INDICATOR_PRESETS["trend"])
+
+    first = svc.render_chart(momentum, df, analysis)
+    figures = len(plt.get_fignums())
+    svc.render_charts([trend, momentum, momentum], df, analysis)
+    again = svc.render_chart(momentum, df, analysis)
+
+    assert again == first
+    assert len(svc._figure_templates) == 2
+    assert len(plt.get_fignums()) == figures + 1
+
+
+def test_charts_render_concurrently_across_threads(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "CHART_RENDERER", "raster")
+    svc = ChartGeneratorService()
+    df = svc._candles_to_dataframe(_candles())
+    analysis = SimpleNamespace(smc=SMCAnalysis())
+    config = ChartConfig("EURUSD", width=500, height=350, indicators=INDICATOR_PRESETS["trend"])
+    expected = ChartGeneratorService().render_chart(config, df, analysis)
+
+    # Both renders must be inside the renderer at once: a service-wide render lock would time out here.
+    both_rendering = threading.Barrier(2, timeout=5)
+    render_base64 = RasterChartRenderer.render_base64
+
+    def rendezvous(self, spec, width, height):
+        both_rendering.wait()
+        return render_base64(self, spec, width, height)
+
+    monkeypatch.setattr(RasterChartRenderer, "render_base64", rendezvous)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        images = list(pool.map(lambda _: svc.render_chart(config, df, analysis), range(2)))
+
+    assert images == [expected, expected]
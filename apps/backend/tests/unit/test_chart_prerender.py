@@ -0,0 +1,133 @@
+import asyncio
+import time
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+import src.engines.trading.bar_close_scheduler as scheduler_module
+import src.services.chart_generator_service as chart_module
+import src.services.market_data_service as market_module
+from src.engines.trading.base_broker import Tick
+from src.services.chart_prerender_service import (
+    ChartPrerenderService,
+    PrerenderedChart,
+    PrerenderTarget,
+    last_bar_close,
+    parse_targets,
+)
+
+
+class _Generator:
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+
+    async def generate_charts(self, configs):
+        self.batches.append(list(configs))
+        return {
+            name: (f"img-{name}", {"last_bar_time": "2026-01-05T10:00:00", "bars": config.bars})
+            for name, config in configs.items()
+        }
+
+
+class _MarketData:
+    def __init__(self) -> None:
+        self.invalidated: list[tuple[str, str]] = []
+
+    def invalidate(self, symbol: str, timeframe: str) -> None:
+        self.invalidated.append((symbol, timeframe))
+
+
+@pytest.fixture
+def generator(monkeypatch) -> _Generator:
+    fake = _Generator()
+    monkeypatch.setattr(chart_module, "get_chart_generator_service", lambda: fake)
+    return fake
+
+
+@pytest.fixture
+def market(monkeypatch) -> _MarketData:
+    fake = _MarketData()
+    monkeypatch.setattr(market_module, "get_market_data_service", lambda: fake)
+    return fake
+
+
+def test_bar_close_and_targets() -> None:
+    assert last_bar_close("15m", now=1000.0) == 900.0
+    assert parse_targets("EUR_USD:15m:smc, EUR_USD:15m:smc,bad,XAU_USD:1H:vision") == [
+        PrerenderTarget("EUR_USD", "15m", "smc"),
+        PrerenderTarget("XAU_USD", "1H", "vision"),
+    ]
+
+
+async def test_bar_close_renders_presets_in_one_batch(generator, market) -> None:
+    service = ChartPrerenderService(
+        targets=[
+            PrerenderTarget("EUR_USD", "15m", "smc"),
+            PrerenderTarget("EUR_USD", "15m", "complete"),
+            PrerenderTarget("EUR_USD", "1h", "trend"),
+        ],
+    )
+
+    await service.on_bar_close("EUR_USD", "15m")
+
+    assert generator.batches == [["smc", "complete"]]
+    assert ("EUR_USD", "15m") in market.invalidated
+    chart = service.get("EUR_USD", "15m", "smc")
+    assert chart is not None
+    assert chart.image_base64 == "img-smc"
+    assert chart.bar_time == datetime(2026, 1, 5, 10, 0)
+    assert service.get("EUR_USD", "1h", "trend") is None
+    assert service.get_images("EUR_USD", ["15m", "1h"], "complete") == {"15m": "img-complete"}
+
+
+def test_images_from_before_the_last_bar_close_are_stale() -> None:
+    service = ChartPrerenderService(targets=[])
+    target = PrerenderTarget("EUR_USD", "15m", "smc")
+    service.store(PrerenderedChart(target, "old", None, rendered_at=last_bar_close("15m") - 1))
+    assert service.get("EUR_USD", "15m", "smc") is None
+
+    service.store(PrerenderedChart(target, "new", None, rendered_at=time.time()))
+    assert service.get("EUR_USD", "15m", "smc").image_base64 == "new"
+
+
+def test_cache_is_bounded() -> None:
+    service = ChartPrerenderService(targets=[], cache_size=2)
+    now = time.time()
+    for index in range(3):
+        target = PrerenderTarget(f"SYM{index}", "1h", "smc")
+        service.store(PrerenderedChart(target, f"img{index}", datetime(2026, 1, 5, index), rendered_at=now))
+
+    assert service.get("SYM0", "1h", "smc") is None
+    assert service.get("SYM2", "1h", "smc").image_base64 == "img2"
+    assert service.get_stats()["cached"] == 2
+
+
+class _TickBroker:
+    async def stream_prices(self, symbols: list[str]):
+        for _ in range(3):
+            yield Tick(symbol="EURUSD", bid=Decimal("1.1"), ask=Decimal("1.1"), timestamp=datetime.utcnow())
+        await asyncio.Event().wait()
+
+
+async def test_bar_closes_come_from_the_bar_close_scheduler(monkeypatch) -> None:
+    clock = iter([1_767_600_010, 1_767_600_020, 1_767_600_910])  # Third tick opens the next 15m bar
+    monkeypatch.setattr(scheduler_module.time, "time", lambda: next(clock))
+    service = ChartPrerenderService(targets=[PrerenderTarget("EUR_USD", "15m", "smc")])
+    closes: list[tuple[str, str]] = []
+    closed = asyncio.Event()
+
+    async def on_bar_close(symbol: str, timeframe: str) -> None:
+        closes.append((symbol, timeframe))
+        if len(closes) == 2:
+            closed.set()
+
+    monkeypatch.setattr(service, "on_bar_close", on_bar_close)
+    service.start(_TickBroker())
+    try:
+        await asyncio.wait_for(closed.wait(), timeout=1)
+    finally:
+        await service.stop()
+
+    # Warm-up render, then the close reported by the tick stream.
+    assert closes == [("EUR_USD", "15m"), ("EUR_USD", "15m")]
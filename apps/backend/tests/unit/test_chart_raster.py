@@ -0,0 +1,160 @@
+import base64
+import io
+import os
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+from PIL import Image
+
+from src.core.config import settings
+from src.services.chart_generator_service import (
+    INDICATOR_PRESETS,
+    ChartConfig,
+    ChartGeneratorService,
+)
+from src.services.chart_raster import (
+    RasterChartRenderer,
+    RasterChartSpec,
+    RasterLevel,
+    RasterSeries,
+    RasterTheme,
+    RasterZone,
+)
+from src.services.technical_analysis_service import (
+    MarketStructure,
+    PriceZone,
+    SMCAnalysis,
+    StructurePoint,
+    ZoneType,
+)
+
+GOLDEN_DIR = Path(__file__).parent / "golden"
+# Regenerate with: UPDATE_CHART_GOLDENS=1 pytest tests/unit/test_chart_raster.py
+UPDATE_GOLDENS = os.environ.get("UPDATE_CHART_GOLDENS") == "1"
+# Font rasterization differs slightly across Pillow/FreeType builds.
+MAX_DIFF_RATIO = 0.02
+
+THEME = RasterTheme(
+    background="#0d1117",
+    grid="#21262d",
+    text="#c9d1d9",
+    candle_up="#00ff88",
+    candle_down="#ff4757",
+    volume_up="#00ff8866",
+    volume_down="#ff475766",
+)
+
+
+def _frame(bars: int = 80) -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    close = 1.1 + np.cumsum(rng.normal(0, 0.001, bars))
+    open_ = np.r_[close[0], close[:-1]]
+    return pd.DataFrame(
+        {
+            "open": open_,
+            "high": np.maximum(open_, close) + 0.0004,
+            "low": np.minimum(open_, close) - 0.0004,
+            "close": close,
+            "volume": rng.integers(100, 1000, bars).astype(float),
+        },
+        index=pd.date_range("2026-01-05", periods=bars, freq="15min"),
+    )
+
+
+def _smc(df: pd.DataFrame) -> SMCAnalysis:
+    stamp = datetime(2026, 1, 5)
+    close = df["close"].to_numpy()
+
+    def zone(kind: ZoneType, low: float, high: float) -> PriceZone:
+        return PriceZone(kind, Decimal(str(round(high, 5))), Decimal(str(round(low, 5))), 60.0, stamp)
+
+    return SMCAnalysis(
+        order_blocks=[zone(ZoneType.ORDER_BLOCK_BULLISH, close[40], close[40] + 0.001)],
+        fair_value_gaps=[zone(ZoneType.FVG_BEARISH, close[50] + 0.001, close[50] + 0.002)],
+        liquidity_pools=[zone(ZoneType.LIQUIDITY_HIGH, df["high"].max(), df["high"].max())],
+        demand_zones=[zone(ZoneType.DEMAND, df["low"].min(), df["low"].min() + 0.001)],
+        structure_points=[StructurePoint(MarketStructure.HH, Decimal(str(round(df["high"].max(), 5))), stamp)],
+    )
+
+
+def _pixels(png: bytes) -> np.ndarray:
+    return np.asarray(Image.open(io.BytesIO(png)).convert("RGB"), dtype=np.int16)
+
+
+def _assert_matches_golden(png: bytes, name: str) -> None:
+    path = GOLDEN_DIR / name
+    if UPDATE_GOLDENS or not path.exists():
+        if not UPDATE_GOLDENS:
+            pytest.fail(f"missing golden image {path}; run with UPDATE_CHART_GOLDENS=1")
+        path.write_bytes(png)
+        return
+    actual, expected = _pixels(png), _pixels(path.read_bytes())
+    assert actual.shape == expected.shape
+    differing = (np.abs(actual - expected).max(axis=2) > 24).mean()
+    assert differing <= MAX_DIFF_RATIO, f"{name}: {differing:.2%} of pixels differ"
+
+
+def test_raster_chart_matches_golden() -> None:
+    df = _frame()
+    close = df["close"]
+    spec = RasterChartSpec(
+        title="EURUSD - 15m",
+        timestamps=list(df.index.to_pydatetime()),
+        open=df["open"].to_numpy(),
+        high=df["high"].to_numpy(),
+        low=df["low"].to_numpy(),
+        close=close.to_numpy(),
+        volume=df["volume"].to_numpy(),
+        panels=["main", "volume"],
+        panel_labels={"volume": "Volume"},
+        series=[RasterSeries(close.ewm(span=20).mean().to_numpy(), "#ffd93d", label="EMA 20")],
+        levels=[RasterLevel(float(close.iloc[-1]), "#e74c3c", dash=2)],
+        zones=[RasterZone(float(close.min()), float(close.min()) + 0.001, "#00ff8844", "#00ff88", dash=4, start=60)],
+    )
+
+    png = RasterChartRenderer(THEME).render_png(spec, 400, 300)
+
+    _assert_matches_golden(png, "raster_candles.png")
+
+
+def test_generator_complete_preset_matches_golden(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "CHART_RENDERER", "raster")
+    df = _frame()
+    config = ChartConfig("EURUSD", width=600, height=400, indicators=INDICATOR_PRESETS["complete"])
+
+    image = ChartGeneratorService().render_chart(config, df, SimpleNamespace(smc=_smc(df)))
+
+    _assert_matches_golden(base64.b64decode(image), "generator_complete.png")
+
+
+def test_raster_chart_size_and_background() -> None:
+    df = _frame(30)
+    spec = RasterChartSpec(
+        title="",
+        timestamps=[datetime(2026, 1, 5) + timedelta(hours=i) for i in range(30)],
+        open=df["open"].to_numpy(),
+        high=df["high"].to_numpy(),
+        low=df["low"].to_numpy(),
+        close=df["close"].to_numpy(),
+    )
+
+    pixels = _pixels(RasterChartRenderer(THEME).render_png(spec, 320, 200))
+
+    assert pixels.shape == (200, 320, 3)
+    assert tuple(pixels[0, 0]) == (0x0D, 0x11, 0x17)
+    assert tuple(pixels[-1, -1]) == (0x0D, 0x11, 0x17)
+
+
+def test_matplotlib_renderer_still_selectable(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "CHART_RENDERER", "matplotlib")
+    df = _frame(40)
+    config = ChartConfig("EURUSD", width=400, height=300, indicators=INDICATOR_PRESETS["trend"])
+
+    image = ChartGeneratorService().render_chart(config, df, SimpleNamespace(smc=SMCAnalysis()))
+
+    assert Image.open(io.BytesIO(base64.b64decode(image))).size == (400, 300)
@@ -0,0 +1,85 @@
+from datetime import UTC, datetime, timedelta, tzinfo
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.services.compute_executor import (
+    ComputeExecutor,
+    SharedFrameHandle,
+    SharedOHLCVFrame,
+    load_shared_frame,
+)
+
+
+def _frame(tz: tzinfo | None = None) -> pd.DataFrame:
+    start = datetime(2024, 1, 1, tzinfo=tz)
+    index = pd.DatetimeIndex([start + timedelta(minutes=15 * i) for i in range(64)], name="timestamp")
+    values = np.linspace(1.0, 2.0, 64)
+    return pd.DataFrame(
+        {"open": values, "high": values + 0.1, "low": values - 0.1, "close": values, "volume": values * 10},
+        index=index,
+    )
+
+
+@pytest.mark.parametrize("tz", [None, UTC])
+def test_shared_frame_roundtrip_preserves_index_and_values(tz) -> None:
+    df = _frame(tz)
+    with SharedOHLCVFrame(df) as shared:
+        restored = load_shared_frame(shared.handle)
+
+    pd.testing.assert_frame_equal(restored, df, check_index_type=False, check_freq=False)
+    assert list(restored.index) == list(df.index)
+
+
+def _frame_summary(handle: SharedFrameHandle) -> tuple[int, float, str, int]:
+    """Pool job: load the shared frame in the worker process."""
+    import os
+
+    df = load_shared_frame(handle)
+    return len(df), float(df["close"].sum()), str(df.index[-1]), os.getpid()
+
+
+@pytest.mark.asyncio
+async def test_process_mode_reads_frames_from_shared_memory() -> None:
+    import os
+
+    executor = ComputeExecutor(mode="process", max_workers=1)
+    df = _frame(UTC)
+    try:
+        with SharedOHLCVFrame(df) as shared:
+            rows, close_sum, last, pid = await executor.run("summary", _frame_summary, shared.handle)
+    finally:
+        executor.shutdown()
+
+    assert executor.uses_processes
+    assert pid != os.getpid()
+    assert (rows, last) == (64, str(df.index[-1]))
+    assert close_sum == pytest.approx(float(df["close"].sum()))
+    assert executor.get_stats()["inline_fallbacks"] == 0
+
+
+@pytest.mark.asyncio
+async def test_thread_mode_tracks_jobs() -> None:
+    executor = ComputeExecutor(mode="thread", max_workers=2)
+    try:
+        result = await executor.run("sum", sum, [1, 2, 3])
+        with pytest.raises(ZeroDivisionError):
+            await executor.run("div", lambda: 1 / 0)
+    finally:
+        executor.shutdown()
+
+    stats = executor.get_stats()
+    assert result == 6
+    assert stats["submitted"] == 2
+    assert stats["completed"] == 1
+    assert stats["failed"] == 1
+    assert stats["in_flight"] == 0
+    assert stats["by_kind"] == {"sum": 1, "div": 1}
+
+
+@pytest.mark.asyncio
+async def test_inline_mode_bypasses_pool() -> None:
+    executor = ComputeExecutor(mode="inline")
+    assert await executor.run("sum", sum, [1, 2]) == 3
+    assert executor.get_stats()["submitted"] == 0
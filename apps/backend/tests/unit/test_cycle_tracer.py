@@ -0,0 +1,143 @@
+import asyncio
+import io
+import json
+
+import pytest
+
+import src.core.cycle_tracer as cycle_tracer
+from src.core.bot_logger import BotLogger, BufferedLogWriter
+from src.core.cycle_tracer import CycleTracer, current_cycle_id, trace_span, traced, traced_call
+from src.engines.trading.broker_telemetry import BrokerTelemetry, InstrumentedBroker
+
+
+class _Browser:
+    @traced("screenshot")
+    async def take_screenshot(self) -> str:
+        await asyncio.sleep(0)
+        return "png"
+
+
+class _FakeBroker:
+    name = "fake"
+
+    async def get_positions(self):
+        return []
+
+
+async def _model_call(model: str) -> str:
+    with trace_span("llm", model, model=model):
+        await asyncio.sleep(0)
+    return model
+
+
+async def test_spans_nest_across_tasks_and_inherit_symbol():
+    tracer = CycleTracer(max_cycles=5, export_path="")
+
+    with tracer.cycle("analysis", broker="demo") as trace:
+        assert current_cycle_id() == trace.cycle_id
+        with trace_span("gating", "can_open_trade", symbol="EUR_USD"):
+            pass
+        with trace_span("analysis", "tradingview_agent", symbol="EUR_USD"):
+            await _Browser().take_screenshot()
+            await asyncio.gather(_model_call("gpt"), _model_call("gemini"))
+            with trace_span("consensus"):
+                pass
+
+    assert current_cycle_id() is None
+    waterfall = tracer.get(trace.cycle_id).waterfall()
+    rows = {row["name"]: row for row in waterfall["waterfall"]}
+    assert set(rows) == {"can_open_trade", "tradingview_agent", "take_screenshot", "gpt", "gemini", "consensus"}
+    analysis = rows["tradingview_agent"]
+    assert analysis["depth"] == 0
+    assert rows["gpt"]["parent_id"] == analysis["span_id"]
+    assert rows["gpt"]["depth"] == 1 and rows["gpt"]["attributes"] == {"model": "gpt"}
+    assert all(row["symbol"] == "EUR_USD" for row in rows.values())
+    assert rows["take_screenshot"]["stage"] == "screenshot"
+    assert rows["consensus"]["offset_ms"] >= analysis["offset_ms"]
+    assert set(waterfall["stages"]) == {"gating", "analysis", "screenshot", "llm", "consensus"}
+    assert waterfall["symbols"] == ["EUR_USD"]
+    assert waterfall["attributes"] == {"broker": "demo"}
+    assert waterfall["duration_ms"] >= analysis["duration_ms"]
+
+
+async def test_failed_span_is_marked_and_exception_propagates():
+    tracer = CycleTracer(max_cycles=5, export_path="")
+
+    with tracer.cycle("analysis") as trace:
+        with pytest.raises(RuntimeError):
+            await traced_call("order", "place_order", _fail(), symbol="XAU_USD")
+
+    span = trace.spans[0]
+    assert span.status == "error" and span.error == "rejected"
+    assert span.duration_ms is not None
+    assert tracer.recent()[0]["errors"] == 1
+
+
+async def _fail():
+    raise RuntimeError("rejected")
+
+
+async def test_tracing_is_a_no_op_outside_cycles_and_buffer_is_bounded():
+    tracer = CycleTracer(max_cycles=2, export_path="")
+
+    with trace_span("llm", "ignored"):
+        pass
+    assert await _Browser().take_screenshot() == "png"
+
+    ids = []
+    for _ in range(3):
+        with tracer.cycle("positions") as trace:
+            ids.append(trace.cycle_id)
+
+    assert [cycle["cycle_id"] for cycle in tracer.recent()] == ids[:0:-1]
+    assert tracer.get(ids[0]) is None
+
+
+async def test_cycles_are_exported_as_otlp_json_lines(tmp_path):
+    path = tmp_path / "traces" / "cycles.jsonl"
+    tracer = CycleTracer(max_cycles=5, export_path=str(path))
+
+    for _ in range(2):
+        with tracer.cycle("analysis", trigger="bar_close") as trace:
+            with trace_span("llm", "gpt", symbol="EUR_USD"):
+                pass
+
+    tracer.flush()
+    lines = path.read_text().splitlines()
+    assert len(lines) == 2
+    spans = json.loads(lines[-1])["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    root, llm = spans
+    assert root["traceId"] == llm["traceId"] == trace.cycle_id
+    assert llm["parentSpanId"] == root["spanId"]
+    assert llm["name"] == "llm:gpt"
+    assert {"key": "symbol", "value": {"stringValue": "EUR_USD"}} in llm["attributes"]
+    assert int(llm["endTimeUnixNano"]) >= int(llm["startTimeUnixNano"])
+
+
+async def test_export_failures_are_logged(tmp_path, monkeypatch):
+    blocker = tmp_path / "not-a-directory"
+    blocker.write_text("")
+    stream = io.StringIO()
+    monkeypatch.setattr(
+        cycle_tracer, "logger", BotLogger("CycleTracer", writer=BufferedLogWriter(stream=stream, background=False)),
+    )
+    tracer = CycleTracer(max_cycles=5, export_path=str(blocker / "cycles.jsonl"))
+
+    with tracer.cycle("analysis"):
+        pass
+    tracer.flush()
+    cycle_tracer.logger.writer.flush()
+
+    assert "Export to" in stream.getvalue()
+    assert len(tracer.recent()) == 1
+
+
+async def test_instrumented_broker_calls_become_spans():
+    tracer = CycleTracer(max_cycles=5, export_path="")
+    broker = InstrumentedBroker(_FakeBroker(), label="demo", telemetry=BrokerTelemetry())
+
+    assert await broker.get_positions() == []
+    with tracer.cycle("positions") as trace:
+        assert await broker.get_positions() == []
+
+    assert [(span.stage, span.name) for span in trace.spans] == [("broker", "get_positions")]
@@ -0,0 +1,107 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+import src.services.deal_sync_service as deal_sync_module
+from src.core.database import Base
+from src.core.models import BrokerAccount, User
+from src.services.deal_sync_service import BrokerGone, DealSyncService, DealSyncWorker, fetch_start
+from src.services.trade_history_service import TradeHistoryService, deal_to_trade
+
+
+class _FakeBroker:
+    def __init__(self, deals: list[dict]):
+        self.deals = deals
+        self.requests: list[str] = []
+
+    async def get_deals_history(self, start_time: str) -> list[dict]:
+        self.requests.append(start_time)
+        start = datetime.fromisoformat(start_time)
+        return [d for d in self.deals if datetime.fromisoformat(d["time"]) >= start]
+
+
+def _deal(deal_id: str, closed: datetime, profit: float = 5.0) -> dict:
+    return {"id": deal_id, "type": "DEAL_TYPE_SELL", "symbol": "EURUSD", "price": 1.1,
+            "volume": 0.1, "profit": profit, "time": closed.isoformat()}
+
+
+@pytest.fixture
+async def sessions(monkeypatch):
+    monkeypatch.setattr(deal_sync_module.settings, "TRADE_DEAL_HISTORY_DAYS", 30, raising=False)
+    history = TradeHistoryService()
+    monkeypatch.setattr(deal_sync_module, "get_trade_history_service", lambda: history)
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as db:
+        db.add(User(id=1, email="a@example.com", username="a", hashed_password="x"))
+        db.add(BrokerAccount(id=3, user_id=1, name="Demo", broker_type="metatrader"))
+        await db.commit()
+    yield factory
+    await engine.dispose()
+
+
+def test_fetch_start_is_hour_aligned_and_bounded(monkeypatch):
+    monkeypatch.setattr(deal_sync_module.settings, "TRADE_DEAL_HISTORY_DAYS", 30, raising=False)
+    now = datetime(2026, 3, 20, 15, 42, tzinfo=UTC)
+
+    assert fetch_start(None, now) == datetime(2026, 2, 18, 15, 0, tzinfo=UTC)
+    assert fetch_start(datetime(2026, 3, 20, 14, 10, tzinfo=UTC), now) == datetime(2026, 3, 20, 13, 0, tzinfo=UTC)
+    assert fetch_start(datetime(2020, 1, 1, tzinfo=UTC), now) == fetch_start(None, now)
+
+
+def test_deal_to_trade_skips_balance_operations():
+    closed = datetime(2026, 3, 2, 10, 0, tzinfo=UTC)
+    trade = deal_to_trade(_deal("9", closed), 3, "Demo")
+    assert trade["direction"] == "SHORT" and trade["profit_loss"] == 5.0
+    assert trade["exit_timestamp"] == closed.isoformat()
+    assert deal_to_trade({"id": "10", "type": "DEAL_TYPE_BALANCE", "profit": 0}, 3, "Demo") is None
+
+
+async def test_worker_fetches_only_new_deals_after_the_first_sync(sessions):
+    now = datetime.now(UTC)
+    broker = _FakeBroker([_deal("1", now - timedelta(days=3)), _deal("2", now - timedelta(days=2))])
+
+    async def connect(account):
+        return broker
+
+    worker = DealSyncWorker(1, 3, session_factory=sessions, connect=connect)
+    assert await worker.sync_once() == 2
+    assert datetime.now(UTC) - datetime.fromisoformat(broker.requests[0]) >= timedelta(days=29)
+    assert worker.high_water == datetime.fromisoformat(broker.deals[1]["time"])
+
+    broker.deals.append(_deal("3", now - timedelta(minutes=5), profit=-2.0))
+    assert await worker.sync_once() == 1
+    assert datetime.fromisoformat(broker.requests[1]) > now - timedelta(days=2, hours=2)
+
+    async with sessions() as db:
+        rows = await TradeHistoryService().query_trades(db, 1, broker_ids=[3], closed_only=True)
+    assert sorted(row.external_id for row in rows) == ["1", "2", "3"]
+    assert worker.get_stats()["syncs"] == 2
+
+
+async def test_worker_resumes_from_stored_deals_and_stops_for_deleted_brokers(sessions):
+    closed = datetime.now(UTC) - timedelta(hours=5)
+    async with sessions() as db:
+        await TradeHistoryService().upsert_trades(db, 1, [deal_to_trade(_deal("1", closed), 3, "Demo")], source="deal")
+        await db.commit()
+    broker = _FakeBroker([])
+
+    async def connect(account):
+        return broker
+
+    service = DealSyncService(session_factory=sessions, connect=connect)
+    worker = service.ensure(1, 3)
+    await worker.stop()
+    await worker.sync_once()
+    assert broker.requests == [fetch_start(closed).isoformat()]
+
+    async with sessions() as db:
+        await db.delete(await db.get(BrokerAccount, 3))
+        await db.commit()
+    with pytest.raises(BrokerGone):
+        await worker.sync_once()
+    await service.stop_all()
+    assert service.get_stats()["workers"] == 0
@@ -0,0 +1,103 @@
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from src.engines.trading.auto_trader import AutoTrader
+from src.engines.trading.base_broker import AccountInfo, OrderSide, Tick
+
+
+class _FakeBroker:
+    def __init__(self) -> None:
+        self.calls: dict[str, int] = {}
+
+    def _count(self, name: str) -> None:
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    async def get_symbol_specification(self, symbol: str):
+        self._count("spec")
+        return {"contractSize": 100000, "digits": 5, "stopsLevel": 10, "point": 0.00001}
+
+    async def get_current_price(self, symbol: str) -> Tick:
+        self._count("tick")
+        return Tick(symbol=symbol, bid=Decimal("1.1000"), ask=Decimal("1.1002"), timestamp=datetime.utcnow())
+
+    async def get_account_info(self) -> AccountInfo:
+        self._count("account")
+        return AccountInfo(
+            account_id="acc",
+            balance=Decimal("10000"),
+            equity=Decimal("10000"),
+            margin_used=Decimal("0"),
+            margin_available=Decimal("10000"),
+            unrealized_pnl=Decimal("0"),
+            realized_pnl_today=Decimal("0"),
+            leverage=100,
+        )
+
+    async def can_trade_symbol(self, symbol: str, side: OrderSide):
+        self._count("tradable")
+        return (side == OrderSide.BUY, "" if side == OrderSide.BUY else "close only", symbol)
+
+
+@pytest.mark.asyncio
+async def test_warm_execution_context_collects_pre_trade_data() -> None:
+    trader = AutoTrader()
+    broker = _FakeBroker()
+    trader.broker = broker
+
+    ctx = await trader._warm_execution_context("EUR_USD")
+
+    assert ctx.errors == []
+    assert float(ctx.tick.mid) == pytest.approx(1.1001)
+    assert ctx.broker_spec["contractSize"] == 100000
+    assert ctx.tradable["LONG"][0] is True
+    assert ctx.tradable["SHORT"][0] is False
+    assert ctx.dynamic_rr is not None
+
+    # Specs are cached across cycles; quotes and account are not.
+    await trader._warm_execution_context("EUR_USD")
+    assert broker.calls["spec"] == 1
+    assert broker.calls["tick"] == 2
+    assert broker.calls["account"] == 2
+
+
+@pytest.mark.asyncio
+async def test_warm_order_is_aborted_without_a_fresh_quote() -> None:
+    trader = AutoTrader()
+    broker = _FakeBroker()
+    trader.broker = broker
+    ctx = await trader._warm_execution_context("EUR_USD")
+    placed = []
+
+    async def no_quote(symbol: str):
+        raise ConnectionError("quote feed down")
+
+    async def can_open(symbol: str):
+        return True, ""
+
+    async def place_order(order):
+        placed.append(order)
+
+    trader._get_tick_with_external_fallback = no_quote
+    trader._can_open_trade_for_symbol = can_open
+    broker.place_order = place_order
+    consensus = {"direction": "LONG", "stop_loss": 1.0950, "take_profit": 1.1100}
+
+    await trader._execute_tradingview_trade("EUR_USD", consensus, [], execution_context=ctx)
+
+    assert placed == []
+    assert broker.calls["account"] == 2  # equity refreshed alongside the quote
+    assert "prezzo aggiornato non disponibile" in trader.state.analysis_logs.latest(1)[0].message
+
+
+def test_execution_latency_history_is_bounded() -> None:
+    trader = AutoTrader()
+    for i in range(250):
+        signal_ms, roundtrip_ms = trader._record_execution_latency(
+            "EUR_USD", 0.0, 0.010, 0.015, "filled", True
+        )
+    assert signal_ms == pytest.approx(10.0)
+    assert roundtrip_ms == pytest.approx(5.0)
+    assert len(trader.state.execution_latencies) == 200
+    assert trader.state.execution_latencies[-1]["warm_context"] is True
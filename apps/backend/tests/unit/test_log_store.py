@@ -0,0 +1,62 @@
+import pickle
+
+from src.core.log_store import AnalysisLogStore
+from src.engines.trading.auto_trader import AutoTrader
+
+
+def _fill(store: AnalysisLogStore, count: int) -> None:
+    for i in range(count):
+        symbol = "EUR_USD" if i % 2 == 0 else "XAU_USD"
+        log_type = "skip" if i % 3 == 0 else "analysis"
+        store.append(symbol, log_type, f"entry {i}", ts=1_767_600_000 + i)
+
+
+def test_ring_buffer_evicts_oldest_and_keeps_indexes_in_sync():
+    store = AnalysisLogStore(capacity=5)
+    _fill(store, 12)
+
+    assert len(store) == 5 and store.total == 12
+    assert [r.message for r in store.latest(10)] == [f"entry {i}" for i in range(7, 12)]
+    assert store.get(7) is None and store.get(8).message == "entry 7"
+    assert store.counts() == {
+        "symbols": {"XAU_USD": 3, "EUR_USD": 2},
+        "types": {"analysis": 4, "skip": 1},
+    }
+
+
+def test_cursor_pages_back_through_filtered_records():
+    store = AnalysisLogStore(capacity=100)
+    _fill(store, 30)
+
+    first = store.query(symbol="EUR_USD", limit=4)
+    second = store.query(symbol="EUR_USD", limit=4, before=first.next_cursor)
+
+    assert [r.message for r in first.records] == ["entry 22", "entry 24", "entry 26", "entry 28"]
+    assert [r.message for r in second.records] == ["entry 14", "entry 16", "entry 18", "entry 20"]
+    both = store.query(symbol="EUR_USD", log_type="skip", limit=100)
+    assert [r.message for r in both.records] == ["entry 0", "entry 6", "entry 12", "entry 18", "entry 24"]
+    assert both.next_cursor is None
+
+
+def test_after_cursor_polls_only_new_records():
+    store = AnalysisLogStore(capacity=100)
+    _fill(store, 3)
+    page = store.query(limit=10)
+
+    assert store.query(after=page.last_id).records == []
+    store.append("GBP_USD", "trade", "filled")
+    newer = store.query(after=page.last_id)
+    assert [r.to_dict()["message"] for r in newer.records] == ["filled"]
+    assert newer.last_id == 4
+
+
+def test_auto_trader_logs_survive_state_mirroring():
+    trader = AutoTrader()
+    trader._log_analysis("EUR_USD", "trade", "opened", {"lots": 0.1})
+
+    mirrored = pickle.loads(pickle.dumps(trader.state))
+
+    entry = trader.get_status()["analysis_logs"][-1]
+    assert entry["message"] == "opened" and entry["details"] == {"lots": 0.1}
+    assert mirrored.analysis_logs.query(log_type="trade").records[0].message == "opened"
+
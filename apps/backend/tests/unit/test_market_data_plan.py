@@ -0,0 +1,89 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from src.services.market_data_service import (
+    OHLCV,
+    MarketData,
+    MarketDataService,
+    resample_candles,
+)
+
+
+def _candles(start: datetime, count: int, minutes: int) -> list[OHLCV]:
+    return [
+        OHLCV(
+            timestamp=start + timedelta(minutes=minutes * i),
+            open=Decimal(100 + i),
+            high=Decimal(101 + i),
+            low=Decimal(99 + i),
+            close=Decimal(100 + i) + Decimal("0.5"),
+            volume=1.0,
+        )
+        for i in range(count)
+    ]
+
+
+class _PlanService(MarketDataService):
+    def __init__(self, available: int = 5000) -> None:
+        super().__init__()
+        self.available = available
+        self.calls: list[tuple[str, int]] = []
+
+    async def get_market_data(self, symbol: str, timeframe: str = "15m", bars: int = 100) -> MarketData:
+        self.calls.append((timeframe, bars))
+        minutes = {"15m": 15, "1h": 60, "4h": 240, "1d": 1440}[timeframe]
+        count = min(bars, self.available)
+        start = datetime(2026, 1, 1) + timedelta(minutes=minutes * (5000 - count))
+        candles = _candles(start, count, minutes)
+        return MarketData(symbol=symbol, timeframe=timeframe, candles=candles, current_price=candles[-1].close)
+
+
+def test_resample_aligns_buckets_and_drops_partial_first_bucket():
+    # Starts at 00:15, so the 00:00 hour is incomplete and is dropped.
+    candles = _candles(datetime(2026, 1, 1, 0, 15), 11, 15)
+
+    hours = resample_candles(candles, 3600)
+
+    assert [c.timestamp for c in hours] == [datetime(2026, 1, 1, 1), datetime(2026, 1, 1, 2)]
+    first = hours[0]
+    assert first.open == candles[3].open
+    assert first.close == candles[6].close
+    assert first.high == max(c.high for c in candles[3:7])
+    assert first.low == min(c.low for c in candles[3:7])
+    assert first.volume == 4.0
+    # The trailing bar in progress is kept.
+    assert hours[-1].close == candles[-1].close
+
+
+async def test_plan_fetches_finest_timeframe_once_and_resamples():
+    service = _PlanService()
+
+    data = await service.get_timeframe_plan("EUR_USD", ["15m", "1H", "4H", "1D"], bars=100)
+
+    assert set(data) == {"15m", "1H", "4H", "1D"}
+    assert sorted(service.calls) == [("15m", 1616), ("1d", 100)]
+    assert all(len(md.candles) == 100 for md in data.values())
+    assert data["4H"].timeframe == "4h"
+    assert data["4H"].candles[-1].close == data["15m"].candles[-1].close
+    assert data["1H"].candles[1].timestamp - data["1H"].candles[0].timestamp == timedelta(hours=1)
+
+
+async def test_plan_fetches_directly_when_history_is_too_short():
+    service = _PlanService(available=500)
+
+    data = await service.get_timeframe_plan("EUR_USD", ["15m", "1h", "4h"], bars=100)
+
+    assert set(data) == {"15m", "1h", "4h"}
+    # 500 x 15m covers 125 hourly bars but not 100 four-hour bars.
+    assert sorted(service.calls) == [("15m", 1616), ("4h", 100)]
+
+
+async def test_plan_keeps_source_daily_bars():
+    service = _PlanService()
+
+    data = await service.get_timeframe_plan("EUR_USD", ["1h", "4h", "1d"], bars=30)
+
+    # 4h is rebuilt from the hourly base; daily bars keep the source's session boundaries.
+    assert sorted(service.calls) == [("1d", 30), ("1h", 124)]
+    assert data["1d"].timeframe == "1d"
+    assert len(data["4h"].candles) == 30
@@ -0,0 +1,85 @@
+from datetime import UTC, datetime
+from decimal import Decimal
+
+import httpx
+import pytest
+
+from src.engines.trading.metatrader_bridge_broker import MetaTraderBridgeBroker
+
+# test_symbol_autodiscovery replaces httpx.AsyncClient at import; keep the real one.
+_AsyncClient = httpx.AsyncClient
+
+START = datetime(2026, 1, 5, tzinfo=UTC)
+
+
+def _broker(handler) -> MetaTraderBridgeBroker:
+    broker = MetaTraderBridgeBroker(
+        account_number="1001",
+        password="secret",
+        bridge_base_url="http://bridge.test",
+    )
+    broker._client = _AsyncClient(transport=httpx.MockTransport(handler))
+    broker._session_id = "s1"
+    broker._connected = True
+    return broker
+
+
+def _page(first: int, bars: int, next_cursor: str | None) -> dict:
+    times = [first + i * 3600 for i in range(bars)]
+    return {
+        "fields": ["t", "o", "h", "l", "c", "v"],
+        "count": bars,
+        "next_cursor": next_cursor,
+        "columns": {
+            "t": times,
+            "o": [1.1] * bars,
+            "h": [1.2] * bars,
+            "l": [1.0] * bars,
+            "c": [1.15] * bars,
+            "v": [100] * bars,
+        },
+    }
+
+
+@pytest.mark.asyncio
+async def test_range_candles_follow_history_cursor() -> None:
+    start = int(START.timestamp())
+    seen: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/api/v1/sessions/s1/history/EURUSD"
+        params = dict(request.url.params)
+        seen.append(params)
+        if "cursor" not in params:
+            return httpx.Response(200, json=_page(start, 3, str(start + 3 * 3600)))
+        return httpx.Response(200, json=_page(int(params["cursor"]), 2, None))
+
+    broker = _broker(handler)
+    broker.HISTORY_PAGE_BARS = 3
+    candles = await broker.get_candles("EUR_USD", "H1", count=10, from_time=START)
+    await broker._client.aclose()
+
+    assert len(candles) == 5
+    assert candles[0].timestamp == START
+    assert candles[-1].close == Decimal("1.15")
+    assert seen[0]["from"] == str(start) and seen[0]["limit"] == "3"
+    assert seen[1]["cursor"] == str(start + 3 * 3600) and "from" not in seen[1]
+
+
+@pytest.mark.asyncio
+async def test_range_candles_fall_back_without_history_endpoint() -> None:
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        if "/history/" in request.url.path:
+            return httpx.Response(404, json={"detail": "Not Found"})
+        return httpx.Response(200, json=[{"timestamp": START.isoformat(), "open": 1, "high": 2, "low": 0.5, "close": 1.5}])
+
+    broker = _broker(handler)
+    first = await broker.get_candles("EUR_USD", "H1", count=5, from_time=START)
+    second = await broker.get_candles("EUR_USD", "H1", count=5, from_time=START)
+    await broker._client.aclose()
+
+    assert len(first) == len(second) == 1
+    assert [path.split("/")[5] for path in calls] == ["history", "candles", "candles"]
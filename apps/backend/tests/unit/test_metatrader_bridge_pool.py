@@ -0,0 +1,96 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src.engines.trading.metatrader_bridge_broker import MetaTraderBridgeBroker
+from src.engines.trading.metatrader_bridge_pool import (
+    acquire_bridge_client,
+    load_capabilities,
+    release_bridge_client,
+)
+
+BASE_URL = "http://bridge.pool.test"
+
+# test_symbol_autodiscovery replaces httpx.AsyncClient at import; keep the real one.
+_AsyncClient = httpx.AsyncClient
+
+
+class _FakeBridge:
+    """Bridge advertising state deltas but no batch price endpoint."""
+
+    def __init__(self) -> None:
+        self.paths: list[str] = []
+        self.sessions = 0
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        self.paths.append(path)
+        if path == "/api/v1/capabilities":
+            return httpx.Response(200, json={"version": "0.1.0", "features": ["state_delta", "history"]})
+        if path == "/api/v1/sessions/connect":
+            self.sessions += 1
+            return httpx.Response(200, json={"session_id": f"s{self.sessions}"})
+        if path.endswith("/state"):
+            return httpx.Response(
+                200,
+                json={"version": 1, "full": True, "account": {"balance": 500}, "positions": [], "orders": []},
+            )
+        if "/prices/" in path:
+            return httpx.Response(200, json={"bid": 1.1, "ask": 1.2})
+        return httpx.Response(200, json={})
+
+
+def _broker(login: str) -> MetaTraderBridgeBroker:
+    return MetaTraderBridgeBroker(account_number=login, password="x", bridge_base_url=BASE_URL)
+
+
+@pytest.mark.asyncio
+async def test_accounts_on_one_bridge_share_client_and_capabilities() -> None:
+    bridge = _FakeBridge()
+    host = acquire_bridge_client(BASE_URL)
+    host.client = _AsyncClient(transport=httpx.MockTransport(bridge.handler))
+    first, second = _broker("1001"), _broker("1002")
+    try:
+        await first.connect()
+        await second.connect()
+        assert first._client is second._client is host.client
+        assert bridge.paths.count("/api/v1/capabilities") == 1
+
+        # Account and positions read together cost a single state request.
+        account, positions = await asyncio.gather(first.get_account_info(), first.get_positions())
+        assert account.balance == 500
+        assert positions == []
+        assert bridge.paths.count("/api/v1/sessions/s1/state") == 1
+
+        # Batch prices not advertised: no probe of the bulk endpoint.
+        assert set(await second.get_prices(["EUR/USD"])) == {"EUR/USD"}
+        assert "/api/v1/sessions/s2/prices" not in bridge.paths
+    finally:
+        await first.disconnect()
+        await second.disconnect()
+        await release_bridge_client(host)
+    assert host.client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_bridges_behind_one_host_are_keyed_by_base_url() -> None:
+    paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        return httpx.Response(200, json={"features": ["history"]})
+
+    first = acquire_bridge_client("http://Proxy.test/bridge-a/")
+    first.client = _AsyncClient(transport=httpx.MockTransport(handler))
+    same = acquire_bridge_client("http://proxy.test/bridge-a")
+    other = acquire_bridge_client("http://proxy.test/bridge-b")
+    other.client = _AsyncClient(transport=httpx.MockTransport(handler))
+    try:
+        assert first is same
+        assert other is not first
+        assert await load_capabilities(first, {}, 5.0) == frozenset({"history"})
+        assert paths == ["/bridge-a/api/v1/capabilities"]
+    finally:
+        for host in (first, same, other):
+            await release_bridge_client(host)
@@ -0,0 +1,69 @@
+import httpx
+import pytest
+
+from src.engines.trading.metatrader_bridge_broker import MetaTraderBridgeBroker
+
+# test_symbol_autodiscovery replaces httpx.AsyncClient at import; keep the real one.
+_AsyncClient = httpx.AsyncClient
+
+
+def _quote(symbol: str, bid: float) -> dict:
+    return {"symbol": symbol, "bid": bid, "ask": bid + 0.0002, "timestamp": "2026-01-05T10:00:00Z"}
+
+
+def _broker(handler) -> MetaTraderBridgeBroker:
+    broker = MetaTraderBridgeBroker(account_number="1001", password="x", bridge_base_url="http://bridge.test")
+    broker._client = _AsyncClient(transport=httpx.MockTransport(handler))
+    broker._session_id = "s1"
+    broker._connected = True
+    return broker
+
+
+@pytest.mark.asyncio
+async def test_bulk_prices_use_one_call_and_skip_per_symbol_errors() -> None:
+    paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        assert request.url.params["symbols"] == "EURUSD,GBPUSD,XXXYYY"
+        return httpx.Response(
+            200,
+            json={
+                "prices": {"EURUSD": _quote("EURUSD", 1.1), "GBPUSD": _quote("GBPUSD", 1.3)},
+                "errors": {"XXXYYY": "symbol not found"},
+            },
+        )
+
+    broker = _broker(handler)
+    prices = await broker.get_prices(["EUR/USD", "GBP_USD", "XXX/YYY"])
+    await broker._client.aclose()
+
+    assert paths == ["/api/v1/sessions/s1/prices"]
+    assert set(prices) == {"EUR/USD", "GBP_USD"}
+    assert float(prices["EUR/USD"].bid) == pytest.approx(1.1)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status", [404, 503])
+async def test_bulk_prices_failure_falls_back_to_per_symbol_quotes(status: int) -> None:
+    paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        if request.url.path == "/api/v1/sessions/s1/prices":
+            return httpx.Response(status, text="unavailable")
+        symbol = request.url.path.rsplit("/", 1)[-1]
+        if symbol == "XXXYYY":
+            return httpx.Response(400, json={"detail": "symbol not found"})
+        return httpx.Response(200, json=_quote(symbol, 1.2))
+
+    broker = _broker(handler)
+    prices = await broker.get_prices(["EUR/USD", "XXX/YYY"])
+    await broker._client.aclose()
+
+    assert set(prices) == {"EUR/USD"}
+    assert paths == [
+        "/api/v1/sessions/s1/prices",
+        "/api/v1/sessions/s1/prices/EURUSD",
+        "/api/v1/sessions/s1/prices/XXXYYY",
+    ]
@@ -0,0 +1,61 @@
+import httpx
+import pytest
+
+from src.engines.trading.auto_trader import AutoTrader
+from src.engines.trading.metatrader_bridge_broker import MetaTraderBridgeBroker
+
+# test_symbol_autodiscovery replaces httpx.AsyncClient at import; keep the real one.
+_AsyncClient = httpx.AsyncClient
+
+
+def _spec(symbol: str) -> dict:
+    return {"symbol": symbol, "digits": 5, "tickSize": 0.00001, "tickValue": 1.0, "contractSize": 100000}
+
+
+@pytest.mark.asyncio
+async def test_bulk_specs_are_fetched_once_and_warm_the_trader_cache() -> None:
+    requests: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/api/v1/sessions/s1/symbols/specs"
+        symbols = request.url.params["symbols"].split(",")
+        requests.append(request.url.params["symbols"])
+        specs = {s: _spec(s) for s in symbols if s != "XXXYYY"}
+        return httpx.Response(200, json={"specs": specs, "errors": {"XXXYYY": "not found"}})
+
+    broker = MetaTraderBridgeBroker(account_number="1001", password="x", bridge_base_url="http://bridge.test")
+    broker._client = _AsyncClient(transport=httpx.MockTransport(handler))
+    broker._session_id = "s1"
+    broker._connected = True
+
+    trader = AutoTrader()
+    trader.broker = broker
+    trader.config.symbols = ["EUR/USD", "GBP_USD", "XXX/YYY"]
+    await trader._warm_symbol_specs()
+
+    # Cached in the trader: no bridge call on the order path.
+    assert (await trader._get_symbol_spec_cached("EUR/USD"))["digits"] == 5
+    # Cached in the broker: a second lookup only asks for the missing symbol.
+    assert (await broker.get_symbol_specification("GBP_USD"))["symbol"] == "GBPUSD"
+    assert await broker.get_symbol_specification("XXX/YYY") == {}
+    await broker._client.aclose()
+
+    assert requests == ["EURUSD,GBPUSD,XXXYYY", "XXXYYY"]
+
+
+@pytest.mark.asyncio
+async def test_empty_specs_are_not_cached_by_the_trader() -> None:
+    calls: list[str] = []
+
+    class FlakyBroker:
+        async def get_symbol_specification(self, symbol: str) -> dict:
+            calls.append(symbol)
+            return {} if len(calls) == 1 else _spec("EURUSD")
+
+    trader = AutoTrader()
+    trader.broker = FlakyBroker()
+
+    assert await trader._get_symbol_spec_cached("EUR/USD") == {}
+    assert (await trader._get_symbol_spec_cached("EUR/USD"))["digits"] == 5
+    assert (await trader._get_symbol_spec_cached("EUR/USD"))["digits"] == 5
+    assert calls == ["EUR/USD", "EUR/USD"]
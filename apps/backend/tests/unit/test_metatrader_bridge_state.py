@@ -0,0 +1,79 @@
+import httpx
+import pytest
+
+from src.engines.trading.metatrader_bridge_broker import MetaTraderBridgeBroker
+
+# test_symbol_autodiscovery replaces httpx.AsyncClient at import; keep the real one.
+_AsyncClient = httpx.AsyncClient
+
+
+def _position(position_id: str, symbol: str, profit: float) -> dict:
+    return {"position_id": position_id, "symbol": symbol, "side": "buy", "volume": 0.1, "open_price": 1.1, "profit": profit}
+
+
+def _broker(handler) -> MetaTraderBridgeBroker:
+    broker = MetaTraderBridgeBroker(account_number="1001", password="x", bridge_base_url="http://bridge.test")
+    broker._client = _AsyncClient(transport=httpx.MockTransport(handler))
+    broker._session_id = "s1"
+    broker._connected = True
+    return broker
+
+
+@pytest.mark.asyncio
+async def test_state_deltas_update_the_local_mirror() -> None:
+    seen: list[str | None] = []
+    responses = [
+        {
+            "version": 3,
+            "full": True,
+            "account": {"balance": 1000, "equity": 1005},
+            "positions": [_position("p1", "EURUSD", 5.0)],
+            "orders": [{"order_id": "o1", "symbol": "GBPUSD", "side": "sell", "order_type": "limit", "volume": 0.2}],
+        },
+        *({"version": 3, "full": False, "changes": []} for _ in range(3)),
+        {
+            "version": 4,
+            "full": False,
+            "changes": [
+                {"version": 4, "kind": "position", "op": "upsert", "id": "p2", "data": _position("p2", "USDJPY", -1.0)},
+                {"version": 4, "kind": "order", "op": "remove", "id": "o1", "data": None},
+            ],
+        },
+        {"version": 4, "full": False, "changes": []},
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/api/v1/sessions/s1/state"
+        seen.append(request.url.params.get("since"))
+        return httpx.Response(200, json=responses.pop(0))
+
+    broker = _broker(handler)
+    positions = await broker.get_positions()
+    assert [p.position_id for p in positions] == ["p1"]
+    assert (await broker.get_open_orders("GBP/USD"))[0].order_id == "o1"
+    assert (await broker.get_account_info()).equity == 1005
+
+    # Nothing changed: positions are served from the parsed cache.
+    assert (await broker.get_positions())[0] is positions[0]
+
+    assert [p.symbol for p in await broker.get_positions()] == ["EUR_USD", "USD_JPY"]
+    assert await broker.get_open_orders() == []
+    await broker._client.aclose()
+    assert seen == [None, "3", "3", "3", "3", "4"]
+
+
+@pytest.mark.asyncio
+async def test_bridge_without_state_endpoint_uses_resource_endpoints() -> None:
+    paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        if request.url.path.endswith("/state"):
+            return httpx.Response(404, json={"detail": "Not Found"})
+        return httpx.Response(200, json=[_position("p1", "EURUSD", 1.0)])
+
+    broker = _broker(handler)
+    assert len(await broker.get_positions()) == 1
+    assert len(await broker.get_positions()) == 1
+    await broker._client.aclose()
+    assert paths == ["/api/v1/sessions/s1/state", "/api/v1/sessions/s1/positions", "/api/v1/sessions/s1/positions"]
@@ -0,0 +1,96 @@
+import json
+from decimal import Decimal
+
+import httpx
+import pytest
+
+from src.engines.trading.metatrader_bridge_broker import MetaTraderBridgeBroker
+
+# test_symbol_autodiscovery replaces httpx.AsyncClient at import; keep the real one.
+_AsyncClient = httpx.AsyncClient
+
+
+def _broker(handler) -> MetaTraderBridgeBroker:
+    broker = MetaTraderBridgeBroker(
+        account_number="1001",
+        password="secret",
+        bridge_base_url="http://bridge.test",
+    )
+    broker._client = _AsyncClient(transport=httpx.MockTransport(handler))
+    broker._session_id = "s1"
+    broker._connected = True
+    return broker
+
+
+@pytest.mark.asyncio
+async def test_stream_prices_maps_frames_and_skips_heartbeats() -> None:
+    lines = [
+        {"s": "EURUSD", "b": 1.1, "a": 1.1002, "t": 1760000000123},
+        {"hb": 1760000000200},
+        {"s": "GBPUSD", "b": 1.3, "a": 1.3002, "t": 1760000000300},
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/api/v1/sessions/s1/stream/prices"
+        assert request.url.params["symbols"] == "EURUSD"
+        body = "".join(json.dumps(line) + "\n" for line in lines)
+        return httpx.Response(200, text=body, headers={"Content-Type": "application/x-ndjson"})
+
+    broker = _broker(handler)
+    ticks = [tick async for tick in broker._stream_ticks({"EURUSD": "EUR_USD"})]
+    await broker._client.aclose()
+
+    assert len(ticks) == 1
+    assert ticks[0].symbol == "EUR_USD"
+    assert ticks[0].ask == Decimal("1.1002")
+    assert ticks[0].timestamp.timestamp() == pytest.approx(1760000000.123)
+
+
+@pytest.mark.asyncio
+async def test_stream_prices_falls_back_to_polling_on_old_bridge() -> None:
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        if request.url.path.endswith("/stream/prices"):
+            return httpx.Response(404, json={"detail": "Not Found"})
+        return httpx.Response(200, json={"prices": {"EURUSD": {"bid": 1.1, "ask": 1.1002}}, "errors": {}})
+
+    broker = _broker(handler)
+    stream = broker.stream_prices(["EUR_USD"])
+    tick = await anext(stream)
+    await stream.aclose()
+    await broker._client.aclose()
+
+    assert tick.symbol == "EUR_USD"
+    assert calls == ["/api/v1/sessions/s1/stream/prices", "/api/v1/sessions/s1/prices"]
+
+
+@pytest.mark.asyncio
+async def test_stream_reconnects_with_capped_backoff_reset_by_ticks(monkeypatch) -> None:
+    connections = 0
+    tick_line = json.dumps({"s": "EURUSD", "b": 1.1, "a": 1.1002, "t": 1760000000123}) + "\n"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal connections
+        if request.url.path.endswith("/stream/prices"):
+            connections += 1
+            # Connections 4 and 6 deliver a tick; the others end straight away.
+            return httpx.Response(200, text=tick_line if connections in (4, 6) else "")
+        return httpx.Response(200, json={"prices": {}, "errors": {}})
+
+    delays: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr("src.engines.trading.metatrader_bridge_broker.asyncio.sleep", fake_sleep)
+    monkeypatch.setattr(MetaTraderBridgeBroker, "STREAM_RECONNECT_MAX_SECONDS", 3.0)
+    broker = _broker(handler)
+    stream = broker.stream_prices(["EUR_USD"])
+    await anext(stream)
+    await anext(stream)
+    await stream.aclose()
+    await broker._client.aclose()
+
+    assert delays == [1.0, 2.0, 3.0, 1.0, 2.0]
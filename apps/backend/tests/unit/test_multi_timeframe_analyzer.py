@@ -0,0 +1,62 @@
+from types import SimpleNamespace
+
+import pytest
+
+from src.engines.ai import multi_timeframe_analyzer as analyzer_module
+from src.engines.ai.multi_timeframe_analyzer import MultiTimeframeAnalyzer
+
+
+class _Prerendered:
+    def __init__(self, images: dict[str, str]):
+        self.images = images
+
+    def get_images(self, symbol, timeframes, preset):
+        return {tf: self.images[tf] for tf in timeframes if tf in self.images}
+
+
+class _ChartService:
+    def __init__(self) -> None:
+        self.prompt_timeframes: list[str] | None = None
+
+    async def generate_multi_timeframe_charts(self, symbol, timeframes, ohlcv_data_map):
+        return {}  # No candles: nothing rendered
+
+    def create_vision_prompt(self, symbol, timeframes):
+        self.prompt_timeframes = timeframes
+        return "prompt"
+
+
+class _VisionAnalyzer:
+    def __init__(self) -> None:
+        self.images: dict[str, str] | None = None
+
+    async def analyze_all_models(self, images_base64, prompt, max_models):
+        self.images = images_base64
+        return [SimpleNamespace(
+            model="m1", direction="LONG", confidence=70, stop_loss=None, take_profit=[],
+            reasoning="", patterns_detected=[], latency_ms=5, error=None,
+        )]
+
+
+@pytest.mark.asyncio
+async def test_vision_votes_use_the_charts_that_exist(monkeypatch) -> None:
+    monkeypatch.setattr(analyzer_module, "get_chart_prerender_service", lambda: _Prerendered({"H1": "h1-image"}))
+    analyzer = MultiTimeframeAnalyzer()
+    analyzer.chart_service = _ChartService()
+    analyzer.vision_analyzer = _VisionAnalyzer()
+
+    result = await analyzer._run_vision_analysis("EUR/USD", ["M15", "H1"])
+
+    assert [vote["provider"] for vote in result["votes"]] == ["vision_m1"]
+    assert analyzer.vision_analyzer.images == {"H1": "h1-image"}
+    assert analyzer.chart_service.prompt_timeframes == ["H1"]
+
+
+@pytest.mark.asyncio
+async def test_vision_analysis_needs_the_chart_service(monkeypatch) -> None:
+    monkeypatch.setattr(analyzer_module, "get_chart_prerender_service", lambda: _Prerendered({"H1": "h1-image"}))
+    analyzer = MultiTimeframeAnalyzer()
+    analyzer.vision_analyzer = _VisionAnalyzer()
+
+    assert await analyzer._run_vision_analysis("EUR/USD", ["H1"]) == {"votes": []}
+    assert analyzer.vision_analyzer.images is None
@@ -0,0 +1,104 @@
+from datetime import UTC, date, datetime, timedelta
+
+import numpy as np
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+import src.services.performance_analytics_service as analytics_module
+from src.core.database import Base
+from src.services.performance_analytics_service import (
+    PerformanceAnalyticsService,
+    TradeFrame,
+    daily_performance,
+    equity_curve,
+    summarize,
+)
+from src.services.trade_history_service import TradeHistoryService
+
+USER = 5
+
+
+def _frame(trades: list[tuple[datetime, float]], hold: timedelta = timedelta(hours=2)) -> TradeFrame:
+    return TradeFrame.from_rows([(closed - hold, closed, pnl) for closed, pnl in trades])
+
+
+def _at(day: int, hour: int = 12) -> datetime:
+    return datetime(2026, 3, day, hour, tzinfo=UTC)
+
+
+def test_summary_matches_trade_by_trade_figures():
+    frame = _frame([(_at(3), -50.0), (_at(1), 100.0), (_at(2), 40.0), (_at(4), 30.0), (_at(4, 15), -80.0)])
+
+    summary = summarize(frame, initial_balance=1000.0)
+
+    assert summary.total_trades == 5 and summary.winning_trades == 3 and summary.losing_trades == 2
+    assert summary.total_pnl == pytest.approx(40.0)
+    assert summary.profit_factor == pytest.approx(170 / 130)
+    assert summary.largest_loss == -80.0 and summary.expectancy == pytest.approx(8.0)
+    # Equity 1100, 1140, 1090, 1120, 1040: deepest drop is 100 from the 1140 peak.
+    assert summary.max_drawdown == pytest.approx(100.0)
+    assert summary.max_drawdown_percent == pytest.approx(100 / 1140 * 100)
+    assert summary.average_hold_hours == pytest.approx(2.0)
+
+    returns = np.array([100 / 1000, 40 / 1100, -50 / 1140, -50 / 1090])
+    assert summary.sharpe_ratio == pytest.approx(returns.mean() / returns.std(ddof=1) * np.sqrt(365))
+    downside = np.sqrt(np.mean(np.minimum(returns, 0) ** 2))
+    assert summary.sortino_ratio == pytest.approx(returns.mean() / downside * np.sqrt(365))
+
+
+def test_ratios_need_more_than_one_day_and_window_is_inclusive():
+    frame = _frame([(_at(1), 10.0), (_at(1, 18), -5.0), (_at(5), 20.0)])
+
+    assert summarize(frame.window(end=date(2026, 3, 1))).sharpe_ratio is None
+    assert len(frame.window(date(2026, 3, 2), date(2026, 3, 5))) == 1
+    assert summarize(frame.window(start=date(2026, 3, 6))).total_trades == 0
+
+
+def test_daily_and_equity_curve_group_by_closing_bucket():
+    frame = _frame([(_at(1, 9), 10.0), (_at(1, 9) + timedelta(minutes=30), -30.0), (_at(3, 14), 50.0)])
+
+    days = daily_performance(frame)
+    assert [(d["date"], d["pnl"], d["trades"], d["win_rate"], d["cumulative_pnl"]) for d in days] == [
+        (date(2026, 3, 1), -20.0, 2, 50.0, -20.0),
+        (date(2026, 3, 3), 50.0, 1, 100.0, 30.0),
+    ]
+
+    hourly = equity_curve(frame, "1h", initial_balance=100.0)
+    assert [(p["timestamp"], p["equity"], p["drawdown"]) for p in hourly] == [
+        ("2026-03-01T09:00:00+00:00", 80.0, 30.0),
+        ("2026-03-03T14:00:00+00:00", 130.0, 0.0),
+    ]
+    assert len(equity_curve(frame, "15m")) == 3
+
+
+@pytest.fixture
+async def db():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+async def test_results_are_cached_until_trades_change(db, monkeypatch):
+    history = TradeHistoryService()
+    monkeypatch.setattr(analytics_module, "get_trade_history_service", lambda: history)
+    service = PerformanceAnalyticsService(max_users=4)
+
+    def trade(trade_id: str, day: int, pnl: float) -> dict:
+        return {"id": trade_id, "symbol": "EUR/USD", "direction": "LONG", "timestamp": _at(day, 8).isoformat(),
+                "exit_timestamp": _at(day).isoformat(), "status": "closed", "profit_loss": pnl}
+
+    await history.upsert_trades(db, USER, [trade("1", 1, 10.0), trade("open", 2, None) | {"exit_timestamp": None}],
+                                source="bot")
+    await db.commit()
+    assert (await service.summary(db, USER)).total_trades == 1
+    assert (await service.summary(db, USER)).total_pnl == 10.0
+    assert service.get_stats() == {"users": 1, "frame_loads": 1, "hits": 1, "misses": 1}
+
+    await history.upsert_trades(db, USER, [trade("2", 2, -4.0)], source="bot")
+    await db.commit()
+    summary = await service.summary(db, USER)
+    assert summary.total_trades == 2 and summary.total_pnl == 6.0
+    assert service.get_stats()["frame_loads"] == 2
@@ -0,0 +1,107 @@
+import asyncio
+import base64
+import json
+import time
+
+import httpx
+import pytest
+
+from src.engines.trading.platform_rest_broker import MatchTraderBroker
+from src.engines.trading.platform_rest_session import (
+    RestRateLimiter,
+    RestTokenSession,
+    acquire_host_client,
+    release_host_client,
+)
+
+BASE_URL = "https://mt.example.test"
+
+# test_symbol_autodiscovery replaces httpx.AsyncClient at import; keep the real one.
+_AsyncClient = httpx.AsyncClient
+
+
+class _FakePlatform:
+    """Match-Trader-like API whose tokens can be revoked."""
+
+    def __init__(self) -> None:
+        self.logins = 0
+        self.valid_token = ""
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/health":
+            return httpx.Response(200, json={"ok": True})
+        if request.url.path == "/api/login":
+            self.logins += 1
+            self.valid_token = f"tok{self.logins}"
+            return httpx.Response(200, json={"access_token": self.valid_token, "expires_in": 3600})
+        if request.headers.get("Authorization") != f"Bearer {self.valid_token}":
+            return httpx.Response(401, json={"error": "expired"})
+        return httpx.Response(200, json={"balance": 1000}, headers={"X-RateLimit-Remaining": "42"})
+
+
+def _broker(password: str) -> MatchTraderBroker:
+    return MatchTraderBroker(
+        account_id="1001",
+        password=password,
+        server_name="Demo",
+        api_base_url=BASE_URL,
+    )
+
+
+def _mock_host(platform: _FakePlatform):
+    host = acquire_host_client(BASE_URL)
+    host.client = _AsyncClient(transport=httpx.MockTransport(platform.handler))
+    return host
+
+
+@pytest.mark.asyncio
+async def test_instances_share_client_token_and_relogin_once() -> None:
+    platform = _FakePlatform()
+    host = _mock_host(platform)
+    first, second = _broker("secret-a"), _broker("secret-a")
+    try:
+        await first.connect()
+        await second.connect()
+        assert platform.logins == 1
+        assert first._session is second._session
+        assert first._client is second._client is host.client
+
+        # Token revoked server-side: a burst of calls triggers a single re-login.
+        platform.valid_token = "revoked"
+        results = await asyncio.gather(*(
+            broker._request("GET", "/api/account") for broker in (first, second, first, second)
+        ))
+        assert all(status == 200 for status, _ in results)
+        assert platform.logins == 2
+        assert host.limiter.remaining == 42
+
+        assert _broker("other-password")._session is not first._session
+    finally:
+        await first.disconnect()
+        await second.disconnect()
+        await release_host_client(host)
+    assert host.client.is_closed
+
+
+def test_token_expiry_from_jwt_and_refresh_margin() -> None:
+    claims = base64.urlsafe_b64encode(json.dumps({"exp": time.time() + 30}).encode()).decode().rstrip("=")
+    session = RestTokenSession("k")
+    session.set_token(f"h.{claims}.s")
+    assert session.expires_at is not None
+    assert session.needs_refresh()  # Inside the 60s refresh margin
+
+    session.set_token("opaque", expires_in=3600)
+    assert not session.needs_refresh()
+
+
+def test_rate_limiter_honours_retry_after_and_exhausted_budget() -> None:
+    limiter = RestRateLimiter()
+    limiter.update(200, httpx.Headers({"X-RateLimit-Remaining": "5", "X-RateLimit-Reset": "10"}))
+    assert limiter.blocked_for == 0
+
+    limiter.update(429, httpx.Headers({"Retry-After": "2"}))
+    assert 1.5 < limiter.blocked_for <= 2.0
+
+    limiter = RestRateLimiter()
+    limiter.update(200, httpx.Headers({"RateLimit-Remaining": "0", "RateLimit-Reset": str(time.time() + 5)}))
+    assert 4.0 < limiter.blocked_for <= 5.0
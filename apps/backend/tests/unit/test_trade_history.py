@@ -0,0 +1,151 @@
+import json
+from datetime import UTC, date, datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+import src.services.trade_history_service as history_module
+from src.core.database import Base
+from src.core.models import AppSettings, Trade
+from src.services.trade_history_service import TradeHistoryService, trade_to_dict
+
+USER = 7
+
+
+@pytest.fixture
+async def db():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+def _trade(trade_id: str, day: int, pnl: float | None = None, symbol: str = "EUR/USD", broker_id: int = 1) -> dict:
+    opened = datetime(2026, 3, day, 9, 0, tzinfo=UTC)
+    return {
+        "id": trade_id,
+        "broker_id": broker_id,
+        "broker_name": "Demo",
+        "symbol": symbol,
+        "direction": "LONG",
+        "entry_price": 1.1,
+        "timestamp": opened.isoformat(),
+        "exit_timestamp": (opened + timedelta(hours=2)).isoformat() if pnl is not None else None,
+        "status": "closed" if pnl is not None else "open",
+        "profit_loss": pnl,
+    }
+
+
+async def _count(db: AsyncSession) -> int:
+    return (await db.execute(select(func.count(Trade.id)))).scalar_one()
+
+
+async def test_upsert_updates_rows_in_place_and_skips_unchanged(db):
+    service = TradeHistoryService()
+
+    assert await service.upsert_trades(db, USER, [_trade("1", 2), _trade("2", 3, 5.0)], source="bot") == 2
+    await db.commit()
+    assert await service.upsert_trades(db, USER, [_trade("1", 2), _trade("2", 3, 5.0)], source="bot") == 0
+    assert await service.upsert_trades(db, USER, [_trade("1", 2, -3.0)], source="bot") == 1
+
+    assert await _count(db) == 2
+    closed = trade_to_dict((await service.query_trades(db, USER, symbol="EUR/USD"))[1])
+    assert closed["id"] == "1" and closed["status"] == "closed" and closed["profit_loss"] == -3.0
+    assert closed["exit_timestamp"] == "2026-03-02T11:00:00+00:00"
+
+
+async def test_rolled_back_writes_are_not_skipped_later(db):
+    service = TradeHistoryService()
+
+    assert await service.upsert_trades(db, USER, [_trade("1", 2)], source="bot") == 1
+    await db.rollback()
+
+    assert await service.upsert_trades(db, USER, [_trade("1", 2)], source="bot") == 1
+    await db.commit()
+    assert await _count(db) == 1
+
+
+async def test_data_version_changes_only_when_writes_commit(db):
+    service = TradeHistoryService()
+
+    await service.upsert_trades(db, USER, [_trade("1", 2)], source="bot")
+    assert service.data_version(USER) == 0
+    await db.commit()
+    assert service.data_version(USER) == 1
+
+    await service.clear_user(db, USER)
+    await db.rollback()
+    assert service.data_version(USER) == 1
+    await service.clear_user(db, USER)
+    await db.commit()
+    assert service.data_version(USER) == 2
+
+
+async def test_written_fingerprints_are_capped(db, monkeypatch):
+    monkeypatch.setattr(history_module, "_MAX_FINGERPRINTS", 2)
+    service = TradeHistoryService()
+
+    await service.upsert_trades(db, USER, [_trade(str(day), day) for day in range(1, 4)], source="bot")
+    await db.commit()
+
+    assert list(service._written) == [(USER, 1, "2"), (USER, 1, "3")]
+    # The evicted row is written again (a harmless no-op upsert); the remembered ones are skipped.
+    assert await service.upsert_trades(db, USER, [_trade(str(day), day) for day in range(1, 4)], source="bot") == 1
+
+
+async def test_queries_filter_and_paginate_in_sql(db):
+    service = TradeHistoryService()
+    trades = [_trade(str(day), day, pnl=float(day)) for day in range(1, 11)]
+    trades += [_trade("open", 11), _trade("gold", 5, 1.0, symbol="XAU/USD", broker_id=2)]
+    await service.upsert_trades(db, USER, trades, source="deal")
+    await service.upsert_trades(db, USER + 1, [_trade("other", 5, 1.0)], source="deal")
+
+    page = await service.query_trades(db, USER, limit=3, offset=1)
+    assert [t.external_id for t in page] == ["10", "9", "8"]
+
+    in_range = dict(start=date(2026, 3, 4), end=date(2026, 3, 6), closed_only=True)
+    assert sorted(t.external_id for t in await service.query_trades(db, USER, **in_range)) == ["4", "5", "6", "gold"]
+    assert await service.count_trades(db, USER, broker_ids=[1], **in_range) == 3
+    assert await service.count_trades(db, USER, symbol="XAU/USD") == 1
+    assert await service.count_trades(db, USER, closed_only=True) == 11
+
+
+async def test_closed_trades_without_exit_time_fall_back_to_entry_time(db):
+    service = TradeHistoryService()
+    trade = _trade("cached", 8)
+    trade["profit_loss"] = 2.5
+
+    await service.upsert_trades(db, USER, [trade], source="cache")
+
+    rows = await service.query_trades(db, USER, start=date(2026, 3, 8), end=date(2026, 3, 8), closed_only=True)
+    assert [t.external_id for t in rows] == ["cached"]
+
+
+async def test_legacy_json_cache_is_imported_once_without_overwriting(db):
+    service = TradeHistoryService()
+    await service.upsert_trades(db, USER, [_trade("1", 2, 10.0)], source="deal")
+    legacy = [_trade("1", 2, 99.0), _trade("2", 3, 1.0), {"symbol": "no id"}]
+    db.add(AppSettings(key=f"trade_history_user_{USER}", value=json.dumps(legacy)))
+    await db.flush()
+
+    assert await service.import_legacy_cache(db, USER) == 2
+    assert await service.import_legacy_cache(db, USER) == 0
+
+    rows = {t.external_id: t for t in await service.query_trades(db, USER)}
+    assert rows["1"].profit_loss == 10.0 and rows["1"].source == "deal"
+    assert rows["2"].source == "cache"
+    assert (await db.execute(select(AppSettings))).scalar_one_or_none() is None
+
+
+async def test_newest_deal_time_only_counts_deals_of_the_broker(db):
+    service = TradeHistoryService()
+    assert await service.newest_deal_time(db, USER, 1) is None
+
+    await service.upsert_trades(db, USER, [_trade("d1", 4, 1.0), _trade("d2", 6, 2.0)], source="deal")
+    await service.upsert_trades(db, USER, [_trade("bot", 9, 3.0)], source="bot")
+    await service.upsert_trades(db, USER, [_trade("other", 8, 1.0, broker_id=2)], source="deal")
+
+    assert await service.newest_deal_time(db, USER, 1) == datetime(2026, 3, 6, 11, 0, tzinfo=UTC)
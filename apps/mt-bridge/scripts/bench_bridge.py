@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+"""
+Load test / benchmark for the MT bridge with the mock provider.
+
+Starts the bridge (uvicorn, MT_BRIDGE_PROVIDER_MODE=mock) on a free local port,
+opens N sessions and drives a weighted mix of price polls, candle fetches,
+order placements and position/account queries. Reports p50/p95/p99 latency
+and throughput per operation and can save / compare JSON baselines.
+
+Eseguire dalla directory apps/mt-bridge:
+    python scripts/bench_bridge.py run --sessions 8 --concurrency 32 --duration 20 --output bench.json
+    python scripts/bench_bridge.py run --session-mode process --baseline bench.json
+    python scripts/bench_bridge.py compare bench.json bench-new.json --threshold 0.15
+
+With --url the load is sent to an already running bridge instead.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+
+import httpx
+
+BRIDGE_ROOT = Path(__file__).resolve().parents[1]
+
+# Operation -> relative weight of the request mix (roughly what a trading backend does).
+DEFAULT_MIX = {
+    "prices": 30,
+    "price": 15,
+    "candles": 15,
+    "positions": 15,
+    "account": 10,
+    "orders_open": 5,
+    "place_order": 6,
+    "close_position": 4,
+}
+DEFAULT_SYMBOLS = "EURUSD,GBPUSD,USDJPY,XAUUSD,US30"
+
+# Latency percentiles (and throughput) compared between runs.
+COMPARED_METRICS = ("p50_ms", "p95_ms", "p99_ms")
+
+
+@dataclass
+class BenchSession:
+    session_id: str
+    open_positions: Counter = field(default_factory=Counter)
+
+
+@dataclass
+class OpStats:
+    latencies_ms: list[float] = field(default_factory=list)
+    errors: int = 0
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, round(pct / 100.0 * len(ordered) + 0.5) - 1))
+    return ordered[rank]
+
+
+def _summarize(stats: OpStats, elapsed: float) -> dict:
+    values = stats.latencies_ms
+    count = len(values)
+    return {
+        "count": count,
+        "errors": stats.errors,
+        "rps": round(count / elapsed, 2) if elapsed > 0 else 0.0,
+        "mean_ms": round(sum(values) / count, 3) if count else 0.0,
+        "p50_ms": round(_percentile(values, 50), 3),
+        "p95_ms": round(_percentile(values, 95), 3),
+        "p99_ms": round(_percentile(values, 99), 3),
+        "max_ms": round(max(values), 3) if values else 0.0,
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BRIDGE_ROOT,
+            capture_output=True,
+            text=True,
+            timeout=5,
+            check=False,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _start_bridge(args: argparse.Namespace) -> tuple[subprocess.Popen, str]:
+    port = _free_port()
+    env = dict(os.environ)
+    env.update(
+        {
+            "MT_BRIDGE_PROVIDER_MODE": "mock",
+            "MT_BRIDGE_SESSION_MODE": args.session_mode,
+            "MT_BRIDGE_MAX_SESSIONS": str(max(args.sessions, 1)),
+            "MT_BRIDGE_API_KEY": "",
+        }
+    )
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "src.main:app", "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"],
+        cwd=BRIDGE_ROOT,
+        env=env,
+    )
+    return process, f"http://127.0.0.1:{port}"
+
+
+async def _wait_ready(client: httpx.AsyncClient, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            response = await client.get("/api/v1/health")
+            if response.status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.2)
+    raise RuntimeError("Bridge did not become ready")
+
+
+async def _open_sessions(client: httpx.AsyncClient, count: int) -> list[BenchSession]:
+    async def _connect(index: int) -> BenchSession:
+        response = await client.post(
+            "/api/v1/sessions/connect",
+            json={"platform": "mt5", "login": str(900000 + index), "password": "bench", "server": "Bench-Demo"},
+        )
+        response.raise_for_status()
+        return BenchSession(session_id=response.json()["session_id"])
+
+    return list(await asyncio.gather(*(_connect(i) for i in range(count))))
+
+
+async def _run_op(client: httpx.AsyncClient, op: str, session: BenchSession, symbols: list[str], rng: random.Random):
+    base = f"/api/v1/sessions/{session.session_id}"
+    symbol = rng.choice(symbols)
+    if op == "close_position" and not session.open_positions:
+        op = "place_order"
+    if op == "prices":
+        return op, await client.get(f"{base}/prices", params={"symbols": ",".join(symbols)})
+    if op == "price":
+        return op, await client.get(f"{base}/prices/{symbol}")
+    if op == "candles":
+        return op, await client.get(f"{base}/candles/{symbol}", params={"timeframe": "M5", "count": 200})
+    if op == "positions":
+        return op, await client.get(f"{base}/positions")
+    if op == "account":
+        return op, await client.get(f"{base}/account")
+    if op == "orders_open":
+        return op, await client.get(f"{base}/orders/open")
+    if op == "place_order":
+        response = await client.post(
+            f"{base}/orders",
+            json={"symbol": symbol, "side": rng.choice(("buy", "sell")), "volume": 0.01},
+        )
+        if response.status_code < 400:
+            session.open_positions[symbol] += 1
+        return op, response
+    symbol = rng.choice(sorted(session.open_positions))
+    session.open_positions[symbol] -= 1
+    if session.open_positions[symbol] <= 0:
+        del session.open_positions[symbol]
+    return op, await client.post(f"{base}/positions/close", json={"symbol": symbol})
+
+
+async def _drive(
+    client: httpx.AsyncClient,
+    sessions: list[BenchSession],
+    mix: dict[str, int],
+    symbols: list[str],
+    *,
+    concurrency: int,
+    warmup: float,
+    duration: float,
+    seed: int,
+) -> tuple[dict[str, OpStats], float]:
+    stats: dict[str, OpStats] = {op: OpStats() for op in mix}
+    ops, weights = list(mix), list(mix.values())
+    started = time.monotonic()
+    measure_from = started + warmup
+    deadline = measure_from + duration
+
+    async def _worker(index: int) -> None:
+        rng = random.Random(seed + index)
+        session = sessions[index % len(sessions)]
+        while True:
+            now = time.monotonic()
+            if now >= deadline:
+                return
+            op = rng.choices(ops, weights=weights)[0]
+            t0 = time.perf_counter()
+            try:
+                op, response = await _run_op(client, op, session, symbols, rng)
+                failed = response.status_code >= 400
+            except httpx.HTTPError:
+                failed = True
+            elapsed_ms = (time.perf_counter() - t0) * 1000.0
+            if now < measure_from:
+                continue
+            op_stats = stats.setdefault(op, OpStats())
+            if failed:
+                op_stats.errors += 1
+            else:
+                op_stats.latencies_ms.append(elapsed_ms)
+
+    await asyncio.gather(*(_worker(i) for i in range(concurrency)))
+    return stats, max(0.001, time.monotonic() - measure_from)
+
+
+async def run_benchmark(args: argparse.Namespace) -> dict:
+    mix = dict(DEFAULT_MIX)
+    for item in args.mix or []:
+        name, _, weight = item.partition("=")
+        if name not in DEFAULT_MIX:
+            raise SystemExit(f"Unknown operation in --mix: {name} (valid: {', '.join(DEFAULT_MIX)})")
+        mix[name] = int(weight)
+    mix = {name: weight for name, weight in mix.items() if weight > 0}
+    symbols = [s.strip().upper() for s in args.symbols.split(",") if s.strip()]
+
+    process = None
+    base_url = args.url
+    if not base_url:
+        process, base_url = _start_bridge(args)
+    headers = {"Authorization": f"Bearer {args.api_key}"} if args.api_key else None
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    try:
+        async with httpx.AsyncClient(base_url=base_url, headers=headers, limits=limits, timeout=60.0) as client:
+            await _wait_ready(client)
+            sessions = await _open_sessions(client, args.sessions)
+            try:
+                stats, elapsed = await _drive(
+                    client,
+                    sessions,
+                    mix,
+                    symbols,
+                    concurrency=args.concurrency,
+                    warmup=args.warmup,
+                    duration=args.duration,
+                    seed=args.seed,
+                )
+            finally:
+                for session in sessions:
+                    try:
+                        await client.post(f"/api/v1/sessions/{session.session_id}/disconnect")
+                    except httpx.HTTPError:
+                        pass
+    finally:
+        if process is not None:
+            process.terminate()
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+    overall = OpStats()
+    for op_stats in stats.values():
+        overall.latencies_ms.extend(op_stats.latencies_ms)
+        overall.errors += op_stats.errors
+    return {
+        "meta": {
+            "timestamp": datetime.now(UTC).isoformat(),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "target": args.url or "local-mock",
+            "session_mode": None if args.url else args.session_mode,
+            "sessions": args.sessions,
+            "concurrency": args.concurrency,
+            "duration_seconds": round(elapsed, 3),
+            "symbols": symbols,
+            "mix": mix,
+        },
+        "overall": _summarize(overall, elapsed),
+        "operations": {op: _summarize(op_stats, elapsed) for op, op_stats in stats.items()},
+    }
+
+
+def compare_results(baseline: dict, current: dict, threshold: float) -> list[str]:
+    """Human-readable regressions of ``current`` against ``baseline`` (empty list = none)."""
+    regressions: list[str] = []
+    rows = [("overall", baseline.get("overall") or {}, current.get("overall") or {})]
+    for op, base_op in (baseline.get("operations") or {}).items():
+        rows.append((op, base_op, (current.get("operations") or {}).get(op) or {}))
+    for name, base, cur in rows:
+        if not cur:
+            continue
+        for metric in COMPARED_METRICS:
+            before, after = float(base.get(metric) or 0.0), float(cur.get(metric) or 0.0)
+            if before > 0 and after > before * (1.0 + threshold):
+                regressions.append(f"{name}.{metric}: {before:.3f} -> {after:.3f} (+{(after / before - 1) * 100:.1f}%)")
+        before, after = float(base.get("rps") or 0.0), float(cur.get("rps") or 0.0)
+        if name == "overall" and before > 0 and after < before * (1.0 - threshold):
+            regressions.append(f"{name}.rps: {before:.2f} -> {after:.2f} ({(after / before - 1) * 100:.1f}%)")
+        if int(cur.get("errors") or 0) > int(base.get("errors") or 0):
+            regressions.append(f"{name}.errors: {base.get('errors', 0)} -> {cur.get('errors')}")
+    return regressions
+
+
+def _print_report(result: dict) -> None:
+    meta = result["meta"]
+    print(
+        f"[Bench] target={meta['target']} mode={meta['session_mode']} sessions={meta['sessions']} "
+        f"concurrency={meta['concurrency']} duration={meta['duration_seconds']}s commit={meta['commit']}"
+    )
+    print(f"{'operation':<16}{'count':>8}{'err':>6}{'rps':>10}{'p50':>10}{'p95':>10}{'p99':>10}")
+    for name, row in [*result["operations"].items(), ("overall", result["overall"])]:
+        print(
+            f"{name:<16}{row['count']:>8}{row['errors']:>6}{row['rps']:>10.1f}"
+            f"{row['p50_ms']:>10.2f}{row['p95_ms']:>10.2f}{row['p99_ms']:>10.2f}"
+        )
+
+
+def _report_regressions(regressions: list[str], threshold: float) -> int:
+    if not regressions:
+        print(f"[Bench] No regressions above {threshold * 100:.0f}%")
+        return 0
+    print(f"[Bench] {len(regressions)} regression(s) above {threshold * 100:.0f}%:")
+    for line in regressions:
+        print(f"  - {line}")
+    return 1
+
+
+def _load(path: str) -> dict:
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="MT bridge load test with the mock provider")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run the benchmark")
+    run.add_argument("--url", help="existing bridge base URL (default: start a local mock bridge)")
+    run.add_argument("--api-key", default=os.getenv("MT_BRIDGE_API_KEY") or None)
+    run.add_argument("--session-mode", choices=("inprocess", "process"), default="inprocess")
+    run.add_argument("--sessions", type=int, default=4)
+    run.add_argument("--concurrency", type=int, default=16)
+    run.add_argument("--duration", type=float, default=15.0, help="measured seconds")
+    run.add_argument("--warmup", type=float, default=2.0, help="unmeasured seconds before the run")
+    run.add_argument("--symbols", default=DEFAULT_SYMBOLS)
+    run.add_argument("--mix", nargs="*", metavar="OP=WEIGHT", help=f"override weights ({', '.join(DEFAULT_MIX)})")
+    run.add_argument("--seed", type=int, default=42)
+    run.add_argument("--output", help="write the result JSON here (e.g. a baseline)")
+    run.add_argument("--baseline", help="compare against this result JSON; exit 1 on regressions")
+    run.add_argument("--threshold", type=float, default=0.15, help="allowed relative slowdown (0.15 = 15%%)")
+
+    compare = commands.add_parser("compare", help="compare two result files")
+    compare.add_argument("baseline")
+    compare.add_argument("current")
+    compare.add_argument("--threshold", type=float, default=0.15)
+
+    args = parser.parse_args()
+    if args.command == "compare":
+        return _report_regressions(compare_results(_load(args.baseline), _load(args.current), args.threshold), args.threshold)
+
+    if args.sessions < 1 or args.concurrency < 1:
+        parser.error("--sessions and --concurrency must be >= 1")
+    result = asyncio.run(run_benchmark(args))
+    _print_report(result)
+    if args.output:
+        Path(args.output).write_text(json.dumps(result, indent=2), encoding="utf-8")
+        print(f"[Bench] Result written to {args.output}")
+    if args.baseline:
+        return _report_regressions(compare_results(_load(args.baseline), result, args.threshold), args.threshold)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,221 @@
+import asyncio
+import time
+from collections import deque
+from typing import Any
+
+from src.providers import BaseTerminalProvider
+from src.tick_stream import encode_frame
+
+# Versioned account state (positions, pending orders, account summary).
+#   full:  {"version": 7, "full": true, "account": {...}, "positions": [...], "orders": [...]}
+#   delta: {"version": 9, "full": false, "changes": [
+#              {"version": 8, "kind": "position", "op": "upsert", "id": "123", "data": {...}},
+#              {"version": 9, "kind": "order", "op": "remove", "id": "456", "data": null}]}
+# A delta is only served while every change after ``since`` is still in the change log;
+# otherwise (too old, or a version from another bridge run) the full state is returned.
+
+_LOG_SIZE = 2000
+_QUEUE_SIZE = 100
+
+_ID_KEYS = {
+    "position": ("position_id", "ticket"),
+    "order": ("order_id", "ticket"),
+}
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+def _index(kind: str, rows: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    indexed: dict[str, dict[str, Any]] = {}
+    for row in rows or []:
+        if not isinstance(row, dict):
+            continue
+        key = next((str(row[k]) for k in _ID_KEYS[kind] if row.get(k) not in (None, "")), "")
+        if key:
+            indexed[key] = dict(row)
+    return indexed
+
+
+class AccountStateTracker:
+    """
+    Per-session account state with a version counter and a bounded change log.
+
+    A background task re-reads account, positions and open orders every
+    interval, diffs them against the previous snapshot and records only what
+    changed. The task stops after ``idle_seconds`` without readers or
+    subscribers and is restarted (with a fresh read) by the next request.
+    """
+
+    def __init__(self, provider: BaseTerminalProvider, *, interval_seconds: float, idle_seconds: float):
+        self._provider = provider
+        self._interval = max(0.05, interval_seconds)
+        self._idle = max(self._interval, idle_seconds)
+        self.version = 0
+        self._account: dict[str, Any] = {}
+        self._positions: dict[str, dict[str, Any]] = {}
+        self._orders: dict[str, dict[str, Any]] = {}
+        self._log: deque[dict[str, Any]] = deque()
+        # Oldest ``since`` that can still be answered with a delta.
+        self._floor = 0
+        self._subscribers: set[asyncio.Queue] = set()
+        self._refresh_lock = asyncio.Lock()
+        self._wake = asyncio.Event()
+        self._stale = True
+        self._last_access = time.monotonic()
+        self._task: asyncio.Task | None = None
+        self._closed = False
+
+    def invalidate(self) -> None:
+        """Mark the state stale after a trade call; the next read refreshes first."""
+        self._stale = True
+        self._wake.set()
+
+    async def state_since(self, since: int | None) -> dict[str, Any]:
+        await self._ensure_fresh()
+        if since is None or since < self._floor or since > self.version:
+            return self.full_state()
+        return {
+            "version": self.version,
+            "full": False,
+            "changes": [change for change in self._log if change["version"] > since],
+        }
+
+    def full_state(self) -> dict[str, Any]:
+        return {
+            "version": self.version,
+            "full": True,
+            "account": self._account,
+            "positions": list(self._positions.values()),
+            "orders": list(self._orders.values()),
+        }
+
+    async def subscribe(self) -> asyncio.Queue:
+        await self._ensure_fresh()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=_QUEUE_SIZE)
+        queue.put_nowait(self.full_state())
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        self._subscribers.discard(queue)
+        self._last_access = time.monotonic()
+
+    async def close(self) -> None:
+        self._closed = True
+        for queue in list(self._subscribers):
+            self._push(queue, None)
+        self._subscribers.clear()
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+
+    async def _ensure_fresh(self) -> None:
+        self._last_access = time.monotonic()
+        running = self._task is not None and not self._task.done()
+        if self._stale or not running:
+            await self.refresh()
+        elif self._refresh_lock.locked():
+            # A poll that started after the last invalidation is in flight: wait for it.
+            async with self._refresh_lock:
+                pass
+        if not running and not self._closed:
+            self._task = asyncio.create_task(self._run())
+
+    async def refresh(self) -> None:
+        async with self._refresh_lock:
+            self._stale = False
+            try:
+                account, positions, orders = await asyncio.gather(
+                    self._provider.get_account_info(),
+                    self._provider.get_positions(),
+                    self._provider.get_open_orders(),
+                )
+            except BaseException:
+                self._stale = True
+                raise
+            self._apply(account, positions, orders)
+
+    def _apply(self, account: dict[str, Any], positions: list[dict[str, Any]], orders: list[dict[str, Any]]) -> None:
+        if self.version == 0:
+            self.version = self._floor = 1
+            self._account = dict(account or {})
+            self._positions = _index("position", positions)
+            self._orders = _index("order", orders)
+            return
+
+        version = self.version + 1
+        changes: list[dict[str, Any]] = []
+        account = dict(account or {})
+        if account != self._account:
+            self._account = account
+            changes.append({"version": version, "kind": "account", "op": "upsert", "id": "account", "data": account})
+        for kind, current, fresh in (
+            ("position", self._positions, _index("position", positions)),
+            ("order", self._orders, _index("order", orders)),
+        ):
+            for key in [key for key in current if key not in fresh]:
+                del current[key]
+                changes.append({"version": version, "kind": kind, "op": "remove", "id": key, "data": None})
+            for key, row in fresh.items():
+                if current.get(key) != row:
+                    current[key] = row
+                    changes.append({"version": version, "kind": kind, "op": "upsert", "id": key, "data": row})
+        if not changes:
+            return
+
+        self.version = version
+        for change in changes:
+            if len(self._log) >= _LOG_SIZE:
+                self._floor = max(self._floor, self._log.popleft()["version"])
+            self._log.append(change)
+        frame = {"version": version, "full": False, "changes": changes}
+        for queue in list(self._subscribers):
+            self._push(queue, frame)
+
+    def _push(self, queue: asyncio.Queue, frame: dict[str, Any] | None) -> None:
+        if queue.full():
+            # Slow consumer: deltas cannot be skipped, so resync it with the full state.
+            while not queue.empty():
+                queue.get_nowait()
+            if frame is not None:
+                frame = self.full_state()
+        queue.put_nowait(frame)
+
+    async def _run(self) -> None:
+        while not self._closed:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self._interval)
+            except TimeoutError:
+                pass
+            self._wake.clear()
+            if not self._subscribers and time.monotonic() - self._last_access > self._idle:
+                self._stale = True
+                return
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # Keep the last good state; the next poll retries.
+                pass
+
+
+async def stream_state_frames(tracker: AccountStateTracker, heartbeat_seconds: float):
+    """Async generator of encoded state frames: the full state first, then deltas."""
+    queue = await tracker.subscribe()
+    try:
+        while True:
+            try:
+                frame = await asyncio.wait_for(queue.get(), timeout=heartbeat_seconds)
+            except TimeoutError:
+                frame = {"hb": _now_ms()}
+            if frame is None:
+                return
+            yield encode_frame(frame)
+    finally:
+        tracker.unsubscribe(queue)
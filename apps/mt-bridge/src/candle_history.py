@@ -0,0 +1,74 @@
+import json
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from src.providers import BaseTerminalProvider, BridgeProviderError
+from src.providers.base import CANDLE_COLUMNS, timeframe_seconds
+
+# Page payload (columnar, ``t`` in epoch seconds):
+#   {"symbol": "EURUSD", "timeframe": "M5", "fields": ["t", "o", "h", "l", "c", "v"],
+#    "count": 2, "next_cursor": "1760003000",
+#    "columns": {"t": [1760000000, 1760000300], "o": [...], ...}}
+# ``next_cursor`` is null on the last page of the requested range.
+
+HISTORY_FORMATS = ("json", "msgpack")
+
+
+async def history_page(
+    provider: BaseTerminalProvider,
+    *,
+    symbol: str,
+    timeframe: str,
+    start: datetime | None,
+    end: datetime | None,
+    limit: int,
+) -> dict[str, Any]:
+    """
+    One page of a (possibly very long) history range.
+
+    With a ``start`` each page covers at most ``limit`` bar slots of the
+    timeframe, so the provider never scans more than one page worth of
+    history per request; pages over market closures hold fewer bars.
+    Without one the page holds the latest ``limit`` bars up to ``end``.
+    """
+    end = end or datetime.now(UTC)
+    if start is None:
+        columns = await provider.get_candle_history(
+            symbol=symbol,
+            timeframe=timeframe,
+            start=None,
+            end=end,
+            limit=limit,
+        )
+        next_cursor = None
+    else:
+        if start > end:
+            raise BridgeProviderError("History range start is after its end")
+        window_end = min(end, start + timedelta(seconds=timeframe_seconds(timeframe) * limit - 1))
+        columns = await provider.get_candle_history(
+            symbol=symbol,
+            timeframe=timeframe,
+            start=start,
+            end=window_end,
+            limit=limit,
+        )
+        next_cursor = str(int(window_end.timestamp()) + 1) if window_end < end else None
+    return {
+        "symbol": symbol,
+        "timeframe": timeframe,
+        "fields": list(CANDLE_COLUMNS),
+        "count": len(columns.get("t", [])),
+        "next_cursor": next_cursor,
+        "columns": columns,
+    }
+
+
+def encode_history(payload: dict[str, Any], response_format: str) -> tuple[bytes, str]:
+    """Serialize a history page; msgpack is optional on bridge nodes."""
+    if response_format == "msgpack":
+        try:
+            import msgpack
+        except ImportError as exc:
+            raise BridgeProviderError("format=msgpack requires the msgpack package on the bridge node") from exc
+        return msgpack.packb(payload, use_bin_type=True), "application/x-msgpack"
+    return json.dumps(payload, separators=(",", ":")).encode(), "application/json"
@@ -1,3 +1,4 @@
+import os
 from functools import lru_cache
 
 from pydantic import Field
@@ -16,7 +17,12 @@ class BridgeSettings(BaseSettings):
     MT_BRIDGE_API_KEY: str | None = None
     MT_BRIDGE_PROVIDER_MODE: str = Field(default="mock", description="mock|mt5")
     MT_BRIDGE_DEFAULT_PLATFORM: str = Field(default="mt5", description="mt4|mt5")
-    MT_BRIDGE_MAX_SESSIONS: int = 20
+    MT_BRIDGE_SESSION_MODE: str = Field(default="inprocess", description="inprocess|process")
+    MT_BRIDGE_MAX_SESSIONS: int = 0  # 0 = auto: 20 in-process, cores x MT_BRIDGE_SESSIONS_PER_CPU in process mode
+    MT_BRIDGE_SESSIONS_PER_CPU: int = 2
+    MT_BRIDGE_WORKER_HEALTH_INTERVAL_SECONDS: float = 5.0
+    MT_BRIDGE_WORKER_RPC_TIMEOUT_SECONDS: float = 30.0
+    MT_BRIDGE_WORKER_CONNECT_TIMEOUT_SECONDS: float = 120.0
     MT_BRIDGE_TERMINAL_AUTO_LAUNCH: bool = False
     MT_BRIDGE_TERMINAL_SHUTDOWN_ON_DISCONNECT: bool = True
     MT_BRIDGE_TERMINAL_LAUNCH_TIMEOUT_SECONDS: float = 10.0
@@ -26,6 +32,22 @@ class BridgeSettings(BaseSettings):
     MT_BRIDGE_MT4_ADAPTER_TIMEOUT_SECONDS: float = 20.0
     MT_BRIDGE_MT5_AUTO_SERVER_DISCOVERY: bool = True
     MT_BRIDGE_MT5_SERVER_CANDIDATES: str | None = None
+    MT_BRIDGE_STREAM_POLL_INTERVAL_MS: int = 100
+    MT_BRIDGE_STREAM_HEARTBEAT_SECONDS: float = 5.0
+    MT_BRIDGE_STATE_POLL_INTERVAL_MS: int = 500
+    MT_BRIDGE_STATE_IDLE_SECONDS: float = 60.0
+
+    @property
+    def process_sessions(self) -> bool:
+        return (self.MT_BRIDGE_SESSION_MODE or "inprocess").strip().lower() == "process"
+
+    @property
+    def max_sessions(self) -> int:
+        if self.MT_BRIDGE_MAX_SESSIONS > 0:
+            return int(self.MT_BRIDGE_MAX_SESSIONS)
+        if self.process_sessions:
+            return max(1, (os.cpu_count() or 1) * max(1, int(self.MT_BRIDGE_SESSIONS_PER_CPU)))
+        return 20
 
 
 @lru_cache
@@ -1,11 +1,15 @@
+import importlib.util
 from datetime import datetime
 from typing import Any
 
 from fastapi import Depends, FastAPI, HTTPException, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 
+from src.account_state import stream_state_frames
+from src.candle_history import HISTORY_FORMATS, encode_history, history_page
 from src.config import BridgeSettings, get_settings
 from src.providers import BridgeProviderError
+from src.providers.base import parse_time_param
 from src.schemas import (
     ClosePositionRequest,
     ConnectSessionRequest,
@@ -16,7 +20,8 @@ from src.schemas import (
     SessionSnapshot,
 )
 from src.security import verify_bridge_api_key
-from src.session_manager import SessionManager
+from src.session_manager import BridgeSession, SessionManager
+from src.tick_stream import stream_frames
 
 
 def _first_non_empty(*values: str | None) -> str | None:
@@ -42,6 +47,12 @@ def _normalize_server_candidates(values: list[str] | None) -> list[str]:
     return result
 
 
+def _invalidate_state(session: BridgeSession) -> None:
+    # Trade calls change positions/orders: the next state read must not wait for the poll.
+    if session.state_tracker:
+        session.state_tracker.invalidate()
+
+
 def _mask_login(value: str) -> str:
     raw = (value or "").strip()
     if len(raw) <= 4:
@@ -76,13 +87,38 @@ async def health():
         "timestamp": datetime.utcnow().isoformat(),
         "provider_mode": settings.MT_BRIDGE_PROVIDER_MODE,
         "sessions": len(sessions),
-        "max_sessions": settings.MT_BRIDGE_MAX_SESSIONS,
+        "max_sessions": settings.max_sessions,
+        "session_mode": "process" if settings.process_sessions else "inprocess",
         "terminal_auto_launch": settings.MT_BRIDGE_TERMINAL_AUTO_LAUNCH,
         "mt4_adapter_configured": bool((settings.MT_BRIDGE_MT4_ADAPTER_BASE_URL or "").strip()),
         "mt5_auto_server_discovery": bool(settings.MT_BRIDGE_MT5_AUTO_SERVER_DISCOVERY),
     }
 
 
+# Optional endpoints clients may rely on without probing for 404s.
+BRIDGE_FEATURES = (
+    "prices_batch",
+    "stream_prices",
+    "symbol_specs",
+    "history",
+    "state_delta",
+    "stream_state",
+)
+
+
+@app.get("/api/v1/capabilities", dependencies=[Depends(verify_bridge_api_key)])
+async def capabilities():
+    features = list(BRIDGE_FEATURES)
+    if importlib.util.find_spec("msgpack") is not None:
+        features.append("history_msgpack")
+    return {
+        "version": app.version,
+        "features": features,
+        "session_mode": "process" if settings.process_sessions else "inprocess",
+        "max_sessions": settings.max_sessions,
+    }
+
+
 @app.get("/api/v1/sessions", response_model=list[SessionSnapshot], dependencies=[Depends(verify_bridge_api_key)])
 async def list_sessions():
     raw = await session_manager.list_sessions()
@@ -174,7 +210,10 @@ async def place_order(session_id: str, data: PlaceOrderRequest):
     try:
         session = await session_manager.get_session(session_id)
         payload = data.model_dump()
-        return await session.provider.place_order(payload)
+        try:
+            return await session.provider.place_order(payload)
+        finally:
+            _invalidate_state(session)
     except KeyError:
         raise _not_found(session_id)
     except BridgeProviderError as exc:
@@ -210,7 +249,10 @@ async def get_order(session_id: str, order_id: str):
 async def cancel_order(session_id: str, order_id: str):
     try:
         session = await session_manager.get_session(session_id)
-        ok = await session.provider.cancel_order(order_id)
+        try:
+            ok = await session.provider.cancel_order(order_id)
+        finally:
+            _invalidate_state(session)
         if not ok:
             raise HTTPException(status_code=404, detail=f"Order not found/cancellable: {order_id}")
         return GenericStatusResponse(status="success", detail="Order cancelled")
@@ -225,7 +267,10 @@ async def close_position(session_id: str, data: ClosePositionRequest):
     try:
         session = await session_manager.get_session(session_id)
         payload = data.model_dump(exclude_none=True)
-        return await session.provider.close_position(payload)
+        try:
+            return await session.provider.close_position(payload)
+        finally:
+            _invalidate_state(session)
     except KeyError:
         raise _not_found(session_id)
     except BridgeProviderError as exc:
@@ -237,7 +282,10 @@ async def modify_position(session_id: str, data: ModifyPositionRequest):
     try:
         session = await session_manager.get_session(session_id)
         payload = data.model_dump(exclude_none=True)
-        ok = await session.provider.modify_position(payload)
+        try:
+            ok = await session.provider.modify_position(payload)
+        finally:
+            _invalidate_state(session)
         if not ok:
             raise HTTPException(status_code=404, detail=f"Position not found for symbol: {data.symbol}")
         return GenericStatusResponse(status="success", detail="Position modified")
@@ -268,16 +316,100 @@ async def get_prices(
         selected = [s.strip() for s in (symbols or "").split(",") if s.strip()]
         if not selected:
             raise HTTPException(status_code=400, detail="symbols query parameter is required")
+        quotes = await session.provider.get_prices(list(dict.fromkeys(selected)))
         prices: dict[str, Any] = {}
-        for symbol in selected:
-            prices[symbol] = await session.provider.get_price(symbol)
-        return {"prices": prices}
+        errors: dict[str, str] = {}
+        for symbol, quote in quotes.items():
+            if "error" in quote:
+                errors[symbol] = str(quote["error"])
+            else:
+                prices[symbol] = quote
+        if not prices and errors:
+            raise BridgeProviderError("; ".join(f"{symbol}: {error}" for symbol, error in errors.items()))
+        return {"prices": prices, "errors": errors}
     except KeyError:
         raise _not_found(session_id)
     except BridgeProviderError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
 
 
+@app.get("/api/v1/sessions/{session_id}/symbols/specs", dependencies=[Depends(verify_bridge_api_key)])
+async def get_symbol_specs(
+    session_id: str,
+    symbols: str | None = Query(default=None, description="comma-separated symbols"),
+):
+    try:
+        session = await session_manager.get_session(session_id)
+        selected = [s.strip() for s in (symbols or "").split(",") if s.strip()]
+        if not selected:
+            raise HTTPException(status_code=400, detail="symbols query parameter is required")
+        raw = await session.provider.get_symbol_specs(list(dict.fromkeys(selected)))
+        specs: dict[str, Any] = {}
+        errors: dict[str, str] = {}
+        for symbol, spec in raw.items():
+            if "error" in spec:
+                errors[symbol] = str(spec["error"])
+            else:
+                specs[symbol] = spec
+        return {"specs": specs, "errors": errors}
+    except KeyError:
+        raise _not_found(session_id)
+    except BridgeProviderError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+
+@app.get("/api/v1/sessions/{session_id}/stream/prices", dependencies=[Depends(verify_bridge_api_key)])
+async def stream_prices(
+    session_id: str,
+    symbols: str | None = Query(default=None, description="comma-separated symbols"),
+):
+    try:
+        session = await session_manager.get_session(session_id)
+    except KeyError:
+        raise _not_found(session_id)
+    selected = list(dict.fromkeys(s.strip() for s in (symbols or "").split(",") if s.strip()))
+    if not selected:
+        raise HTTPException(status_code=400, detail="symbols query parameter is required")
+    hub = session_manager.get_tick_hub(session)
+    return StreamingResponse(
+        stream_frames(hub, selected, float(settings.MT_BRIDGE_STREAM_HEARTBEAT_SECONDS)),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.get("/api/v1/sessions/{session_id}/state", dependencies=[Depends(verify_bridge_api_key)])
+async def get_account_state(
+    session_id: str,
+    since: int | None = Query(default=None, ge=0, description="last version seen by the caller"),
+):
+    try:
+        session = await session_manager.get_session(session_id)
+        return await session_manager.get_state_tracker(session).state_since(since)
+    except KeyError:
+        raise _not_found(session_id)
+    except BridgeProviderError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+
+@app.get("/api/v1/sessions/{session_id}/stream/state", dependencies=[Depends(verify_bridge_api_key)])
+async def stream_account_state(session_id: str):
+    try:
+        session = await session_manager.get_session(session_id)
+        tracker = session_manager.get_state_tracker(session)
+        # Fail before the response starts if the terminal cannot be read.
+        await tracker.state_since(None)
+    except KeyError:
+        raise _not_found(session_id)
+    except BridgeProviderError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return StreamingResponse(
+        stream_state_frames(tracker, float(settings.MT_BRIDGE_STREAM_HEARTBEAT_SECONDS)),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.get("/api/v1/sessions/{session_id}/candles/{symbol}", dependencies=[Depends(verify_bridge_api_key)])
 async def get_candles(
     session_id: str,
@@ -306,6 +438,37 @@ async def get_candles(
         raise HTTPException(status_code=400, detail=str(exc))
 
 
+@app.get("/api/v1/sessions/{session_id}/history/{symbol}", dependencies=[Depends(verify_bridge_api_key)])
+async def get_candle_history(
+    session_id: str,
+    symbol: str,
+    timeframe: str = Query(default="M5"),
+    from_param: str | None = Query(default=None, alias="from"),
+    to_param: str | None = Query(default=None, alias="to"),
+    cursor: str | None = Query(default=None, description="next_cursor of the previous page"),
+    limit: int = Query(default=5000, ge=1, le=50000),
+    response_format: str = Query(default="json", alias="format"),
+):
+    if response_format not in HISTORY_FORMATS:
+        raise HTTPException(status_code=400, detail=f"format must be one of: {', '.join(HISTORY_FORMATS)}")
+    try:
+        session = await session_manager.get_session(session_id)
+        page = await history_page(
+            session.provider,
+            symbol=symbol,
+            timeframe=timeframe,
+            start=parse_time_param(_first_non_empty(cursor, from_param)),
+            end=parse_time_param(to_param),
+            limit=limit,
+        )
+        content, media_type = encode_history(page, response_format)
+        return Response(content=content, media_type=media_type)
+    except KeyError:
+        raise _not_found(session_id)
+    except BridgeProviderError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+
 @app.exception_handler(BridgeProviderError)
 async def _provider_error_handler(_, exc: BridgeProviderError):
     return JSONResponse(
@@ -1,11 +1,64 @@
+import asyncio
 from abc import ABC, abstractmethod
+from datetime import UTC, datetime
 from typing import Any
 
+TIMEFRAME_SECONDS = {
+    "M1": 60,
+    "M5": 300,
+    "M15": 900,
+    "M30": 1800,
+    "H1": 3600,
+    "H4": 14400,
+    "D": 86400,
+}
+
+# Columnar candle history: one array per field, ``t`` in epoch seconds.
+CANDLE_COLUMNS = ("t", "o", "h", "l", "c", "v")
+
 
 class BridgeProviderError(Exception):
     pass
 
 
+def timeframe_seconds(timeframe: str) -> int:
+    return TIMEFRAME_SECONDS.get((timeframe or "M5").upper(), 300)
+
+
+def parse_time_param(value: Any) -> datetime | None:
+    """Parse ISO-8601 or epoch (seconds or milliseconds) into an aware UTC datetime."""
+    if value is None or value == "":
+        return None
+    raw = str(value).strip()
+    try:
+        epoch = float(raw)
+    except ValueError:
+        try:
+            parsed = datetime.fromisoformat(raw)
+        except ValueError as exc:
+            raise BridgeProviderError(f"Invalid time value: {raw}") from exc
+        return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+    if epoch > 1e11:
+        epoch /= 1000.0
+    return datetime.fromtimestamp(epoch, tz=UTC)
+
+
+def candle_rows_to_columns(rows: list[dict[str, Any]]) -> dict[str, list]:
+    """Convert legacy per-bar dicts into ``CANDLE_COLUMNS`` arrays."""
+    columns: dict[str, list] = {name: [] for name in CANDLE_COLUMNS}
+    for row in rows:
+        ts = parse_time_param(row.get("timestamp", row.get("time")))
+        if ts is None:
+            continue
+        columns["t"].append(int(ts.timestamp()))
+        columns["o"].append(float(row.get("open", 0.0) or 0.0))
+        columns["h"].append(float(row.get("high", 0.0) or 0.0))
+        columns["l"].append(float(row.get("low", 0.0) or 0.0))
+        columns["c"].append(float(row.get("close", 0.0) or 0.0))
+        columns["v"].append(float(row.get("volume", 0.0) or 0.0))
+    return columns
+
+
 class BaseTerminalProvider(ABC):
     @property
     @abstractmethod
@@ -67,6 +120,70 @@ class BaseTerminalProvider(ABC):
     async def get_price(self, symbol: str) -> dict[str, Any]:
         raise NotImplementedError
 
+    async def get_prices(self, symbols: list[str]) -> dict[str, dict[str, Any]]:
+        """
+        Quotes for several symbols in one call.
+
+        Symbols that fail map to ``{"error": "..."}`` instead of aborting the batch.
+        Providers override this with a cheaper native batch when they have one.
+        """
+        results = await asyncio.gather(
+            *(self.get_price(symbol) for symbol in symbols),
+            return_exceptions=True,
+        )
+        prices: dict[str, dict[str, Any]] = {}
+        for symbol, result in zip(symbols, results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                prices[symbol] = {"error": str(result) or type(result).__name__}
+            else:
+                prices[symbol] = result
+        return prices
+
+    async def get_symbol_specs(self, symbols: list[str]) -> dict[str, dict[str, Any]]:
+        """
+        Trading specs (digits, tick size/value, volume limits, ...) for several symbols.
+
+        Keys follow the MetaApi-style names the backend already reads
+        (``tickValue``, ``contractSize``, ``minVolume``, ...). Symbols that fail
+        map to ``{"error": "..."}``.
+        """
+        raise BridgeProviderError(f"Symbol specifications are not supported by the {self.name} provider")
+
+    async def get_candle_history(
+        self,
+        *,
+        symbol: str,
+        timeframe: str,
+        start: datetime | None,
+        end: datetime,
+        limit: int,
+    ) -> dict[str, list]:
+        """
+        Bars with ``start <= t <= end`` as ``CANDLE_COLUMNS`` arrays, oldest first.
+
+        Without ``start`` these are the latest ``limit`` bars up to ``end``.
+        Providers override this with a native range query; the default goes
+        through ``get_candles`` and converts the rows.
+        """
+        rows = await self.get_candles(
+            symbol=symbol,
+            timeframe=timeframe,
+            count=limit,
+            from_time=start.isoformat() if start is not None else None,
+            to_time=end.isoformat(),
+        )
+        columns = candle_rows_to_columns(rows)
+        start_ts = int(start.timestamp()) if start is not None else None
+        end_ts = int(end.timestamp())
+        keep = sorted(
+            (i for i, ts in enumerate(columns["t"]) if (start_ts is None or start_ts <= ts) and ts <= end_ts),
+            key=lambda i: columns["t"][i],
+        )
+        keep = keep[:limit] if start is not None else keep[-limit:]
+        return {name: [values[i] for i in keep] for name, values in columns.items()}
+
     @abstractmethod
     async def get_candles(
         self,
@@ -1,9 +1,22 @@
 import random
 import uuid
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, datetime
+from itertools import islice
 from typing import Any
 
-from .base import BaseTerminalProvider
+from .base import (
+    CANDLE_COLUMNS,
+    BaseTerminalProvider,
+    parse_time_param,
+    timeframe_seconds,
+)
+
+
+def _market_open(ts: int) -> bool:
+    """FX hours: closed from Friday 22:00 to Sunday 22:00 UTC."""
+    moment = datetime.fromtimestamp(ts, tz=UTC)
+    weekday, hour = moment.weekday(), moment.hour
+    return not (weekday == 5 or (weekday == 4 and hour >= 22) or (weekday == 6 and hour < 22))
 
 
 class MockTerminalProvider(BaseTerminalProvider):
@@ -68,6 +81,33 @@ class MockTerminalProvider(BaseTerminalProvider):
         ask = round(mid + spread / 2, 6 if base < 10 else 3)
         return bid, ask
 
+    async def get_symbol_specs(self, symbols: list[str]) -> dict[str, dict[str, Any]]:
+        specs: dict[str, dict[str, Any]] = {}
+        for symbol in symbols:
+            normalized = symbol.upper().replace("/", "").replace("_", "")
+            forex = self._base_price(symbol) < 10
+            point = 0.000001 if forex else 0.001
+            contract_size = 100000.0 if forex else 100.0
+            specs[symbol] = {
+                "symbol": normalized,
+                "description": f"Mock {normalized}",
+                "digits": 6 if forex else 3,
+                "point": point,
+                "tickSize": point,
+                "tickValue": round(point * contract_size, 6),
+                "contractSize": contract_size,
+                "minVolume": 0.01,
+                "maxVolume": 100.0,
+                "volumeStep": 0.01,
+                "stopsLevel": 0,
+                "baseCurrency": normalized[:3],
+                "profitCurrency": normalized[3:6] or "USD",
+                "marginCurrency": normalized[:3],
+                "tradeMode": "SYMBOL_TRADE_MODE_FULL",
+                "fillingModes": ["SYMBOL_FILLING_FOK", "SYMBOL_FILLING_IOC"],
+            }
+        return specs
+
     async def get_account_info(self) -> dict[str, Any]:
         floating = sum(float(p.get("profit", 0.0) or 0.0) for p in self._positions)
         self._equity = self._balance + floating
@@ -194,6 +234,51 @@ class MockTerminalProvider(BaseTerminalProvider):
             "timestamp": datetime.now(UTC).isoformat(),
         }
 
+    async def get_prices(self, symbols: list[str]) -> dict[str, dict[str, Any]]:
+        timestamp = datetime.now(UTC).isoformat()
+        prices: dict[str, dict[str, Any]] = {}
+        for symbol in symbols:
+            bid, ask = self._tick(symbol)
+            prices[symbol] = {"symbol": symbol.upper(), "bid": bid, "ask": ask, "timestamp": timestamp}
+        return prices
+
+    def _bar_columns(
+        self,
+        symbol: str,
+        timeframe: str,
+        start: datetime | None,
+        end: datetime | None,
+        count: int,
+    ) -> dict[str, list]:
+        step = timeframe_seconds(timeframe)
+        end_ts = int((end or datetime.now(UTC)).timestamp()) // step * step
+        if start is None:
+            stamps: list[int] = []
+            ts = end_ts
+            while len(stamps) < count:
+                if _market_open(ts):
+                    stamps.append(ts)
+                ts -= step
+            stamps.reverse()
+        else:
+            first_ts = -(-int(start.timestamp()) // step) * step
+            stamps = list(islice((ts for ts in range(first_ts, end_ts + 1, step) if _market_open(ts)), count))
+        base = self._base_price(symbol)
+        digits = 6 if base < 10 else 3
+        columns: dict[str, list] = {name: [] for name in CANDLE_COLUMNS}
+        for ts in stamps:
+            open_px = base + self._rng.uniform(-0.002, 0.002) * base / 100
+            high_px = open_px + abs(self._rng.uniform(0.0002, 0.0012) * base / 100)
+            low_px = open_px - abs(self._rng.uniform(0.0002, 0.0012) * base / 100)
+            close_px = low_px + (high_px - low_px) * self._rng.random()
+            columns["t"].append(ts)
+            columns["o"].append(round(open_px, digits))
+            columns["h"].append(round(high_px, digits))
+            columns["l"].append(round(low_px, digits))
+            columns["c"].append(round(close_px, digits))
+            columns["v"].append(int(abs(self._rng.gauss(1500, 350))))
+        return columns
+
     async def get_candles(
         self,
         *,
@@ -203,30 +288,35 @@ class MockTerminalProvider(BaseTerminalProvider):
         from_time: str | None = None,
         to_time: str | None = None,
     ) -> list[dict[str, Any]]:
-        _ = from_time, to_time
         safe_count = max(1, min(int(count or 100), 2000))
-        now = datetime.now(UTC)
-        tf_map = {"M1": 1, "M5": 5, "M15": 15, "M30": 30, "H1": 60, "H4": 240, "D": 1440}
-        minutes = tf_map.get(str(timeframe).upper(), 5)
+        columns = self._bar_columns(
+            symbol,
+            timeframe,
+            parse_time_param(from_time),
+            parse_time_param(to_time),
+            safe_count,
+        )
+        return [
+            {
+                "symbol": symbol.upper(),
+                "timestamp": datetime.fromtimestamp(ts, tz=UTC).isoformat(),
+                "open": o,
+                "high": h,
+                "low": low,
+                "close": c,
+                "volume": v,
+                "timeframe": timeframe,
+            }
+            for ts, o, h, low, c, v in zip(*(columns[name] for name in CANDLE_COLUMNS))
+        ]
 
-        bars: list[dict[str, Any]] = []
-        base = self._base_price(symbol)
-        for i in range(safe_count):
-            ts = now - timedelta(minutes=(safe_count - i) * minutes)
-            open_px = base + self._rng.uniform(-0.002, 0.002) * base / 100
-            high_px = open_px + abs(self._rng.uniform(0.0002, 0.0012) * base / 100)
-            low_px = open_px - abs(self._rng.uniform(0.0002, 0.0012) * base / 100)
-            close_px = low_px + (high_px - low_px) * self._rng.random()
-            bars.append(
-                {
-                    "symbol": symbol.upper(),
-                    "timestamp": ts.isoformat(),
-                    "open": round(open_px, 6 if base < 10 else 3),
-                    "high": round(high_px, 6 if base < 10 else 3),
-                    "low": round(low_px, 6 if base < 10 else 3),
-                    "close": round(close_px, 6 if base < 10 else 3),
-                    "volume": int(abs(self._rng.gauss(1500, 350))),
-                    "timeframe": timeframe,
-                }
-            )
-        return bars
+    async def get_candle_history(
+        self,
+        *,
+        symbol: str,
+        timeframe: str,
+        start: datetime | None,
+        end: datetime,
+        limit: int,
+    ) -> dict[str, list]:
+        return self._bar_columns(symbol, timeframe, start, end, limit)
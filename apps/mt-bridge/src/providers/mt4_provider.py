@@ -36,6 +36,7 @@ class MT4TerminalProvider(BaseTerminalProvider):
         self._timeout = max(float(settings.MT_BRIDGE_MT4_ADAPTER_TIMEOUT_SECONDS), 5.0)
         self._session_id: str | None = None
         self._client: httpx.AsyncClient | None = None
+        self._bulk_prices_supported = True
 
     @property
     def name(self) -> str:
@@ -233,6 +234,33 @@ class MT4TerminalProvider(BaseTerminalProvider):
         )
         return payload if isinstance(payload, dict) else {"raw": payload}
 
+    async def get_prices(self, symbols: list[str]) -> dict[str, dict[str, Any]]:
+        if self._bulk_prices_supported:
+            try:
+                payload = await self._request(
+                    "GET",
+                    self._session_endpoint("/api/v1/sessions/{session_id}/prices"),
+                    params={"symbols": ",".join(symbols)},
+                )
+            except BridgeProviderError as exc:
+                if "(404)" not in str(exc) and "(405)" not in str(exc):
+                    raise
+                # Adapter without a bulk endpoint: fall back to concurrent single quotes.
+                self._bulk_prices_supported = False
+            else:
+                quotes = _pick(payload, ["prices"], {})
+                errors = _pick(payload, ["errors"], {})
+                prices: dict[str, dict[str, Any]] = {}
+                for symbol in symbols:
+                    quote = quotes.get(symbol) if isinstance(quotes, dict) else None
+                    if isinstance(quote, dict):
+                        prices[symbol] = quote
+                    else:
+                        error = errors.get(symbol) if isinstance(errors, dict) else None
+                        prices[symbol] = {"error": str(error or "No quote returned by MT4 adapter")}
+                return prices
+        return await super().get_prices(symbols)
+
     async def get_candles(
         self,
         *,
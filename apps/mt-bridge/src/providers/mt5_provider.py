@@ -1,11 +1,26 @@
 import asyncio
 import re
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from src.config import BridgeSettings
 
-from .base import BaseTerminalProvider, BridgeProviderError
+from .base import (
+    CANDLE_COLUMNS,
+    BaseTerminalProvider,
+    BridgeProviderError,
+    parse_time_param,
+    timeframe_seconds,
+)
+
+# MT5 symbol_info().trade_mode -> MetaApi-style names used by the backend.
+_TRADE_MODES = {
+    0: "SYMBOL_TRADE_MODE_DISABLED",
+    1: "SYMBOL_TRADE_MODE_LONGONLY",
+    2: "SYMBOL_TRADE_MODE_SHORTONLY",
+    3: "SYMBOL_TRADE_MODE_CLOSEONLY",
+    4: "SYMBOL_TRADE_MODE_FULL",
+}
 
 
 class MT5TerminalProvider(BaseTerminalProvider):
@@ -25,6 +40,10 @@ class MT5TerminalProvider(BaseTerminalProvider):
         self._server = ""
         self._platform = "mt5"
         self._mt5: Any = None
+        # Requested symbol -> selected terminal symbol (symbol_select done once)
+        self._selected_symbols: dict[str, str] = {}
+        # Selected terminal symbol -> spec built from symbol_info (static per session)
+        self._symbol_specs: dict[str, dict[str, Any]] = {}
 
     @property
     def name(self) -> str:
@@ -180,6 +199,8 @@ class MT5TerminalProvider(BaseTerminalProvider):
             self._login = resolved_login
             self._server = resolved_server
             self._platform = platform
+            self._selected_symbols.clear()
+            self._symbol_specs.clear()
             self._connected = True
             return
 
@@ -192,6 +213,8 @@ class MT5TerminalProvider(BaseTerminalProvider):
         if self._mt5 and self._connected:
             await asyncio.to_thread(self._mt5.shutdown)
         self._connected = False
+        self._selected_symbols.clear()
+        self._symbol_specs.clear()
 
     async def get_account_info(self) -> dict[str, Any]:
         if not self._connected or not self._mt5:
@@ -220,20 +243,89 @@ class MT5TerminalProvider(BaseTerminalProvider):
             "server": self._server,
         }
 
-    async def _ensure_symbol(self, symbol: str) -> str:
-        if not self._connected or not self._mt5:
-            raise BridgeProviderError("MT5 provider not connected")
+    def _select_symbol_sync(self, symbol: str) -> str:
+        """Select ``symbol`` in Market Watch (blocking); cached per session."""
+        cached = self._selected_symbols.get(symbol)
+        if cached:
+            return cached
         mt5 = self._mt5
         normalized = symbol.upper().replace("/", "").replace("_", "")
-        selected = await asyncio.to_thread(mt5.symbol_select, normalized, True)
-        if not selected:
+        if mt5.symbol_select(normalized, True):
+            resolved = normalized
+        else:
             # Best effort fallback: check original variant
             original = symbol.upper().replace("_", "/")
-            selected = await asyncio.to_thread(mt5.symbol_select, original, True)
-            if selected:
-                return original
-            raise BridgeProviderError(f"MT5 symbol not available/selectable: {symbol}")
-        return normalized
+            if not mt5.symbol_select(original, True):
+                raise BridgeProviderError(f"MT5 symbol not available/selectable: {symbol}")
+            resolved = original
+        self._selected_symbols[symbol] = resolved
+        return resolved
+
+    async def _ensure_symbol(self, symbol: str) -> str:
+        if not self._connected or not self._mt5:
+            raise BridgeProviderError("MT5 provider not connected")
+        cached = self._selected_symbols.get(symbol)
+        if cached:
+            return cached
+        return await asyncio.to_thread(self._select_symbol_sync, symbol)
+
+    def _spec_from_info(self, symbol: str, info: dict[str, Any]) -> dict[str, Any]:
+        filling = int(info.get("filling_mode", 0) or 0)
+        trade_mode = info.get("trade_mode")
+        filling_modes = []
+        if filling & 1:
+            filling_modes.append("SYMBOL_FILLING_FOK")
+        if filling & 2:
+            filling_modes.append("SYMBOL_FILLING_IOC")
+        return {
+            "symbol": symbol,
+            "description": str(info.get("description", "") or ""),
+            "digits": int(info.get("digits", 0) or 0),
+            "point": float(info.get("point", 0.0) or 0.0),
+            "tickSize": float(info.get("trade_tick_size", 0.0) or 0.0),
+            "tickValue": float(info.get("trade_tick_value", 0.0) or 0.0),
+            "contractSize": float(info.get("trade_contract_size", 0.0) or 0.0),
+            "minVolume": float(info.get("volume_min", 0.0) or 0.0),
+            "maxVolume": float(info.get("volume_max", 0.0) or 0.0),
+            "volumeStep": float(info.get("volume_step", 0.0) or 0.0),
+            "stopsLevel": int(info.get("trade_stops_level", 0) or 0),
+            "baseCurrency": str(info.get("currency_base", "") or ""),
+            "profitCurrency": str(info.get("currency_profit", "") or ""),
+            "marginCurrency": str(info.get("currency_margin", "") or ""),
+            "tradeMode": _TRADE_MODES.get(int(trade_mode if trade_mode is not None else 4), "SYMBOL_TRADE_MODE_FULL"),
+            "fillingModes": filling_modes,
+        }
+
+    def _spec_sync(self, symbol: str) -> dict[str, Any]:
+        """Select ``symbol`` and return its cached spec (blocking)."""
+        selected_symbol = self._select_symbol_sync(symbol)
+        spec = self._symbol_specs.get(selected_symbol)
+        if spec is None:
+            info = self._asdict(self._mt5.symbol_info(selected_symbol))
+            if not info:
+                raise BridgeProviderError(f"MT5 symbol_info unavailable for {selected_symbol}")
+            spec = self._spec_from_info(selected_symbol, info)
+            self._symbol_specs[selected_symbol] = spec
+        return spec
+
+    def _specs_sync(self, symbols: list[str]) -> dict[str, dict[str, Any]]:
+        specs: dict[str, dict[str, Any]] = {}
+        for symbol in symbols:
+            try:
+                specs[symbol] = self._spec_sync(symbol)
+            except Exception as exc:
+                specs[symbol] = {"error": str(exc)}
+        return specs
+
+    async def get_symbol_specs(self, symbols: list[str]) -> dict[str, dict[str, Any]]:
+        if not self._connected or not self._mt5:
+            raise BridgeProviderError("MT5 provider not connected")
+        return await asyncio.to_thread(self._specs_sync, symbols)
+
+    def _trade_context_sync(self, symbol: str) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Spec and current tick for an order in one executor hop."""
+        spec = self._spec_sync(symbol)
+        return spec, self._asdict(self._mt5.symbol_info_tick(spec["symbol"]))
 
     async def get_positions(self) -> list[dict[str, Any]]:
         if not self._connected or not self._mt5:
@@ -281,15 +373,14 @@ class MT5TerminalProvider(BaseTerminalProvider):
             raise BridgeProviderError("MT5 provider not connected")
         mt5 = self._mt5
 
-        symbol = await self._ensure_symbol(str(payload.get("symbol", "")))
         side = str(payload.get("side", "buy")).lower()
         order_type = str(payload.get("order_type", "market")).lower()
         volume = float(payload.get("volume", 0.0) or 0.0)
         if volume <= 0:
             return {"status": "rejected", "message": "Volume must be > 0"}
 
-        tick = await asyncio.to_thread(mt5.symbol_info_tick, symbol)
-        tick_data = self._asdict(tick)
+        spec, tick_data = await asyncio.to_thread(self._trade_context_sync, str(payload.get("symbol", "")))
+        symbol = spec["symbol"]
         bid = float(tick_data.get("bid", 0.0) or 0.0)
         ask = float(tick_data.get("ask", 0.0) or 0.0)
         if bid <= 0 or ask <= 0:
@@ -425,9 +516,8 @@ class MT5TerminalProvider(BaseTerminalProvider):
         close_volume = min(close_volume, position_volume)
         pos_type = int(pos.get("type", 0) or 0)
 
-        selected_symbol = await self._ensure_symbol(symbol)
-        tick = await asyncio.to_thread(mt5.symbol_info_tick, selected_symbol)
-        tick_data = self._asdict(tick)
+        spec, tick_data = await asyncio.to_thread(self._trade_context_sync, symbol)
+        selected_symbol = spec["symbol"]
         bid = float(tick_data.get("bid", 0.0) or 0.0)
         ask = float(tick_data.get("ask", 0.0) or 0.0)
         side_close = int(getattr(mt5, "ORDER_TYPE_SELL", 1)) if pos_type == int(getattr(mt5, "POSITION_TYPE_BUY", 0)) else int(getattr(mt5, "ORDER_TYPE_BUY", 0))
@@ -491,16 +581,14 @@ class MT5TerminalProvider(BaseTerminalProvider):
             int(getattr(mt5, "TRADE_RETCODE_PLACED", -1)),
         }
 
-    async def get_price(self, symbol: str) -> dict[str, Any]:
-        if not self._connected or not self._mt5:
-            raise BridgeProviderError("MT5 provider not connected")
-        mt5 = self._mt5
-        selected_symbol = await self._ensure_symbol(symbol)
-        tick = await asyncio.to_thread(mt5.symbol_info_tick, selected_symbol)
-        data = self._asdict(tick)
+    def _quote_sync(self, symbol: str) -> dict[str, Any]:
+        selected_symbol = self._select_symbol_sync(symbol)
+        data = self._asdict(self._mt5.symbol_info_tick(selected_symbol))
         bid = float(data.get("bid", 0.0) or 0.0)
         ask = float(data.get("ask", 0.0) or 0.0)
         if bid <= 0 or ask <= 0:
+            # Symbol may have been removed from Market Watch: reselect next time.
+            self._selected_symbols.pop(symbol, None)
             raise BridgeProviderError(f"No valid tick for {selected_symbol}")
         return {
             "symbol": selected_symbol,
@@ -509,6 +597,26 @@ class MT5TerminalProvider(BaseTerminalProvider):
             "timestamp": datetime.now(UTC).isoformat(),
         }
 
+    def _quotes_sync(self, symbols: list[str]) -> dict[str, dict[str, Any]]:
+        prices: dict[str, dict[str, Any]] = {}
+        for symbol in symbols:
+            try:
+                prices[symbol] = self._quote_sync(symbol)
+            except Exception as exc:
+                prices[symbol] = {"error": str(exc)}
+        return prices
+
+    async def get_price(self, symbol: str) -> dict[str, Any]:
+        if not self._connected or not self._mt5:
+            raise BridgeProviderError("MT5 provider not connected")
+        return await asyncio.to_thread(self._quote_sync, symbol)
+
+    async def get_prices(self, symbols: list[str]) -> dict[str, dict[str, Any]]:
+        if not self._connected or not self._mt5:
+            raise BridgeProviderError("MT5 provider not connected")
+        # One executor hop for the whole batch instead of select + tick per symbol.
+        return await asyncio.to_thread(self._quotes_sync, symbols)
+
     def _map_timeframe(self, tf: str) -> int:
         mt5 = self._mt5
         mapping = {
@@ -522,6 +630,71 @@ class MT5TerminalProvider(BaseTerminalProvider):
         }
         return mapping.get((tf or "M5").upper(), int(getattr(mt5, "TIMEFRAME_M5", 5)))
 
+    def _rates_columns(self, rates: Any) -> dict[str, list]:
+        """Columns straight from ``copy_rates_*`` output (numpy structured array), no per-bar dicts."""
+        if rates is None or len(rates) == 0:
+            return {name: [] for name in CANDLE_COLUMNS}
+        names = getattr(getattr(rates, "dtype", None), "names", None)
+        if names:
+            volume_field = "tick_volume" if "tick_volume" in names else "real_volume"
+            return {
+                "t": rates["time"].astype("int64").tolist(),
+                "o": rates["open"].astype(float).tolist(),
+                "h": rates["high"].astype(float).tolist(),
+                "l": rates["low"].astype(float).tolist(),
+                "c": rates["close"].astype(float).tolist(),
+                "v": rates[volume_field].astype(float).tolist(),
+            }
+        rows = [self._asdict(rate) for rate in rates]
+        return {
+            "t": [int(row.get("time", 0) or 0) for row in rows],
+            "o": [float(row.get("open", 0.0) or 0.0) for row in rows],
+            "h": [float(row.get("high", 0.0) or 0.0) for row in rows],
+            "l": [float(row.get("low", 0.0) or 0.0) for row in rows],
+            "c": [float(row.get("close", 0.0) or 0.0) for row in rows],
+            "v": [float(row.get("tick_volume", row.get("real_volume", 0.0)) or 0.0) for row in rows],
+        }
+
+    def _rates_sync(
+        self,
+        symbol: str,
+        tf: int,
+        start: datetime | None,
+        end: datetime | None,
+        count: int,
+    ) -> dict[str, list]:
+        mt5 = self._mt5
+        if start is None and end is None:
+            rates = mt5.copy_rates_from_pos(symbol, tf, 0, count)
+        elif start is None:
+            # Latest ``count`` bars up to ``end``.
+            rates = mt5.copy_rates_from(symbol, tf, end, count)
+        else:
+            rates = mt5.copy_rates_range(symbol, tf, start, end or datetime.now(UTC))
+        columns = self._rates_columns(rates)
+        if start is not None and len(columns["t"]) > count:
+            columns = {name: values[:count] for name, values in columns.items()}
+        return columns
+
+    def _first_rates_sync(
+        self,
+        symbol: str,
+        tf: int,
+        start: datetime,
+        count: int,
+        step: int,
+    ) -> dict[str, list]:
+        """First ``count`` bars from ``start`` without copying everything up to now."""
+        now = datetime.now(UTC)
+        span = timedelta(seconds=step * count)
+        while True:
+            # Closures (weekends, holidays, session breaks) leave slots empty: widen until enough bars.
+            end = min(now, start + span)
+            columns = self._rates_columns(self._mt5.copy_rates_range(symbol, tf, start, end))
+            if len(columns["t"]) >= count or end >= now:
+                return {name: values[:count] for name, values in columns.items()}
+            span *= 2
+
     async def get_candles(
         self,
         *,
@@ -531,31 +704,56 @@ class MT5TerminalProvider(BaseTerminalProvider):
         from_time: str | None = None,
         to_time: str | None = None,
     ) -> list[dict[str, Any]]:
-        _ = from_time, to_time
         if not self._connected or not self._mt5:
             raise BridgeProviderError("MT5 provider not connected")
-        mt5 = self._mt5
         selected_symbol = await self._ensure_symbol(symbol)
         tf = self._map_timeframe(timeframe)
         safe_count = max(1, min(int(count or 100), 2000))
-        rates = await asyncio.to_thread(mt5.copy_rates_from_pos, selected_symbol, tf, 0, safe_count)
-        if rates is None:
-            return []
-
-        result: list[dict[str, Any]] = []
-        for rate in rates:
-            row = self._asdict(rate)
-            ts_value = int(row.get("time", 0) or 0)
-            result.append(
-                {
-                    "symbol": selected_symbol,
-                    "timestamp": datetime.fromtimestamp(ts_value, tz=UTC).isoformat() if ts_value else datetime.now(UTC).isoformat(),
-                    "open": float(row.get("open", 0.0) or 0.0),
-                    "high": float(row.get("high", 0.0) or 0.0),
-                    "low": float(row.get("low", 0.0) or 0.0),
-                    "close": float(row.get("close", 0.0) or 0.0),
-                    "volume": float(row.get("tick_volume", row.get("real_volume", 0.0)) or 0.0),
-                    "timeframe": timeframe,
-                }
+        start = parse_time_param(from_time)
+        end = parse_time_param(to_time)
+        if start is not None and end is None:
+            columns = await asyncio.to_thread(
+                self._first_rates_sync,
+                selected_symbol,
+                tf,
+                start,
+                safe_count,
+                timeframe_seconds(timeframe),
             )
-        return result
+        else:
+            columns = await asyncio.to_thread(
+                self._rates_sync,
+                selected_symbol,
+                tf,
+                start,
+                end,
+                safe_count,
+            )
+        return [
+            {
+                "symbol": selected_symbol,
+                "timestamp": datetime.fromtimestamp(ts, tz=UTC).isoformat(),
+                "open": o,
+                "high": h,
+                "low": low,
+                "close": c,
+                "volume": v,
+                "timeframe": timeframe,
+            }
+            for ts, o, h, low, c, v in zip(*(columns[name] for name in CANDLE_COLUMNS))
+        ]
+
+    async def get_candle_history(
+        self,
+        *,
+        symbol: str,
+        timeframe: str,
+        start: datetime | None,
+        end: datetime,
+        limit: int,
+    ) -> dict[str, list]:
+        if not self._connected or not self._mt5:
+            raise BridgeProviderError("MT5 provider not connected")
+        selected_symbol = await self._ensure_symbol(symbol)
+        tf = self._map_timeframe(timeframe)
+        return await asyncio.to_thread(self._rates_sync, selected_symbol, tf, start, end, limit)
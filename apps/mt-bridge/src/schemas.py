@@ -36,6 +36,8 @@ class SessionSnapshot(BaseModel):
     provider: str
     terminal_pid: int | None = None
     terminal_managed: bool = False
+    worker_pid: int | None = None
+    worker_restarts: int = 0
 
 
 class PlaceOrderRequest(BaseModel):
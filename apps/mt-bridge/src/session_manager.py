@@ -4,9 +4,12 @@ from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
 
+from src.account_state import AccountStateTracker
 from src.config import BridgeSettings
 from src.providers import BaseTerminalProvider, BridgeProviderError, create_provider
+from src.session_worker import WorkerTerminalProvider
 from src.terminal_manager import ManagedTerminal, TerminalManager
+from src.tick_stream import TickHub
 
 
 @dataclass
@@ -19,8 +22,11 @@ class BridgeSession:
     last_seen_at: datetime
     provider: BaseTerminalProvider
     managed_terminal: ManagedTerminal | None = None
+    tick_hub: TickHub | None = None
+    state_tracker: AccountStateTracker | None = None
 
     def snapshot(self) -> dict[str, Any]:
+        worker = self.provider if isinstance(self.provider, WorkerTerminalProvider) else None
         return {
             "session_id": self.session_id,
             "platform": self.platform,
@@ -31,15 +37,42 @@ class BridgeSession:
             "provider": self.provider.name,
             "terminal_pid": self.managed_terminal.pid if self.managed_terminal else None,
             "terminal_managed": bool(self.managed_terminal),
+            "worker_pid": worker.pid if worker else None,
+            "worker_restarts": worker.restarts if worker else 0,
         }
 
 
+def _same_account(login: str, server: str, other_login: str, other_server: str) -> bool:
+    """Same login on the same server; a missing server on either side matches any."""
+    server = server.strip().lower()
+    other_server = other_server.strip().lower()
+    return bool(login and other_login == login) and (not server or not other_server or server == other_server)
+
+
+# Consecutive failed pings before an alive-but-stuck session worker is recycled.
+_MAX_MISSED_PINGS = 3
+
+
 class SessionManager:
     def __init__(self, settings: BridgeSettings):
         self.settings = settings
         self._sessions: dict[str, BridgeSession] = {}
         self._lock = asyncio.Lock()
         self._terminal_manager = TerminalManager(settings=settings)
+        # Sessions whose worker is still logging in (process mode, counted against the limit).
+        self._connecting = 0
+        # (provider, login, server) -> future of the worker login in progress for that account.
+        self._logins_in_flight: dict[tuple[str, str, str], asyncio.Future] = {}
+        self._supervisor_task: asyncio.Task | None = None
+
+    def _new_provider(self, platform: str) -> BaseTerminalProvider:
+        if self.settings.process_sessions:
+            return WorkerTerminalProvider(
+                platform=platform,
+                settings=self.settings,
+                worker_key=uuid.uuid4().hex[:8],
+            )
+        return create_provider(platform=platform, settings=self.settings)
 
     async def create_session(
         self,
@@ -53,103 +86,165 @@ class SessionManager:
         workspace_id: str | None = None,
         server_candidates: list[str] | None = None,
     ) -> tuple[BridgeSession, bool]:
+        requested_login = str(login or "").strip()
+        requested_server = str(server or "").strip().lower()
+        pending_login: asyncio.Future | None = None
         async with self._lock:
-            if len(self._sessions) >= int(self.settings.MT_BRIDGE_MAX_SESSIONS):
-                raise BridgeProviderError(
-                    f"Max sessions reached ({self.settings.MT_BRIDGE_MAX_SESSIONS})"
-                )
-
-            provider = create_provider(platform=platform, settings=self.settings)
+            provider = self._new_provider(platform)
             safe_platform = (platform or self.settings.MT_BRIDGE_DEFAULT_PLATFORM or "mt5").strip().lower()
-            managed_terminal: ManagedTerminal | None = None
-
-            # MT5 package binding is process-global; keep one active MT5 session per bridge process.
-            if provider.name == "mt5":
-                existing_mt5 = [s for s in self._sessions.values() if s.provider.name == "mt5"]
-                if existing_mt5:
-                    existing = existing_mt5[0]
-                    requested_login = str(login or "").strip()
-                    requested_server = str(server or "").strip().lower()
+
+            # MT5 package binding is process-global; in-process mode keeps one active MT5 session.
+            # Process mode runs one worker per account: identical logins are reused for any provider.
+            if provider.name == "mt5" or self.settings.process_sessions:
+                for existing in [s for s in self._sessions.values() if s.provider.name == provider.name]:
                     active_login = str(existing.login or "").strip()
                     active_server = str(existing.server or "").strip()
-                    active_server_lower = active_server.lower()
-
-                    same_login = bool(requested_login and active_login == requested_login)
-                    same_server = (
-                        not requested_server
-                        or not active_server_lower
-                        or active_server_lower == requested_server
-                    )
 
-                    if same_login and same_server:
+                    if _same_account(requested_login, requested_server, active_login, active_server):
                         existing.last_seen_at = datetime.now(UTC)
                         return existing, True
 
+                    if not self.settings.process_sessions:
+                        raise BridgeProviderError(
+                            "MT5 provider mode currently supports one active session per bridge process. "
+                            f"Active session login={active_login or '<unknown>'}, "
+                            f"server={active_server or '<unknown>'}. "
+                            "Disconnect current session first or set MT_BRIDGE_SESSION_MODE=process."
+                        )
+
+            if self.settings.process_sessions:
+                # Same account already logging in: wait for that worker instead of spawning another.
+                pending_login = next(
+                    (
+                        future
+                        for (pending_name, other_login, other_server), future in self._logins_in_flight.items()
+                        if pending_name == provider.name
+                        and _same_account(requested_login, requested_server, other_login, other_server)
+                    ),
+                    None,
+                )
+
+            if pending_login is None:
+                if len(self._sessions) + self._connecting >= self.settings.max_sessions:
                     raise BridgeProviderError(
-                        "MT5 provider mode currently supports one active session per bridge process. "
-                        f"Active session login={active_login or '<unknown>'}, "
-                        f"server={active_server or '<unknown>'}. "
-                        "Disconnect current session first or use a dedicated bridge node/process."
+                        f"Max sessions reached ({self.settings.max_sessions})"
                     )
 
-            if self.settings.MT_BRIDGE_TERMINAL_AUTO_LAUNCH and terminal_path:
-                managed_terminal = await self._terminal_manager.launch_terminal(
-                    terminal_path=terminal_path,
-                    platform=safe_platform,
-                    login=login,
-                    server=str(server or "").strip(),
-                    data_path=data_path,
-                    workspace_id=workspace_id,
-                )
+                open_kwargs: dict[str, Any] = {
+                    "platform": safe_platform,
+                    "login": login,
+                    "password": password,
+                    "server": server,
+                    "terminal_path": terminal_path,
+                    "data_path": data_path,
+                    "workspace_id": workspace_id,
+                    "server_candidates": server_candidates,
+                }
+                if not self.settings.process_sessions:
+                    return await self._open_session(provider, **open_kwargs)
+                # Worker logins run outside the lock so sessions connect in parallel.
+                self._connecting += 1
+                login_key = (provider.name, requested_login, requested_server)
+                login_done: asyncio.Future = asyncio.get_running_loop().create_future()
+                if requested_login:
+                    self._logins_in_flight[login_key] = login_done
 
-            try:
-                await provider.connect(
-                    login=login,
-                    password=password,
-                    server=server,
-                    platform=safe_platform,
-                    terminal_path=terminal_path,
-                    data_path=data_path,
-                    workspace_id=workspace_id,
-                    server_candidates=server_candidates,
-                )
-            except Exception:
-                if managed_terminal:
-                    try:
-                        await self._terminal_manager.stop_terminal(managed_terminal)
-                    except Exception:
-                        pass
-                raise
-            resolved_login = str(login or "").strip()
-            resolved_server = str(server or "").strip()
-            try:
-                account_info = await provider.get_account_info()
-                resolved_login = str(
-                    account_info.get("login")
-                    or account_info.get("accountId")
-                    or resolved_login
-                ).strip()
-                resolved_server = str(
-                    account_info.get("server")
-                    or account_info.get("server_name")
-                    or resolved_server
-                ).strip()
-            except Exception:
-                pass
-            now = datetime.now(UTC)
-            session_id = f"sess_{uuid.uuid4().hex}"
-            session = BridgeSession(
-                session_id=session_id,
-                platform=safe_platform,
-                login=resolved_login or login,
-                server=resolved_server,
-                connected_at=now,
-                last_seen_at=now,
-                provider=provider,
-                managed_terminal=managed_terminal,
+        if pending_login is not None:
+            # Shielded: a caller that gives up must not cancel the login it is waiting on.
+            session, _ = await asyncio.shield(pending_login)
+            session.last_seen_at = datetime.now(UTC)
+            return session, True
+
+        self._ensure_supervisor()
+        try:
+            result = await self._open_session(provider, **open_kwargs)
+            login_done.set_result(result)
+            return result
+        except Exception as exc:
+            login_done.set_exception(exc)
+            raise
+        finally:
+            if not login_done.done():
+                # Cancelled mid-login: release the waiters with an error.
+                login_done.set_exception(BridgeProviderError(f"Login for {requested_login} was aborted"))
+            # Marks the outcome as retrieved, so a failed login nobody waited on logs no warning.
+            login_done.exception()
+            self._connecting -= 1
+            if self._logins_in_flight.get(login_key) is login_done:
+                del self._logins_in_flight[login_key]
+
+    async def _open_session(
+        self,
+        provider: BaseTerminalProvider,
+        *,
+        platform: str,
+        login: str,
+        password: str,
+        server: str | None,
+        terminal_path: str | None,
+        data_path: str | None,
+        workspace_id: str | None,
+        server_candidates: list[str] | None,
+    ) -> tuple[BridgeSession, bool]:
+        managed_terminal: ManagedTerminal | None = None
+        if self.settings.MT_BRIDGE_TERMINAL_AUTO_LAUNCH and terminal_path:
+            managed_terminal = await self._terminal_manager.launch_terminal(
+                terminal_path=terminal_path,
+                platform=platform,
+                login=login,
+                server=str(server or "").strip(),
+                data_path=data_path,
+                workspace_id=workspace_id,
+            )
+
+        try:
+            await provider.connect(
+                login=login,
+                password=password,
+                server=server,
+                platform=platform,
+                terminal_path=terminal_path,
+                data_path=data_path,
+                workspace_id=workspace_id,
+                server_candidates=server_candidates,
             )
-            self._sessions[session_id] = session
-            return session, False
+        except Exception:
+            if managed_terminal:
+                try:
+                    await self._terminal_manager.stop_terminal(managed_terminal)
+                except Exception:
+                    pass
+            raise
+        resolved_login = str(login or "").strip()
+        resolved_server = str(server or "").strip()
+        try:
+            account_info = await provider.get_account_info()
+            resolved_login = str(
+                account_info.get("login")
+                or account_info.get("accountId")
+                or resolved_login
+            ).strip()
+            resolved_server = str(
+                account_info.get("server")
+                or account_info.get("server_name")
+                or resolved_server
+            ).strip()
+        except Exception:
+            pass
+        now = datetime.now(UTC)
+        session_id = f"sess_{uuid.uuid4().hex}"
+        session = BridgeSession(
+            session_id=session_id,
+            platform=platform,
+            login=resolved_login or login,
+            server=resolved_server,
+            connected_at=now,
+            last_seen_at=now,
+            provider=provider,
+            managed_terminal=managed_terminal,
+        )
+        self._sessions[session_id] = session
+        return session, False
 
     async def disconnect_session(self, session_id: str) -> bool:
         async with self._lock:
@@ -157,6 +252,10 @@ class SessionManager:
         if not session:
             return False
 
+        if session.tick_hub:
+            await session.tick_hub.close()
+        if session.state_tracker:
+            await session.state_tracker.close()
         try:
             await session.provider.disconnect()
         finally:
@@ -164,11 +263,57 @@ class SessionManager:
                 await self._terminal_manager.stop_terminal(session.managed_terminal)
         return True
 
+    def _ensure_supervisor(self) -> None:
+        if self._supervisor_task is None or self._supervisor_task.done():
+            self._supervisor_task = asyncio.create_task(self._supervise())
+
+    async def _supervise(self) -> None:
+        while True:
+            try:
+                await asyncio.sleep(self.settings.MT_BRIDGE_WORKER_HEALTH_INTERVAL_SECONDS)
+                for session in list(self._sessions.values()):
+                    if isinstance(session.provider, WorkerTerminalProvider):
+                        await self._check_worker(session, session.provider)
+            except asyncio.CancelledError:
+                break
+            except Exception as exc:
+                print(f"[SessionManager] Supervisor error: {exc}")
+
+    async def _check_worker(self, session: BridgeSession, worker: WorkerTerminalProvider) -> None:
+        reason = None
+        if not worker.is_alive():
+            reason = "process exited"
+        else:
+            try:
+                await worker.ping()
+                worker.missed_pings = 0
+            except Exception:
+                worker.missed_pings += 1
+                if worker.missed_pings >= _MAX_MISSED_PINGS:
+                    reason = "unresponsive"
+        if reason is None or session.session_id not in self._sessions:
+            return
+        try:
+            await worker.respawn(reason)
+        except Exception as exc:
+            print(f"[SessionManager] Worker respawn failed for {session.session_id}: {exc}")
+
     async def shutdown_all(self) -> None:
+        if self._supervisor_task:
+            self._supervisor_task.cancel()
+            try:
+                await self._supervisor_task
+            except asyncio.CancelledError:
+                pass
+            self._supervisor_task = None
         async with self._lock:
             sessions = list(self._sessions.values())
             self._sessions = {}
         for session in sessions:
+            if session.tick_hub:
+                await session.tick_hub.close()
+            if session.state_tracker:
+                await session.state_tracker.close()
             try:
                 await session.provider.disconnect()
             except Exception:
@@ -183,6 +328,23 @@ class SessionManager:
     async def list_sessions(self) -> list[dict[str, Any]]:
         return [session.snapshot() for session in self._sessions.values()]
 
+    def get_tick_hub(self, session: BridgeSession) -> TickHub:
+        if session.tick_hub is None:
+            session.tick_hub = TickHub(
+                session.provider,
+                interval_seconds=float(self.settings.MT_BRIDGE_STREAM_POLL_INTERVAL_MS) / 1000.0,
+            )
+        return session.tick_hub
+
+    def get_state_tracker(self, session: BridgeSession) -> AccountStateTracker:
+        if session.state_tracker is None:
+            session.state_tracker = AccountStateTracker(
+                session.provider,
+                interval_seconds=float(self.settings.MT_BRIDGE_STATE_POLL_INTERVAL_MS) / 1000.0,
+                idle_seconds=float(self.settings.MT_BRIDGE_STATE_IDLE_SECONDS),
+            )
+        return session.state_tracker
+
     async def get_session(self, session_id: str) -> BridgeSession:
         session = self._sessions.get(session_id)
         if not session:
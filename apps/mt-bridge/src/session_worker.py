@@ -0,0 +1,444 @@
+"""
+Session worker processes - one terminal provider per subprocess.
+
+With ``MT_BRIDGE_SESSION_MODE=process`` every bridge session runs its provider
+in a dedicated worker process. The MetaTrader5 package binds to a single
+terminal per process, so this is what allows several MT5 sessions on one node;
+a slow or crashing terminal also no longer stalls the other sessions.
+
+Control plane:
+- Parent <-> worker traffic goes over a duplex ``multiprocessing`` pipe.
+- Requests are small dicts ``{"id", "method", "kwargs"}`` and replies
+  ``{"id", "ok", "result" | "error", "error_type"}``.
+- ``WorkerTerminalProvider`` implements ``BaseTerminalProvider`` with RPCs, so
+  routes, the tick hub and ``SessionManager`` use it like a local provider.
+
+``SessionManager`` health-checks the workers; a dead or unresponsive worker is
+respawned and logged back in with the original connect arguments.
+"""
+
+import asyncio
+import itertools
+import multiprocessing
+import threading
+from datetime import UTC, datetime
+from multiprocessing.connection import Connection
+from typing import Any
+
+from src.config import BridgeSettings
+from src.providers import BaseTerminalProvider, BridgeProviderError, create_provider
+
+_MP_CONTEXT = multiprocessing.get_context("spawn")
+
+# Provider methods a worker will execute on behalf of the parent.
+_PROVIDER_METHODS = frozenset({
+    "connect",
+    "disconnect",
+    "get_account_info",
+    "get_positions",
+    "place_order",
+    "get_open_orders",
+    "get_order",
+    "cancel_order",
+    "close_position",
+    "modify_position",
+    "get_price",
+    "get_prices",
+    "get_symbol_specs",
+    "get_candles",
+    "get_candle_history",
+})
+
+
+class SessionWorkerError(BridgeProviderError):
+    """Raised when a session worker is down or does not answer."""
+
+
+# ============ Worker process side ============
+
+class _WorkerRuntime:
+    """Event loop running inside a worker process, hosting one provider."""
+
+    def __init__(self, conn: Connection, worker_key: str, settings: BridgeSettings, platform: str):
+        self._conn = conn
+        self._worker_key = worker_key
+        self._provider = create_provider(platform=platform, settings=settings)
+        self._tasks: set[asyncio.Task] = set()
+        self._shutdown = asyncio.Event()
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        # Daemon thread: a blocking recv() must not hold up interpreter exit.
+        threading.Thread(
+            target=self._read_forever,
+            args=(loop,),
+            name=f"session-worker-ipc-{self._worker_key}",
+            daemon=True,
+        ).start()
+        await self._shutdown.wait()
+        try:
+            await self._provider.disconnect()
+        except Exception:
+            pass
+        try:
+            self._conn.close()
+        except Exception:
+            pass
+
+    def _read_forever(self, loop: asyncio.AbstractEventLoop) -> None:
+        while True:
+            try:
+                message = self._conn.recv()
+            except (EOFError, OSError):
+                # Parent went away: log out instead of holding the terminal.
+                loop.call_soon_threadsafe(self._shutdown.set)
+                return
+            loop.call_soon_threadsafe(self._dispatch, message)
+
+    def _dispatch(self, message: dict[str, Any]) -> None:
+        task = asyncio.create_task(self._handle(message))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _reply(self, payload: dict[str, Any]) -> None:
+        try:
+            self._conn.send(payload)
+        except (OSError, ValueError):
+            self._shutdown.set()
+
+    async def _handle(self, message: dict[str, Any]) -> None:
+        request_id = message.get("id")
+        method = message.get("method")
+        kwargs = message.get("kwargs") or {}
+        try:
+            result: Any = None
+            if method == "ping":
+                result = {"worker": self._worker_key, "provider": self._provider.name}
+            elif method == "shutdown":
+                self._shutdown.set()
+            elif method in _PROVIDER_METHODS:
+                result = await getattr(self._provider, method)(**kwargs)
+            else:
+                raise BridgeProviderError(f"Unknown worker method: {method}")
+            self._reply({"id": request_id, "ok": True, "result": result})
+        except Exception as exc:
+            self._reply({
+                "id": request_id,
+                "ok": False,
+                "error": str(exc) or type(exc).__name__,
+                "error_type": type(exc).__name__,
+            })
+
+
+def _worker_entry(conn: Connection, worker_key: str, settings: BridgeSettings, platform: str) -> None:
+    """Process entry point (must be importable for the spawn start method)."""
+    print(f"[SessionWorker:{worker_key}] Worker process started")
+    try:
+        asyncio.run(_WorkerRuntime(conn, worker_key, settings, platform).run())
+    except KeyboardInterrupt:
+        pass
+    print(f"[SessionWorker:{worker_key}] Worker process exited")
+
+
+# ============ Parent side ============
+
+class WorkerTerminalProvider(BaseTerminalProvider):
+    """
+    Parent-side provider whose calls are executed in a dedicated worker process.
+
+    The worker is spawned on ``connect`` and shut down on ``disconnect``.
+    Connect arguments are kept so a respawned worker can log back in.
+    """
+
+    def __init__(self, *, platform: str, settings: BridgeSettings, worker_key: str):
+        self.worker_key = worker_key
+        self.restarts = 0
+        self.missed_pings = 0
+        self.started_at: datetime | None = None
+        self._platform = platform
+        self._settings = settings
+        # Constructors are side-effect free; this only resolves the provider name.
+        self._name = create_provider(platform=platform, settings=settings).name
+        self._connect_kwargs: dict[str, Any] | None = None
+        self._process: multiprocessing.process.BaseProcess | None = None
+        self._conn: Connection | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._pending: dict[int, asyncio.Future] = {}
+        self._ids = itertools.count(1)
+        self._send_lock = threading.Lock()
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def pid(self) -> int | None:
+        return self._process.pid if self._process else None
+
+    def is_alive(self) -> bool:
+        return bool(self._process and self._process.is_alive())
+
+    # ---- process management ----
+
+    async def _spawn(self) -> None:
+        # Joining a stuck worker and starting a new one both block: keep them off the loop.
+        await asyncio.to_thread(self._reap, self._detach())
+        self._loop = asyncio.get_running_loop()
+        parent_conn, child_conn = _MP_CONTEXT.Pipe(duplex=True)
+        process = _MP_CONTEXT.Process(
+            target=_worker_entry,
+            args=(child_conn, self.worker_key, self._settings, self._platform),
+            name=f"session-worker-{self.worker_key}",
+            daemon=True,
+        )
+        await asyncio.to_thread(process.start)
+        child_conn.close()
+        self._process = process
+        self._conn = parent_conn
+        self.started_at = datetime.now(UTC)
+        self.missed_pings = 0
+        threading.Thread(
+            target=self._read_forever,
+            args=(parent_conn,),
+            name=f"session-worker-reader-{self.worker_key}",
+            daemon=True,
+        ).start()
+
+    def _read_forever(self, conn: Connection) -> None:
+        while True:
+            try:
+                message = conn.recv()
+            except (EOFError, OSError):
+                break
+            future = self._pending.pop(message.get("id"), None)
+            if future is None:
+                continue
+            if message.get("ok"):
+                self._settle(future, result=message.get("result"))
+            elif message.get("error_type") == "BridgeProviderError":
+                self._settle(future, error=BridgeProviderError(message.get("error") or "provider error"))
+            else:
+                self._settle(future, error=RuntimeError(f"{message.get('error_type')}: {message.get('error')}"))
+        if self._loop is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._pipe_closed, conn)
+            except RuntimeError:
+                pass  # Loop already closed
+
+    def _pipe_closed(self, conn: Connection) -> None:
+        # Checked on the loop: the worker may have been respawned since this pipe closed.
+        if conn is self._conn:
+            self._fail_pending("worker pipe closed")
+
+    @staticmethod
+    def _settle(future: asyncio.Future, result: Any = None, error: Exception | None = None) -> None:
+        """Complete ``future`` from any thread, on the loop of the caller that awaits it."""
+
+        def _apply() -> None:
+            if future.done():
+                return
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+        try:
+            future.get_loop().call_soon_threadsafe(_apply)
+        except RuntimeError:
+            pass  # Caller's loop already closed
+
+    def _fail_pending(self, reason: str) -> None:
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            self._settle(future, error=SessionWorkerError(f"Session worker {self.worker_key}: {reason}"))
+
+    def _detach(self) -> multiprocessing.process.BaseProcess | None:
+        """Close the pipe and fail pending calls; returns the process still to be reaped."""
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            try:
+                conn.close()
+            except Exception:
+                pass
+        self._fail_pending("worker terminated")
+        process, self._process = self._process, None
+        return process
+
+    @staticmethod
+    def _reap(process: multiprocessing.process.BaseProcess | None) -> None:
+        """Terminate and join the process (blocking, up to 5 s)."""
+        if process is not None and process.is_alive():
+            process.terminate()
+            process.join(timeout=5)
+            if process.is_alive():
+                process.kill()
+
+    async def _call(self, method: str, timeout: float | None = None, **kwargs: Any) -> Any:
+        if not self.is_alive() or self._conn is None:
+            raise SessionWorkerError(f"Session worker {self.worker_key} is not running")
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            with self._send_lock:
+                self._conn.send({"id": request_id, "method": method, "kwargs": kwargs})
+        except (OSError, ValueError) as exc:
+            self._pending.pop(request_id, None)
+            raise SessionWorkerError(f"Session worker {self.worker_key} send failed: {exc}")
+        try:
+            return await asyncio.wait_for(
+                future,
+                timeout=timeout or self._settings.MT_BRIDGE_WORKER_RPC_TIMEOUT_SECONDS,
+            )
+        except TimeoutError:
+            raise SessionWorkerError(f"Session worker {self.worker_key} timed out on {method}")
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def _start_and_login(self) -> None:
+        await self._spawn()
+        await self._call("ping", timeout=self._settings.MT_BRIDGE_WORKER_CONNECT_TIMEOUT_SECONDS)
+        if self._connect_kwargs is not None:
+            await self._call(
+                "connect",
+                timeout=self._settings.MT_BRIDGE_WORKER_CONNECT_TIMEOUT_SECONDS,
+                **self._connect_kwargs,
+            )
+
+    async def ping(self) -> None:
+        await self._call("ping", timeout=self._settings.MT_BRIDGE_WORKER_HEALTH_INTERVAL_SECONDS)
+
+    async def respawn(self, reason: str) -> None:
+        """Restart the worker process and log it back in."""
+        print(f"[SessionWorker:{self.worker_key}] Restarting worker ({reason})")
+        self.restarts += 1
+        await self._start_and_login()
+
+    async def close(self) -> None:
+        """Stop the worker process without logging out first."""
+        process = self._process
+        if process is not None and self.is_alive():
+            try:
+                await self._call("shutdown", timeout=5)
+                await asyncio.to_thread(process.join, 5)
+            except Exception:
+                pass
+        await asyncio.to_thread(self._reap, self._detach())
+
+    def describe(self) -> dict[str, Any]:
+        return {
+            "worker": self.worker_key,
+            "pid": self.pid,
+            "alive": self.is_alive(),
+            "restarts": self.restarts,
+            "started_at": self.started_at,
+        }
+
+    # ---- BaseTerminalProvider ----
+
+    async def connect(
+        self,
+        *,
+        login: str,
+        password: str,
+        server: str | None,
+        platform: str,
+        terminal_path: str | None = None,
+        data_path: str | None = None,
+        workspace_id: str | None = None,
+        server_candidates: list[str] | None = None,
+    ) -> None:
+        self._connect_kwargs = {
+            "login": login,
+            "password": password,
+            "server": server,
+            "platform": platform,
+            "terminal_path": terminal_path,
+            "data_path": data_path,
+            "workspace_id": workspace_id,
+            "server_candidates": server_candidates,
+        }
+        try:
+            await self._start_and_login()
+        except Exception:
+            self._connect_kwargs = None
+            await self.close()
+            raise
+
+    async def disconnect(self) -> None:
+        self._connect_kwargs = None
+        try:
+            if self.is_alive():
+                await self._call("disconnect")
+        finally:
+            await self.close()
+
+    async def get_account_info(self) -> dict[str, Any]:
+        return await self._call("get_account_info")
+
+    async def get_positions(self) -> list[dict[str, Any]]:
+        return await self._call("get_positions")
+
+    async def place_order(self, payload: dict[str, Any]) -> dict[str, Any]:
+        return await self._call("place_order", payload=payload)
+
+    async def get_open_orders(self) -> list[dict[str, Any]]:
+        return await self._call("get_open_orders")
+
+    async def get_order(self, order_id: str) -> dict[str, Any] | None:
+        return await self._call("get_order", order_id=order_id)
+
+    async def cancel_order(self, order_id: str) -> bool:
+        return await self._call("cancel_order", order_id=order_id)
+
+    async def close_position(self, payload: dict[str, Any]) -> dict[str, Any]:
+        return await self._call("close_position", payload=payload)
+
+    async def modify_position(self, payload: dict[str, Any]) -> bool:
+        return await self._call("modify_position", payload=payload)
+
+    async def get_price(self, symbol: str) -> dict[str, Any]:
+        return await self._call("get_price", symbol=symbol)
+
+    async def get_prices(self, symbols: list[str]) -> dict[str, dict[str, Any]]:
+        # One IPC round-trip per batch; the worker fans out with its own provider.
+        return await self._call("get_prices", symbols=symbols)
+
+    async def get_symbol_specs(self, symbols: list[str]) -> dict[str, dict[str, Any]]:
+        return await self._call("get_symbol_specs", symbols=symbols)
+
+    async def get_candles(
+        self,
+        *,
+        symbol: str,
+        timeframe: str,
+        count: int,
+        from_time: str | None = None,
+        to_time: str | None = None,
+    ) -> list[dict[str, Any]]:
+        return await self._call(
+            "get_candles",
+            symbol=symbol,
+            timeframe=timeframe,
+            count=count,
+            from_time=from_time,
+            to_time=to_time,
+        )
+
+    async def get_candle_history(
+        self,
+        *,
+        symbol: str,
+        timeframe: str,
+        start: datetime | None,
+        end: datetime,
+        limit: int,
+    ) -> dict[str, list]:
+        return await self._call(
+            "get_candle_history",
+            symbol=symbol,
+            timeframe=timeframe,
+            start=start,
+            end=end,
+            limit=limit,
+        )
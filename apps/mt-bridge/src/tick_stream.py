@@ -0,0 +1,140 @@
+import asyncio
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.providers import BaseTerminalProvider
+
+# Frames are compact JSON lines:
+#   tick:      {"s": "EURUSD", "b": 1.08234, "a": 1.08245, "t": 1760000000123}
+#   heartbeat: {"hb": 1760000000123}
+# Only quotes whose bid/ask changed since the previous poll are pushed.
+
+_QUEUE_SIZE = 1000
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+def encode_frame(frame: dict[str, Any]) -> bytes:
+    return (json.dumps(frame, separators=(",", ":")) + "\n").encode()
+
+
+@dataclass(eq=False)
+class TickSubscription:
+    symbols: frozenset[str]
+    queue: asyncio.Queue = field(default_factory=lambda: asyncio.Queue(maxsize=_QUEUE_SIZE))
+
+    def push(self, frame: dict[str, Any] | None) -> None:
+        if self.queue.full():
+            # Slow consumer: drop the oldest frame, newer quotes supersede it.
+            try:
+                self.queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+        self.queue.put_nowait(frame)
+
+
+class TickHub:
+    """
+    Per-session tick poller.
+
+    One background task polls the union of subscribed symbols with a single
+    batched ``provider.get_prices`` call per interval and fans changed quotes
+    out to every subscriber. The task exits when the last subscriber leaves.
+    """
+
+    def __init__(self, provider: BaseTerminalProvider, *, interval_seconds: float):
+        self._provider = provider
+        self._interval = max(0.01, interval_seconds)
+        self._subscribers: set[TickSubscription] = set()
+        self._last: dict[str, tuple[float, float]] = {}
+        self._frames: dict[str, dict[str, Any]] = {}
+        self._task: asyncio.Task | None = None
+        self._closed = False
+
+    @property
+    def symbols(self) -> list[str]:
+        merged: set[str] = set()
+        for subscriber in self._subscribers:
+            merged |= subscriber.symbols
+        return sorted(merged)
+
+    def subscribe(self, symbols: list[str]) -> TickSubscription:
+        subscription = TickSubscription(symbols=frozenset(symbols))
+        self._subscribers.add(subscription)
+        # Late subscribers start from the latest known quotes.
+        for symbol in subscription.symbols:
+            frame = self._frames.get(symbol)
+            if frame:
+                subscription.push(frame)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return subscription
+
+    def unsubscribe(self, subscription: TickSubscription) -> None:
+        self._subscribers.discard(subscription)
+
+    async def close(self) -> None:
+        self._closed = True
+        for subscriber in list(self._subscribers):
+            subscriber.push(None)
+        self._subscribers.clear()
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+
+    async def _run(self) -> None:
+        while self._subscribers and not self._closed:
+            started = time.monotonic()
+            try:
+                quotes = await self._provider.get_prices(self.symbols)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                quotes = {}
+            for symbol, quote in quotes.items():
+                frame = self._changed_frame(symbol, quote)
+                if frame is None:
+                    continue
+                for subscriber in list(self._subscribers):
+                    if symbol in subscriber.symbols:
+                        subscriber.push(frame)
+            elapsed = time.monotonic() - started
+            await asyncio.sleep(max(0.0, self._interval - elapsed))
+
+    def _changed_frame(self, symbol: str, quote: dict[str, Any]) -> dict[str, Any] | None:
+        if "error" in quote:
+            return None
+        try:
+            bid = float(quote.get("bid") or 0.0)
+            ask = float(quote.get("ask") or 0.0)
+        except (TypeError, ValueError):
+            return None
+        if bid <= 0 or ask <= 0 or self._last.get(symbol) == (bid, ask):
+            return None
+        self._last[symbol] = (bid, ask)
+        frame = {"s": symbol, "b": bid, "a": ask, "t": _now_ms()}
+        self._frames[symbol] = frame
+        return frame
+
+
+async def stream_frames(hub: TickHub, symbols: list[str], heartbeat_seconds: float):
+    """Async generator of encoded frames for one streaming client."""
+    subscription = hub.subscribe(symbols)
+    try:
+        while True:
+            try:
+                frame = await asyncio.wait_for(subscription.queue.get(), timeout=heartbeat_seconds)
+            except TimeoutError:
+                frame = {"hb": _now_ms()}
+            if frame is None:
+                return
+            yield encode_frame(frame)
+    finally:
+        hub.unsubscribe(subscription)
@@ -0,0 +1,6 @@
+import os
+
+# The app reads its settings at import: pin tests to the in-memory provider, no API key.
+os.environ.setdefault("MT_BRIDGE_PROVIDER_MODE", "mock")
+os.environ.setdefault("MT_BRIDGE_SESSION_MODE", "inprocess")
+os.environ["MT_BRIDGE_API_KEY"] = ""
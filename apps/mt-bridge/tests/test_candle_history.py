@@ -0,0 +1,85 @@
+from datetime import UTC, datetime
+from itertools import pairwise
+
+import pytest
+
+from src.candle_history import history_page
+from src.config import BridgeSettings
+from src.providers.mock_provider import MockTerminalProvider
+from src.providers.mt5_provider import MT5TerminalProvider
+
+# Friday 21:00 UTC; the FX week ends at 22:00 and resumes Sunday 22:00.
+FRIDAY_EVENING = datetime(2026, 1, 2, 21, 0, tzinfo=UTC)
+SUNDAY_OPEN = datetime(2026, 1, 4, 22, 0, tzinfo=UTC)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("timeframe, step", [("M5", 300), ("H1", 3600)])
+async def test_latest_page_returns_exactly_limit_bars(timeframe: str, step: int) -> None:
+    # Mid-bar end: the window must still cover five whole bars, ending with the one in progress.
+    end = datetime(2026, 1, 5, 10, 7, 42, tzinfo=UTC)
+    page = await history_page(
+        MockTerminalProvider(),
+        symbol="EURUSD",
+        timeframe=timeframe,
+        start=None,
+        end=end,
+        limit=5,
+    )
+
+    stamps = page["columns"]["t"]
+    assert page["count"] == 5
+    assert stamps[-1] == int(end.timestamp()) // step * step
+    assert all(later - earlier == step for earlier, later in pairwise(stamps))
+    assert page["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_latest_page_spans_the_weekend_gap() -> None:
+    end = SUNDAY_OPEN.replace(minute=27)
+    page = await history_page(
+        MockTerminalProvider(),
+        symbol="EURUSD",
+        timeframe="M5",
+        start=None,
+        end=end,
+        limit=10,
+    )
+
+    stamps = page["columns"]["t"]
+    assert page["count"] == 10
+    assert stamps[0] == int(SUNDAY_OPEN.timestamp()) - 2 * 86400 - 20 * 60  # Friday 21:40
+    assert stamps[-1] == int(SUNDAY_OPEN.timestamp()) + 25 * 60
+    assert page["next_cursor"] is None
+
+
+class _FakeMT5:
+    """``copy_rates_range`` over M5 bars that stop for the weekend."""
+
+    def __init__(self) -> None:
+        self.windows: list[tuple[datetime, datetime]] = []
+        open_bars = [FRIDAY_EVENING.timestamp() + 300 * i for i in range(12)]
+        open_bars += [SUNDAY_OPEN.timestamp() + 300 * i for i in range(200)]
+        self._bars = [{"time": int(ts), "open": 1.1, "high": 1.2, "low": 1.0, "close": 1.1, "tick_volume": 5}
+                      for ts in open_bars]
+
+    def copy_rates_range(self, symbol, tf, start, end):
+        self.windows.append((start, end))
+        return [bar for bar in self._bars if start.timestamp() <= bar["time"] <= end.timestamp()]
+
+
+@pytest.mark.asyncio
+async def test_mt5_candles_from_a_time_read_past_market_closures() -> None:
+    provider = MT5TerminalProvider(settings=BridgeSettings(MT_BRIDGE_PROVIDER_MODE="mock"))
+    provider._mt5 = _FakeMT5()
+    provider._connected = True
+    provider._selected_symbols["EURUSD"] = "EURUSD"
+
+    candles = await provider.get_candles(
+        symbol="EURUSD", timeframe="M5", count=50, from_time=FRIDAY_EVENING.isoformat(),
+    )
+
+    assert len(candles) == 50
+    assert candles[0]["timestamp"] == FRIDAY_EVENING.isoformat()
+    assert candles[12]["timestamp"] == SUNDAY_OPEN.isoformat()
+    assert len(provider._mt5.windows) > 1
@@ -0,0 +1,72 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from src.main import app
+from src.providers import BridgeProviderError
+from src.providers.base import BaseTerminalProvider
+from src.providers.mock_provider import MockTerminalProvider
+
+
+@pytest.fixture
+def client():
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def _connect(client: TestClient, login: str) -> str:
+    response = client.post(
+        "/api/v1/sessions/connect",
+        json={"platform": "mt5", "login": login, "password": "x", "server": "Demo-Server"},
+    )
+    assert response.status_code == 200, response.text
+    return response.json()["session_id"]
+
+
+def _fail_unknown_symbols(monkeypatch: pytest.MonkeyPatch) -> None:
+    # The mock quotes any symbol; route it through the per-symbol batch so one can fail.
+    original = MockTerminalProvider.get_price
+
+    async def get_price(self, symbol: str):
+        if symbol == "XXXYYY":
+            raise BridgeProviderError("symbol not found")
+        return await original(self, symbol)
+
+    monkeypatch.setattr(MockTerminalProvider, "get_price", get_price)
+    monkeypatch.setattr(MockTerminalProvider, "get_prices", BaseTerminalProvider.get_prices)
+
+
+def test_prices_returns_one_quote_per_symbol(client: TestClient) -> None:
+    session_id = _connect(client, "50001")
+    response = client.get(f"/api/v1/sessions/{session_id}/prices", params={"symbols": "EURUSD, GBPUSD,EURUSD"})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert set(body["prices"]) == {"EURUSD", "GBPUSD"}
+    assert body["errors"] == {}
+    assert body["prices"]["EURUSD"]["ask"] >= body["prices"]["EURUSD"]["bid"]
+
+
+def test_prices_reports_per_symbol_errors_next_to_quotes(client: TestClient, monkeypatch) -> None:
+    _fail_unknown_symbols(monkeypatch)
+    session_id = _connect(client, "50002")
+    response = client.get(f"/api/v1/sessions/{session_id}/prices", params={"symbols": "EURUSD,XXXYYY"})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert set(body["prices"]) == {"EURUSD"}
+    assert body["errors"] == {"XXXYYY": "symbol not found"}
+
+
+def test_prices_fails_when_every_symbol_fails(client: TestClient, monkeypatch) -> None:
+    _fail_unknown_symbols(monkeypatch)
+    session_id = _connect(client, "50003")
+    response = client.get(f"/api/v1/sessions/{session_id}/prices", params={"symbols": "XXXYYY"})
+
+    assert response.status_code == 400
+    assert "symbol not found" in response.json()["detail"]
+
+
+def test_prices_requires_symbols_and_a_known_session(client: TestClient) -> None:
+    session_id = _connect(client, "50004")
+    assert client.get(f"/api/v1/sessions/{session_id}/prices").status_code == 400
+    assert client.get("/api/v1/sessions/missing/prices", params={"symbols": "EURUSD"}).status_code == 404
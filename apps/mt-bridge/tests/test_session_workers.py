@@ -0,0 +1,153 @@
+import asyncio
+import os
+import time
+
+import pytest
+import pytest_asyncio
+
+from src.config import BridgeSettings
+from src.session_manager import SessionManager
+from src.session_worker import SessionWorkerError, WorkerTerminalProvider
+
+
+@pytest_asyncio.fixture
+async def manager():
+    settings = BridgeSettings(
+        MT_BRIDGE_PROVIDER_MODE="mock",
+        MT_BRIDGE_SESSION_MODE="process",
+        MT_BRIDGE_MAX_SESSIONS=4,
+        # Tests drive health checks themselves.
+        MT_BRIDGE_WORKER_HEALTH_INTERVAL_SECONDS=60,
+    )
+    session_manager = SessionManager(settings=settings)
+    yield session_manager
+    await session_manager.shutdown_all()
+
+
+async def _connect(manager: SessionManager, login: str, server: str = "Demo-Server"):
+    return await manager.create_session(platform="mt5", login=login, password="x", server=server)
+
+
+@pytest.mark.asyncio
+async def test_session_runs_in_its_own_worker_process(manager: SessionManager) -> None:
+    session, reused = await _connect(manager, "70001")
+    worker = session.provider
+
+    assert not reused
+    assert isinstance(worker, WorkerTerminalProvider)
+    assert worker.is_alive()
+    assert worker.pid not in (None, os.getpid())
+
+    # Provider calls are RPCs answered by the mock provider inside the worker.
+    account = await worker.get_account_info()
+    assert account["login"] == "70001"
+    prices = await worker.get_prices(["EURUSD", "GBPUSD"])
+    assert set(prices) == {"EURUSD", "GBPUSD"}
+
+    await manager.disconnect_session(session.session_id)
+    assert not worker.is_alive()
+
+
+@pytest.mark.asyncio
+async def test_crashed_worker_is_respawned_and_logged_back_in(manager: SessionManager) -> None:
+    session, _ = await _connect(manager, "70002")
+    worker = session.provider
+    crashed_pid = worker.pid
+
+    worker._process.kill()
+    await asyncio.to_thread(worker._process.join, 5)
+    await manager._check_worker(session, worker)
+
+    assert worker.restarts == 1
+    assert worker.is_alive()
+    assert worker.pid != crashed_pid
+    assert (await worker.get_account_info())["login"] == "70002"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_logins_for_one_account_share_a_worker(manager: SessionManager, monkeypatch) -> None:
+    spawned: list[str] = []
+    original_spawn = WorkerTerminalProvider._spawn
+
+    async def counting_spawn(self) -> None:
+        spawned.append(self.worker_key)
+        await original_spawn(self)
+
+    monkeypatch.setattr(WorkerTerminalProvider, "_spawn", counting_spawn)
+
+    results = await asyncio.gather(*(_connect(manager, "70003") for _ in range(3)))
+    again, reused_again = await _connect(manager, "70003", server="demo-server")
+    other, reused_other = await _connect(manager, "70004")
+
+    sessions = {session.session_id for session, _ in results}
+    assert len(sessions) == 1
+    assert sorted(reused for _, reused in results) == [False, True, True]
+    assert reused_again and again.session_id in sessions
+    assert not reused_other and other.session_id not in sessions
+    assert len(spawned) == 2
+    assert len(await manager.list_sessions()) == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_login_is_reported_to_waiting_callers(manager: SessionManager, monkeypatch) -> None:
+    async def failing_connect(self, **kwargs) -> None:
+        await asyncio.sleep(0.05)
+        raise RuntimeError("terminal refused login")
+
+    monkeypatch.setattr(WorkerTerminalProvider, "connect", failing_connect)
+
+    results = await asyncio.gather(
+        *(_connect(manager, "70005") for _ in range(2)),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert manager._logins_in_flight == {}
+    assert manager._connecting == 0
+    assert await manager.list_sessions() == []
+
+
+@pytest.mark.asyncio
+async def test_respawn_does_not_block_the_event_loop(manager: SessionManager, monkeypatch) -> None:
+    session, _ = await _connect(manager, "70006")
+    worker = session.provider
+    reap = worker._reap
+
+    def slow_reap(process) -> None:
+        time.sleep(0.3)
+        reap(process)
+
+    monkeypatch.setattr(worker, "_reap", slow_reap)
+    ticks = 0
+
+    async def ticker() -> None:
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    task = asyncio.create_task(ticker())
+    try:
+        await worker.respawn("test")
+    finally:
+        task.cancel()
+
+    assert ticks >= 10
+    assert worker.is_alive()
+    assert (await worker.get_account_info())["login"] == "70006"
+
+
+@pytest.mark.asyncio
+async def test_closed_pipe_of_a_replaced_worker_does_not_fail_new_calls(manager: SessionManager) -> None:
+    session, _ = await _connect(manager, "70007")
+    worker = session.provider
+    pending = asyncio.get_running_loop().create_future()
+    worker._pending[0] = pending
+
+    worker._pipe_closed(object())
+    await asyncio.sleep(0)
+    assert not pending.done()
+
+    worker._pipe_closed(worker._conn)
+    await asyncio.sleep(0)
+    assert isinstance(pending.exception(), SessionWorkerError)